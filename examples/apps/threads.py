@@ -18,18 +18,18 @@ import time
 import threading
 
 from modlib.apps import Annotator
-from modlib.devices import AiCamera
+from modlib.devices import AiCamera, BUFFER_POLICY, Subscription
 from modlib.models.zoo import SSDMobileNetV2FPNLite320x320
 
 
-def background_task(device: AiCamera):
-    while device._running:
-        frame = device.get_frame()
+def background_task(subscription: Subscription):
+    # Receives the latest frame independent of the main loop, ends when the device stops
+    for frame in subscription:
 
         # simulate work
         time.sleep(1)
 
-        print(f'Performing task: {frame.timestamp}')
+        print(f'Performing task: {frame.timestamp} (skipped {subscription.dropped} frames so far)')
 
 
 device = AiCamera()
@@ -37,11 +37,13 @@ model = SSDMobileNetV2FPNLite320x320()
 device.deploy(model)
 
 annotator = Annotator(thickness=1, text_thickness=1, text_scale=0.4)
-thread = threading.Thread(target=background_task, args=(device,))
 
 
 with device as stream:
+    subscription = device.subscribe(policy=BUFFER_POLICY.LATEST)
+    thread = threading.Thread(target=background_task, args=(subscription,))
     thread.start()
+
     for frame in stream:
         detections = frame.detections[frame.detections.confidence > 0.55]
 
@@ -185,6 +185,14 @@ def load_older(model_path: str, use_mct: bool = False):
                 )
     return model
 
+def squeeze_batch(t: np.ndarray) -> np.ndarray:
+    """
+    Squeeze every sample of a batched output tensor the same way a single inference output is squeezed,
+    while keeping the leading batch axis.
+    """
+    return np.stack([np.squeeze(t[i : i + 1]) if t.ndim > 1 else t[i : i + 1] for i in range(len(t))])
+
+
 def load_tf_keras_model(model_path: str, is_quantized: bool):
     """
     Load a Keras model file using TensorFlow or model_compression_toolkit (if quantized).
@@ -238,6 +246,21 @@ class Interpreter:
         # Return dict for .npz packing
         return {f"output{i}": arr for i, arr in enumerate(squeezed_tensors)}
 
+    def infer_batch(self, input_tensor: np.ndarray) -> Dict[str, np.ndarray]:
+        # Inference for a stacked batch (N, ...), outputs keep the leading batch axis
+        if self.keras_model is None:
+            raise RuntimeError("Model is not compatible with the installed version of TensorFlow.")
+
+        output_tensors = self.keras_model.predict(input_tensor, verbose=0)
+        if not isinstance(output_tensors, (list, tuple)):
+            output_tensors = [output_tensors]  # single output model
+
+        # Post-process (squeeze each sample like `infer` does)
+        batched_tensors = [squeeze_batch(t) for t in output_tensors]
+
+        # Return dict for .npz packing
+        return {f"output{i}": arr for i, arr in enumerate(batched_tensors)}
+
     @property
     def input_tensor_size(self) -> Tuple[int, int]:
         # Keras uses NHWC format: (batch, height, width, channels)
@@ -38,6 +38,14 @@ def validate_onnx_model_path(model_path: str | Path) -> None:
         raise ValueError(f"Model path expected to have .onnx extension, got: {model_path}")
 
 
+def squeeze_batch(t: np.ndarray) -> np.ndarray:
+    """
+    Squeeze every sample of a batched output tensor the same way a single inference output is squeezed,
+    while keeping the leading batch axis.
+    """
+    return np.stack([np.squeeze(t[i : i + 1]) if t.ndim > 1 else t[i : i + 1] for i in range(len(t))])
+
+
 def load_onnx_model(model_path: str, is_quantized: bool) -> onnxruntime.InferenceSession:
     """
     Loads the onnx model file.
@@ -104,6 +112,26 @@ class Interpreter:
         # Return dict for .npz packing
         return {f"output{i}": arr for i, arr in enumerate(squeezed_tensors)}
 
+    def infer_batch(self, input_tensor: np.ndarray) -> Dict[str, np.ndarray]:
+        # Inference for a stacked batch (N, ...), outputs keep the leading batch axis
+        if self.onnx_model is None:
+            raise RuntimeError("Failed to load ONNX model.")
+
+        x = input_tensor.astype(np.float32)
+        batch_dim = self.onnx_model.get_inputs()[0].shape[0]
+        if isinstance(batch_dim, int) and batch_dim != len(x):
+            # Model exported with a static batch size, run the samples one by one
+            outputs = [self.onnx_model.run(self.output_names, {self.input_name: x[i : i + 1]}) for i in range(len(x))]
+            output_tensors = [np.concatenate(ts, axis=0) for ts in zip(*outputs)]
+        else:
+            output_tensors = self.onnx_model.run(self.output_names, {self.input_name: x})
+
+        # Post-process (squeeze each sample like `infer` does)
+        batched_tensors = [squeeze_batch(t) for t in output_tensors]
+
+        # Return dict for .npz packing
+        return {f"output{i}": arr for i, arr in enumerate(batched_tensors)}
+
     @property
     def input_tensor_size(self) -> Tuple[int, int]:
         # ONNX uses NCHW format: [batch, channels, height, width]
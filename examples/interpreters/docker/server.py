@@ -19,10 +19,11 @@ Docker-based FastAPI server for TensorFlow Keras model inference (supports MCT q
 """
 import os
 import json
+import struct
 import numpy as np
 from pathlib import Path
-from typing import Any, Dict
-from fastapi import FastAPI, UploadFile, HTTPException, Response
+from typing import Any, Dict, Tuple
+from fastapi import FastAPI, HTTPException, Request, Response
 from pydantic import BaseModel
 from uuid import uuid4
 from io import BytesIO
@@ -38,6 +39,81 @@ else:
     raise ValueError(f"Invalid BACKEND: {_backend}. Must be 'onnx', 'keras-tf2.13', or 'keras-tf2.14'")
 
 
+# ---------------------------------------------------------------------
+# Tensor transport
+# ---------------------------------------------------------------------
+# Raw tensor transport (same layout as `modlib.devices.interpreters.client.encode_tensors`):
+# per tensor a little-endian uint32 header length, a JSON header {"name", "dtype", "shape"}
+# padded to 8 bytes and the C-contiguous tensor data padded to 8 bytes.
+RAW_TENSORS_CONTENT_TYPE = "application/x-modlib-tensors"
+
+
+def encode_tensors(tensors: Dict[str, np.ndarray]) -> bytearray:
+    headers, sizes = [], []
+    for name, tensor in tensors.items():
+        header = json.dumps({"name": name, "dtype": tensor.dtype.str, "shape": tensor.shape}).encode()
+        headers.append(header + b" " * (-(4 + len(header)) % 8))
+        sizes.append(tensor.nbytes + (-tensor.nbytes % 8))
+
+    buffer = bytearray(sum(4 + len(h) + n for h, n in zip(headers, sizes)))
+    offset = 0
+    for header, size, tensor in zip(headers, sizes, tensors.values()):
+        struct.pack_into("<I", buffer, offset, len(header))
+        buffer[offset + 4 : offset + 4 + len(header)] = header
+        offset += 4 + len(header)
+        np.frombuffer(buffer, dtype=tensor.dtype, count=tensor.size, offset=offset).reshape(tensor.shape)[...] = tensor
+        offset += size
+    return buffer
+
+
+def decode_tensors(buffer: bytes) -> Dict[str, np.ndarray]:
+    tensors = {}
+    offset = 0
+    while offset < len(buffer):
+        (header_size,) = struct.unpack_from("<I", buffer, offset)
+        header = json.loads(bytes(buffer[offset + 4 : offset + 4 + header_size]))
+        offset += 4 + header_size
+        dtype, shape = np.dtype(header["dtype"]), tuple(header["shape"])
+        count = int(np.prod(shape, dtype=np.int64))
+        tensors[header["name"]] = np.frombuffer(buffer, dtype=dtype, count=count, offset=offset).reshape(shape)
+        offset += count * dtype.itemsize + (-count * dtype.itemsize % 8)
+    return tensors
+
+
+async def read_input(request: Request) -> Tuple[np.ndarray, bool]:
+    """Read the input tensor from a raw tensor body or an `input_npy` file upload."""
+    if request.headers.get("content-type", "").startswith(RAW_TENSORS_CONTENT_TYPE):
+        return decode_tensors(await request.body())["input"], True
+
+    form = await request.form()
+    if "input_npy" not in form:
+        raise HTTPException(422, "missing input_npy file")
+    raw = await form["input_npy"].read()
+    return np.load(BytesIO(raw), allow_pickle=False), False  # expects .npy payload
+
+
+def write_outputs(outs: Dict[str, np.ndarray], raw: bool, headers: Dict[str, str]) -> Response:
+    """Serialize outputs as raw tensors or as .npz archive."""
+    headers = {"X-Tensor-Names": ",".join(outs.keys()), **headers}
+    if raw:
+        return Response(content=bytes(encode_tensors(outs)), media_type=RAW_TENSORS_CONTENT_TYPE, headers=headers)
+
+    # Serialize outputs → .npz bytes
+    buf = BytesIO()
+    np.savez(buf, **outs)
+    payload = buf.getvalue()
+
+    return Response(
+        content=payload,
+        media_type="application/octet-stream",
+        headers={
+            "Content-Type": "application/x.numpy-npz",
+            "Content-Disposition": 'attachment; filename="outputs.npz"',
+            **headers,
+        },
+    )
+
+
 # ---------------------------------------------------------------------
 # FastAPI service
 # ---------------------------------------------------------------------
@@ -102,26 +178,22 @@ def get_input_tensor_size(session_id: str) -> Response:
 
 
 @app.post("/infer/{session_id}")
-async def infer(session_id: str, input_npy: UploadFile) -> Response:
+async def infer(session_id: str, request: Request) -> Response:
     if session_id not in _sessions:
         raise HTTPException(404, "unknown session_id")
 
-    raw = await input_npy.read()
-    x = np.load(BytesIO(raw), allow_pickle=False)  # expects .npy payload
-
+    x, raw = await read_input(request)
     outs = _sessions[session_id].infer(x)
+    return write_outputs(outs, raw, {})
 
-    # Serialize outputs → .npz bytes
-    buf = BytesIO()
-    np.savez(buf, **outs)
-    payload = buf.getvalue()
 
-    return Response(
-        content=payload,
-        media_type="application/octet-stream",
-        headers={
-            "Content-Type": "application/x.numpy-npz",
-            "Content-Disposition": 'attachment; filename="outputs.npz"',
-            "X-Tensor-Names": ",".join(outs.keys()),
-        },
-    )
+@app.post("/infer_batch/{session_id}")
+async def infer_batch(session_id: str, request: Request) -> Response:
+    if session_id not in _sessions:
+        raise HTTPException(404, "unknown session_id")
+
+    x, raw = await read_input(request)  # expects a stacked (N, ...) input tensor
+
+    # Outputs keep the leading batch axis, the client splits them per sample
+    outs = _sessions[session_id].infer_batch(x)
+    return write_outputs(outs, raw, {"X-Batch-Size": str(len(x))})
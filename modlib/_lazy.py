@@ -0,0 +1,58 @@
+#
+# Copyright 2026 Sony Semiconductor Solutions Corp. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+
+import importlib.util
+import sys
+from typing import Any, Callable, Dict, List, Tuple
+
+
+def attach(package: str, attributes: Dict[str, str]) -> Tuple[Callable[[str], Any], Callable[[], List[str]], List[str]]:
+    """
+    Lazily load the public attributes of a package on first access (PEP 562), so importing the package
+    does not import all of its submodules and their dependencies (e.g. device SDKs).
+
+    Example:
+    ```
+    __getattr__, __dir__, __all__ = attach(__name__, {"AiCamera": ".ai_camera", "sources": ".sources"})
+    ```
+
+    Args:
+        package: Name of the package, i.e. `__name__` of the package `__init__`.
+        attributes: Mapping of the attribute name to the (relative) module providing it.
+            When the attribute name equals the module name, the submodule itself is the attribute.
+
+    Returns:
+        The `__getattr__`, `__dir__` and `__all__` of the package.
+    """
+
+    def __getattr__(name: str) -> Any:
+        module_name = attributes.get(name)
+        if module_name is None:
+            raise AttributeError(f"module '{package}' has no attribute '{name}'")
+
+        # Import statement machinery instead of `importlib.import_module`, keeps `python -X importtime` complete
+        full_name = importlib.util.resolve_name(module_name, package)
+        __import__(full_name)
+        module = sys.modules[full_name]
+        value = module if full_name.rpartition(".")[2] == name else getattr(module, name)
+        setattr(sys.modules[package], name, value)  # cached, later accesses bypass __getattr__
+        return value
+
+    def __dir__() -> List[str]:
+        return sorted(set(vars(sys.modules[package])) | set(attributes))
+
+    return __getattr__, __dir__, list(attributes)
@@ -14,12 +14,39 @@
 # limitations under the License.
 #
 
-from . import blur
-from .annotate import Annotator, ColorPalette, Color
-from .area import Area
-from .heatmap import Heatmap
-from .matcher import Matcher
-from .object_counter import ObjectCounter
-from .tracker import BYTETracker
-from .motion import Motion
-from .calculate import SpeedCalculator, estimate_angle, calculate_distance, calculate_distance_matrix
+
+from typing import TYPE_CHECKING
+
+from .._lazy import attach
+
+# Applications are imported on first access
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    {
+        "blur": ".blur",
+        "Annotator": ".annotate",
+        "ColorPalette": ".annotate",
+        "Color": ".annotate",
+        "Area": ".area",
+        "Heatmap": ".heatmap",
+        "Matcher": ".matcher",
+        "ObjectCounter": ".object_counter",
+        "BYTETracker": ".tracker",
+        "Motion": ".motion",
+        "SpeedCalculator": ".calculate",
+        "estimate_angle": ".calculate",
+        "calculate_distance": ".calculate",
+        "calculate_distance_matrix": ".calculate",
+    },
+)
+
+if TYPE_CHECKING:
+    from . import blur
+    from .annotate import Annotator, ColorPalette, Color
+    from .area import Area
+    from .heatmap import Heatmap
+    from .matcher import Matcher
+    from .object_counter import ObjectCounter
+    from .tracker import BYTETracker
+    from .motion import Motion
+    from .calculate import SpeedCalculator, estimate_angle, calculate_distance, calculate_distance_matrix
@@ -14,9 +14,40 @@
 # limitations under the License.
 #
 
-from .ai_camera import AiCamera
-from .triton import Triton
-from .interpreters import InterpreterClient
-from .sources import Images, Video, Dataset
-from .frame import Frame, IMAGE_TYPE
-from .device import Device
+
+from typing import TYPE_CHECKING
+
+from .._lazy import attach
+
+# Devices are imported on first access, e.g. `from modlib.devices import Images` does not load the device SDKs
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    {
+        "AiCamera": ".ai_camera",
+        "Triton": ".triton",
+        "InterpreterClient": ".interpreters",
+        "SimulatedCamera": ".simulated",
+        "Images": ".sources",
+        "Video": ".sources",
+        "Dataset": ".sources",
+        "Frame": ".frame",
+        "IMAGE_TYPE": ".frame",
+        "Device": ".device",
+        "BUFFER_POLICY": ".broadcast",
+        "FrameQueue": ".broadcast",
+        "Subscription": ".broadcast",
+        "FrameRing": ".frame_ring",
+        "FrameRingReader": ".frame_ring",
+    },
+)
+
+if TYPE_CHECKING:
+    from .ai_camera import AiCamera
+    from .triton import Triton
+    from .interpreters import InterpreterClient
+    from .simulated import SimulatedCamera
+    from .sources import Images, Video, Dataset
+    from .frame import Frame, IMAGE_TYPE
+    from .device import Device
+    from .broadcast import BUFFER_POLICY, FrameQueue, Subscription
+    from .frame_ring import FrameRing, FrameRingReader
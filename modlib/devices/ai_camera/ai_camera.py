@@ -24,7 +24,7 @@ import threading
 import time
 from datetime import datetime
 from pathlib import Path
-from typing import Optional, Tuple, Union
+from typing import List, Optional, Tuple, Union
 
 import numpy as np
 
@@ -43,6 +43,7 @@ from modlib.models import (
 )
 from modlib.models.zoo import InputTensorOnly
 
+from ..broadcast import BUFFER_POLICY, FrameBroadcaster, Subscription
 from ..device import Device, Rate
 from ..frame import IMAGE_TYPE, ROI, Frame
 from ..utils import IMX500Converter, check_dir_required
@@ -167,6 +168,7 @@ class AiCamera(Device):
         self._frames = []
         self._frameslock = threading.Lock()  # frame buffer lock
         self._frame_ready = threading.Condition(self._frameslock)
+        self._broadcaster = FrameBroadcaster()  # frame subscriptions of other consumers
         self.last_detections = None
 
         # Process thread
@@ -264,15 +266,8 @@ class AiCamera(Device):
         if isinstance(self.model, InputTensorOnly):
             pass
         elif output_tensor:
-            np_output = np.fromiter(output_tensor, dtype=np.float32)
             output_tensor_info = self._parse_output_tensor_info(req)
-
-            offset = 0
-            outputs = []
-            for tensor_shape in self._get_output_tensor_shape(output_tensor_info):
-                size = np.prod(tensor_shape)
-                outputs.append(np_output[offset : offset + size].reshape(tensor_shape, order="F"))
-                offset += size
+            outputs = self._get_output_tensors(output_tensor, output_tensor_info)
 
             # Post processing
             detections = self.model.post_process(outputs)
@@ -311,26 +306,29 @@ class AiCamera(Device):
             image_type = IMAGE_TYPE.VGA
             h, w, c = image.shape
 
-        with self._frameslock:
-            self._frames.append(
-                Frame(
-                    timestamp=datetime.now().isoformat(),
-                    image=image,
-                    image_type=image_type,
-                    width=w,
-                    height=h,
-                    channels=c,
-                    detections=detections,
-                    new_detection=new_detection,
-                    fps=self.fps.value,
-                    dps=self.dps.value,
-                    color_format=color_format,
-                    roi=self.roi,
-                    frame_count=frame_count,
-                )
-            )
+        frame = Frame(
+            timestamp=datetime.now().isoformat(),
+            image=image,
+            image_type=image_type,
+            width=w,
+            height=h,
+            channels=c,
+            detections=detections,
+            new_detection=new_detection,
+            fps=self.fps.value,
+            dps=self.dps.value,
+            color_format=color_format,
+            roi=self.roi,
+            frame_count=frame_count,
+        )
 
+        with self._frameslock:
+            self._frames.append(frame)
             self._frame_ready.notify_all()  # Notify waiting threads
+            self._notify_async_waiters()  # Notify waiting coroutines
+
+        # Publish to subscriptions outside the frame buffer lock, blocking subscriptions may apply backpressure
+        self._broadcaster.publish(frame)
 
     def _initiate_roi(self) -> None:
         # Full field of view if high res image cropping not specified
@@ -471,6 +469,9 @@ class AiCamera(Device):
         """
         atexit.unregister(self.stop)
 
+        # End all subscriptions, releasing a processing thread blocked by a full subscription
+        self._broadcaster.close()
+
         if self.imx500 is not None:
             self.imx500.stop_network_fw_progress_bar()
 
@@ -795,6 +796,39 @@ class AiCamera(Device):
         # TODO: can be removed when output tensor shape available in model
         return [list(t.size)[: t.num_dimensions] for t in parsed_info.info[: parsed_info.num_tensors]]
 
+    @staticmethod
+    def _output_tensor_to_numpy(output_tensor) -> np.ndarray:
+        """
+        Convert the `CnnOutputTensor` metadata into a flat float32 array without iterating it in Python.
+        Only metadata exposing the buffer protocol is viewed without a copy (copied once when read-only,
+        post-processors may modify the output tensors in place). Sequences of floats, as returned by the
+        libcamera Python bindings, are converted element by element into a single preallocated array.
+        """
+        try:
+            view = memoryview(output_tensor)
+        except TypeError:
+            return np.fromiter(output_tensor, dtype=np.float32, count=len(output_tensor))
+
+        np_output = np.frombuffer(view, dtype=np.float32)
+        return np_output.copy() if view.readonly else np_output
+
+    @staticmethod
+    def _get_output_tensors(output_tensor, output_tensor_info) -> List[np.ndarray]:
+        """
+        Split the flat `CnnOutputTensor` metadata into the output tensors of the model.
+        The output tensors are (column-major) views into a single float32 array.
+        """
+        np_output = AiCamera._output_tensor_to_numpy(output_tensor)
+
+        offset = 0
+        outputs = []
+        for tensor_shape in AiCamera._get_output_tensor_shape(output_tensor_info):
+            size = int(np.prod(tensor_shape))
+            outputs.append(np_output[offset : offset + size].reshape(tensor_shape, order="F"))
+            offset += size
+
+        return outputs
+
     def __enter__(self):
         """
         Start the AiCamera device stream.
@@ -815,6 +849,22 @@ class AiCamera(Device):
         self.fps.init()
         return self
 
+    def subscribe(self, maxsize: int = 8, policy: str = BUFFER_POLICY.DROP_OLDEST) -> Subscription:
+        """
+        Subscribe to all frames of the device stream, e.g. to display, record or analyse the stream
+        from other threads. Every subscription has its own bounded ring buffer and drop counter,
+        independent of the frames consumed by iterating the device. Subscriptions end when the device stops.
+
+        Args:
+            maxsize: Capacity of the subscription ring buffer. Defaults to 8, ignored for `BUFFER_POLICY.LATEST`.
+            policy: Policy when the ring buffer is full, see `BUFFER_POLICY`. Defaults to `BUFFER_POLICY.DROP_OLDEST`.
+                With `BUFFER_POLICY.BLOCK` a slow consumer slows down the device stream.
+
+        Returns:
+            The subscription, iterate it or call `subscription.get()` to receive the frames.
+        """
+        return self._broadcaster.subscribe(maxsize, policy)
+
     def get_frame(self) -> Frame:
         """
         Gets the next processed frame in the device stream.
@@ -829,17 +879,36 @@ class AiCamera(Device):
             # We only allow the main thread to pop and clear the frame buffer
             # Calling get_frame() from a thread other than the main thread is allowed and
             # returns the last frame in the buffer for processing
-            if threading.current_thread() is threading.main_thread():
-                frame = self._frames.pop(-1)
-                if self._frames:
-                    logger.debug(f"Main thread is dropping {len(self._frames)} frames.")
-                    self._frames.clear()
-                self.fps.update()
-            else:
-                frame = self._frames[-1]
+            return self._take_frame(pop=threading.current_thread() is threading.main_thread())
+
+    def _take_frame(self, pop: bool = True) -> Optional[Frame]:
+        """
+        Take the latest frame from the frame buffer, must be called holding `self._frameslock`.
+
+        Args:
+            pop: Pop the latest frame and drop older frames, otherwise only peek at the latest frame.
+
+        Returns:
+            The latest frame, or None when the frame buffer is empty.
+        """
+        if not self._frames:
+            return None
+
+        if pop:
+            frame = self._frames.pop(-1)
+            if self._frames:
+                logger.debug(f"Main thread is dropping {len(self._frames)} frames.")
+                self._frames.clear()
+            self.fps.update()
+        else:
+            frame = self._frames[-1]
 
         return frame
 
+    async def _anext_frame(self) -> Frame:
+        # The consuming event loop owns the frame buffer, like the main thread does for `get_frame()`
+        return await self._wait_for_frame(self._take_frame)
+
     def __next__(self) -> Frame:
         """
         Get the next frame in the device stream.
@@ -29,12 +29,38 @@
 import os
 import selectors
 import threading
+from collections.abc import Mapping
 
 import numpy as np
 
 from .utils import convert_from_libcamera_type, libcamera
 
 
+class LazyMetadata(Mapping):
+    """
+    Read-only view on the metadata of a libcamera request, indexed by control name.
+    Values are only converted from their libcamera type when accessed.
+    """
+
+    def __init__(self, metadata):
+        self._raw = {k.name: v for k, v in metadata.items()}
+        self._converted = {}
+
+    def __getitem__(self, key):
+        if key not in self._converted:
+            self._converted[key] = convert_from_libcamera_type(self._raw[key])
+        return self._converted[key]
+
+    def __contains__(self, key):
+        return key in self._raw
+
+    def __iter__(self):
+        return iter(self._raw)
+
+    def __len__(self):
+        return len(self._raw)
+
+
 class LibcameraRequest:
     def __init__(self, request, device):
         self.request = request
@@ -79,9 +105,7 @@ class LibcameraRequest:
     @property
     def metadata(self):
         if self._metadata is None:
-            self._metadata = {}
-            for k, v in self.request.metadata.items():
-                self._metadata[k.name] = convert_from_libcamera_type(v)
+            self._metadata = LazyMetadata(self.request.metadata)
         return self._metadata
 
     @property
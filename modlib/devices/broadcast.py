@@ -0,0 +1,278 @@
+#
+# Copyright 2026 Sony Semiconductor Solutions Corp. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import List, Optional
+
+from .frame import Frame
+
+
+@dataclass
+class BUFFER_POLICY:
+    """
+    Policy of a frame subscription when its ring buffer is full. Can be used as e.g. `BUFFER_POLICY.DROP_OLDEST`
+    """
+
+    DROP_OLDEST = "drop_oldest"  #: Drop the oldest buffered frame to make room for the new frame.
+    LATEST = "latest"  #: Only keep the latest frame, older unread frames are dropped.
+    BLOCK = "block"  #: Block the producer until the consumer made room (backpressure on the device).
+
+
+class FrameQueue:
+    """
+    Bounded ring buffer of frames between a producer and a consumer thread.
+    When the buffer is full, the `policy` decides to drop the oldest frame or to block the producer.
+
+    Example:
+    ```
+    queue = FrameQueue(maxsize=32, policy=BUFFER_POLICY.BLOCK)
+
+    def consume():
+        for frame in queue:
+            ...
+
+    threading.Thread(target=consume).start()
+    for frame in stream:
+        queue.put(frame)
+    queue.end()
+    ```
+
+    Iterating a queue blocks until the next frame is available. After `end()`, the frames still
+    buffered are returned before the iteration stops.
+    """
+
+    maxsize: int  #: Capacity of the ring buffer.
+    policy: str  #: Buffer policy when the ring buffer is full, see `BUFFER_POLICY`.
+    received: int  #: Number of frames put into the queue.
+    dropped: int  #: Number of frames dropped because the consumer was too slow.
+    blocked_time: float  #: Total time in seconds the producer was blocked by this queue.
+
+    def __init__(self, maxsize: int = 8, policy: str = BUFFER_POLICY.DROP_OLDEST):
+        """
+        Args:
+            maxsize: Capacity of the ring buffer. Defaults to 8, ignored for `BUFFER_POLICY.LATEST`.
+            policy: Policy when the ring buffer is full, see `BUFFER_POLICY`. Defaults to `BUFFER_POLICY.DROP_OLDEST`.
+
+        Raises:
+            ValueError: When the policy or maxsize is invalid.
+        """
+        if policy not in (BUFFER_POLICY.DROP_OLDEST, BUFFER_POLICY.LATEST, BUFFER_POLICY.BLOCK):
+            raise ValueError(
+                f"Invalid buffer policy '{policy}'. Must be one of: "
+                f"{BUFFER_POLICY.DROP_OLDEST}, {BUFFER_POLICY.LATEST}, {BUFFER_POLICY.BLOCK}."
+            )
+        if maxsize < 1:
+            raise ValueError(f"Queue maxsize must be a positive integer, got {maxsize}.")
+
+        self.maxsize = 1 if policy == BUFFER_POLICY.LATEST else maxsize
+        self.policy = policy
+        self.received = 0
+        self.dropped = 0
+        self.blocked_time = 0.0
+
+        self._buffer = deque()
+        self._cond = threading.Condition()
+        self._closed = False
+
+    @property
+    def closed(self) -> bool:
+        """Whether the queue stopped receiving frames."""
+        return self._closed
+
+    def __len__(self) -> int:
+        """Number of frames waiting in the ring buffer."""
+        return len(self._buffer)
+
+    def put(self, frame: Frame):
+        """
+        Put a frame into the ring buffer. Blocks while the buffer is full for `BUFFER_POLICY.BLOCK`,
+        otherwise drops the oldest buffered frame. Ignored once the queue is closed.
+
+        Args:
+            frame: The frame to add.
+        """
+        with self._cond:
+            if self._closed:
+                return
+            self.received += 1
+
+            if len(self._buffer) >= self.maxsize:
+                if self.policy == BUFFER_POLICY.BLOCK:
+                    t0 = time.perf_counter()
+                    while len(self._buffer) >= self.maxsize and not self._closed:
+                        self._cond.wait()
+                    self.blocked_time += time.perf_counter() - t0
+                    if self._closed:
+                        return
+                else:
+                    self._buffer.popleft()
+                    self.dropped += 1
+
+            self._buffer.append(frame)
+            self._cond.notify_all()
+
+    def get(self, timeout: Optional[float] = None) -> Optional[Frame]:
+        """
+        Get the next frame from the ring buffer, waiting until a frame is available.
+
+        Args:
+            timeout: Maximum time in seconds to wait for a frame. Defaults to None, waiting indefinitely.
+
+        Returns:
+            The next frame, or None when the timeout expired or the queue ended.
+        """
+        with self._cond:
+            if not self._cond.wait_for(lambda: self._buffer or self._closed, timeout):
+                return None
+            if not self._buffer:
+                return None
+            frame = self._buffer.popleft()
+            self._cond.notify_all()  # wake up a producer blocked on a full buffer
+            return frame
+
+    def end(self):
+        """
+        Stop receiving frames and release a blocked producer. Buffered frames can still be read.
+        """
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+
+    def close(self):
+        """
+        Stop receiving frames. Pending frames are discarded and waiting calls return.
+        """
+        with self._cond:
+            self._buffer.clear()
+        self.end()
+
+    def __iter__(self):
+        return self
+
+    def __next__(self) -> Frame:
+        frame = self.get()
+        if frame is None:
+            raise StopIteration
+        return frame
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def __repr__(self) -> str:
+        return (
+            f"{type(self).__name__}(policy={self.policy}, maxsize={self.maxsize}, buffered={len(self)}, "
+            f"received={self.received}, dropped={self.dropped})"
+        )
+
+
+class Subscription(FrameQueue):
+    """
+    Consumer side of a frame broadcast with its own bounded ring buffer.
+    Created by `device.subscribe()`, every subscription receives all frames of the device stream
+    independent of the main thread iterating the device and of other subscriptions.
+
+    Example:
+    ```
+    def record(subscription):
+        for frame in subscription:
+            ...
+
+    with device as stream:
+        subscription = device.subscribe(maxsize=32, policy=BUFFER_POLICY.DROP_OLDEST)
+        threading.Thread(target=record, args=(subscription,)).start()
+        for frame in stream:
+            ...
+    ```
+
+    Iterating a subscription blocks until the next frame is available. When the device stream stops,
+    the frames still buffered are returned before the iteration stops.
+    Closing a subscription unsubscribes from the device stream.
+    """
+
+    def __init__(self, broadcaster: "FrameBroadcaster", maxsize: int, policy: str):
+        super().__init__(maxsize, policy)
+        self._broadcaster = broadcaster
+
+    def end(self):
+        """
+        Unsubscribe from the device stream, buffered frames can still be read.
+        """
+        super().end()
+        self._broadcaster._remove(self)
+
+
+class FrameBroadcaster:
+    """
+    Producer side of a frame broadcast, publishing every frame of a device stream to all subscriptions.
+    """
+
+    def __init__(self):
+        self._subscriptions: List[Subscription] = []
+        self._lock = threading.Lock()
+
+    def subscribe(self, maxsize: int = 8, policy: str = BUFFER_POLICY.DROP_OLDEST) -> Subscription:
+        """
+        Create a new subscription to the published frames.
+
+        Args:
+            maxsize: Capacity of the subscription ring buffer. Defaults to 8, ignored for `BUFFER_POLICY.LATEST`.
+            policy: Policy when the ring buffer is full, see `BUFFER_POLICY`. Defaults to `BUFFER_POLICY.DROP_OLDEST`.
+
+        Returns:
+            The new subscription.
+        """
+        subscription = Subscription(self, maxsize, policy)
+        with self._lock:
+            self._subscriptions.append(subscription)
+        return subscription
+
+    def publish(self, frame: Frame):
+        """
+        Publish a frame to all subscriptions. Blocks when a subscription with `BUFFER_POLICY.BLOCK` is full.
+        Must not be called holding a lock the consumers require.
+
+        Args:
+            frame: The frame to publish.
+        """
+        with self._lock:
+            subscriptions = list(self._subscriptions)
+        for subscription in subscriptions:
+            subscription.put(frame)
+
+    def close(self):
+        """
+        End all subscriptions and release a blocked producer. Subscriptions return their remaining
+        buffered frames before their iteration stops. New subscriptions can be created afterwards.
+        """
+        with self._lock:
+            subscriptions = list(self._subscriptions)
+        for subscription in subscriptions:
+            subscription.end()
+
+    def _remove(self, subscription: Subscription):
+        with self._lock:
+            if subscription in self._subscriptions:
+                self._subscriptions.remove(subscription)
+
+    def __len__(self) -> int:
+        """Number of active subscriptions."""
+        return len(self._subscriptions)
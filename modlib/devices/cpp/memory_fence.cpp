@@ -0,0 +1,43 @@
+/*
+ * Copyright 2026 Sony Semiconductor Solutions Corp. All rights reserved.
+ * 
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ * 
+ *    http://www.apache.org/licenses/LICENSE-2.0
+ * 
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ */
+
+#include <Python.h>
+#include <atomic>
+
+// Full memory barrier, orders the shared memory stores and loads of the frame ring seqlock
+// on weakly ordered CPUs (e.g. the aarch64 Raspberry Pi)
+static PyObject* memory_fence(PyObject* self, PyObject* args) {
+    std::atomic_thread_fence(std::memory_order_seq_cst);
+    Py_RETURN_NONE;
+}
+
+static PyMethodDef methods[] = {
+    {"memory_fence", (PyCFunction)memory_fence, METH_NOARGS, NULL},
+    {NULL, NULL, 0, NULL},
+};
+
+// Module: cpp_memory_fence
+static struct PyModuleDef module = {
+    PyModuleDef_HEAD_INIT,
+    "cpp_memory_fence",
+    NULL,
+    -1,
+    methods,
+};
+
+PyMODINIT_FUNC PyInit_cpp_memory_fence(void) {
+    return PyModule_Create(&module);
+}
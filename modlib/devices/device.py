@@ -14,10 +14,12 @@
 # limitations under the License.
 #
 
+import asyncio
 import time
 from abc import ABC, abstractmethod
 from collections import deque
-from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Optional
 
 
 from ..models import Model
@@ -72,6 +74,45 @@ class Rate:
         return str(self.value)
 
 
+class Latency:
+    """
+    A class used to maintain a rolling average latency (e.g., from a camera request to its frame).
+    """
+
+    def __init__(self, window: int = 30):
+        """
+        Initialize the Latency instance with a specified window size.
+
+        Args:
+            window: The maximum number of latencies stored to compute the ongoing average.
+        """
+        self.value = 0.0
+        self.last = 0.0
+        self.max = 0.0
+        self.times = deque(maxlen=window)
+
+    def update(self, latency: float):
+        """
+        Record a new latency, then recalculate and store the new average latency.
+
+        Args:
+            latency: The measured latency in seconds.
+        """
+        self.times.append(latency)
+        self.value = sum(self.times) / len(self.times)
+        self.last = latency
+        self.max = max(self.max, latency)
+
+    def __repr__(self) -> str:
+        """
+        String representation of the current average latency.
+
+        Returns:
+            The current stored average latency in seconds as a string.
+        """
+        return str(self.value)
+
+
 class Device(ABC):
     """
     Abstract base class for devices.
@@ -89,6 +130,16 @@ class Device(ABC):
         for frame in stream:
             ...
     ```
+
+    Every device can also be entered and iterated from an asyncio event loop, e.g. to drive several
+    devices concurrently or to serve frames over a network connection. Example usage:
+    ```
+    async with device as stream:
+        async for frame in stream:
+            ...
+    ```
+    By default the blocking device calls run in a dedicated worker thread per device. Devices that buffer
+    frames from a background thread override `_anext_frame` to wait for new frames without blocking the loop.
     """
 
     def __init__(
@@ -112,6 +163,9 @@ class Device(ABC):
 
         self.start_time = time.perf_counter()
 
+        self._async_executor = None
+        self._async_waiters = []
+
     @abstractmethod
     def deploy(self, model: Model, *args):
         """
@@ -167,3 +221,107 @@ class Device(ABC):
         if self.timeout is not None and elapsed_time > self.timeout:
             self.__exit__(None, None, None)
             raise StopIteration
+
+    async def __aenter__(self):
+        """
+        Enter the device stream from an asyncio event loop.
+        Runs the blocking `__enter__` in the device worker thread.
+        """
+        await asyncio.get_running_loop().run_in_executor(self._get_async_executor(), self.__enter__)
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, exc_traceback):
+        """
+        Exit the device stream from an asyncio event loop.
+        Runs the blocking `__exit__` in the device worker thread and releases the worker thread.
+        """
+        loop = asyncio.get_running_loop()
+        try:
+            await loop.run_in_executor(self._get_async_executor(), self.__exit__, exc_type, exc_value, exc_traceback)
+        finally:
+            self._async_executor.shutdown(wait=False)
+            self._async_executor = None
+
+    def __aiter__(self):
+        """
+        Iterate over the frames in the device stream from an asyncio event loop.
+        """
+        self.__iter__()
+        return self
+
+    async def __anext__(self) -> Frame:
+        """
+        Get the next frame in the device stream without blocking the event loop.
+
+        Returns:
+            The next frame in the device stream.
+        """
+        try:
+            self.check_timeout()
+        except StopIteration:
+            raise StopAsyncIteration
+
+        frame = await self._anext_frame()
+        if frame is None:
+            raise StopAsyncIteration
+        return frame
+
+    async def _anext_frame(self) -> Optional[Frame]:
+        """
+        Get the next frame for the asynchronous iterator, None when the stream has ended.
+        Defaults to running the blocking `__next__` in the device worker thread.
+        """
+        return await asyncio.get_running_loop().run_in_executor(self._get_async_executor(), _next_or_none, self)
+
+    def _get_async_executor(self) -> ThreadPoolExecutor:
+        # One worker thread per device, so a blocking device never stalls other devices on the same loop
+        if self._async_executor is None:
+            self._async_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix=f"modlib-{type(self).__name__}")
+        return self._async_executor
+
+    async def _wait_for_frame(self, take_frame: Callable[[], Optional[Frame]]) -> Frame:
+        """
+        Wait for a frame of a device that buffers frames from a background thread, without blocking the loop.
+        Requires the device to guard its frame buffer with `self._frameslock` and to call
+        `_notify_async_waiters()` (holding the lock) when a new frame is available.
+
+        Args:
+            take_frame: Function returning the next buffered frame, or None when no frame is available.
+                Called while holding `self._frameslock`.
+
+        Returns:
+            The next frame in the device stream.
+        """
+        loop = asyncio.get_running_loop()
+        while True:
+            waiter = loop.create_future()
+            with self._frameslock:
+                frame = take_frame()
+                if frame is not None:
+                    return frame
+                self._async_waiters.append((loop, waiter))
+            await waiter
+
+    def _notify_async_waiters(self):
+        """
+        Wake up all coroutines waiting in `_wait_for_frame`. Must be called holding `self._frameslock`.
+        """
+        for loop, waiter in self._async_waiters:
+            try:
+                loop.call_soon_threadsafe(_set_waiter, waiter)
+            except RuntimeError:
+                pass  # event loop already closed
+        self._async_waiters.clear()
+
+
+def _next_or_none(device: Device) -> Optional[Frame]:
+    # StopIteration can not be raised through a future
+    try:
+        return next(device)
+    except StopIteration:
+        return None
+
+
+def _set_waiter(waiter: asyncio.Future):
+    if not waiter.done():
+        waiter.set_result(None)
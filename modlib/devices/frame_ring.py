@@ -0,0 +1,455 @@
+#
+# Copyright 2026 Sony Semiconductor Solutions Corp. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import logging
+import mmap
+import os
+import platform
+import time
+from multiprocessing import shared_memory
+from typing import Optional
+
+import numpy as np
+
+from .frame import Frame
+from .playback.codecs import BinaryCodec
+
+try:
+    from .cpp_memory_fence import memory_fence as _memory_fence
+except ImportError:  # extension module not built
+    _memory_fence = None
+
+logger = logging.getLogger(__name__.split(".")[-1])
+
+_MAGIC = b"MODLIBFR"
+_VERSION = 1
+
+_HEADER_DTYPE = np.dtype(
+    [
+        ("magic", "S8"),
+        ("version", "<u4"),
+        ("num_slots", "<u4"),
+        ("image_capacity", "<u8"),
+        ("meta_capacity", "<u8"),
+        ("head", "<u8"),  # index of the next frame to publish
+        ("closed", "<u4"),
+        ("reserved", "V20"),
+    ]
+)
+
+_SLOT_DTYPE = np.dtype(
+    [
+        ("seq", "<u8"),  # seqlock counter, odd while the producer writes the slot
+        ("index", "<u8"),  # frame index stored in the slot
+        ("meta_len", "<u8"),
+        ("image_len", "<u8"),
+        ("shape", "<u4", (3,)),
+        ("ndim", "<u4"),
+        ("dtype", "S8"),
+        ("reserved", "V8"),
+    ]
+)
+
+_ALIGN = 64
+_SHM_DIR = "/dev/shm"
+_X86_MACHINES = ("x86_64", "amd64", "i386", "i686", "x86")
+
+
+def _aligned(n: int) -> int:
+    return (n + _ALIGN - 1) & ~(_ALIGN - 1)
+
+
+class _RingLayout:
+    # Header | slot headers | slot data (image capacity + meta capacity per slot)
+
+    def __init__(self, buf: memoryview):
+        self.header = np.ndarray((), dtype=_HEADER_DTYPE, buffer=buf)
+        self.num_slots = int(self.header["num_slots"])
+        self.image_capacity = int(self.header["image_capacity"])
+        self.meta_capacity = int(self.header["meta_capacity"])
+        self.slots = np.ndarray((self.num_slots,), dtype=_SLOT_DTYPE, buffer=buf, offset=_HEADER_DTYPE.itemsize)
+        self.data_offset = _aligned(_HEADER_DTYPE.itemsize + self.num_slots * _SLOT_DTYPE.itemsize)
+        self.slot_size = self.image_capacity + self.meta_capacity
+
+    @staticmethod
+    def size(num_slots: int, image_capacity: int, meta_capacity: int) -> int:
+        return _aligned(_HEADER_DTYPE.itemsize + num_slots * _SLOT_DTYPE.itemsize) + num_slots * (
+            image_capacity + meta_capacity
+        )
+
+    def image_offset(self, slot: int) -> int:
+        return self.data_offset + slot * self.slot_size
+
+    def meta_offset(self, slot: int) -> int:
+        return self.image_offset(slot) + self.image_capacity
+
+
+def _fence():
+    # Orders the seqlock loads and stores between processes. Without the extension module the ring relies on the
+    # ordered stores and loads of x86 (TSO), the Python interpreter never reorders them.
+    if _memory_fence is not None:
+        _memory_fence()
+
+
+def _check_memory_ordering():
+    if _memory_fence is None and platform.machine().lower() not in _X86_MACHINES:
+        logger.warning(
+            "The frame ring memory fence extension is not built, "
+            f"consumers on {platform.machine()} may read torn frames."
+        )
+
+
+class FrameRing:
+    """
+    Producer side of a shared-memory frame ring, delivering frames of any device to other processes
+    without pickling them. Consumer processes attach by name with `FrameRingReader`.
+
+    Every frame is written into one of `num_slots` fixed size slots: the image planes as raw pixels and
+    the remaining frame attributes and detections serialised with the `BinaryCodec`. Slots are protected
+    by a seqlock: the producer never waits for consumers, a consumer that falls more than `num_slots`
+    frames behind skips the overwritten frames. The seqlock is ordered by memory fences of the compiled
+    `cpp_memory_fence` extension, without it the ring is only safe on x86 CPUs.
+
+    Example:
+    ```
+    ring = FrameRing(name="modlib_frames", max_image_bytes=640 * 480 * 3)
+    with device as stream:
+        for frame in stream:
+            ring.publish(frame)
+    ring.close()
+    ```
+    """
+
+    name: str  #: Name of the shared-memory segment consumers attach to.
+    num_slots: int  #: Number of frame slots in the ring.
+    published: int  #: Number of frames published to the ring.
+
+    def __init__(
+        self,
+        name: Optional[str] = None,
+        num_slots: int = 8,
+        max_image_bytes: int = 640 * 480 * 3,
+        max_meta_bytes: int = 256 * 1024,
+    ):
+        """
+        Args:
+            name: Name of the shared-memory segment. Defaults to None, generating a unique name.
+            num_slots: Number of frame slots. Consumer zero-copy views stay valid for `num_slots - 1` frames.
+            max_image_bytes: Capacity of the image planes of every slot in bytes.
+            max_meta_bytes: Capacity of the serialised frame attributes and detections of every slot in bytes.
+
+        Raises:
+            ValueError: When the ring geometry is invalid.
+            FileExistsError: When a shared-memory segment with the given name already exists.
+        """
+        if num_slots < 2:
+            raise ValueError(f"Frame ring needs at least 2 slots, got {num_slots}.")
+        if max_image_bytes < 0 or max_meta_bytes <= 0:
+            raise ValueError("Frame ring slot capacities must be positive.")
+        _check_memory_ordering()
+
+        image_capacity = _aligned(max_image_bytes)
+        meta_capacity = _aligned(max_meta_bytes)
+        self._shm = shared_memory.SharedMemory(
+            name=name, create=True, size=_RingLayout.size(num_slots, image_capacity, meta_capacity)
+        )
+
+        header = np.ndarray((), dtype=_HEADER_DTYPE, buffer=self._shm.buf)
+        header["num_slots"] = num_slots
+        header["image_capacity"] = image_capacity
+        header["meta_capacity"] = meta_capacity
+        header["version"] = _VERSION
+        _fence()
+        header["magic"] = _MAGIC  # written last, marks the ring as initialised
+        del header
+
+        self._layout = _RingLayout(self._shm.buf)
+        self._codec = BinaryCodec(image_format="raw")
+
+        self.name = self._shm.name
+        self.num_slots = num_slots
+        self.published = 0
+
+    def publish(self, frame: Frame):
+        """
+        Publish a frame to the ring, overwriting the oldest slot. Never blocks on consumers.
+
+        Args:
+            frame: The frame to publish, the image is omitted when running headless.
+
+        Raises:
+            ValueError: When the image or the serialised detections exceed the slot capacity.
+        """
+        layout = self._layout
+        if layout is None:
+            raise ValueError("Frame ring is closed.")
+
+        image = frame._image
+        if image is not None:
+            image = np.ascontiguousarray(image)
+            if image.nbytes > layout.image_capacity or image.ndim > 3:
+                raise ValueError(
+                    f"Image of shape {image.shape} does not fit the frame ring slot ({layout.image_capacity} bytes)."
+                )
+        meta = self._codec.dumps(frame, image=False)
+        if len(meta) > layout.meta_capacity:
+            raise ValueError(f"Serialised detections ({len(meta)} bytes) exceed the frame ring slot capacity.")
+
+        index = int(layout.header["head"])
+        slot_id = index % layout.num_slots
+        slot = layout.slots[slot_id : slot_id + 1]
+        seq = int(slot["seq"][0])
+
+        slot["seq"] = seq + 1  # odd: slot is being written
+        _fence()
+        slot["index"] = index
+        slot["meta_len"] = len(meta)
+        if image is not None:
+            offset = layout.image_offset(slot_id)
+            self._shm.buf[offset : offset + image.nbytes] = image.reshape(-1).view(np.uint8)
+            slot["image_len"] = image.nbytes
+            slot["ndim"] = image.ndim
+            slot["shape"] = image.shape + (0,) * (3 - image.ndim)
+            slot["dtype"] = image.dtype.str.encode()
+        else:
+            slot["image_len"] = 0
+            slot["ndim"] = 0
+        offset = layout.meta_offset(slot_id)
+        self._shm.buf[offset : offset + len(meta)] = meta
+        _fence()
+        slot["seq"] = seq + 2  # even: slot is consistent
+        _fence()
+
+        layout.header["head"] = index + 1
+        self.published += 1
+
+    def close(self):
+        """
+        Mark the stream as ended and remove the shared-memory segment.
+        Attached consumers return the remaining frames before their iteration stops.
+        """
+        if self._layout is None:
+            return
+        _fence()
+        self._layout.header["closed"] = 1
+        self._layout = None
+        self._shm.close()
+        self._shm.unlink()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def __repr__(self) -> str:
+        return f"FrameRing(name={self.name}, num_slots={self.num_slots}, published={self.published})"
+
+
+class FrameRingReader:
+    """
+    Consumer side of a shared-memory frame ring, attached by the name of a `FrameRing` in another process.
+
+    Frames are returned with their image as a read-only zero-copy numpy view into the shared memory.
+    The view stays valid until the producer wraps around the ring; use `is_valid` after processing to detect
+    a frame that was overwritten meanwhile, or request a private copy with `get(copy=True)`.
+
+    Example:
+    ```
+    reader = FrameRingReader("modlib_frames")
+    for frame in reader:
+        encoder.write(frame.image)
+    ```
+    """
+
+    POLL_INTERVAL = 0.0005  #: Interval in seconds at which a waiting consumer polls for new frames.
+
+    name: str  #: Name of the attached shared-memory segment.
+    received: int  #: Number of frames read from the ring.
+    dropped: int  #: Number of frames overwritten before they were read.
+
+    def __init__(self, name: str):
+        """
+        Args:
+            name: Name of the shared-memory segment, as in `FrameRing.name`.
+
+        Raises:
+            FileNotFoundError: When no frame ring with the given name exists.
+            ValueError: When the shared-memory segment is not a frame ring.
+        """
+        _check_memory_ordering()
+        self._mmap = _attach(name)
+        self._buf = memoryview(self._mmap)
+        header = np.ndarray((), dtype=_HEADER_DTYPE, buffer=self._buf)
+        magic = header["magic"]
+        _fence()
+        if magic != _MAGIC or header["version"] != _VERSION:
+            del header
+            self._buf.release()
+            self._mmap.close()
+            raise ValueError(f"Shared-memory segment '{name}' is not a frame ring.")
+        del header
+
+        self._layout = _RingLayout(self._buf)
+        self._codec = BinaryCodec()
+        self._next = int(self._layout.header["head"])  # start at the next published frame
+
+        self.name = name
+        self.received = 0
+        self.dropped = 0
+
+    def get(self, timeout: Optional[float] = None, latest: bool = False, copy: bool = False) -> Optional[Frame]:
+        """
+        Get the next frame from the ring, waiting until a frame is published.
+
+        Args:
+            timeout: Maximum time in seconds to wait for a frame. Defaults to None, waiting indefinitely.
+            latest: Skip to the most recently published frame. Defaults to False, reading every frame.
+            copy: Return a private copy of the image instead of a zero-copy view. Defaults to False.
+
+        Returns:
+            The next frame, or None when the timeout expired or the producer closed the ring.
+        """
+        layout = self._layout
+        deadline = None if timeout is None else time.perf_counter() + timeout
+
+        while True:
+            head = int(layout.header["head"])
+            _fence()
+            if self._next < head:
+                oldest = head - 1 if latest else head - layout.num_slots
+                if self._next < oldest:
+                    self.dropped += oldest - self._next
+                    self._next = oldest
+
+                frame = self._read(self._next % layout.num_slots, self._next, copy)
+                self._next += 1
+                if frame is None:
+                    self.dropped += 1  # overwritten while reading
+                    continue
+                self.received += 1
+                return frame
+
+            _fence()
+            if layout.header["closed"] and self._next >= int(layout.header["head"]):
+                return None
+            if deadline is not None and time.perf_counter() >= deadline:
+                return None
+            time.sleep(self.POLL_INTERVAL)
+
+    def is_valid(self, frame: Frame) -> bool:
+        """
+        Check if the zero-copy image of a frame read from this ring was not overwritten by the producer.
+
+        Args:
+            frame: Frame returned by `get`.
+
+        Returns:
+            Whether the slot still holds the frame.
+        """
+        slot_id, seq = frame._ring_slot
+        _fence()
+        return int(self._layout.slots["seq"][slot_id]) == seq
+
+    def _read(self, slot_id: int, index: int, copy: bool) -> Optional[Frame]:
+        layout = self._layout
+        slot = layout.slots[slot_id]
+
+        seq = int(slot["seq"])
+        _fence()
+        if seq & 1 or int(slot["index"]) != index:
+            return None
+
+        try:
+            frame = self._codec.decode_at(self._buf, layout.meta_offset(slot_id))
+        except Exception:
+            _fence()
+            if int(layout.slots["seq"][slot_id]) != seq:
+                return None  # torn read of a slot that is being rewritten
+            raise
+
+        if int(slot["image_len"]):
+            ndim = int(slot["ndim"])
+            image = np.ndarray(
+                tuple(int(v) for v in slot["shape"][:ndim]),
+                dtype=np.dtype(slot["dtype"].decode()),
+                buffer=self._mmap,
+                offset=layout.image_offset(slot_id),
+            )
+            if copy:
+                image = image.copy()
+            else:
+                image.flags.writeable = False
+            frame.image = image
+
+        # Validate the slot was not rewritten while reading
+        _fence()
+        if int(layout.slots["seq"][slot_id]) != seq:
+            return None
+        frame._ring_slot = (slot_id, seq)
+        return frame
+
+    def close(self):
+        """
+        Detach from the frame ring. The shared memory is released once no zero-copy views are referenced.
+        """
+        if self._layout is None:
+            return
+        self._layout = None
+        self._buf.release()
+        try:
+            self._mmap.close()
+        except BufferError:
+            pass  # zero-copy frames still reference the mapping, it is unmapped with the last view
+
+    def __iter__(self):
+        return self
+
+    def __next__(self) -> Frame:
+        frame = self.get()
+        if frame is None:
+            raise StopIteration
+        return frame
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def __repr__(self) -> str:
+        return f"FrameRingReader(name={self.name}, received={self.received}, dropped={self.dropped})"
+
+
+def _attach(name: str) -> mmap.mmap:
+    # Map the segment without the resource tracker of `SharedMemory`, which would unlink the segment
+    # of the producer when the consumer process exits
+    if platform.system() == "Windows":
+        header = mmap.mmap(-1, _HEADER_DTYPE.itemsize, tagname=name)
+        info = np.frombuffer(header, dtype=_HEADER_DTYPE, count=1)[0]
+        size = _RingLayout.size(int(info["num_slots"]), int(info["image_capacity"]), int(info["meta_capacity"]))
+        del info
+        header.close()
+        return mmap.mmap(-1, size, tagname=name)
+
+    elif platform.system() == "Linux":
+        fd = os.open(os.path.join(_SHM_DIR, name.lstrip("/")), os.O_RDWR)
+        try:
+            return mmap.mmap(fd, os.fstat(fd).st_size)
+        finally:
+            os.close(fd)
+    else:
+        raise ValueError("Unsupported platform")
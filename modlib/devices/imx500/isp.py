@@ -14,7 +14,8 @@
 # limitations under the License.
 #
 
-from typing import Tuple
+from functools import lru_cache
+from typing import Optional, Sequence, Tuple
 
 import cv2
 import numpy as np
@@ -92,7 +93,7 @@ def isp_resize_and_crop(img: np.ndarray, model: Model) -> Tuple[np.ndarray, ROI]
     return r, roi
 
 
-def isp_normalize_and_quantscale(t: np.ndarray, model: Model) -> np.ndarray:
+def isp_normalize_and_quantscale(t: np.ndarray, model: Model, out: Optional[np.ndarray] = None) -> np.ndarray:
     """
     Normalization and quantization scaling of the input tensor.
     This function does the equivalent of the following things simultaneously:
@@ -102,6 +103,7 @@ def isp_normalize_and_quantscale(t: np.ndarray, model: Model) -> np.ndarray:
     Args:
         t: Input tensor
         model: Model to normalize and quantscale the input tensor for.
+        out: Optional preallocated CHW output tensor of the model dtype and the shape of `t`.
 
     Returns:
         Normalized and quantized input tensor.
@@ -134,6 +136,19 @@ def isp_normalize_and_quantscale(t: np.ndarray, model: Model) -> np.ndarray:
     norm_shift = model.info["input_tensor"]["norm_shift"]
     div_val = model.info["input_tensor"]["div_val"]
     div_shift = model.info["input_tensor"]["div_shift"]
+    dtype = model.info["input_tensor"]["dtype"]
+
+    if t.dtype == np.uint8:
+        # An uint8 input has only 256 possible values per channel, look up the precomputed result
+        lut = _normalize_lut(tuple(norm_val), tuple(norm_shift), tuple(div_val), div_shift, np.dtype(dtype).str)
+        if out is None:
+            out = np.empty(t.shape, dtype=lut.dtype)
+        for i in [0, 1, 2]:
+            if lut.itemsize == 1:
+                cv2.LUT(t[i], lut[i], dst=out[i])
+            else:
+                np.take(lut[i], t[i], out=out[i])
+        return out
 
     t = t.astype(np.int32)  # uint8 > int32 just for calculations
 
@@ -144,11 +159,13 @@ def isp_normalize_and_quantscale(t: np.ndarray, model: Model) -> np.ndarray:
         t[i] = (((t[i] * div_val[i]) >> div_shift) + norm_val[i]) >> norm_shift[i]
 
     # t range now -128-127 or 0-255 depending on dtype
-    dtype = model.info["input_tensor"]["dtype"]
+    if out is not None:
+        out[...] = t
+        return out
     return t.astype(dtype)
 
 
-def isp_denormalize_input_tensor(t: np.ndarray, model: Model) -> np.ndarray:
+def isp_denormalize_input_tensor(t: np.ndarray, model: Model, out: Optional[np.ndarray] = None) -> np.ndarray:
     """
     Denormalization of the input tensor.
     This function denormalizes the input tensor of any applied normalization and quantization scaling.
@@ -157,35 +174,90 @@ def isp_denormalize_input_tensor(t: np.ndarray, model: Model) -> np.ndarray:
     Args:
         t: Input tensor
         model: Model to denormalize the input tensor for.
+        out: Optional preallocated HxWx3 uint8 output image. A new image is allocated when not provided.
 
     Returns:
         Denormalized input tensor as a image in HWC format.
     """
 
-    norm_val = model.info["input_tensor"]["norm_val"]
-    norm_shift = model.info["input_tensor"]["norm_shift"]
-    div_val = model.info["input_tensor"]["div_val"]
-    div_shift = model.info["input_tensor"]["div_shift"]
-
     w, h = model.input_tensor_size
     H_pad = h + (h % 2)
     W_pad = w + (32 - (w % 32) if w % 32 != 0 else 0)
 
-    if int(np.asarray(t).size) == 3 * h * w:
-        r1 = np.array(t, dtype=np.uint8).astype(np.int32).reshape((3, h, w))  # CHW
-    elif int(np.asarray(t).size) == 3 * H_pad * W_pad:
-        r1 = np.array(t, dtype=np.uint8).astype(np.int32).reshape((3, H_pad, W_pad))[:, :h, :w]  # CHW
+    r1 = _as_uint8(t)
+    if r1.size == 3 * h * w:
+        r1 = r1.reshape((3, h, w))  # CHW
+    elif r1.size == 3 * H_pad * W_pad:
+        r1 = r1.reshape((3, H_pad, W_pad))[:, :h, :w]  # CHW
     else:
         raise ValueError(
-            f"Unexpected input tensor size: got {int(np.asarray(t).size)} elements, expected {3 * h * w} "
+            f"Unexpected input tensor size: got {r1.size} elements, expected {3 * h * w} "
             f"(3x{h}x{w}) or {3 * H_pad * W_pad} (3x{H_pad}x{W_pad})."
         )
 
-    for i in [0, 1, 2]:
-        r1[i] = ((((r1[i] << norm_shift[i]) - norm_val[i]) << div_shift) // div_val[i]) & 0xFF
+    return isp_denormalize_chw(r1, model, out)
+
+
+def isp_denormalize_chw(r1: np.ndarray, model: Model, out: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Denormalize a 3xHxW uint8 input tensor (the raw bytes of the int8 or uint8 tensor) into a HxWx3 image.
+
+    Args:
+        r1: Input tensor in CHW format as uint8.
+        model: Model to denormalize the input tensor for.
+        out: Optional preallocated HxWx3 uint8 output image. A new image is allocated when not provided.
+
+    Returns:
+        Denormalized input tensor as a image in HWC format.
+    """
+    _assert_3chw(r1)
+
+    norm_val = model.info["input_tensor"]["norm_val"]
+    norm_shift = model.info["input_tensor"]["norm_shift"]
+    div_val = model.info["input_tensor"]["div_val"]
+    div_shift = model.info["input_tensor"]["div_shift"]
+    lut = _denormalize_lut(tuple(norm_val), tuple(norm_shift), tuple(div_val), div_shift)
 
-    input_tensor_image = np.transpose(r1, (1, 2, 0)).astype(np.uint8).copy()  # CHW -> HWC
-    return input_tensor_image
+    # Interleave CHW -> HWC into the output image, then apply the per channel lookup table in place
+    if out is None:
+        out = np.empty((r1.shape[1], r1.shape[2], 3), dtype=np.uint8)
+    cv2.merge([r1[0], r1[1], r1[2]], dst=out)
+    cv2.LUT(out, lut, dst=out)
+    return out
+
+
+def _as_uint8(t) -> np.ndarray:
+    # Raw bytes of the int8/uint8 input tensor, without a copy for numpy arrays
+    if isinstance(t, np.ndarray) and t.dtype.itemsize == 1:
+        return t.view(np.uint8).ravel()
+    return np.asarray(t).astype(np.uint8).ravel()  # wraps signed values
+
+
+@lru_cache(maxsize=16)
+def _normalize_lut(
+    norm_val: Sequence[int], norm_shift: Sequence[int], div_val: Sequence[int], div_shift: int, dtype: str
+) -> np.ndarray:
+    # (3, 256) lookup table of `isp_normalize_and_quantscale` for every uint8 value of each channel
+    x = np.arange(256, dtype=np.int32)
+    lut = np.stack([(((x * div_val[i]) >> div_shift) + norm_val[i]) >> norm_shift[i] for i in [0, 1, 2]])
+    lut = lut.astype(dtype)
+    lut.flags.writeable = False
+    return lut
+
+
+@lru_cache(maxsize=16)
+def _denormalize_lut(
+    norm_val: Sequence[int], norm_shift: Sequence[int], div_val: Sequence[int], div_shift: int
+) -> np.ndarray:
+    # (256, 1, 3) lookup table of `isp_denormalize_input_tensor` indexed by the raw input tensor byte,
+    # in the layout of cv2.LUT for 3 channel images
+    q = np.arange(256, dtype=np.int32)
+    lut = np.stack(
+        [((((q << norm_shift[i]) - norm_val[i]) << div_shift) // div_val[i]) & 0xFF for i in [0, 1, 2]], axis=-1
+    )
+    lut = np.ascontiguousarray(lut.astype(np.uint8).reshape(256, 1, 3))
+    lut.flags.writeable = False
+    return lut
 
 
 def isp_padding(t: np.ndarray, model: Model) -> np.ndarray:
@@ -15,17 +15,84 @@
 #
 
 import io
+import json
 import atexit
-from typing import Optional, List, Union
+import asyncio
+import struct
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, Optional, List, Union
 
 import requests
 import numpy as np
+from requests.adapters import HTTPAdapter
 
 from modlib.devices.device import Device, Rate
 from modlib.devices.frame import IMAGE_TYPE, Frame
 from modlib.devices.sources import Source
 from modlib.models import Model, Classifications, Detections, Poses, Segments, InstanceSegments, Anomaly
 
+#: Content type of the raw tensor transport, see `encode_tensors`.
+RAW_TENSORS_CONTENT_TYPE = "application/x-modlib-tensors"
+
+
+def encode_tensors(tensors: Dict[str, np.ndarray]) -> bytearray:
+    """
+    Serialise named tensors into a single buffer for the raw tensor transport.
+
+    Every tensor is stored as a little-endian uint32 header length, a JSON header
+    `{"name": ..., "dtype": ..., "shape": [...]}` padded to 8 bytes and the C-contiguous tensor data.
+    Compared to `.npy`/`.npz` containers the tensor data is copied only once into the request body.
+
+    Args:
+        tensors: Dictionary of tensor name and tensor.
+
+    Returns:
+        The encoded buffer.
+    """
+    headers, sizes = [], []
+    for name, tensor in tensors.items():
+        header = json.dumps({"name": name, "dtype": tensor.dtype.str, "shape": tensor.shape}).encode()
+        headers.append(header + b" " * (-(4 + len(header)) % 8))
+        sizes.append(tensor.nbytes + (-tensor.nbytes % 8))
+
+    buffer = bytearray(sum(4 + len(h) + n for h, n in zip(headers, sizes)))
+    offset = 0
+    for header, size, tensor in zip(headers, sizes, tensors.values()):
+        struct.pack_into("<I", buffer, offset, len(header))
+        buffer[offset + 4 : offset + 4 + len(header)] = header
+        offset += 4 + len(header)
+        np.frombuffer(buffer, dtype=tensor.dtype, count=tensor.size, offset=offset).reshape(tensor.shape)[...] = tensor
+        offset += size
+
+    return buffer
+
+
+def decode_tensors(buffer: Union[bytes, bytearray, memoryview]) -> Dict[str, np.ndarray]:
+    """
+    Deserialise a buffer of the raw tensor transport, see `encode_tensors`.
+    The returned tensors are views into the given buffer, pass a `bytearray` for writable tensors.
+
+    Args:
+        buffer: The encoded buffer.
+
+    Returns:
+        Dictionary of tensor name and tensor, in the encoded order.
+    """
+    tensors = {}
+    offset = 0
+    while offset < len(buffer):
+        (header_size,) = struct.unpack_from("<I", buffer, offset)
+        header = json.loads(bytes(buffer[offset + 4 : offset + 4 + header_size]))
+        offset += 4 + header_size
+
+        dtype, shape = np.dtype(header["dtype"]), tuple(header["shape"])
+        count = int(np.prod(shape, dtype=np.int64))
+        tensors[header["name"]] = np.frombuffer(buffer, dtype=dtype, count=count, offset=offset).reshape(shape)
+        offset += count * dtype.itemsize + (-count * dtype.itemsize % 8)
+
+    return tensors
+
 
 class InterpreterClient(Device):
     """
@@ -40,6 +107,13 @@ class InterpreterClient(Device):
     - `POST /infer/<session_id>` to run inference for that session
     - `DELETE /session/<session_id>` to close the session
 
+    And optionally, when running with a `batch_size` > 1:
+    - `POST /infer_batch/<session_id>` to run inference for a batch of input tensors
+
+    All requests reuse the connections of a keep-alive session. Tensors are sent either as `.npy` file upload
+    (returning a `.npz` archive) or, with `transport="raw"`, as raw tensor bytes with a small shape/dtype header.
+    Setting `pipeline` keeps multiple inference requests in flight while frames are still returned in order.
+
     Please read the interpreter server documentation for more details on how to build and run it.
     """
 
@@ -50,6 +124,9 @@ class InterpreterClient(Device):
         headless: Optional[bool] = False,
         timeout: Optional[int] = None,
         enable_input_tensor: Optional[bool] = False,
+        batch_size: int = 1,
+        transport: str = "npy",
+        pipeline: int = 0,
     ):
         """
         Initialize the interpreter client device.
@@ -60,6 +137,12 @@ class InterpreterClient(Device):
             headless: Disable image processing when set. Defaults to False.
             timeout: Optional timeout in seconds for the device loop. Defaults to None.
             enable_input_tensor: When enabling input tensor, `frame.image` will be replaced by the input tensor image.
+            batch_size: Number of source frames sent to the interpreter server in a single `/infer_batch` request.
+                Defaults to 1, sending every frame separately to the `/infer` endpoint.
+            transport: Tensor serialisation, `"npy"` (file upload of a `.npy`, `.npz` response) or `"raw"`
+                (raw tensor bytes with a shape/dtype header, see `encode_tensors`). Defaults to `"npy"`.
+            pipeline: Number of inference requests kept in flight by a pool of worker threads.
+                Frames are returned in source order. Defaults to 0, running every request synchronously.
         """
         super().__init__(
             headless=headless,
@@ -67,8 +150,28 @@ class InterpreterClient(Device):
             timeout=timeout,
         )
 
+        if batch_size < 1:
+            raise ValueError(f"Batch size must be a positive integer, got {batch_size}.")
+        if transport not in ("npy", "raw"):
+            raise ValueError(f"Invalid transport '{transport}'. Must be 'npy' or 'raw'.")
+        if pipeline < 0:
+            raise ValueError(f"Pipeline depth must be a non-negative integer, got {pipeline}.")
+
         self.source = source
         self.endpoint = endpoint
+        self.batch_size = batch_size
+        self.transport = transport
+        self.pipeline = pipeline
+        self._frame_buffer = deque()
+        self._in_flight = deque()
+        self._source_exhausted = False
+        self._executor = None
+
+        # Keep-alive connections, one per request in flight
+        self._session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=max(pipeline, 1))
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
 
         self.model = None
         self.fps = Rate()
@@ -96,7 +199,7 @@ class InterpreterClient(Device):
             )
         print(f"Connecting to interpreter server: {self.endpoint}")
 
-        r = requests.post(
+        r = self._session.post(
             f"{self.endpoint}/init",
             json=data,
         )
@@ -121,7 +224,7 @@ class InterpreterClient(Device):
         `requests.get(<endpoint>/input_tensor_size/<session_id>)`
         And expect a response with the input tensor size in the body.
         """
-        r = requests.get(f"{self.endpoint}/input_tensor_size/{self.session_id}")
+        r = self._session.get(f"{self.endpoint}/input_tensor_size/{self.session_id}")
 
         try:
             r.raise_for_status()
@@ -157,61 +260,184 @@ class InterpreterClient(Device):
             )
 
         self.fps.init()
+        self._frame_buffer.clear()
+        self._in_flight.clear()
+        self._source_exhausted = False
+        if self.pipeline and self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.pipeline, thread_name_prefix="modlib-infer")
         return self
 
     def __next__(self):
         """
         Fetch the next frame, run inference if a model is set, and return a frame.
+        With a `batch_size` > 1 the next batch of source frames is inferred at once and returned one by one.
 
         Returns:
             Frame with optional detections and performance metadata.
         """
         self.check_timeout()
-        self.fps.update()
 
-        input_frame = self.source.get_frame()
-        if input_frame is None:
+        if not self._frame_buffer:
+            self._fill_frame_buffer()
+        if not self._frame_buffer:
             raise StopIteration
 
-        if self.model:
-            # Pre-process
-            it_image, it, roi = self.model.pre_process(input_frame.copy())
-            if self.enable_input_tensor:
+        return self._pop_frame()
+
+    async def _anext_frame(self) -> Optional[Frame]:
+        """
+        Asynchronous counterpart of `__next__`. Reading and pre-processing the source frames runs in the
+        device worker thread, while pipelined inference requests are awaited on the event loop.
+        """
+        if not self._frame_buffer:
+            loop = asyncio.get_running_loop()
+            executor = self._get_async_executor()
+            while not self._source_exhausted and len(self._in_flight) < max(self.pipeline, 1):
+                self._add_in_flight(await loop.run_in_executor(executor, self._read_batch))
+
+            if not self._in_flight:
+                return None
+
+            inputs, pre_processed, results = self._in_flight.popleft()
+            if isinstance(results, Future):
+                results = await asyncio.wrap_future(results)
+            self._buffer_frames(inputs, pre_processed, results)
+
+        return self._pop_frame()
+
+    def _pop_frame(self) -> Frame:
+        self.fps.update()
+        frame = self._frame_buffer.popleft()
+        frame.fps = frame.dps = self.fps.value
+        return frame
+
+    def _fill_frame_buffer(self):
+        """
+        Keep up to `pipeline` batches in flight and buffer the frames of the oldest batch.
+        """
+        while not self._source_exhausted and len(self._in_flight) < max(self.pipeline, 1):
+            self._add_in_flight(self._read_batch())
+
+        if not self._in_flight:
+            return
+
+        inputs, pre_processed, results = self._in_flight.popleft()
+        if isinstance(results, Future):
+            results = results.result()
+        self._buffer_frames(inputs, pre_processed, results)
+
+    def _add_in_flight(self, batch):
+        if batch is None:
+            self._source_exhausted = True
+        else:
+            self._in_flight.append(batch)
+
+    def _buffer_frames(self, inputs: list, pre_processed: list, results: list):
+        for (input_frame, timestamp), (it_image, _, roi), detections in zip(inputs, pre_processed, results):
+            if self.model and self.enable_input_tensor:
                 image = it_image
                 image_type = IMAGE_TYPE.INPUT_TENSOR
                 w, h, c = image.shape
                 color_format = self.model.color_format
-                # roi = ROI(left=0, top=0, width=1, height=1) not needed?
             else:
                 image = input_frame
                 image_type = IMAGE_TYPE.SOURCE
                 w, h, c = self.source.width, self.source.height, self.source.channels
                 color_format = self.source.color_format
 
-            # Infer
-            detections = self.infer(it)
+            self._frame_buffer.append(
+                Frame(
+                    timestamp=timestamp,
+                    image=image,
+                    image_type=image_type,
+                    width=w,
+                    height=h,
+                    channels=c,
+                    detections=detections,
+                    new_detection=True if self.model else False,
+                    fps=self.fps.value,
+                    dps=self.fps.value,
+                    color_format=color_format,
+                    roi=roi,
+                    frame_count=0,
+                )
+            )
+
+    def _read_batch(self):
+        """
+        Read up to `batch_size` frames from the source, pre-process them and start the inference.
+
+        Returns:
+            Tuple of the input frames with their timestamp, the pre-processed inputs and the results
+            (or a future of the results when pipelining). None when the source is exhausted.
+        """
+        inputs = []
+        for _ in range(self.batch_size):
+            input_frame = self.source.get_frame()
+            if input_frame is None:
+                break
+            inputs.append((input_frame, self.source.timestamp.isoformat()))
+
+        if not inputs:
+            return None
+
+        if not self.model:
+            return inputs, [(None, None, None)] * len(inputs), [None] * len(inputs)
+
+        # Pre-process
+        pre_processed = [self.model.pre_process(input_frame.copy()) for input_frame, _ in inputs]
+        input_tensors = [it for _, it, _ in pre_processed]
+
+        # Infer
+        if self._executor:
+            results = self._executor.submit(self._infer_inputs, input_tensors)
         else:
-            image = input_frame
-            image_type = IMAGE_TYPE.SOURCE
-            w, h, c = self.source.width, self.source.height, self.source.channels
-            color_format = self.source.color_format
-            detections = None
-
-        return Frame(
-            timestamp=self.source.timestamp.isoformat(),
-            image=image,
-            image_type=image_type,
-            width=w,
-            height=h,
-            channels=c,
-            detections=detections,
-            new_detection=True if self.model else False,
-            fps=self.fps.value,
-            dps=self.fps.value,
-            color_format=color_format,
-            roi=roi,
-            frame_count=0,
+            results = self._infer_inputs(input_tensors)
+
+        return inputs, pre_processed, results
+
+    def _infer_inputs(self, input_tensors: List[np.ndarray]) -> list:
+        if len(input_tensors) == 1:
+            return [self.infer(input_tensors[0])]
+        return self.infer_batch(input_tensors)
+
+    def _post_tensor(self, path: str, input_tensor: np.ndarray) -> List[np.ndarray]:
+        """
+        Send an input tensor to an inference endpoint using the configured transport.
+
+        Args:
+            path: Endpoint path, e.g. `infer` or `infer_batch`.
+            input_tensor: Input tensor including the batch dimension.
+
+        Returns:
+            List of output tensors from the interpreter server, sorted by name.
+        """
+        url = f"{self.endpoint}/{path}/{self.session_id}"
+
+        if self.transport == "raw":
+            r = self._session.post(
+                url,
+                data=encode_tensors({"input": input_tensor}),
+                headers={"Content-Type": RAW_TENSORS_CONTENT_TYPE, "Accept": RAW_TENSORS_CONTENT_TYPE},
+            )
+            r.raise_for_status()
+
+            # Views into a writable copy of the response body
+            outputs = decode_tensors(bytearray(r.content))
+            return [outputs[k] for k in sorted(outputs)]
+
+        buf = io.BytesIO()
+        np.save(buf, input_tensor)
+
+        r = self._session.post(
+            url,
+            files={"input_npy": ("input.npy", buf.getbuffer(), "application/octet-stream")},
         )
+        r.raise_for_status()
+
+        # Load output tensors
+        npz = np.load(io.BytesIO(r.content), allow_pickle=False)
+        return [npz[k] for k in sorted(npz.files)]
 
     def _infer(self, input_tensor: np.ndarray) -> List[np.ndarray]:
         """
@@ -219,6 +445,7 @@ class InterpreterClient(Device):
         This will send a POST request to the interpreter server.
         `requests.post(<endpoint>/infer/<session_id>, files={"input_npy": ("input.npy", input_tensor, "application/octet-stream")})`
         And expect a response with the output tensors in the body.
+        When using the raw transport, the input and output tensors are encoded with `encode_tensors`.
 
         Args:
             input_tensor: Input tensor.
@@ -231,21 +458,7 @@ class InterpreterClient(Device):
         if input_tensor.ndim == 3:
             input_tensor = np.expand_dims(input_tensor, axis=0)
 
-        buf = io.BytesIO()
-        np.save(buf, input_tensor)
-        buf.seek(0)
-
-        r = requests.post(
-            f"{self.endpoint}/infer/{self.session_id}",
-            files={"input_npy": ("input.npy", buf.getvalue(), "application/octet-stream")},
-        )
-        r.raise_for_status()
-
-        # Load output tensors
-        npz = np.load(io.BytesIO(r.content), allow_pickle=False)
-        output_tensors = [npz[k] for k in sorted(npz.files)]
-
-        return output_tensors
+        return self._post_tensor("infer", input_tensor)
 
     def infer(
         self, input_tensor: np.ndarray
@@ -264,17 +477,94 @@ class InterpreterClient(Device):
         output_tensors = self._infer(input_tensor)
         return self.model.post_process(output_tensors)
 
+    def _infer_batch(self, input_tensors: List[np.ndarray]) -> List[List[np.ndarray]]:
+        """
+        Run inference for a batch of input tensors on the remote interpreter server.
+        The input tensors are stacked along the batch axis and sent in a single POST request.
+        `requests.post(<endpoint>/infer_batch/<session_id>, files={"input_npy": ("input.npy", batch, ...)})`
+        And expect a response with the output tensors in the body, each with a leading batch axis.
+
+        Args:
+            input_tensors: List of input tensors with identical shape.
+
+        Returns:
+            List of output tensors for every input tensor in the batch.
+        """
+        # Stack along the batch dimension: (N, H, W, C)
+        batch = np.concatenate([np.expand_dims(t, axis=0) if t.ndim == 3 else t for t in input_tensors], axis=0)
+
+        # Split the output tensors back per sample
+        outputs = self._post_tensor("infer_batch", batch)
+        for output in outputs:
+            if len(output) != len(batch):
+                raise RuntimeError(
+                    f"Interpreter server returned a batch of {len(output)} outputs for {len(batch)} input tensors."
+                )
+
+        return [[output[i] for output in outputs] for i in range(len(batch))]
+
+    def infer_batch(
+        self, input_tensors: List[np.ndarray]
+    ) -> List[Union[Classifications, Detections, Poses, Segments, InstanceSegments, Anomaly]]:
+        """
+        Run inference for a batch of input tensors on the remote interpreter server.
+        And return the post-processed result for every input tensor.
+
+        Args:
+            input_tensors: List of input tensors with identical shape.
+
+        Returns:
+            List of post-processed results, in the order of the input tensors.
+        """
+        return [self.model.post_process(output_tensors) for output_tensors in self._infer_batch(input_tensors)]
+
+    async def infer_async(
+        self, input_tensor: np.ndarray
+    ) -> Union[Classifications, Detections, Poses, Segments, InstanceSegments, Anomaly]:
+        """
+        Asynchronous `infer`, awaitable from an asyncio event loop without blocking it.
+        The request runs on the pipeline worker pool when `pipeline` is set, otherwise in the default executor.
+
+        Args:
+            input_tensor: Input tensor.
+
+        Returns:
+            Post-processed result.
+        """
+        return await asyncio.get_running_loop().run_in_executor(self._executor, self.infer, input_tensor)
+
+    async def infer_batch_async(
+        self, input_tensors: List[np.ndarray]
+    ) -> List[Union[Classifications, Detections, Poses, Segments, InstanceSegments, Anomaly]]:
+        """
+        Asynchronous `infer_batch`, awaitable from an asyncio event loop without blocking it.
+
+        Args:
+            input_tensors: List of input tensors with identical shape.
+
+        Returns:
+            List of post-processed results, in the order of the input tensors.
+        """
+        return await asyncio.get_running_loop().run_in_executor(self._executor, self.infer_batch, input_tensors)
+
     def stop(self):
         """
         Close the active interpreter session.
         This will send a DELETE request to the interpreter server.
         `requests.delete(<endpoint>/session/<session_id>)` and expect a 200 OK response.
+        Pending pipelined requests are awaited and the keep-alive connections are closed.
         """
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+        self._in_flight.clear()
+
         if self.session_id is not None:
             # Close session
             print("\nClosing session...")
-            requests.delete(f"{self.endpoint}/session/{self.session_id}")
+            self._session.delete(f"{self.endpoint}/session/{self.session_id}")
             self.session_id = None
             print("Done.")
 
+        self._session.close()
         self._running = False
@@ -14,6 +14,6 @@
 # limitations under the License.
 #
 
-from .codecs import JsonCodec, PickleCodec
+from .codecs import BinaryCodec, JsonCodec, PickleCodec
 from .playback import Playback
 from .recorder import Recorder
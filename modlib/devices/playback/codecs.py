@@ -16,15 +16,19 @@
 
 import base64
 import copy
+import io
 import cv2
 import json
 import pickle
+import struct
 import numpy as np
 
 from abc import ABC, abstractmethod
-from typing import IO, BinaryIO, Union
+from datetime import datetime
+from typing import IO, BinaryIO, Dict, Tuple, Union
 
-from ..frame import Frame
+from ..frame import RESULT_TYPE, Frame
+from modlib.models import ROI
 
 
 class FrameCodec(ABC):
@@ -71,6 +75,20 @@ class FrameCodec(ABC):
         """Returns the encoding if applicable, otherwise None."""
         return None  # Default to None for binary codecs
 
+    @property
+    def seekable(self) -> bool:
+        """Returns True if the codec supports random access through `read_index` and `decode_at`."""
+        return False
+
+    def finalize(self, file: Union[IO, BinaryIO]):
+        """
+        Finish the recording before the file is closed, e.g. by writing an index. Defaults to a no-op.
+
+        Args:
+            file: The open file object the frames were written to
+        """
+        pass
+
 
 class JsonCodec(FrameCodec):
     """
@@ -120,22 +138,16 @@ class PickleCodec(FrameCodec):
 
         # Serialize and write as a single line
         pickle.dump(frame_copy, file)
-        file.flush()
 
     @staticmethod
     def decode(file: Union[IO, BinaryIO]) -> Frame | None:
-        # Check if there is more data to read
-        current_position = file.tell()
-        file.seek(0, 2)
-        end_position = file.tell()
-        file.seek(current_position)
-        if current_position == end_position:
-            return None
-
-        frame = pickle.load(file)
+        try:
+            frame = pickle.load(file)
+        except EOFError:
+            return None  # end of the recording
 
         # Decode and decompress the image data if available
-        if frame.image is not None:
+        if frame._image is not None:
             frame.image = cv2.imdecode(
                 np.frombuffer(base64.b64decode(frame.image.split(",")[1]), dtype=np.uint8), cv2.IMREAD_COLOR
             )
@@ -155,3 +167,319 @@ class PickleCodec(FrameCodec):
     @property
     def encoding(self) -> str | None:
         return None
+
+
+class BinaryCodec(FrameCodec):
+    """
+    A codec for encoding and decoding frames in an indexed binary container.
+
+    Every frame is written as a chunk holding a small JSON header, the image payload (JPEG or raw pixels)
+    and the detections as packed numpy arrays. On `finalize` an index of the frame offsets and timestamps
+    is appended, allowing the `Playback` device to open long recordings instantly and to seek to any frame
+    or time. Recordings that were not finalized (e.g. after a crash) are indexed by scanning the chunks.
+
+    Example:
+    ```
+    rec = Recorder(directory="./temp/recordings", codec=BinaryCodec(image_format="raw"))
+    ...
+    device = Playback(recording="./temp/recordings/recording_2025-03-10_14-12-00.bin", codec=BinaryCodec())
+    device.seek(time=60.0)
+    ```
+
+    File layout (little-endian, all sections 8-byte aligned):
+    ```
+    header: MAGIC (8 bytes)
+    chunk:  b"FRAM", meta length, image length, arrays length (uint32) | meta JSON | image | arrays
+    ...
+    index:  b"INDX", frame count (uint32) | frame count x (offset uint64, timestamp float64)
+    footer: index offset (uint64) | INDEX_MAGIC (8 bytes)
+    ```
+    """
+
+    MAGIC = b"MODLIBR\x01"  #: File header identifying the container and its version.
+    INDEX_MAGIC = b"MODLIBIX"  #: Footer identifying a finalized recording with an index.
+    INDEX_DTYPE = np.dtype([("offset", "<u8"), ("timestamp", "<f8")])  #: Index entry of every frame.
+
+    _CHUNK = struct.Struct("<4sIII")
+    _FOOTER = struct.Struct("<Q8s")
+
+    def __init__(self, image_format: str = "jpeg", jpeg_quality: int = 95):
+        """
+        Args:
+            image_format: Image payload, either "jpeg" (compressed) or "raw" (lossless and fastest to decode).
+            jpeg_quality: JPEG quality (0-100) when `image_format` is "jpeg".
+        """
+        if image_format not in ("jpeg", "raw"):
+            raise ValueError(f"Invalid image format '{image_format}'. Must be one of: jpeg, raw.")
+        self.image_format = image_format
+        self.jpeg_quality = jpeg_quality
+        self._indices: Dict[Union[IO, BinaryIO], list] = {}  # index entries of every open recording file
+
+    def encode(self, frame: Frame, file: Union[IO, BinaryIO]):
+        index = self._indices.get(file)
+        if index is None:
+            index = self._indices[file] = []
+            if file.tell() == 0:
+                file.write(self.MAGIC)
+
+        offset = file.tell()
+        self._write_chunk(frame, file, image=True)
+        index.append((offset, _posix_time(frame.timestamp)))
+
+    def dumps(self, frame: Frame, image: bool = True) -> bytes:
+        """
+        Encode a single frame chunk without the recording header and index,
+        e.g. to pass frames between processes. Decode it with `decode_at(buffer, 0)`.
+
+        Args:
+            frame: The frame to encode.
+            image: Whether to include the image payload. Defaults to True.
+
+        Returns:
+            The encoded frame chunk.
+        """
+        buffer = io.BytesIO()
+        self._write_chunk(frame, buffer, image=image)
+        return buffer.getvalue()
+
+    def _write_chunk(self, frame: Frame, file: Union[IO, BinaryIO], image: bool):
+        meta = {
+            "timestamp": frame.timestamp,
+            "image_type": frame.image_type,
+            "width": int(frame.width),
+            "height": int(frame.height),
+            "channels": int(frame.channels),
+            "new_detection": bool(frame.new_detection),
+            "fps": float(frame.fps),
+            "dps": float(frame.dps),
+            "color_format": frame.color_format,
+            "roi": [float(v) for v in frame.roi] if frame.roi is not None else None,
+            "frame_count": int(frame.frame_count) if frame.frame_count is not None else None,
+        }
+
+        # Image payload
+        payload = b""
+        if image and frame._image is not None:
+            if self.image_format == "raw":
+                payload = np.ascontiguousarray(frame._image)
+                meta["image"] = {"format": "raw", "dtype": payload.dtype.str, "shape": payload.shape}
+            else:
+                ret, payload = cv2.imencode(
+                    ".jpg",
+                    cv2.cvtColor(frame._image, cv2.COLOR_RGB2BGR) if frame.color_format == "RGB" else frame._image,
+                    [cv2.IMWRITE_JPEG_QUALITY, self.jpeg_quality],
+                )
+                meta["image"] = {"format": "jpeg"}
+
+        # Detections as packed arrays, the remaining attributes in the header
+        arrays = []
+        if frame._detections is not None:
+            meta["detection_type"], meta["detections"], arrays = _pack_result(frame._detections)
+
+        meta_bytes = json.dumps(meta, separators=(",", ":")).encode("utf-8")
+        arrays_len = sum(_padded(a.nbytes) for a in arrays)
+        image_len = memoryview(payload).nbytes
+
+        file.write(self._CHUNK.pack(b"FRAM", len(meta_bytes), image_len, arrays_len))
+        _write_padded(file, meta_bytes)
+        _write_padded(file, payload)
+        for a in arrays:
+            _write_padded(file, a)
+
+    def decode(self, file: Union[IO, BinaryIO]) -> Frame | None:
+        if file.tell() == 0 and file.read(len(self.MAGIC)) != self.MAGIC:
+            raise ValueError("Not a recording of the BinaryCodec.")
+
+        header = file.read(self._CHUNK.size)
+        if len(header) < self._CHUNK.size:
+            return None
+        tag, meta_len, image_len, arrays_len = self._CHUNK.unpack(header)
+        if tag != b"FRAM":
+            return None  # reached the index
+
+        chunk = file.read(_padded(meta_len) + _padded(image_len) + arrays_len)
+        return self._decode_chunk(memoryview(chunk), 0, meta_len, image_len)
+
+    def decode_at(self, buffer: Union[bytes, memoryview], offset: int) -> Frame:
+        """
+        Decode the frame starting at the given offset of the recording.
+
+        Args:
+            buffer: Buffer with the complete recording, e.g. a memory map of the file.
+            offset: Byte offset of the frame chunk as provided by `read_index`.
+
+        Returns:
+            The decoded frame.
+        """
+        buffer = memoryview(buffer)
+        tag, meta_len, image_len, arrays_len = self._CHUNK.unpack_from(buffer, offset)
+        if tag != b"FRAM":
+            raise ValueError(f"No frame found at offset {offset} of the recording.")
+        return self._decode_chunk(buffer, offset + self._CHUNK.size, meta_len, image_len)
+
+    def read_index(self, buffer: Union[bytes, memoryview]) -> np.ndarray:
+        """
+        Read the frame index of a recording.
+
+        Args:
+            buffer: Buffer with the complete recording, e.g. a memory map of the file.
+
+        Returns:
+            Structured array of `INDEX_DTYPE` with the byte offset and POSIX timestamp (NaN when unknown)
+            of every frame.
+        """
+        buffer = memoryview(buffer)
+        if len(buffer) == 0:
+            return np.empty((0,), dtype=self.INDEX_DTYPE)
+        if bytes(buffer[: len(self.MAGIC)]) != self.MAGIC:
+            raise ValueError("Not a recording of the BinaryCodec.")
+
+        # Finalized recording, read the index from the footer
+        if len(buffer) >= len(self.MAGIC) + self._FOOTER.size:
+            index_offset, magic = self._FOOTER.unpack_from(buffer, len(buffer) - self._FOOTER.size)
+            if magic == self.INDEX_MAGIC:
+                tag, count, _, _ = self._CHUNK.unpack_from(buffer, index_offset)
+                return np.frombuffer(
+                    buffer, dtype=self.INDEX_DTYPE, count=count, offset=index_offset + self._CHUNK.size
+                ).copy()
+
+        # Unfinished recording, scan the chunk headers (a truncated last frame is ignored)
+        entries = []
+        offset = len(self.MAGIC)
+        while offset + self._CHUNK.size <= len(buffer):
+            tag, meta_len, image_len, arrays_len = self._CHUNK.unpack_from(buffer, offset)
+            end = offset + self._CHUNK.size + _padded(meta_len) + _padded(image_len) + arrays_len
+            if tag != b"FRAM" or end > len(buffer):
+                break
+            start = offset + self._CHUNK.size
+            meta = json.loads(bytes(buffer[start : start + meta_len]))
+            entries.append((offset, _posix_time(meta["timestamp"])))
+            offset = end
+        return np.array(entries, dtype=self.INDEX_DTYPE)
+
+    def finalize(self, file: Union[IO, BinaryIO]):
+        index = self._indices.pop(file, None)
+        if index is None:
+            return
+
+        index_offset = file.tell()
+        file.write(self._CHUNK.pack(b"INDX", len(index), 0, 0))
+        file.write(np.array(index, dtype=self.INDEX_DTYPE).tobytes())
+        file.write(self._FOOTER.pack(index_offset, self.INDEX_MAGIC))
+        file.flush()
+
+    def _decode_chunk(self, buffer: memoryview, start: int, meta_len: int, image_len: int) -> Frame:
+        meta = json.loads(bytes(buffer[start : start + meta_len]))
+        image_start = start + _padded(meta_len)
+        arrays_start = image_start + _padded(image_len)
+
+        image = None
+        image_info = meta.get("image")
+        if image_info is not None:
+            payload = buffer[image_start : image_start + image_len]
+            if image_info["format"] == "raw":
+                # Copy out of the buffer, frames are annotated in place
+                image = np.frombuffer(payload, dtype=image_info["dtype"]).reshape(image_info["shape"]).copy()
+            else:
+                image = cv2.imdecode(np.frombuffer(payload, dtype=np.uint8), cv2.IMREAD_COLOR)
+                if meta["color_format"] == "RGB":
+                    image = cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
+
+        detections = None
+        detection_type = meta.get("detection_type")
+        if detection_type is not None:
+            detections = _unpack_result(detection_type, meta["detections"], buffer, arrays_start)
+
+        return Frame(
+            timestamp=meta["timestamp"],
+            image=image,
+            image_type=meta["image_type"],
+            width=meta["width"],
+            height=meta["height"],
+            channels=meta["channels"],
+            detections=detections,
+            new_detection=meta["new_detection"],
+            fps=meta["fps"],
+            dps=meta["dps"],
+            color_format=meta["color_format"],
+            roi=ROI(*meta["roi"]) if meta["roi"] is not None else None,
+            frame_count=meta["frame_count"],
+        )
+
+    @property
+    def file_extension(self) -> str:
+        return "bin"
+
+    @property
+    def binary_mode(self) -> bool:
+        return True
+
+    @property
+    def encoding(self) -> str | None:
+        return None
+
+    @property
+    def seekable(self) -> bool:
+        return True
+
+
+def _padded(n: int) -> int:
+    return (n + 7) & ~7
+
+
+def _write_padded(file: BinaryIO, data):
+    n = memoryview(data).nbytes
+    file.write(data)
+    if n % 8:
+        file.write(bytes(_padded(n) - n))
+
+
+def _posix_time(timestamp: str) -> float:
+    try:
+        return datetime.fromisoformat(timestamp).timestamp()
+    except (TypeError, ValueError):
+        return float("nan")
+
+
+def _pack_result(result) -> Tuple[str, dict, list]:
+    # Split the result attributes in numpy arrays (packed) and JSON serializable values (header)
+    attrs, arrays = {}, []
+    for name, value in vars(result).items():
+        if isinstance(value, np.ndarray):
+            attrs[name] = {"array": [value.dtype.str, value.shape]}
+            arrays.append(np.ascontiguousarray(value))
+        elif isinstance(value, list) and value and all(isinstance(v, np.ndarray) for v in value):
+            attrs[name] = {"arrays": [[v.dtype.str, v.shape] for v in value]}
+            arrays.extend(np.ascontiguousarray(v) for v in value)
+        elif isinstance(value, tuple):
+            attrs[name] = {"tuple": [v.item() if isinstance(v, np.generic) else v for v in value]}
+        else:
+            attrs[name] = {"value": value.item() if isinstance(value, np.generic) else value}
+    return type(result).__name__, attrs, arrays
+
+
+def _unpack_result(detection_type: str, attrs: dict, buffer: memoryview, offset: int):
+    if not hasattr(RESULT_TYPE, detection_type):
+        raise TypeError(f"Unsupported detection type: {detection_type}")
+
+    def read_array(dtype, shape):
+        nonlocal offset
+        dtype = np.dtype(dtype)
+        count = int(np.prod(shape))
+        # Copy out of the buffer, results are modified in place by the apps
+        a = np.frombuffer(buffer, dtype=dtype, count=count, offset=offset).reshape(shape).copy()
+        offset += _padded(count * dtype.itemsize)
+        return a
+
+    result = object.__new__(getattr(RESULT_TYPE, detection_type))
+    for name, attr in attrs.items():
+        if "array" in attr:
+            value = read_array(*attr["array"])
+        elif "arrays" in attr:
+            value = [read_array(*a) for a in attr["arrays"]]
+        elif "tuple" in attr:
+            value = tuple(attr["tuple"])
+        else:
+            value = attr["value"]
+        setattr(result, name, value)
+    return result
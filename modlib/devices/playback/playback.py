@@ -14,10 +14,16 @@
 # limitations under the License.
 #
 
+import mmap
+import queue
+import threading
+import time
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Tuple
 
-from .codecs import FrameCodec, JsonCodec
+import numpy as np
+
+from .codecs import FrameCodec, JsonCodec, _posix_time
 from ..device import Device
 from ..frame import Frame
 from modlib.models.model import Model
@@ -38,6 +44,21 @@ class Playback(Device):
             print(frame.detections)
             frame.display()
     ```
+
+    Recordings of a seekable codec (e.g. `BinaryCodec`) are memory mapped and indexed, which allows to
+    `seek` to a frame or time and to get the number of frames with `len(device)`.
+    ```
+    device = Playback(recording="./path/to/my_recording.bin", codec=BinaryCodec())
+    device.seek(time=60.0)  # Continue playback one minute into the recording
+    ```
+
+    By default frames are returned as fast as they are decoded. Set `realtime=True` to replay at the recorded
+    frame timing (scaled by `speed`), so apps see the same timing profile as they did live. Set `prefetch` to
+    decode frames ahead on a background thread for maximum throughput, and `loop=True` to replay the recording
+    indefinitely.
+    ```
+    device = Playback(recording="./path/to/my_recording.json", realtime=True, speed=2.0, prefetch=8, loop=True)
+    ```
     """
 
     def __init__(
@@ -46,7 +67,35 @@ class Playback(Device):
         codec: Optional[FrameCodec] = JsonCodec(),
         headless: Optional[bool] = False,
         timeout: Optional[int] = None,
+        realtime: bool = False,
+        speed: float = 1.0,
+        prefetch: int = 0,
+        loop: bool = False,
     ):
+        """
+        Initialize the Playback device.
+
+        Args:
+            recording: Path to the recording file.
+            codec: The codec the recording was created with.
+            headless: Initiating the Playback device in headless mode.
+            timeout: If set, automatically stop the device loop after the specified seconds.
+            realtime: Pace the playback to the recorded frame timestamps. Defaults to False (as fast as possible).
+            speed: Playback speed factor when `realtime` is enabled, e.g. 2.0 replays twice as fast.
+            prefetch: Number of frames to decode ahead on a background thread. Defaults to 0 (no prefetching).
+            loop: Restart at the beginning of the recording when the end is reached. Defaults to False.
+        """
+        if speed <= 0:
+            raise ValueError(f"Playback speed must be positive, got {speed}.")
+        if prefetch < 0:
+            raise ValueError(f"Prefetch must be a non-negative integer, got {prefetch}.")
+        self.realtime = realtime
+        self.speed = speed
+        self.prefetch = prefetch
+        self.loop = loop
+        self.loops = 0  # number of times the recording restarted
+        self._loops_read = 0
+
         self.filepath = Path(recording)
         if not self.filepath.exists():
             raise FileNotFoundError(f"Recording file not found: {self.filepath}")
@@ -59,6 +108,22 @@ class Playback(Device):
         # Reset file position
         self.file.seek(0)
 
+        # Memory map and index the recording for random access
+        self._mmap = None
+        self._index = None
+        self._position = 0  # index of the next frame to decode
+        self._next_position = 0  # index of the next frame to return
+        if codec.seekable:
+            if self.filepath.stat().st_size > 0:
+                self._mmap = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+            self._index = codec.read_index(self._mmap if self._mmap is not None else b"")
+
+        # Realtime pacing reference (wall clock, recorded time) and prefetching thread
+        self._pace_reference = None
+        self._prefetch_queue = None
+        self._prefetch_thread = None
+        self._prefetch_stop = threading.Event()
+
         super().__init__(
             headless=headless,
             enable_input_tensor=False,
@@ -85,6 +150,10 @@ class Playback(Device):
         """
         Stop the playback device stream.
         """
+        self._stop_prefetch()
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
         if not self.file.closed:
             self.file.close()
 
@@ -103,9 +172,162 @@ class Playback(Device):
         """
         self.check_timeout()
 
-        # Read next frame from the recording
-        frame = self.codec.decode(self.file)
+        if self.prefetch > 0:
+            if self._prefetch_thread is None:
+                self._start_prefetch()
+            item = self._prefetch_queue.get()
+            if isinstance(item, Exception):
+                self._prefetch_thread = None
+                raise item
+            frame, position, loops = item
+            if frame is None:
+                self._stop_prefetch()  # the reader reached the end of the recording
+        else:
+            frame, position, loops = self._read_frame()
+
         if frame is None:
             raise StopIteration
+        self._next_position = position
+        self.loops = loops
+
+        if self.realtime:
+            self._pace(frame)
+        return frame
 
+    def _read_frame(self) -> Tuple[Optional[Frame], int, int]:
+        # Decode the next recorded frame, restarting at the beginning of the recording when looping
+        frame = self._decode_next()
+        if frame is None and self.loop:
+            self._rewind()
+            frame = self._decode_next()
+            if frame is not None:
+                self._loops_read += 1
+        return frame, self._position, self._loops_read
+
+    def _decode_next(self) -> Optional[Frame]:
+        # Read next frame from the indexed recording
+        if self._index is not None:
+            if self._position >= len(self._index):
+                return None
+            frame = self.codec.decode_at(self._mmap, int(self._index["offset"][self._position]))
+            self._position += 1
+            return frame
+
+        # Read next frame from the recording
+        frame = self.codec.decode(self.file)
+        if frame is not None:
+            self._position += 1
         return frame
+
+    def _rewind(self):
+        self._position = 0
+        if self._index is None:
+            self.file.seek(0)
+
+    def _pace(self, frame: Frame):
+        # Sleep until the recorded time of the frame (relative to a reference frame) is due,
+        # restarting the reference on the first frame, after seeking or looping, or for unknown timestamps
+        recorded = _posix_time(frame.timestamp)
+        now = time.perf_counter()
+        if self._pace_reference is None or not recorded >= self._pace_reference[1]:
+            self._pace_reference = (now, recorded)
+            return
+
+        due = self._pace_reference[0] + (recorded - self._pace_reference[1]) / self.speed
+        if due > now:
+            time.sleep(due - now)
+
+    def _start_prefetch(self):
+        self._prefetch_stop.clear()
+        self._prefetch_queue = queue.Queue(maxsize=self.prefetch)
+        self._prefetch_thread = threading.Thread(target=self._prefetch_loop, name="modlib-playback", daemon=True)
+        self._prefetch_thread.start()
+
+    def _prefetch_loop(self):
+        try:
+            while not self._prefetch_stop.is_set():
+                item = self._read_frame()
+                self._put_prefetched(item)
+                if item[0] is None:
+                    break
+        except Exception as e:
+            self._put_prefetched(e)
+
+    def _put_prefetched(self, item):
+        while not self._prefetch_stop.is_set():
+            try:
+                self._prefetch_queue.put(item, timeout=0.1)
+                return
+            except queue.Full:
+                pass
+
+    def _stop_prefetch(self):
+        if self._prefetch_thread is None:
+            return
+        self._prefetch_stop.set()
+        self._prefetch_thread.join()
+        self._prefetch_thread = None
+        self._prefetch_queue = None
+
+    def __len__(self) -> int:
+        """
+        Number of frames in the recording.
+
+        Raises:
+            TypeError: When the recording codec does not support random access.
+        """
+        self._check_seekable()
+        return len(self._index)
+
+    def seek(self, frame: Optional[int] = None, time: Optional[float] = None) -> int:
+        """
+        Set the position of the playback to a frame index or a time in the recording.
+
+        Args:
+            frame: Index of the next frame to play. Negative values index from the end of the recording.
+            time: Time in seconds since the first frame. Playback continues at the first frame at or after this time.
+
+        Returns:
+            The index of the next frame to play.
+
+        Raises:
+            TypeError: When the recording codec does not support random access.
+            ValueError: When not exactly one of `frame` or `time` is provided, or the recording has no timestamps.
+            IndexError: When the frame index is out of range.
+        """
+        self._check_seekable()
+        if (frame is None) == (time is None):
+            raise ValueError("Provide exactly one of `frame` or `time` to seek to.")
+
+        n = len(self._index)
+        if frame is not None:
+            position = frame + n if frame < 0 else frame
+            if not 0 <= position <= n:
+                raise IndexError(f"Frame index {frame} out of range for a recording of {n} frames.")
+        else:
+            timestamps = self._index["timestamp"]
+            if n > 0 and np.isnan(timestamps).any():
+                raise ValueError("Seeking by time requires ISO formatted timestamps in all recorded frames.")
+            position = int(np.searchsorted(timestamps - timestamps[0], time, side="left")) if n > 0 else 0
+
+        self._stop_prefetch()
+        self._position = position
+        self._next_position = position
+        self._pace_reference = None
+        return position
+
+    def tell(self) -> int:
+        """
+        Index of the next frame to play.
+
+        Raises:
+            TypeError: When the recording codec does not support random access.
+        """
+        self._check_seekable()
+        return self._next_position
+
+    def _check_seekable(self):
+        if self._index is None:
+            raise TypeError(
+                f"The {type(self.codec).__name__} does not support random access, use a seekable codec like BinaryCodec."
+            )
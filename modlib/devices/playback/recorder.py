@@ -15,14 +15,18 @@
 #
 
 import atexit
+import copy
 import shutil
 import sys
+import threading
+import time
 import warnings
 from datetime import datetime
 from pathlib import Path
 from typing import IO, BinaryIO, Union
 
 from .codecs import FrameCodec, JsonCodec
+from ..broadcast import BUFFER_POLICY, FrameQueue
 from ..frame import Frame
 
 
@@ -38,6 +42,11 @@ class Recorder:
         for frame in stream:
             rec.add(frame)  # Add the frame to the recording
     ```
+
+    By default frames are handed to a bounded queue and encoded and written by a background writer thread,
+    keeping the encoding and disk I/O out of the capture loop. When the writer can not keep up, the queue
+    `policy` decides to drop the oldest queued frame (`BUFFER_POLICY.DROP_OLDEST`) or to block `add`
+    (`BUFFER_POLICY.BLOCK`). Call `close()` to write all queued frames and close the recording.
     """
 
     codec: FrameCodec  #: The codec used for encoding/decoding frames
@@ -45,10 +54,34 @@ class Recorder:
     file: Union[IO, BinaryIO]  #: The open recording file object (automatically closed on exit)
 
     MIN_FREE_SPACE: int = 100 * 1024 * 1024  # 100MB buffer to prevent filling disk
-
-    def __init__(self, directory: str, codec: FrameCodec = JsonCodec()):
+    DISK_CHECK_INTERVAL: float = 1.0  # Seconds between free disk space checks (and flushes of the file)
+    BUFFER_SIZE: int = 1024 * 1024  # Size of the file write buffer
+
+    def __init__(
+        self,
+        directory: str,
+        codec: FrameCodec = JsonCodec(),
+        background: bool = True,
+        maxsize: int = 64,
+        policy: str = BUFFER_POLICY.BLOCK,
+    ):
+        """
+        Args:
+            directory: Directory to create the recording file in.
+            codec: The codec used for encoding the frames.
+            background: Encode and write frames on a background writer thread. Defaults to True.
+                When False, frames are encoded and written in `add`.
+            maxsize: Capacity of the queue of frames waiting to be written. Defaults to 64.
+            policy: Policy when the queue is full, either `BUFFER_POLICY.BLOCK` (default, no frames are lost)
+                or `BUFFER_POLICY.DROP_OLDEST`.
+        """
         if not isinstance(codec, FrameCodec):
             raise ValueError("Codec must be an instance of FrameCodec.")
+        if policy not in (BUFFER_POLICY.BLOCK, BUFFER_POLICY.DROP_OLDEST):
+            raise ValueError(
+                f"Invalid recorder policy '{policy}'. "
+                f"Must be one of: {BUFFER_POLICY.BLOCK}, {BUFFER_POLICY.DROP_OLDEST}."
+            )
         self.codec = codec
 
         directory = Path(directory)
@@ -65,25 +98,140 @@ class Recorder:
 
         # Open file using codec-defined mode and encoding
         file_model = "ab" if codec.binary_mode else "a"
-        self.file = self.path.open(file_model, encoding=codec.encoding)
+        self.file = self.path.open(file_model, buffering=self.BUFFER_SIZE, encoding=codec.encoding)
+
+        self._lock = threading.Lock()  # guards the file
+        self._written = 0
+        self._submitted = 0  # frames queued for the writer
+        self._processed = 0  # queued frames taken by the writer
+        self._processed_cond = threading.Condition()
+        self._next_disk_check = 0.0
+        self._low_disk_space = False
+        self._error = None
+
+        self._queue = None
+        self._thread = None
+        if background:
+            self._queue = FrameQueue(maxsize=maxsize, policy=policy)
+            self._thread = threading.Thread(target=self._write_loop, name="modlib-recorder", daemon=True)
+            self._thread.start()
 
         atexit.register(self.close)
 
+    @property
+    def written(self) -> int:
+        """Number of frames written to the recording."""
+        return self._written
+
+    @property
+    def dropped(self) -> int:
+        """Number of frames dropped because the writer could not keep up."""
+        return self._queue.dropped if self._queue is not None else 0
+
+    @property
+    def blocked_time(self) -> float:
+        """Total time in seconds `add` was blocked on a full queue."""
+        return self._queue.blocked_time if self._queue is not None else 0.0
+
+    @property
+    def pending(self) -> int:
+        """Number of frames waiting in the queue to be written."""
+        return len(self._queue) if self._queue is not None else 0
+
+    def flush(self):
+        """Wait until all queued frames are written and flush the recording file."""
+        if self._thread is not None:
+            with self._processed_cond:
+                self._processed_cond.wait_for(
+                    lambda: self._processed + self._queue.dropped >= self._submitted or not self._thread.is_alive()
+                )
+        with self._lock:
+            if not self.file.closed:
+                self.file.flush()
+
     def close(self):
-        """Close the recording file."""
-        if not self.file.closed:
-            self.file.close()
+        """Write all queued frames and close the recording file."""
+        if self._thread is not None:
+            self._queue.end()  # the writer drains the remaining frames
+            if self._thread is not threading.current_thread():
+                self._thread.join()
+
+        with self._lock:
+            if not self.file.closed:
+                self.codec.finalize(self.file)
+                self.file.close()
+
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise error
 
     def add(self, frame: Frame):
-        """Save a frame to the recording file."""
+        """
+        Save a frame to the recording file. In background mode, a copy of the frame is queued and
+        the frame can be annotated right after.
+        """
+        if self._error is not None:
+            self.close()
 
-        free_space = shutil.disk_usage(self.path.parent).free
-        if free_space < self.MIN_FREE_SPACE:
-            warnings.warn(
-                f"Warning: Low disk space ({free_space / (1024 * 1024)} MB available). Stopping recording.",
-                UserWarning,
-            )
+        if self._low_disk_space:
             self.close()
             sys.exit()
 
-        self.codec.encode(frame, self.file)
+        if self._queue is None:
+            self._write(frame)
+            if self._low_disk_space:
+                self.close()
+                sys.exit()
+            return
+
+        if not self._queue.closed:
+            self._submitted += 1
+            self._queue.put(self._snapshot(frame))
+
+    @staticmethod
+    def _snapshot(frame: Frame) -> Frame:
+        # Decouple the queued frame from later in-place annotations of the image and detections
+        snapshot = copy.copy(frame)
+        if frame._image is not None:
+            snapshot._image = frame._image.copy()
+        if frame._detections is not None:
+            snapshot._detections = copy.deepcopy(frame._detections)
+        return snapshot
+
+    def _write_loop(self):
+        try:
+            for frame in self._queue:
+                self._write(frame)
+                with self._processed_cond:
+                    self._processed += 1
+                    self._processed_cond.notify_all()
+                if self._low_disk_space:
+                    self._queue.close()  # stop receiving frames, `add` stops the application
+        except Exception as e:
+            self._error = e
+            self._queue.close()
+        finally:
+            with self._processed_cond:
+                self._processed_cond.notify_all()
+
+    def _write(self, frame: Frame):
+        with self._lock:
+            if self.file.closed or self._low_disk_space:
+                return
+
+            # Rate limited free disk space check
+            now = time.monotonic()
+            if now >= self._next_disk_check:
+                self._next_disk_check = now + self.DISK_CHECK_INTERVAL
+                self.file.flush()
+                free_space = shutil.disk_usage(self.path.parent).free
+                if free_space < self.MIN_FREE_SPACE:
+                    warnings.warn(
+                        f"Warning: Low disk space ({free_space / (1024 * 1024)} MB available). Stopping recording.",
+                        UserWarning,
+                    )
+                    self._low_disk_space = True
+                    return
+
+            self.codec.encode(frame, self.file)
+            self._written += 1
@@ -0,0 +1,431 @@
+#
+# Copyright 2026 Sony Semiconductor Solutions Corp. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+
+import atexit
+import logging
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, List, Optional, Sequence, Union
+
+import numpy as np
+
+from modlib.models import Model
+
+from ..broadcast import BUFFER_POLICY, FrameBroadcaster, Subscription
+from ..device import Device, Rate
+from ..frame import IMAGE_TYPE, ROI, Frame
+from ..sources import Source
+
+logger = logging.getLogger(__name__.split(".")[-1])
+
+Interpreter = Callable[[np.ndarray], List[np.ndarray]]
+
+
+class SimulatedCamera(Device):
+    """
+    A hardware-free simulation of the AI Camera.
+
+    Replays a `Video` or `Images` source at a configured frame rate and attaches the post-processed results of
+    injected output tensors at a configured detection rate, using the same frame buffer, frame dropping and
+    FPS/DPS accounting as the `AiCamera`. This allows to benchmark the complete application pipeline on any machine.
+
+    The output tensors are either pre-recorded (`output_tensors`) or computed by a local `interpreter`
+    from the pre-processed source frames.
+
+    Example:
+    ```
+    from modlib.devices import SimulatedCamera, Video
+
+    device = SimulatedCamera(source=Video("./path/to/video.mp4"), frame_rate=30, detection_rate=15,
+                             output_tensors="./path/to/output_tensors/")
+    device.deploy(model)
+
+    with device as stream:
+        for frame in stream:
+            print(frame.detections, frame.fps, frame.dps)
+    ```
+
+    The stream ends when the source is exhausted and all buffered frames are consumed. An error while processing a
+    frame, e.g. a failing interpreter, ends the stream by raising the error to the consumer.
+    """
+
+    def __init__(
+        self,
+        source: Source,
+        frame_rate: float = 30,
+        detection_rate: Optional[float] = None,
+        output_tensors: Optional[Union[str, Path, Sequence[np.ndarray]]] = None,
+        interpreter: Optional[Interpreter] = None,
+        headless: Optional[bool] = False,
+        enable_input_tensor: Optional[bool] = False,
+        timeout: Optional[int] = None,
+    ):
+        """
+        Initialize the SimulatedCamera device.
+
+        Args:
+            source: The source of the frame images, e.g. `Video` or `Images`.
+            frame_rate: The frames per second the source is replayed at.
+            detection_rate: The detections per second, e.g. the DPS measured on the real device.
+                Defaults to None, providing a new detection for every frame.
+            output_tensors: Pre-recorded output tensors, either a list of arrays (the same output tensors for every
+                detection), a `.npy`/`.npz` file, or a directory of `.npy`/`.npz` files replayed in sorted order.
+            interpreter: Local interpreter computing the output tensors from the pre-processed input tensor,
+                e.g. `lambda x: session.run(None, {"input": x})`. Exclusive with `output_tensors`.
+            headless: Initialising the SimulatedCamera in headless mode means `frame.image` is never processed
+                and unavailable.
+            enable_input_tensor: When enabling input tensor, `frame.image` will be replaced by the input tensor image.
+            timeout: If set, automatically stop the device loop after the specified seconds.
+
+        Raises:
+            ValueError: When the rates are not positive or both `output_tensors` and `interpreter` are provided.
+            FileNotFoundError: When the output tensors can not be found.
+        """
+        if frame_rate <= 0 or (detection_rate is not None and detection_rate <= 0):
+            raise ValueError(f"Frame and detection rates must be positive, got {frame_rate} and {detection_rate}.")
+        if output_tensors is not None and interpreter is not None:
+            raise ValueError("Provide either pre-recorded `output_tensors` or an `interpreter`, not both.")
+
+        self.source = source
+        self.frame_rate = frame_rate
+        self.detection_rate = detection_rate
+        self.interpreter = interpreter
+        self.model = None
+        self._output_tensors = _load_output_tensors(output_tensors) if output_tensors is not None else None
+        self._output_tensors_index = 0
+
+        # Frame buffer
+        self._frames = []
+        self._frameslock = threading.Lock()  # frame buffer lock
+        self._frame_ready = threading.Condition(self._frameslock)
+        self._broadcaster = FrameBroadcaster()  # frame subscriptions of other consumers
+        self._source_exhausted = False
+        self._error = None  # exception of the processing thread, raised to the consumer
+        self.dropped_frames = 0  # Frames dropped because the consumer was slower than the frame rate.
+        self.last_detections = None
+        self.last_frame_count = None
+        self.input_tensor_image = None
+        self.roi = ROI(left=0, top=0, width=1, height=1)
+
+        # Process thread
+        self._proc_abort = threading.Event()
+        self._proc_thread = None
+
+        self.rps = Rate()
+        self.fps = Rate()
+        self.dps = Rate()
+
+        super().__init__(
+            headless=headless,
+            enable_input_tensor=enable_input_tensor,
+            timeout=timeout,
+        )
+
+    def deploy(self, model: Model):
+        """
+        Deploy the model used to pre-process the source frames and post-process the output tensors.
+
+        Args:
+            model: The model to simulate.
+        """
+        self.model = model
+
+    def start(self):
+        """
+        Start the SimulatedCamera device stream.
+        """
+        if self.model is not None and self._output_tensors is None and self.interpreter is None:
+            raise ValueError("A deployed model requires `output_tensors` or an `interpreter` to simulate detections.")
+
+        with self._frameslock:
+            self._frames.clear()
+            self._source_exhausted = False
+            self._error = None
+        self.dropped_frames = 0
+        self.last_detections = None
+
+        self._proc_abort.clear()
+        self._proc_thread = threading.Thread(target=self._process_frames_func, name="modlib-simulated", daemon=True)
+        self._proc_thread.start()
+        self.rps.init()
+        self.dps.init()
+
+        atexit.register(self.stop)
+
+    def stop(self):
+        """
+        Stop the SimulatedCamera device stream.
+        """
+        atexit.unregister(self.stop)
+
+        # End all subscriptions, releasing a processing thread blocked by a full subscription
+        self._broadcaster.close()
+
+        if self._proc_thread and self._proc_thread.is_alive():
+            self._proc_abort.set()
+            self._proc_thread.join()
+        self._proc_thread = None
+
+        with self._frameslock:
+            self._frames.clear()
+
+    def _process_frames_func(self):
+        # Replay the source at the frame rate, without bursts to catch up when falling behind
+        period = 1 / self.frame_rate
+        next_frame_time = time.perf_counter()
+        next_detection_time = next_frame_time
+
+        while not self._proc_abort.is_set():
+            delay = next_frame_time - time.perf_counter()
+            if delay > 0 and self._proc_abort.wait(delay):
+                break
+
+            image = self.source.get_frame()
+            if image is None:
+                break
+            self.rps.update()
+
+            # A new detection when due at the detection rate, like the IMX500 running slower than the sensor
+            now = time.perf_counter()
+            run_detection = now >= next_detection_time
+            if run_detection and self.detection_rate is not None:
+                next_detection_time = max(next_detection_time + 1 / self.detection_rate, now)
+
+            try:
+                self._parse_image(image, run_detection)
+            except Exception as e:
+                # End the stream and raise the error to the consumer, instead of ending like an exhausted source
+                with self._frameslock:
+                    self._error = e
+                break
+
+            next_frame_time = max(next_frame_time + period, time.perf_counter())
+
+        with self._frameslock:
+            self._source_exhausted = True
+            self._frame_ready.notify_all()
+            self._notify_async_waiters()
+
+    def _parse_image(self, image: np.ndarray, run_detection: bool):
+        detections = None
+        frame_count = None
+        new_detection = False
+
+        if self.model is None:
+            pass
+        elif run_detection:
+            outputs = self._get_output_tensors(image)
+
+            # Post processing
+            detections = self.model.post_process(outputs)
+
+            new_detection = True
+            frame_count = ((self.last_frame_count or 0) + 1) & 0xFF  # 8 bit frame counter, like the IMX500
+            self.last_detections = detections
+            self.last_frame_count = frame_count
+            self.dps.update()
+
+        elif self.last_detections is None:
+            # No detection yet
+            # Skip adding to frame_queue
+            return
+        else:
+            detections = self.last_detections
+            frame_count = self.last_frame_count
+
+        # Source or input tensor image
+        if self.headless:
+            image, color_format, image_type = None, None, None
+            h, w, c = None, None, None
+        elif self.enable_input_tensor and self.model is not None:
+            image = self.input_tensor_image
+            color_format = self.model.color_format
+            image_type = IMAGE_TYPE.INPUT_TENSOR
+            h, w, c = image.shape
+        else:
+            color_format = self.source.color_format
+            image_type = IMAGE_TYPE.SOURCE
+            h, w, c = image.shape
+
+        frame = Frame(
+            timestamp=datetime.now().isoformat(),
+            image=image,
+            image_type=image_type,
+            width=w,
+            height=h,
+            channels=c,
+            detections=detections,
+            new_detection=new_detection,
+            fps=self.fps.value,
+            dps=self.dps.value,
+            color_format=color_format,
+            roi=self.roi,
+            frame_count=frame_count,
+        )
+
+        with self._frameslock:
+            self._frames.append(frame)
+            self._frame_ready.notify_all()  # Notify waiting threads
+            self._notify_async_waiters()  # Notify waiting coroutines
+
+        # Publish to subscriptions outside the frame buffer lock, blocking subscriptions may apply backpressure
+        self._broadcaster.publish(frame)
+
+    def _get_output_tensors(self, image: np.ndarray) -> List[np.ndarray]:
+        # Pre-process when the input tensor is required by the interpreter or the input tensor image
+        if self.interpreter is not None or self.enable_input_tensor:
+            it_image, input_tensor, self.roi = self.model.pre_process(image, self.source.color_format)
+            self.input_tensor_image = it_image
+
+        if self.interpreter is not None:
+            return self.interpreter(input_tensor)
+
+        outputs = self._output_tensors[self._output_tensors_index % len(self._output_tensors)]
+        self._output_tensors_index += 1
+        return [o.copy() for o in outputs]  # post-processors may modify the output tensors in place
+
+    def __enter__(self):
+        """
+        Start the SimulatedCamera device stream.
+        """
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """
+        Stop the SimulatedCamera device stream.
+        """
+        self.stop()
+
+    def __iter__(self):
+        """
+        Iterate over the frames in the device stream.
+        """
+        self.fps.init()
+        return self
+
+    def subscribe(self, maxsize: int = 8, policy: str = BUFFER_POLICY.DROP_OLDEST) -> Subscription:
+        """
+        Subscribe to all frames of the device stream, see `AiCamera.subscribe`.
+
+        Args:
+            maxsize: Capacity of the subscription ring buffer. Defaults to 8, ignored for `BUFFER_POLICY.LATEST`.
+            policy: Policy when the ring buffer is full, see `BUFFER_POLICY`. Defaults to `BUFFER_POLICY.DROP_OLDEST`.
+
+        Returns:
+            The subscription, iterate it or call `subscription.get()` to receive the frames.
+        """
+        return self._broadcaster.subscribe(maxsize, policy)
+
+    def get_frame(self) -> Optional[Frame]:
+        """
+        Gets the next processed frame in the device stream.
+
+        Returns:
+            The next frame in the device stream, or None when the source is exhausted.
+        """
+        with self._frameslock:
+            while not self._frames and not self._source_exhausted:
+                self._frame_ready.wait()  # Wait for available frame
+
+            # Like the AiCamera, only the main thread pops and clears the frame buffer
+            return self._take_frame(pop=threading.current_thread() is threading.main_thread())
+
+    def _take_frame(self, pop: bool = True) -> Optional[Frame]:
+        """
+        Take the latest frame from the frame buffer, must be called holding `self._frameslock`.
+
+        Args:
+            pop: Pop the latest frame and drop older frames, otherwise only peek at the latest frame.
+
+        Returns:
+            The latest frame, or None when the frame buffer is empty.
+
+        Raises:
+            Exception: The error that stopped the processing thread, once all buffered frames are taken.
+        """
+        if not self._frames:
+            if self._error is not None:
+                error, self._error = self._error, None
+                raise error
+            return None
+
+        if pop:
+            frame = self._frames.pop(-1)
+            if self._frames:
+                logger.debug(f"Main thread is dropping {len(self._frames)} frames.")
+                self.dropped_frames += len(self._frames)
+                self._frames.clear()
+            self.fps.update()
+        else:
+            frame = self._frames[-1]
+
+        return frame
+
+    def _take_frame_or_end(self):
+        frame = self._take_frame()
+        if frame is None and self._source_exhausted:
+            return _END_OF_STREAM
+        return frame
+
+    async def _anext_frame(self) -> Optional[Frame]:
+        # The consuming event loop owns the frame buffer, like the main thread does for `get_frame()`
+        frame = await self._wait_for_frame(self._take_frame_or_end)
+        return None if frame is _END_OF_STREAM else frame
+
+    def __next__(self) -> Frame:
+        """
+        Get the next frame in the device stream.
+
+        Returns:
+            The next frame in the device stream.
+        """
+        self.check_timeout()
+        frame = self.get_frame()
+        if frame is None:
+            raise StopIteration
+        return frame
+
+
+_END_OF_STREAM = object()
+
+
+def _load_output_tensors(output_tensors: Union[str, Path, Sequence[np.ndarray]]) -> List[List[np.ndarray]]:
+    # List of output tensor sets, one per simulated detection
+    if not isinstance(output_tensors, (str, Path)):
+        return [[np.asarray(o) for o in output_tensors]]
+
+    path = Path(output_tensors)
+    if path.is_dir():
+        files = sorted(list(path.glob("*.npy")) + list(path.glob("*.npz")))
+    elif path.exists():
+        files = [path]
+    else:
+        raise FileNotFoundError(f"Output tensors not found: {path}")
+    if not files:
+        raise FileNotFoundError(f"No .npy or .npz output tensors found in: {path}")
+
+    sets = []
+    for f in files:
+        if f.suffix == ".npz":
+            with np.load(f) as data:
+                sets.append([data[k] for k in data.files])
+        else:
+            sets.append([np.load(f)])
+    return sets
@@ -15,7 +15,12 @@
 #
 
 import os
+import queue
+import threading
+import time
 from abc import ABC, abstractmethod
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 from pathlib import Path
@@ -93,6 +98,143 @@ class Source(ABC):
         return frame
 
 
+@dataclass
+class PrefetchStats:
+    """
+    Statistics of a prefetching image source. Useful to size the `prefetch` depth and number of `workers`.
+    """
+
+    images: int = 0  #: Number of images decoded by the workers.
+    decode_time: float = 0.0  #: Accumulated decode time of all workers in seconds.
+    wait_time: float = 0.0  #: Accumulated time the consumer waited for a decoded image in seconds.
+    requests: int = 0  #: Number of images requested by the consumer.
+    queue_depth: int = 0  #: Number of decoded images ready for the consumer at the last request.
+    max_queue_depth: int = 0  #: Largest observed number of decoded images ready for the consumer.
+
+    @property
+    def decode_latency(self) -> float:
+        """Average decode time of a single image in seconds."""
+        return self.decode_time / self.images if self.images else 0.0
+
+    @property
+    def wait_latency(self) -> float:
+        """Average time the consumer waited for a decoded image in seconds."""
+        return self.wait_time / self.requests if self.requests else 0.0
+
+    def _record_decode(self, duration: float):
+        self.images += 1
+        self.decode_time += duration
+
+    def _record_request(self, queue_depth: int, wait: float):
+        self.requests += 1
+        self.wait_time += wait
+        self.queue_depth = queue_depth
+        self.max_queue_depth = max(self.max_queue_depth, queue_depth)
+
+
+class _ImagePrefetcher:
+    """
+    Decodes images ahead of the consumer on a thread pool (cv2 releases the GIL while decoding).
+    Images are returned in order of request, the prefetch window restarts on out-of-order access.
+    """
+
+    def __init__(
+        self,
+        image_files: list[Path],
+        load_fn: Callable[[Path], np.ndarray | None],
+        prefetch: int,
+        workers: int,
+        stats: PrefetchStats,
+    ):
+        self.image_files = image_files
+        self.load_fn = load_fn
+        self.prefetch = prefetch
+        self.workers = workers
+        self.stats = stats
+
+        self._init_runtime_state()
+
+    def _init_runtime_state(self):
+        self._executor = None
+        self._pending = deque()  # (index, future) in order of submission
+        self._next_index = 0
+        self._stats_lock = threading.Lock()
+
+    def __getstate__(self):
+        # The thread pool, pending futures and lock are not picklable, e.g. a dataset sent to spawned workers
+        state = self.__dict__.copy()
+        for key in ("_executor", "_pending", "_next_index", "_stats_lock"):
+            del state[key]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._init_runtime_state()
+
+    def get(self, index: int) -> np.ndarray | None:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="modlib-prefetch")
+        if not self._pending or self._pending[0][0] != index:
+            self._reset(index)
+
+        queue_depth = sum(f.done() for _, f in self._pending)
+        _, future = self._pending.popleft()
+
+        t0 = time.perf_counter()
+        image = future.result()
+        self.stats._record_request(queue_depth, time.perf_counter() - t0)
+
+        self._submit()
+        return image
+
+    def close(self):
+        if self._executor is not None:
+            self._reset(len(self.image_files))
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    def _load(self, path: Path) -> np.ndarray | None:
+        t0 = time.perf_counter()
+        image = self.load_fn(path)
+        with self._stats_lock:
+            self.stats._record_decode(time.perf_counter() - t0)
+        return image
+
+    def _reset(self, index: int):
+        for _, future in self._pending:
+            future.cancel()
+        self._pending.clear()
+        self._next_index = index
+        self._submit()
+
+    def _submit(self):
+        while len(self._pending) < self.prefetch and self._next_index < len(self.image_files):
+            future = self._executor.submit(self._load, self.image_files[self._next_index])
+            self._pending.append((self._next_index, future))
+            self._next_index += 1
+
+
+def _check_prefetch_args(prefetch: int, workers: Optional[int]) -> int:
+    if prefetch < 0:
+        raise ValueError(f"\nPrefetch must be a non-negative integer, got {prefetch}.\n")
+    if workers is None:
+        return max(1, min(prefetch, os.cpu_count() or 1))
+    if workers < 1:
+        raise ValueError(f"\nWorkers must be a positive integer, got {workers}.\n")
+    return workers
+
+
+def _read_bgr(path: Path) -> np.ndarray | None:
+    return cv2.imread(str(path))  # NOTE: always BGR
+
+
+def _read_rgb(path: Path) -> np.ndarray | None:
+    img_bgr = cv2.imread(str(path))
+    if img_bgr is None:
+        return None
+    return cv2.cvtColor(img_bgr, cv2.COLOR_BGR2RGB)
+
+
 class Images(Source):
     """
     Source for images.
@@ -109,16 +251,19 @@ class Images(Source):
     ```
     """
 
-    def __init__(self, images_dir: Path):
+    def __init__(self, images_dir: Path, prefetch: int = 0, workers: Optional[int] = None):
         """
         Initialize an Image source.
 
         Args:
             images_dir: Path to the directory containing jpg/jpeg/png images.
+            prefetch: Number of images decoded ahead of the consumer. Defaults to 0 (decode on request).
+            workers: Number of decoding threads when prefetching. Defaults to `min(prefetch, cpu_count)`.
 
         Raises:
             FileNotFoundError: When the provided directory does not exist.
             FileNotFoundError: When no images were found in the directory.
+            ValueError: When prefetch or workers are invalid.
         """
         images_dir = Path(images_dir)
         if not images_dir.exists():
@@ -134,6 +279,11 @@ class Images(Source):
         self.channels = None
         self.color_format = COLOR_FORMAT.BGR
 
+        self.prefetch = prefetch
+        self.workers = _check_prefetch_args(prefetch, workers)
+        self.prefetch_stats = PrefetchStats()  #: Decode statistics when prefetching.
+        self._prefetcher = _ImagePrefetcher(self.image_files, _read_bgr, prefetch, self.workers, self.prefetch_stats)
+
     def get_frame(self) -> np.ndarray | None:
         """
         Retrieve the next image from the provided image directory.
@@ -144,14 +294,22 @@ class Images(Source):
         if self.image_number >= len(self.image_files):
             return None
 
-        # NOTE: always BGR
-        image = cv2.imread(str(self.image_files[self.image_number]))
+        if self.prefetch > 0:
+            image = self._prefetcher.get(self.image_number)
+        else:
+            image = _read_bgr(self.image_files[self.image_number])
 
         self.height, self.width, self.channels = image.shape
         self.image_number += 1
 
         return image
 
+    def close(self):
+        """
+        Shut down the prefetching threads (if any).
+        """
+        self._prefetcher.close()
+
     def __len__(self) -> int:
         return len(self.image_files)
 
@@ -168,6 +326,9 @@ class Video(Source):
     """
     Source for video files.
 
+    Frames are decoded sequentially by default. Seeking is only performed on explicit random access
+    through `seek()`, `__getitem__` or by assigning `frame_number`.
+
     Example:
     ```
     from modlib.devices import KerasInterpreter, Video
@@ -180,31 +341,72 @@ class Video(Source):
     ```
     """
 
-    def __init__(self, video_path: Path):
+    def __init__(self, video_path: Path, sequential: bool = True, prefetch: int = 0):
         """
         Initialize a Video source.
 
         Args:
             video_path: Path to the video file.
+            sequential: Decode frames one after the other. When False, the decoder seeks to
+                `frame_number` before every read (slow for inter-frame codecs like H.264). Defaults to True.
+            prefetch: Number of frames decoded ahead on a background thread. Defaults to 0 (no prefetching).
+                Only used in sequential mode.
 
         Raises:
             FileNotFoundError: When the provided video_path does not exist.
+            ValueError: When prefetch is negative.
         """
         video_path = Path(video_path)
         if not video_path.exists():
             raise FileNotFoundError(f"\nThe file {video_path} does not exist.\n")
+        if prefetch < 0:
+            raise ValueError(f"\nPrefetch must be a non-negative integer, got {prefetch}.\n")
 
         self.cap = cv2.VideoCapture(os.path.abspath(video_path))
         self.total_frames = int(self.cap.get(cv2.CAP_PROP_FRAME_COUNT))
         self.height = int(self.cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
         self.width = int(self.cap.get(cv2.CAP_PROP_FRAME_WIDTH))
-        self.frame_number = 0
         self.channels = 3
         self.color_format = COLOR_FORMAT.BGR
 
+        self.sequential = sequential
+        self.prefetch = prefetch if sequential else 0
+
+        self._frame_number = 0
+        self._decoder_position = 0  # Index of the frame returned by the next `cap.read()`
+
+        # Background decoding
+        self._queue = None
+        self._reader = None
+        self._stop_reader = threading.Event()
+        self._end_of_stream = False
+
         self.fps = self.cap.get(cv2.CAP_PROP_FPS)
         self.start_time = datetime.now()
 
+    @property
+    def frame_number(self) -> int:
+        """
+        Index of the next frame returned by `get_frame()`.
+        Assigning a new value seeks the video to that frame.
+        """
+        return self._frame_number
+
+    @frame_number.setter
+    def frame_number(self, value: int):
+        self.seek(value)
+
+    def seek(self, frame_number: int):
+        """
+        Move the video to the given frame. The next call to `get_frame()` returns this frame.
+
+        Args:
+            frame_number: Index of the frame to seek to.
+        """
+        self._stop_prefetch()
+        self._frame_number = frame_number
+        self._end_of_stream = False
+
     def get_frame(self) -> np.ndarray | None:
         """
         Retrieve the next image from the provided video stream.
@@ -212,11 +414,104 @@ class Video(Source):
         Returns:
             The next image as an image array or None if the full video has been completed.
         """
-        self.cap.set(cv2.CAP_PROP_POS_FRAMES, self.frame_number)
+        if self.prefetch > 0:
+            return self._get_prefetched_frame()
+
+        image = self._read(self._frame_number)
+        self._frame_number += 1
+        return image
+
+    def __getitem__(self, index: int) -> np.ndarray:
+        """
+        Random access to a frame of the video. Sequential decoding continues from the frame after `index`.
+
+        Args:
+            index: Index of the frame, negative values count from the end of the video.
+
+        Returns:
+            The requested frame as an image array.
+
+        Raises:
+            IndexError: When the index is out of range.
+        """
+        if index < 0:
+            index += self.total_frames
+        if not 0 <= index < self.total_frames:
+            raise IndexError(f"Frame index {index} out of range for video with {self.total_frames} frames.")
+
+        self.seek(index)
+        image = self.get_frame()
+        if image is None:
+            raise IndexError(f"Frame {index} could not be decoded.")
+        return image
+
+    def close(self):
+        """
+        Stop the background decoding thread (if any) and release the video capture.
+        """
+        self._stop_prefetch()
+        self.cap.release()
+
+    def _read(self, frame_number: int) -> np.ndarray | None:
+        # Only seek when the decoder is not already positioned at the requested frame
+        if not self.sequential or self._decoder_position != frame_number:
+            self.cap.set(cv2.CAP_PROP_POS_FRAMES, frame_number)
         _, image = self.cap.read()
-        self.frame_number += 1
+        self._decoder_position = frame_number + 1
         return image
 
+    def _get_prefetched_frame(self) -> np.ndarray | None:
+        if self._end_of_stream:
+            return None
+        if self._reader is None:
+            self._start_prefetch()
+
+        frame_number, image = self._queue.get()
+        if image is None:
+            self._end_of_stream = True
+            self._stop_prefetch()
+            return None
+
+        self._frame_number = frame_number + 1
+        return image
+
+    def _start_prefetch(self):
+        self._queue = queue.Queue(maxsize=self.prefetch)
+        self._stop_reader.clear()
+        self._reader = threading.Thread(target=self._prefetch_loop, args=(self._frame_number,), daemon=True)
+        self._reader.start()
+
+    def _stop_prefetch(self):
+        if self._reader is None:
+            return
+
+        self._stop_reader.set()
+        # Unblock a reader waiting on a full queue
+        while self._reader.is_alive():
+            try:
+                self._queue.get_nowait()
+            except queue.Empty:
+                pass
+            self._reader.join(timeout=0.01)
+
+        self._reader = None
+        self._queue = None
+
+    def _prefetch_loop(self, frame_number: int):
+        while not self._stop_reader.is_set():
+            image = self._read(frame_number)
+            item = (frame_number, image)
+            while not self._stop_reader.is_set():
+                try:
+                    self._queue.put(item, timeout=0.1)
+                    break
+                except queue.Full:
+                    continue
+
+            if image is None:
+                break
+            frame_number += 1
+
     def __len__(self) -> int:
         return self.total_frames
 
@@ -250,12 +545,17 @@ class Dataset(Source):
     """
     Source that walks a directory tree and yields dataset samples.
     Useful for evaluation pipelines that need specific image ids from file names or folder structures.
+
+    Set `prefetch` to decode images ahead on a thread pool while the consumer runs inference.
+    Samples are still returned in order, `prefetch_stats` reports queue depth and decode latency.
     """
 
     def __init__(
         self,
         images_dir: Path,
         dataset_id_function: Optional[Callable] = None,
+        prefetch: int = 0,
+        workers: Optional[int] = None,
     ):
         """
         Build a dataset source.
@@ -263,9 +563,12 @@ class Dataset(Source):
         Args:
             images_dir: Root directory scanned recursively for images.
             dataset_id_function: Optional callable mapping a Path to an image id; defaults to the file stem.
+            prefetch: Number of images decoded ahead of the consumer. Defaults to 0 (decode on request).
+            workers: Number of decoding threads when prefetching. Defaults to `min(prefetch, cpu_count)`.
 
         Raises:
             FileNotFoundError: If the directory does not exist.
+            ValueError: When prefetch or workers are invalid.
         """
         self.images_dir = Path(images_dir)
         if not self.images_dir.exists():
@@ -286,6 +589,11 @@ class Dataset(Source):
         self.channels = None
         self.color_format = COLOR_FORMAT.BGR  # Color format returned by get_frame()
 
+        self.prefetch = prefetch
+        self.workers = _check_prefetch_args(prefetch, workers)
+        self.prefetch_stats = PrefetchStats()  #: Decode statistics when prefetching.
+        self._prefetcher = _ImagePrefetcher(self.image_files, _read_bgr, prefetch, self.workers, self.prefetch_stats)
+
     def get_frame(self) -> np.ndarray | None:
         """
         Load the next image from the dataset.
@@ -296,7 +604,10 @@ class Dataset(Source):
         if self.image_number >= len(self.image_files):
             return None
 
-        image = cv2.imread(str(self.image_files[self.image_number]))  # NOTE: always BGR
+        if self.prefetch > 0:
+            image = self._prefetcher.get(self.image_number)
+        else:
+            image = _read_bgr(self.image_files[self.image_number])
         self.height, self.width, self.channels = image.shape
         self.image_number += 1
 
@@ -323,17 +634,50 @@ class Dataset(Source):
         Yields:
             DatasetSample with path, name, id, and image in RGB format.
         """
-        for img_path in self.image_files:
-            img_bgr = cv2.imread(str(img_path))
-            if img_bgr is None:
-                continue  # skip corrupted/not found images
-            yield DatasetSample(
-                image_path=img_path,
-                image_name=img_path.name,
-                image_id=self.get_image_id(img_path),
-                image=cv2.cvtColor(img_bgr, cv2.COLOR_BGR2RGB),
-                image_color_format=COLOR_FORMAT.RGB,
-            )
+        prefetcher = None
+        if self.prefetch > 0:
+            prefetcher = _ImagePrefetcher(self.image_files, _read_rgb, self.prefetch, self.workers, self.prefetch_stats)
+
+        try:
+            for i, img_path in enumerate(self.image_files):
+                img_rgb = prefetcher.get(i) if prefetcher else _read_rgb(img_path)
+                if img_rgb is None:
+                    continue  # skip corrupted/not found images
+                yield self._make_sample(img_path, img_rgb)
+        finally:
+            if prefetcher:
+                prefetcher.close()
+
+    def load_sample(self, index: int) -> DatasetSample | None:
+        """
+        Load a single dataset sample by index, independent of the iteration state.
+
+        Args:
+            index: Index of the image in `image_files`.
+
+        Returns:
+            DatasetSample with the image in RGB format, or None when the image could not be read.
+        """
+        img_path = self.image_files[index]
+        img_rgb = _read_rgb(img_path)
+        if img_rgb is None:
+            return None
+        return self._make_sample(img_path, img_rgb)
+
+    def _make_sample(self, img_path: Path, img_rgb: np.ndarray) -> DatasetSample:
+        return DatasetSample(
+            image_path=img_path,
+            image_name=img_path.name,
+            image_id=self.get_image_id(img_path),
+            image=img_rgb,
+            image_color_format=COLOR_FORMAT.RGB,
+        )
+
+    def close(self):
+        """
+        Shut down the prefetching threads (if any).
+        """
+        self._prefetcher.close()
 
     def __len__(self) -> int:
         """Number of images discovered in the dataset."""
@@ -19,35 +19,138 @@ import math
 import mmap
 import platform
 import ctypes
-from typing import Tuple, List
+import re
+import uuid
+from typing import Optional, Tuple, List
 
-from .request_interface import TritonConfig, RequestPool, REQUEST_POOL_SIZE
+from .request_interface import TritonConfig, RequestPool, REQUEST_POOL_SIZE, MAX_REQUEST_POOL_SIZE, MAX_SHM_NAME_LENGTH
 
 SENSOR_WIDTH = 4052
 SENSOR_HEIGHT = 3036
 
+SHM_PREFIX = "modlib_triton"  # prefix of the shared memory segments of all Triton® instances
+SHM_DIR = "/dev/shm"
+
+_SHM_NAME_PATTERN = re.compile(rf"^{SHM_PREFIX}_(\d+)_[0-9a-f]+_\w+$")
+
+
+def unique_shm_name(kind: str) -> str:
+    """
+    Create a unique shared memory segment name for the current process.
+    The creator pid is part of the name, allowing `cleanup_stale_segments` to detect leftovers of crashed processes.
+
+    Args:
+        kind: Kind of the segment, e.g. "config" or "pool".
+
+    Returns:
+        The segment name (without leading slash).
+    """
+    return f"{SHM_PREFIX}_{os.getpid()}_{uuid.uuid4().hex[:8]}_{kind}"
+
+
+def cleanup_stale_segments() -> List[str]:
+    """
+    Remove the shared memory segments of Triton® instances whose process no longer exists,
+    e.g. left behind after a crash or a killed test run. Only segments owned by the current user are removed.
+    Only applies to Linux, Windows releases named shared memory with its last handle.
+
+    NOTE: The creator pid is checked in the PID namespace of the current process. Do not call this while
+    containers with their own PID namespace share `/dev/shm` (e.g. `--ipc=host`), it would remove their segments.
+
+    Returns:
+        The names of the removed segments.
+    """
+    if platform.system() != "Linux" or not os.path.isdir(SHM_DIR):
+        return []
+
+    removed = []
+    for name in os.listdir(SHM_DIR):
+        match = _SHM_NAME_PATTERN.match(name)
+        if match is None or _pid_alive(int(match.group(1))):
+            continue
+        path = os.path.join(SHM_DIR, name)
+        try:
+            if os.stat(path).st_uid != os.getuid():
+                continue
+            os.unlink(path)
+            removed.append(name)
+        except OSError:
+            pass  # removed concurrently
+    return removed
+
+
+def _pid_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True  # exists, owned by another user
+    return True
+
+
+def _open_shared_memory(name: str, size: int) -> Tuple[mmap.mmap, Optional[int]]:
+    if len(name) >= MAX_SHM_NAME_LENGTH:
+        raise ValueError(f"Shared memory name '{name}' exceeds {MAX_SHM_NAME_LENGTH - 1} characters")
+
+    if platform.system() == "Windows":
+        # Create Windows named shared memory
+        return mmap.mmap(-1, size, tagname=f"Local\\{name}"), None
+    elif platform.system() == "Linux":
+        # Create Linux named shared memory, exclusively to never attach to the segment of another instance
+        fd = os.open(os.path.join(SHM_DIR, name), os.O_CREAT | os.O_EXCL | os.O_RDWR, 0o600)
+        os.ftruncate(fd, size)
+        return mmap.mmap(fd, size, mmap.MAP_SHARED, mmap.PROT_WRITE | mmap.PROT_READ), fd
+    else:
+        raise ValueError("Unsupported platform")
+
+
+def attach_shared_memory(name: str, size: int) -> mmap.mmap:
+    """
+    Map an existing shared memory segment, e.g. the request pool in the camera process.
+
+    Args:
+        name: Name of the shared memory segment.
+        size: Size of the segment in bytes.
+
+    Returns:
+        The memory map of the segment.
+    """
+    if platform.system() == "Windows":
+        return mmap.mmap(-1, size, tagname=f"Local\\{name}")
+    elif platform.system() == "Linux":
+        fd = os.open(os.path.join(SHM_DIR, name), os.O_RDWR)
+        try:
+            return mmap.mmap(fd, size, mmap.MAP_SHARED, mmap.PROT_WRITE | mmap.PROT_READ)
+        finally:
+            os.close(fd)
+    else:
+        raise ValueError("Unsupported platform")
+
+
+def _close_shared_memory(name: str, fd: Optional[int]):
+    if fd is not None:
+        os.close(fd)
+        if os.path.exists(os.path.join(SHM_DIR, name)):
+            os.unlink(os.path.join(SHM_DIR, name))
+
 
 class ConfigAllocator:
-    def __init__(self):
+    def __init__(self, name: Optional[str] = None):
+        """
+        Args:
+            name: Name of the shared memory segment. Defaults to a unique name per instance.
+        """
+        self.name = name or unique_shm_name("config")
         self._config_mmap = None
         self._config = None
+        self._shm_fd = None
         self.total_size = ctypes.sizeof(TritonConfig)
 
         self._running = None
 
     def allocate(self) -> int:
-        if platform.system() == "Windows":
-            # Create Windows named shared memory
-            self._config_mmap = mmap.mmap(-1, self.total_size, tagname="Local\\TritonConfig")
-        elif platform.system() == "Linux":
-            # Create Linux named shared memory
-            self._shm_fd = os.open("/dev/shm/TritonConfig", os.O_CREAT | os.O_RDWR, 0o600)
-            os.ftruncate(self._shm_fd, self.total_size)
-            self._config_mmap = mmap.mmap(
-                self._shm_fd, self.total_size, mmap.MAP_SHARED, mmap.PROT_WRITE | mmap.PROT_READ
-            )
-        else:
-            raise ValueError("Unsupported platform")
+        self._config_mmap, self._shm_fd = _open_shared_memory(self.name, self.total_size)
         self._config = TritonConfig.from_buffer(self._config_mmap)
 
         # Initialize with default values
@@ -70,11 +173,8 @@ class ConfigAllocator:
             self._config_mmap.close()
             self._config_mmap = None
 
-        if hasattr(self, "_shm_fd"):
-            os.close(self._shm_fd)
-            self._shm_fd = None
-            if os.path.exists("/dev/shm/TritonConfig"):
-                os.unlink("/dev/shm/TritonConfig")
+        _close_shared_memory(self.name, self._shm_fd)
+        self._shm_fd = None
 
     def get_config(self) -> TritonConfig:
         """Get the config structure from shared memory."""
@@ -96,9 +196,21 @@ class ConfigAllocator:
 
 
 class Allocator:
-    def __init__(self):
+    def __init__(self, name: Optional[str] = None, request_pool_size: int = REQUEST_POOL_SIZE):
+        """
+        Args:
+            name: Name of the shared memory segment. Defaults to a unique name per instance.
+            request_pool_size: Number of requests in the pool. More requests tolerate more jitter
+                of the Python processing at the cost of an image and tensor buffer per request.
+        """
+        if not (1 <= request_pool_size <= MAX_REQUEST_POOL_SIZE):
+            raise ValueError(f"Request pool size must be in range 1..{MAX_REQUEST_POOL_SIZE}, got {request_pool_size}")
+
+        self.name = name or unique_shm_name("pool")
+        self.request_pool_size = request_pool_size
         self._request_pool_mmap = None
         self._request_pool = None
+        self._shm_fd = None
 
         self.total_size = None
 
@@ -112,6 +224,7 @@ class Allocator:
 
         # Calculate total size needed
         pool_size = ctypes.sizeof(RequestPool)
+        n = self.request_pool_size
 
         image_size = math.prod(image_shape) * ctypes.sizeof(ctypes.c_uint8)
         input_tensor_size = math.prod(input_tensor_shape) * ctypes.sizeof(ctypes.c_uint8)
@@ -121,25 +234,16 @@ class Allocator:
 
         # Offsets
         image_buffer_offset = pool_size
-        input_tensor_offset = pool_size + (image_size) * REQUEST_POOL_SIZE
-        output_tensor_offset = pool_size + (image_size + input_tensor_size) * REQUEST_POOL_SIZE
-        self.total_size = pool_size + (image_size + input_tensor_size + output_tensor_size) * REQUEST_POOL_SIZE
-
-        if platform.system() == "Windows":
-            self._request_pool_mmap = mmap.mmap(-1, self.total_size, tagname="Local\\TritonRequestPool")
-        elif platform.system() == "Linux":
-            self._shm_fd = os.open("/dev/shm/TritonRequestPool", os.O_CREAT | os.O_RDWR, 0o600)
-            os.ftruncate(self._shm_fd, self.total_size)
-            self._request_pool_mmap = mmap.mmap(
-                self._shm_fd, self.total_size, mmap.MAP_SHARED, mmap.PROT_WRITE | mmap.PROT_READ
-            )
-        else:
-            raise ValueError("Unsupported platform")
+        input_tensor_offset = pool_size + (image_size) * n
+        output_tensor_offset = pool_size + (image_size + input_tensor_size) * n
+        self.total_size = pool_size + (image_size + input_tensor_size + output_tensor_size) * n
 
+        self._request_pool_mmap, self._shm_fd = _open_shared_memory(self.name, self.total_size)
         self._request_pool = RequestPool.from_buffer(self._request_pool_mmap)
 
         # Initiate the offsets
         # self._request_pool.memory_base = ctypes.addressof(ctypes.c_char.from_buffer(self._request_pool_mmap))
+        self._request_pool.num_requests = n
         self._request_pool.image_buffer_offset = image_buffer_offset
         self._request_pool.input_tensor_offset = input_tensor_offset
         self._request_pool.output_tensor_offset = output_tensor_offset
@@ -158,11 +262,8 @@ class Allocator:
             self._request_pool_mmap.close()
             self._request_pool_mmap = None
 
-        if hasattr(self, "_shm_fd"):
-            os.close(self._shm_fd)
-            self._shm_fd = None
-            if os.path.exists("/dev/shm/TritonRequestPool"):
-                os.unlink("/dev/shm/TritonRequestPool")
+        _close_shared_memory(self.name, self._shm_fd)
+        self._shm_fd = None
 
     def mmap(self):
         if self._request_pool_mmap is None:
@@ -170,13 +271,13 @@ class Allocator:
         return self._request_pool_mmap
 
     def release_request(self, idx: int):
-        if not (0 <= idx < REQUEST_POOL_SIZE):
-            raise IndexError(f"Index {idx} out of range (0..{REQUEST_POOL_SIZE - 1})")
+        if not (0 <= idx < self.request_pool_size):
+            raise IndexError(f"Index {idx} out of range (0..{self.request_pool_size - 1})")
 
         self._request_pool.in_use[idx] = False
 
     def get_request(self, idx: int):
-        if not (0 <= idx < REQUEST_POOL_SIZE):
-            raise IndexError(f"Index {idx} out of range (0..{REQUEST_POOL_SIZE - 1})")
+        if not (0 <= idx < self.request_pool_size):
+            raise IndexError(f"Index {idx} out of range (0..{self.request_pool_size - 1})")
 
         return self._request_pool.requests[idx]
@@ -41,8 +41,9 @@ PyObject* arena_sdk_found(PyObject* self, PyObject* args) {
 
 PyObject* start(PyObject* self, PyObject* args) {
     PyObject* py_callback;
+    const char* config_name;
 
-    if (!PyArg_ParseTuple(args, "O", &py_callback)) {
+    if (!PyArg_ParseTuple(args, "Os", &py_callback, &config_name)) {
         return NULL;
     }
 
@@ -52,8 +53,8 @@ PyObject* start(PyObject* self, PyObject* args) {
         return NULL;
     }
 
-    // Call function with the callback
-    start_triton(py_callback);
+    // Call function with the callback and the name of the shared config segment
+    start_triton(py_callback, config_name);
 
     // Return None
     Py_RETURN_NONE;
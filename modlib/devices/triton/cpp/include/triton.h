@@ -21,7 +21,8 @@
 
 #define MAX_NUM_DIMENSIONS 16
 #define MAX_NUM_TENSORS 16
-#define REQUEST_POOL_SIZE 10
+#define MAX_REQUEST_POOL_SIZE 64
+#define MAX_SHM_NAME_LENGTH 64
 
 // -----------------------------------------------------------------------------
 //  RequestInterface
@@ -78,6 +79,7 @@ struct TritonConfig {
     uint32_t roi_it[4];
     uint32_t roi_hires[4];
     uint64_t total_pool_size;
+    char request_pool_name[MAX_SHM_NAME_LENGTH];
 };
 
 
@@ -86,8 +88,9 @@ struct TritonConfig {
 // -----------------------------------------------------------------------------
 
 struct RequestPool {
-    bool in_use[REQUEST_POOL_SIZE];
-    RequestInterface requests[REQUEST_POOL_SIZE];
+    bool in_use[MAX_REQUEST_POOL_SIZE];
+    RequestInterface requests[MAX_REQUEST_POOL_SIZE];
+    uint32_t num_requests;  // configured pool size, set by the allocator
     uint8_t current_index;
     void* memory_base;
 
@@ -100,12 +103,18 @@ struct RequestPool {
     uint32_t input_tensor_size;
     uint32_t output_tensor_size;
 
+    // Single-producer/single-consumer ring of filled request indices, managed by the Python RequestHandler
+    uint32_t ring_head;
+    uint32_t ring_tail;
+    uint8_t ring_indices[MAX_REQUEST_POOL_SIZE];
+    double ring_timestamps[MAX_REQUEST_POOL_SIZE];
+
     // Initialize from pre-allocated memory
     void init() {
         current_index = 0;
 
         // Initialize all requests in the provided memory
-        for (int i = 0; i < REQUEST_POOL_SIZE; i++) {
+        for (uint32_t i = 0; i < num_requests; i++) {
             // requests[i] = new (static_cast<char*>(memory_base) + pool_size + i * sizeof(RequestInterface)) RequestInterface();
             requests[i].idx = i;
             in_use[i] = false;
@@ -126,11 +135,11 @@ struct RequestPool {
 
     RequestInterface* get_next_request() {
         // Find the next available request
-        for (int i = 0; i < REQUEST_POOL_SIZE; i++) {
-            int idx = (current_index + i) % REQUEST_POOL_SIZE;
+        for (uint32_t i = 0; i < num_requests; i++) {
+            int idx = (current_index + i) % num_requests;
             if (!in_use[idx]) {
                 in_use[idx] = true;
-                current_index = (idx + 1) % REQUEST_POOL_SIZE;
+                current_index = (idx + 1) % num_requests;
                 return &requests[idx];
             }
         }
@@ -139,7 +148,7 @@ struct RequestPool {
 
     void print_pool_usage() {
         std::string usage = "Pool usage: ";
-        for (int i = 0; i < REQUEST_POOL_SIZE; i++) {
+        for (uint32_t i = 0; i < num_requests; i++) {
             usage += (in_use[i] ? "1" : "0");
             usage += " ";
         }
@@ -174,7 +183,7 @@ struct DATNetworkInfo {
 
 
 extern "C" {
-    void start_triton(PyObject* py_callback);
+    void start_triton(PyObject* py_callback, const char* config_name);
     DATNetworkInfo triton_upload_file(const char* filePath, int fileType);
     void simple_acquisition();
 }
\ No newline at end of file
@@ -24,6 +24,8 @@
 #include <iomanip>
 #include <sstream>
 #include <cstdio>
+#include <cstring>
+#include <string>
 #include <sys/stat.h>
 
 // for waiting for system close
@@ -49,11 +51,12 @@
 
 #include <windows.h>
 
-TritonConfig* get_shared_config() {
+TritonConfig* get_shared_config(const char* name) {
+    std::string tagname = std::string("Local\\") + name;
     HANDLE hMapFile = OpenFileMappingA(
         FILE_MAP_ALL_ACCESS,
         FALSE,
-        "Local\\TritonConfig"
+        tagname.c_str()
     );
 
     if (hMapFile == NULL) {
@@ -84,8 +87,9 @@ TritonConfig* get_shared_config() {
 #include <sys/mman.h> // mmap
 #include <unistd.h>   // close
 
-TritonConfig* get_shared_config() {
-    int fd = shm_open("/TritonConfig", O_RDWR, 0666);
+TritonConfig* get_shared_config(const char* name) {
+    std::string shm_name = std::string("/") + name;
+    int fd = shm_open(shm_name.c_str(), O_RDWR, 0666);
     if (fd == -1) {
         perror("shm_open failed");
         return NULL;
@@ -110,11 +114,12 @@ TritonConfig* get_shared_config() {
 
 #ifdef _WIN32
 
-RequestPool* get_shared_request_pool(uint64_t total_pool_size) {
+RequestPool* get_shared_request_pool(const char* name, uint64_t total_pool_size) {
+    std::string tagname = std::string("Local\\") + name;
     HANDLE hMapFile = OpenFileMappingA(
         FILE_MAP_ALL_ACCESS,
         FALSE,
-        "Local\\TritonRequestPool"
+        tagname.c_str()
     );
 
     if (hMapFile == NULL) {
@@ -144,8 +149,9 @@ RequestPool* get_shared_request_pool(uint64_t total_pool_size) {
 
 #else // Linux
 
-RequestPool* get_shared_request_pool(uint64_t total_pool_size) {
-    int fd = shm_open("/TritonRequestPool", O_RDWR, 0666);
+RequestPool* get_shared_request_pool(const char* name, uint64_t total_pool_size) {
+    std::string shm_name = std::string("/") + name;
+    int fd = shm_open(shm_name.c_str(), O_RDWR, 0666);
     if (fd == -1) {
         perror("shm_open failed");
         return nullptr;
@@ -278,7 +284,7 @@ const std::map<unsigned int, std::array<unsigned int, 3>> IMAGE_SHAPE_MAP = {
 };
 
 
-void start_triton(PyObject* py_callback) {
+void start_triton(PyObject* py_callback, const char* config_name) {
     try
     {
         // --------------------------INITIATE------------------------
@@ -298,7 +304,7 @@ void start_triton(PyObject* py_callback) {
         ArenaExample::IMX501Utils util(pDevice, false);
 
         // --------------------------SETTINGS------------------------
-        TritonConfig* triton_config = get_shared_config();
+        TritonConfig* triton_config = get_shared_config(config_name);
         if (!triton_config) {
             std::cerr << "Failed to open shared triton config memory" << std::endl;
             return;
@@ -349,7 +355,8 @@ void start_triton(PyObject* py_callback) {
         util.SetFPS(triton_config->frame_rate);
 
         // -------------------------GET SHARED REQUEST POOL------------------------
-        RequestPool* request_pool = get_shared_request_pool(triton_config->total_pool_size);
+        std::string request_pool_name(triton_config->request_pool_name, strnlen(triton_config->request_pool_name, MAX_SHM_NAME_LENGTH));
+        RequestPool* request_pool = get_shared_request_pool(request_pool_name.c_str(), triton_config->total_pool_size);
         if (!request_pool) {
             std::cerr << "Failed to open shared request pool memory" << std::endl;
             return;
@@ -15,12 +15,14 @@
 #
 
 from enum import Enum
-from ctypes import Structure, c_void_p, c_uint32, c_uint16, c_uint8, c_bool, c_double, c_uint64
+from ctypes import Structure, c_void_p, c_uint32, c_uint16, c_uint8, c_bool, c_double, c_uint64, c_char
 
 
 MAX_NUM_DIMENSIONS = 16
 MAX_NUM_TENSORS = 16
-REQUEST_POOL_SIZE = 10
+REQUEST_POOL_SIZE = 10  # default number of requests in the pool
+MAX_REQUEST_POOL_SIZE = 64
+MAX_SHM_NAME_LENGTH = 64
 
 
 # Matches: struct RequestImage
@@ -77,8 +79,9 @@ class RequestInterface(Structure):
 # Matches: struct RequestPool
 class RequestPool(Structure):
     _fields_ = [
-        ("in_use", c_bool * REQUEST_POOL_SIZE),
-        ("requests", RequestInterface * REQUEST_POOL_SIZE),
+        ("in_use", c_bool * MAX_REQUEST_POOL_SIZE),
+        ("requests", RequestInterface * MAX_REQUEST_POOL_SIZE),
+        ("num_requests", c_uint32),
         ("current_index", c_uint8),
         ("memory_base", c_void_p),
         ("image_buffer_offset", c_uint32),
@@ -88,6 +91,11 @@ class RequestPool(Structure):
         ("image_size", c_uint32),
         ("input_tensor_size", c_uint32),
         ("output_tensor_size", c_uint32),
+        # Single-producer/single-consumer ring of filled request indices (camera process -> processing thread)
+        ("ring_head", c_uint32),
+        ("ring_tail", c_uint32),
+        ("ring_indices", c_uint8 * MAX_REQUEST_POOL_SIZE),
+        ("ring_timestamps", c_double * MAX_REQUEST_POOL_SIZE),
     ]
 
 
@@ -102,6 +110,7 @@ class TritonConfig(Structure):
         ("roi_it", c_uint32 * 4),
         ("roi_hires", c_uint32 * 4),
         ("total_pool_size", c_uint64),
+        ("request_pool_name", c_char * MAX_SHM_NAME_LENGTH),
     ]
 
 
@@ -24,15 +24,18 @@ import signal
 import numpy as np
 import cv2
 import time
+import weakref
 from datetime import datetime
 from typing import Optional, Tuple, Union
 
 
-from ..device import Device, Rate
+from ..broadcast import BUFFER_POLICY, FrameBroadcaster, Subscription
+from ..device import Device, Latency, Rate
 from ..frame import IMAGE_TYPE, ROI, Frame
-from .request_interface import TritonConfig, CameraFileType
-from .allocator import Allocator, ConfigAllocator
+from .request_interface import TritonConfig, CameraFileType, RequestPool, REQUEST_POOL_SIZE, MAX_REQUEST_POOL_SIZE
+from .allocator import Allocator, ConfigAllocator, attach_shared_memory, cleanup_stale_segments
 
+import modlib.devices.imx500.isp as isp
 from modlib.models import COLOR_FORMAT, Model
 from modlib.models.zoo import InputTensorOnly
 
@@ -54,23 +57,119 @@ logging.basicConfig(level=logging.INFO, format="[%(asctime)s] [%(name)s]  %(leve
 logger = logging.getLogger(__name__.split(".")[-1])
 
 
+_INTERPOLATIONS = (cv2.INTER_NEAREST, cv2.INTER_LINEAR, cv2.INTER_AREA, cv2.INTER_CUBIC)
+
+
+class _ImageBufferPool:
+    """
+    Preallocated output images, a buffer is only reused once no frame (or view of it) references it anymore.
+
+    Every acquired image views its buffer through a new ctypes lease object. The image and all views derived
+    from it reference the lease, so the buffer is free once the weak reference to its lease is dead.
+    """
+
+    def __init__(self, size: int = 4):
+        self.size = size
+        self._buffers = []  # [buffer, weak reference to the lease of the last acquired image]
+
+    def acquire(self, shape: Tuple[int, ...], dtype=np.uint8) -> np.ndarray:
+        for entry in self._buffers:
+            buffer, lease = entry
+            if lease() is None and buffer.shape == shape and buffer.dtype == dtype:
+                return self._lease(entry)
+
+        buffer = np.empty(shape, dtype=dtype)
+        if self._buffers and self._buffers[0][0].shape != shape:
+            self._buffers.clear()  # image size changed
+        if len(self._buffers) < self.size:
+            entry = [buffer, None]
+            self._buffers.append(entry)
+            return self._lease(entry)
+        return buffer
+
+    @staticmethod
+    def _lease(entry: list) -> np.ndarray:
+        buffer = entry[0]
+        lease = (ctypes.c_uint8 * buffer.nbytes).from_buffer(buffer)
+        entry[1] = weakref.ref(lease)
+        return np.frombuffer(lease, dtype=buffer.dtype).reshape(buffer.shape)
+
+
 class RequestHandler:
+    """
+    Hands the indices of filled requests from the camera process to the processing thread through a
+    single-producer/single-consumer ring in the shared request pool. Every entry is announced with a semaphore
+    release, which also orders the ring writes of the producer before the reads of the consumer.
+    """
+
     def __init__(self, rps):
-        self._requests = multiprocessing.Manager().list()
-        self._requestslock = multiprocessing.Lock()
-        self.notifyme_r, self.notifyme_w = multiprocessing.Pipe(duplex=False)
+        self._available = multiprocessing.Semaphore(0)
+        self._mmap = None
+        self._pool = None
+        self._pool_name = None
+        self._pool_size = None
 
         self.rps = rps
         self._rps = Rate()
 
+    def attach(self, allocator: Allocator):
+        """Attach to the allocated request pool and reset the ring, before starting the camera process."""
+        self._mmap = allocator.mmap()
+        self._pool = RequestPool.from_buffer(self._mmap)
+        self._pool_name = allocator.name
+        self._pool_size = allocator.total_size
+        self._pool.ring_head = 0
+        self._pool.ring_tail = 0
+
+    def detach(self):
+        """Release the request pool view, required before the allocator closes the shared memory."""
+        self._pool = None
+        self._mmap = None
+
+    def __getstate__(self):
+        # A spawned camera process maps the request pool by name
+        state = self.__dict__.copy()
+        state["_mmap"] = None
+        state["_pool"] = None
+        return state
+
     def py_callback(self, req_idx: int):
-        with self._requestslock:
-            self._requests += [req_idx]
+        # Producer: called by the camera process for every filled request
+        if self._pool is None:
+            self._mmap = attach_shared_memory(self._pool_name, self._pool_size)
+            self._pool = RequestPool.from_buffer(self._mmap)
+
+        head = self._pool.ring_head
+        self._pool.ring_indices[head % MAX_REQUEST_POOL_SIZE] = req_idx
+        self._pool.ring_timestamps[head % MAX_REQUEST_POOL_SIZE] = time.perf_counter()  # system-wide clock
+        self._pool.ring_head = (head + 1) & 0xFFFFFFFF
 
         self._rps.update()
         self.rps.value = self._rps.value
 
-        self.notifyme_w.send(b"\x00")
+        self._available.release()
+
+    def get(self, timeout: Optional[float] = None) -> Optional[Tuple[int, float]]:
+        """
+        Consumer: take the oldest filled request from the ring.
+
+        Args:
+            timeout: Maximum time in seconds to wait for a request, 0 to return immediately.
+
+        Returns:
+            The request index and the `time.perf_counter()` time it was filled, or None when no request arrived.
+        """
+        acquired = self._available.acquire(False) if timeout == 0 else self._available.acquire(True, timeout)
+        if not acquired:
+            return None
+
+        tail = self._pool.ring_tail
+        entry = (
+            int(self._pool.ring_indices[tail % MAX_REQUEST_POOL_SIZE]),
+            float(self._pool.ring_timestamps[tail % MAX_REQUEST_POOL_SIZE]),
+        )
+        self._pool.ring_tail = (tail + 1) & 0xFFFFFFFF
+        return entry
 
 
 class Triton(Device):
@@ -88,6 +187,10 @@ class Triton(Device):
         timeout: Optional[int] = None,
         frame_rate: Optional[float] = 30.0,
         image_size: Tuple[int, int] = (640, 480),
+        request_pool_size: int = REQUEST_POOL_SIZE,
+        resize: bool = True,
+        interpolation: int = cv2.INTER_LINEAR,
+        cleanup_stale_shm: bool = False,
     ):
         """
         Initialize the Triton® device.
@@ -98,7 +201,21 @@ class Triton(Device):
             timeout: If set, automatically stop the device loop after the specified seconds.
             frame_rate: The frames per second applied to the Arena SDK configuration.
             image_size: Resolution of the frame.image. Defaults to (640, 480) which has the original aspect ratio.
+            request_pool_size: Number of requests shared with the camera process. Larger pools tolerate more
+                processing jitter at the cost of one image and tensor buffer per request. Defaults to 10.
+            resize: Resize the frame.image to `image_size`. When False, the sensor binning mode closest to
+                `image_size` is selected and the frame.image keeps its native size, skipping the resize entirely.
+            interpolation: OpenCV interpolation of the resize, e.g. `cv2.INTER_AREA` (best quality when downscaling)
+                or `cv2.INTER_NEAREST` (fastest). Defaults to `cv2.INTER_LINEAR`.
+            cleanup_stale_shm: Remove the shared memory segments left behind by crashed Triton® processes of the
+                current user, see `cleanup_stale_segments`. Only enable when no other PID namespace (container)
+                shares `/dev/shm`. Defaults to False.
         """
+        if interpolation not in _INTERPOLATIONS:
+            raise ValueError(
+                "Invalid interpolation. "
+                "Must be one of: cv2.INTER_NEAREST, cv2.INTER_LINEAR, cv2.INTER_AREA, cv2.INTER_CUBIC."
+            )
         if not triton_cpp.arena_sdk_found():
             raise ImportError("Modlib was compiled without the Arena SDK")
 
@@ -106,8 +223,11 @@ class Triton(Device):
         self.roi_it = None  # ROI input tensor
         self.roi_hires = None  # ROI high resolution image
 
-        # Shared memory for request pool & config
-        self._allocator = Allocator()
+        # Shared memory for request pool & config, unique per instance
+        if cleanup_stale_shm:
+            for name in cleanup_stale_segments():
+                logger.debug(f"Removed stale shared memory segment '{name}'.")
+        self._allocator = Allocator(request_pool_size=request_pool_size)
         self.config = ConfigAllocator()
         self.config.allocate()
 
@@ -115,8 +235,10 @@ class Triton(Device):
         self._frames = []
         self._frameslock = threading.Lock()
         self._frame_ready = threading.Condition(self._frameslock)
+        self._broadcaster = FrameBroadcaster()  # frame subscriptions of other consumers
         self.last_detections = None
         self.input_tensor_image = None
+        self._image_buffers = _ImageBufferPool()  # reusable frame.image buffers
 
         # Process thread
         self.lock = threading.Lock()
@@ -130,6 +252,7 @@ class Triton(Device):
         self.fps = Rate()
         self.dps = Rate()
         self.rps = multiprocessing.Value("d", 0.0)
+        self.request_latency = Latency()  # time in seconds from a filled camera request to its frame
 
         self._rh = RequestHandler(self.rps)
 
@@ -138,6 +261,8 @@ class Triton(Device):
 
         self.frame_rate = frame_rate
         self.image_size = image_size
+        self.resize = resize
+        self.interpolation = interpolation
         super().__init__(
             headless=headless,
             enable_input_tensor=enable_input_tensor,
@@ -215,6 +340,7 @@ class Triton(Device):
             roi_it=(ctypes.c_uint32 * 4)(*roi_it_abs),
             roi_hires=(ctypes.c_uint32 * 4)(*roi_hires_abs),
             total_pool_size=ctypes.c_uint64(self._allocator.total_size),
+            request_pool_name=self._allocator.name.encode(),
         )
 
         self.config.set_config(triton_config)
@@ -223,32 +349,27 @@ class Triton(Device):
         self._proc_started.set()
 
         while not self._proc_abort.is_set():
-            if self._rh.notifyme_r.poll(0.2):
-                self._rh.notifyme_r.recv()
-                self._process_requests()
+            request = self._rh.get(timeout=0.2)
+            if request is not None:
+                self._process_requests(request)
 
-    def _process_requests(self):
-        with self._rh._requestslock:
-            requests = list(self._rh._requests)
-            self._rh._requests[:] = []  # Clear the ListProxy object
+    def _process_requests(self, request: Tuple[int, float]):
+        # Drain the ring, only the latest request is processed
+        while (newer := self._rh.get(timeout=0)) is not None:
+            logger.debug("Processing thread is dropping incoming triton requests.")
+            self._allocator.release_request(request[0])
+            request = newer
 
         with self.lock:
-            if not requests:
-                return
-            req_idx = requests.pop(0)
+            req_idx, request_time = request
 
             # Process information in the triton request
             # Add the processed information as a Frame to the frame buffer
-            self._parse_request(req_idx)
+            self._parse_request(req_idx, request_time)
 
             # Release the request
             self._allocator.release_request(req_idx)
 
-            # Release possible remaining requests, those leftovers are thrown away
-            for req_idx in requests:
-                logger.debug("Processing thread is dropping incoming triton requests.")
-                self._allocator.release_request(req_idx)
-
     def _get_output_tensor_shape(self, req):
         output_tensor = req.output_tensor
         if not output_tensor:
@@ -271,27 +392,36 @@ class Triton(Device):
         w = req.input_tensor.width
         c = req.input_tensor.num_channels
 
-        r1 = (
-            np.frombuffer(
-                self._allocator.mmap(),
-                offset=req.input_tensor.data_offset,
-                count=req.input_tensor.data_size // np.dtype(np.uint8).itemsize,
-                dtype=np.uint8,
-            )
-            .reshape((c, h, w))  # CHW
-            .astype(np.int32)
-        )
-
-        norm_val = self.model.info["input_tensor"]["norm_val"]
-        norm_shift = self.model.info["input_tensor"]["norm_shift"]
-        div_val = self.model.info["input_tensor"]["div_val"]
-        div_shift = self.model.info["input_tensor"]["div_shift"]
-        for i in [0, 1, 2]:
-            r1[i] = ((((r1[i] << norm_shift[i]) - norm_val[i]) << div_shift) // div_val[i]) & 0xFF
-
-        self.input_tensor_image = np.transpose(r1, (1, 2, 0)).astype(np.uint8).copy()  # CHW -> HWC
+        r1 = np.frombuffer(
+            self._allocator.mmap(),
+            offset=req.input_tensor.data_offset,
+            count=req.input_tensor.data_size // np.dtype(np.uint8).itemsize,
+            dtype=np.uint8,
+        ).reshape((c, h, w))  # CHW
+
+        # Denormalize with the model lookup table straight from the shared memory into a new HWC image
+        self.input_tensor_image = isp.isp_denormalize_chw(r1, self.model)
+
+    def _copy_image(self, req) -> np.ndarray:
+        # Copy the image out of the shared memory, the request is reused afterwards.
+        # The resize is fused into the copy, writing straight into a reusable output buffer.
+        rh, rw, rc = req.image.height, req.image.width, req.image.num_channels
+        shared = np.frombuffer(
+            self._allocator.mmap(),
+            offset=req.image.data_offset,
+            count=req.image.data_size // np.dtype(np.uint8).itemsize,
+            dtype=np.uint8,
+        ).reshape((rh, rw, rc))
+
+        if not self.resize or (rw, rh) == tuple(self.image_size):
+            image = self._image_buffers.acquire((rh, rw, rc))
+            np.copyto(image, shared)
+        else:
+            image = self._image_buffers.acquire((self.image_size[1], self.image_size[0], rc))
+            cv2.resize(shared, self.image_size, dst=image, interpolation=self.interpolation)
+        return image
 
-    def _parse_request(self, req_idx):
+    def _parse_request(self, req_idx: int, request_time: Optional[float] = None):
         req = self._allocator.get_request(req_idx)
 
         detections = None
@@ -340,39 +470,36 @@ class Triton(Device):
             image = self.input_tensor_image
             color_format = self.model.color_format
         else:
-            rh, rw, rc = req.image.height, req.image.width, req.image.num_channels
-            image = cv2.resize(
-                np.frombuffer(
-                    self._allocator.mmap(),
-                    offset=req.image.data_offset,
-                    count=req.image.data_size // np.dtype(np.uint8).itemsize,
-                    dtype=np.uint8,
-                ).reshape((rh, rw, rc)),  # copy required: the cv2 resize creates a copy
-                self.image_size,
-            )
+            image = self._copy_image(req)
             color_format = COLOR_FORMAT.BGR
 
         h, w, c = image.shape
 
-        with self._frameslock:
-            self._frames.append(
-                Frame(
-                    timestamp=datetime.now().isoformat(),
-                    image=image,
-                    image_type=IMAGE_TYPE.VGA if not self.enable_input_tensor else IMAGE_TYPE.INPUT_TENSOR,
-                    width=w,
-                    height=h,
-                    channels=c,
-                    detections=detections,
-                    new_detection=new_detection,
-                    fps=self.fps.value,
-                    dps=self.dps.value,
-                    color_format=color_format,
-                    roi=self.roi,
-                )
-            )
+        frame = Frame(
+            timestamp=datetime.now().isoformat(),
+            image=image,
+            image_type=IMAGE_TYPE.VGA if not self.enable_input_tensor else IMAGE_TYPE.INPUT_TENSOR,
+            width=w,
+            height=h,
+            channels=c,
+            detections=detections,
+            new_detection=new_detection,
+            fps=self.fps.value,
+            dps=self.dps.value,
+            color_format=color_format,
+            roi=self.roi,
+        )
 
+        with self._frameslock:
+            self._frames.append(frame)
             self._frame_ready.notify_all()  # Notify waiting threads
+            self._notify_async_waiters()  # Notify waiting coroutines
+
+        if request_time is not None:
+            self.request_latency.update(time.perf_counter() - request_time)
+
+        # Publish to subscriptions outside the frame buffer lock, blocking subscriptions may apply backpressure
+        self._broadcaster.publish(frame)
 
     def _initiate_roi(self) -> None:
         # Full field of view if high res image cropping not specified
@@ -447,6 +574,7 @@ class Triton(Device):
             roi_it=self.roi_it,
             roi_hires=self.roi_hires,
         )
+        self._rh.attach(self._allocator)
 
         # Start processing thread
         self._proc_started.clear()
@@ -459,7 +587,7 @@ class Triton(Device):
         # Call triton process start
         self._triton_cpp_process = multiprocessing.Process(
             target=triton_cpp.start,
-            args=(self._rh.py_callback,),  # Pass the callback function
+            args=(self._rh.py_callback, self.config.name),  # Pass the callback function and config segment
         )
         self._triton_cpp_process.daemon = True
         self.config.set_keep_running(True)
@@ -497,6 +625,9 @@ class Triton(Device):
     def stop(self):
         atexit.unregister(self.stop)
 
+        # End all subscriptions, releasing a processing thread blocked by a full subscription
+        self._broadcaster.close()
+
         # Stop the processing thread
         if self._proc_thread and self._proc_thread.is_alive():
             self._proc_abort.set()
@@ -515,15 +646,10 @@ class Triton(Device):
                 # NOTE: consider a force kill after a timeout in join
 
             # Release any remaining requests
-            with self._rh._requestslock:
-                unseen_requests = self._rh._requests
-                self._rh._requests[:] = []
-
-            for req_idx in unseen_requests:
-                self._allocator.release_request(req_idx)
+            while (request := self._rh.get(timeout=0)) is not None:
+                self._allocator.release_request(request[0])
 
-        self._rh.notifyme_r.close()
-        self._rh.notifyme_w.close()
+        self._rh.detach()
 
         self.model = None
         self.roi_it = None
@@ -703,6 +829,22 @@ class Triton(Device):
         self.fps.init()
         return self
 
+    def subscribe(self, maxsize: int = 8, policy: str = BUFFER_POLICY.DROP_OLDEST) -> Subscription:
+        """
+        Subscribe to all frames of the device stream, e.g. to display, record or analyse the stream
+        from other threads. Every subscription has its own bounded ring buffer and drop counter,
+        independent of the frames consumed by iterating the device. Subscriptions end when the device stops.
+
+        Args:
+            maxsize: Capacity of the subscription ring buffer. Defaults to 8, ignored for `BUFFER_POLICY.LATEST`.
+            policy: Policy when the ring buffer is full, see `BUFFER_POLICY`. Defaults to `BUFFER_POLICY.DROP_OLDEST`.
+                With `BUFFER_POLICY.BLOCK` a slow consumer slows down the device stream.
+
+        Returns:
+            The subscription, iterate it or call `subscription.get()` to receive the frames.
+        """
+        return self._broadcaster.subscribe(maxsize, policy)
+
     def get_frame(self) -> Frame:
         """
         Gets the next processed frame in the device stream.
@@ -717,17 +859,36 @@ class Triton(Device):
             # We only allow the main thread to pop and clear the frame buffer
             # Calling get_frame() from a thread other than the main thread is allowed and
             # returns the last frame in the buffer for processing
-            if threading.current_thread() is threading.main_thread():
-                frame = self._frames.pop(-1)
-                if self._frames:
-                    logger.debug(f"Main thread is dropping {len(self._frames)} frames.")
-                    self._frames.clear()
-                self.fps.update()
-            else:
-                frame = self._frames[-1]
+            return self._take_frame(pop=threading.current_thread() is threading.main_thread())
+
+    def _take_frame(self, pop: bool = True) -> Optional[Frame]:
+        """
+        Take the latest frame from the frame buffer, must be called holding `self._frameslock`.
+
+        Args:
+            pop: Pop the latest frame and drop older frames, otherwise only peek at the latest frame.
+
+        Returns:
+            The latest frame, or None when the frame buffer is empty.
+        """
+        if not self._frames:
+            return None
+
+        if pop:
+            frame = self._frames.pop(-1)
+            if self._frames:
+                logger.debug(f"Main thread is dropping {len(self._frames)} frames.")
+                self._frames.clear()
+            self.fps.update()
+        else:
+            frame = self._frames[-1]
 
         return frame
 
+    async def _anext_frame(self) -> Frame:
+        # The consuming event loop owns the frame buffer, like the main thread does for `get_frame()`
+        return await self._wait_for_frame(self._take_frame)
+
     def __next__(self) -> Frame:
         """
         Get the next frame in the device stream.
@@ -18,3 +18,4 @@ from .evaluator import Evaluator, EvaluationSample
 from .coco import COCOEvaluator, COCOPoseEvaluator
 from .classification import ClassificationEvaluator
 from .voc import VocSegEvaluator
+from .parallel import evaluate_parallel
@@ -55,6 +55,7 @@ class ClassificationEvaluator(Evaluator):
 
         self.labels = labels
         self.num_classes = len(labels) if labels is not None else 1000  # Default to 1000 imagenet classes
+        self.reset()
 
     def _get_ground_truth_class(self, image_id: Union[int, str]) -> Optional[int]:
         """
@@ -116,51 +117,83 @@ class ClassificationEvaluator(Evaluator):
 
         print("=" * 80)
 
-    def evaluate(self, samples: list[EvaluationSample]):
+    def reset(self) -> None:
         """
-        Compute top-1/top-5 accuracy and confusion matrix for classification predictions.
+        Clear all accumulated counts and the confusion matrix.
+        """
+        self._total = 0
+        self._correct_top1 = 0
+        self._correct_top5 = 0
+        self._confusion_matrix = np.zeros((self.num_classes, self.num_classes), dtype=np.int64)
 
-        Args:
-            samples: Samples containing dataset images, ground-truth IDs, and predicted classifications.
+    def add(self, sample: EvaluationSample) -> None:
+        """
+        Accumulate the top-1/top-5 counts and confusion matrix of a single evaluation sample.
 
-        Returns:
-            Dict with aggregate metrics, per-class metrics, and the confusion matrix.
+        Args:
+            sample: Sample containing the ground-truth ID and predicted classifications.
         """
-        total = 0
-        correct_top1 = 0
-        correct_top5 = 0
-        confusion_matrix = np.zeros((self.num_classes, self.num_classes), dtype=np.int64)
+        gt_class = self._get_ground_truth_class(sample.dataset_sample.image_id)
+        if gt_class is None:
+            print(f"Warning: No ground truth for image_id {sample.dataset_sample.image_id}, skipping")
+            return
+
+        if len(sample.detections.class_id) == 0:
+            print(f"Warning: No predictions for image_id {gt_class}, skipping")
+            return
+
+        # Sort by confidence to get top predictions
+        # y_pred_k = k-th highest confidence prediction
+        sorted_indices = np.argsort(sample.detections.confidence)[::-1]
+        class_id_array = np.asarray(sample.detections.class_id)
+        top1_class = class_id_array[sorted_indices[0]]  # y_pred_1
+        top5_classes = class_id_array[sorted_indices[:5]]  # {y_pred_1, ..., y_pred_5}
+
+        # Update metrics according to formulas in module docstring:
+        # Top1Acc = (1/N) * sum_i [y_pred_1[i] == y_true[i]]
+        # Top5Acc = (1/N) * sum_i [y_true[i] in {y_pred_1[i], ..., y_pred_5[i]}]
+        self._total += 1
+        if top1_class == gt_class:
+            self._correct_top1 += 1  # Count: y_pred_1 == y_true
+        if gt_class in top5_classes:
+            self._correct_top5 += 1  # Count: y_true in {y_pred_1, ..., y_pred_5}
+
+        # Update confusion matrix: CM[c_gt, c_pred] = count of samples with GT=c_gt, pred=c_pred
+        # Diagonal elements (CM[c, c]) = TP_c (true positives for class c)
+        if 0 <= gt_class < self.num_classes and 0 <= top1_class < self.num_classes:
+            self._confusion_matrix[gt_class, top1_class] += 1
+
+    def get_state(self) -> dict:
+        """
+        Get the accumulated counts and confusion matrix.
+        """
+        return {
+            "total": self._total,
+            "correct_top1": self._correct_top1,
+            "correct_top5": self._correct_top5,
+            "confusion_matrix": self._confusion_matrix.copy(),
+        }
 
-        for s in samples:
-            gt_class = self._get_ground_truth_class(s.dataset_sample.image_id)
-            if gt_class is None:
-                print(f"Warning: No ground truth for image_id {s.dataset_sample.image_id}, skipping")
-                continue
+    def merge_state(self, state: dict) -> None:
+        """
+        Add the counts and confusion matrix of another evaluator state.
+        """
+        self._total += state["total"]
+        self._correct_top1 += state["correct_top1"]
+        self._correct_top5 += state["correct_top5"]
+        self._confusion_matrix += state["confusion_matrix"]
 
-            if len(s.detections.class_id) == 0:
-                print(f"Warning: No predictions for image_id {gt_class}, skipping")
-                continue
+    def finalize(self):
+        """
+        Compute top-1/top-5 accuracy and confusion matrix over all accumulated samples.
 
-            # Sort by confidence to get top predictions
-            # y_pred_k = k-th highest confidence prediction
-            sorted_indices = np.argsort(s.detections.confidence)[::-1]
-            class_id_array = np.asarray(s.detections.class_id)
-            top1_class = class_id_array[sorted_indices[0]]  # y_pred_1
-            top5_classes = class_id_array[sorted_indices[:5]]  # {y_pred_1, ..., y_pred_5}
-
-            # Update metrics according to formulas in module docstring:
-            # Top1Acc = (1/N) * sum_i [y_pred_1[i] == y_true[i]]
-            # Top5Acc = (1/N) * sum_i [y_true[i] in {y_pred_1[i], ..., y_pred_5[i]}]
-            total += 1
-            if top1_class == gt_class:
-                correct_top1 += 1  # Count: y_pred_1 == y_true
-            if gt_class in top5_classes:
-                correct_top5 += 1  # Count: y_true in {y_pred_1, ..., y_pred_5}
-
-            # Update confusion matrix: CM[c_gt, c_pred] = count of samples with GT=c_gt, pred=c_pred
-            # Diagonal elements (CM[c, c]) = TP_c (true positives for class c)
-            if 0 <= gt_class < self.num_classes and 0 <= top1_class < self.num_classes:
-                confusion_matrix[gt_class, top1_class] += 1
+        Returns:
+            Dict with aggregate metrics, per-class metrics, and the confusion matrix.
+        """
+        total = self._total
+        correct_top1 = self._correct_top1
+        correct_top5 = self._correct_top5
+        confusion_matrix = self._confusion_matrix.copy()  # callers may modify the result
 
         # Compute final metrics
         # Top-1 Accuracy: Top1Acc = correct_top1 / total = (1/N) * sum_i [y_pred_1[i] == y_true[i]]
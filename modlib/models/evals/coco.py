@@ -23,7 +23,7 @@ from pycocotools.coco import COCO
 from pycocotools.cocoeval import COCOeval
 
 from modlib.apps.annotate import Annotator, Color
-from modlib.models import COLOR_FORMAT, Detections, Poses
+from modlib.models import COLOR_FORMAT, ROI, Detections, Poses
 from modlib.models.evals import Evaluator, EvaluationSample
 from modlib.devices.frame import Frame, IMAGE_TYPE
 
@@ -50,6 +50,7 @@ class COCOEvaluator(Evaluator):
         """
         self.ground_truth = ground_truth
         self.coco_gt = COCO(self.ground_truth)
+        self._image_sizes = _image_size_index(self.coco_gt)
 
         if label_mapping_func is not None:
             self.label_mapping_func = label_mapping_func
@@ -57,6 +58,8 @@ class COCOEvaluator(Evaluator):
             # Default to mapping from 80 to 91 classes
             self.label_mapping_func = self._get_label_mapping_func(num_classes)
 
+        self.reset()
+
     def _get_label_mapping_func(self, num_classes: int) -> Callable:
         if num_classes == 80:
             return coco80_to_coco91
@@ -65,64 +68,67 @@ class COCOEvaluator(Evaluator):
         else:
             raise ValueError(f"Unsupported number of classes: {num_classes}")
 
-    def evaluate(self, samples: list[EvaluationSample]) -> np.ndarray:
+    def reset(self) -> None:
+        """
+        Clear all accumulated detections.
+        """
+        self._img_ids = []
+        self._coco_detections = []  # Per sample Nx7 arrays of [image_id, x, y, w, h, score, category_id]
+
+    def add(self, sample: EvaluationSample) -> None:
         """
-        Compute COCO bbox metrics over a list of evaluation samples.
+        Convert the detections of a single evaluation sample to COCO results and accumulate them.
+        Only the image id and the scaled detections are kept, not the sample image.
 
         Args:
-            samples: List of evaluation samples containing detections, ROI, and the dataset sample.
+            sample: Evaluation sample containing detections, ROI, and the dataset sample.
+        """
+        detections = sample.detections
+        image_id = sample.dataset_sample.image_id
+        self._img_ids.append(image_id)
+
+        if len(detections) == 0:
+            return
+
+        # Scale normalized detections directly to the COCO image size
+        coco_height, coco_width = self._image_sizes[image_id]
+        bbox = _compensate_for_roi(detections.bbox, sample.roi, detections._roi_compensated)
+
+        results = np.empty((len(detections), 7), dtype=np.float64)
+        results[:, 0] = image_id
+        results[:, 1] = bbox[:, 0] * coco_width
+        results[:, 2] = bbox[:, 1] * coco_height
+        results[:, 3] = (bbox[:, 2] - bbox[:, 0]) * coco_width
+        results[:, 4] = (bbox[:, 3] - bbox[:, 1]) * coco_height
+        results[:, 5] = detections.confidence
+        results[:, 6] = self.label_mapping_func(np.asarray(detections.class_id))
+        self._coco_detections.append(results)
+
+    def get_state(self) -> dict:
+        """
+        Get the accumulated image ids and COCO results.
+        """
+        return {"img_ids": list(self._img_ids), "coco_detections": list(self._coco_detections)}
+
+    def merge_state(self, state: dict) -> None:
+        """
+        Append the image ids and COCO results of another evaluator state.
+        """
+        self._img_ids.extend(state["img_ids"])
+        self._coco_detections.extend(state["coco_detections"])
+
+    def finalize(self) -> np.ndarray:
+        """
+        Compute COCO bbox metrics over all accumulated samples.
 
         Returns:
             Array containing COCOeval summary statistics.
         """
-        img_ids = []
-        coco_detections = []
-        for s in samples:
-            detections = s.detections
-            image_path = s.dataset_sample.image_path
-            image_id = s.dataset_sample.image_id
-            image = s.dataset_sample.image
-
-            # Scale detections to image
-            scaled_detections = detections.copy()
-            scaled_detections.compensate_for_roi(s.roi)
-            if len(scaled_detections) > 0:
-                scaled_detections.bbox[:, 0] = scaled_detections.bbox[:, 0] * image.shape[1]
-                scaled_detections.bbox[:, 1] = scaled_detections.bbox[:, 1] * image.shape[0]
-                scaled_detections.bbox[:, 2] = scaled_detections.bbox[:, 2] * image.shape[1]
-                scaled_detections.bbox[:, 3] = scaled_detections.bbox[:, 3] * image.shape[0]
-
-            scaled_detections.class_id = self.label_mapping_func(scaled_detections.class_id)
-
-            # TO coco
-            img_ids.append(image_id)
-            img_info = self.coco_gt.loadImgs([image_id])[0]
-            coco_height, coco_width = img_info["height"], img_info["width"]
-            actual_height, actual_width = image.shape[0], image.shape[1]
-            scale_x = coco_width / actual_width
-            scale_y = coco_height / actual_height
-
-            for bbox, confidence, class_id, _ in scaled_detections:
-                coco_detections.append(
-                    {
-                        "image_id": image_id,
-                        "category_id": class_id,
-                        "bbox": [
-                            bbox[0] * scale_x,
-                            bbox[1] * scale_y,
-                            (bbox[2] - bbox[0]) * scale_x,
-                            (bbox[3] - bbox[1]) * scale_y,
-                        ],
-                        "score": confidence,
-                        "file": str(image_path),
-                    }
-                )
-
-        # evaluation
+        coco_detections = np.concatenate(self._coco_detections) if self._coco_detections else np.empty((0, 7))
         coco_dt = self.coco_gt.loadRes(coco_detections)
         coco_eval = COCOeval(self.coco_gt, coco_dt, "bbox")
-        if len(img_ids) > 0:
-            coco_eval.params.imgIds = img_ids
+        if len(self._img_ids) > 0:
+            coco_eval.params.imgIds = self._img_ids
 
         coco_eval.evaluate()
         coco_eval.accumulate()
@@ -239,6 +245,25 @@ class COCOEvaluator(Evaluator):
             cv2.imwrite(output_dir / f"{image_id}_gt_vs_dt.jpg", frame.image)
 
 
+def _image_size_index(coco_gt: COCO) -> dict:
+    """
+    Build an image id to (height, width) lookup of the ground truth images.
+    """
+    return {img["id"]: (img["height"], img["width"]) for img in coco_gt.dataset["images"]}
+
+
+def _compensate_for_roi(bbox: np.ndarray, roi: ROI, roi_compensated: bool = False) -> np.ndarray:
+    """
+    Map normalized (x1, y1, x2, y2) boxes relative to the ROI back to the full image,
+    like `Detections.compensate_for_roi` without copying the detections.
+    """
+    bbox = np.asarray(bbox, dtype=np.float64)
+    if roi == (0, 0, 1, 1) or roi_compensated:
+        return bbox
+    left, top, width, height = roi
+    return np.clip(bbox * (width, height, width, height) + (left, top, left, top), 0, 1)
+
+
 def coco80_to_coco91(x: np.ndarray) -> np.ndarray:
     """
     COCO tools have 91 classes, but many coco trained models only return 80. This is because
@@ -287,67 +312,95 @@ class COCOPoseEvaluator(Evaluator):
         """
         self.ground_truth = ground_truth
         self.coco_gt = COCO(self.ground_truth)
+        self._image_sizes = _image_size_index(self.coco_gt)
+        self.reset()
+
+    def reset(self) -> None:
+        """
+        Clear all accumulated poses.
+        """
+        self._img_ids = []
+        self._coco_detections = []  # Per sample (image_id, keypoints (M, K*3), num_keypoints (M,), scores (M,))
 
-    def evaluate(self, samples: list[EvaluationSample]):
+    def add(self, sample: EvaluationSample) -> None:
         """
-        Run COCO keypoint evaluation on a list of evaluation samples.
+        Convert the poses of a single evaluation sample to COCO results and accumulate them.
+        Only the image id and the scaled keypoints are kept, not the sample image.
 
         Args:
-            samples: Evaluation samples containing predicted poses and dataset metadata.
+            sample: Evaluation sample containing predicted poses and dataset metadata.
+        """
+        poses = sample.detections
+        image_id = sample.dataset_sample.image_id
+        self._img_ids.append(image_id)
+
+        if poses.n_detections == 0 or poses.keypoints.size == 0:
+            return
+
+        # Scale normalized keypoints directly to the COCO image size
+        coco_height, coco_width = self._image_sizes[image_id]
+        keypoints = np.asarray(poses.keypoints, dtype=np.float64)
+        if sample.roi != (0, 0, 1, 1) and not poses._roi_compensated:
+            left, top, width, height = sample.roi
+            keypoints = np.clip(keypoints * (width, height) + (left, top), 0, 1)
+
+        keypoints_coco = np.empty((*keypoints.shape[:2], 3))
+        keypoints_coco[..., 0] = np.clip(keypoints[..., 0] * coco_width, 0, coco_width - 1)
+        keypoints_coco[..., 1] = np.clip(keypoints[..., 1] * coco_height, 0, coco_height - 1)
+        # 2: labeled visible, 1: labeled not visible, 0: not visible
+        keypoints_coco[..., 2] = np.where(np.asarray(poses.keypoint_scores) > 0.5, 2, 0)
+        num_visible = np.count_nonzero(keypoints_coco[..., 2] == 2, axis=1)
+
+        # Skip when no visible keypoints to avoid COCOEval to count them as a detection
+        keep = num_visible > 0
+        if not np.any(keep):
+            return
+
+        self._coco_detections.append(
+            (
+                int(image_id),
+                keypoints_coco[keep].reshape(int(keep.sum()), -1),
+                num_visible[keep],
+                np.asarray(poses.confidence)[keep],
+            )
+        )
+
+    def get_state(self) -> dict:
+        """
+        Get the accumulated image ids and COCO results.
+        """
+        return {"img_ids": list(self._img_ids), "coco_detections": list(self._coco_detections)}
+
+    def merge_state(self, state: dict) -> None:
+        """
+        Append the image ids and COCO results of another evaluator state.
+        """
+        self._img_ids.extend(state["img_ids"])
+        self._coco_detections.extend(state["coco_detections"])
+
+    def finalize(self) -> np.ndarray:
+        """
+        Run COCO keypoint evaluation over all accumulated samples.
 
         Returns:
             Array containing COCOeval summary statistics for keypoints.
         """
-        img_ids = []
-        coco_detections = []
-        for s in samples:
-            detections = s.detections
-            image_id = s.dataset_sample.image_id
-            image = s.dataset_sample.image
+        coco_detections = [
+            {
+                "image_id": image_id,
+                "category_id": 1,  # Person category in COCO
+                "keypoints": kp,
+                "num_keypoints": n,
+                "score": score,
+            }
+            for image_id, keypoints, num_keypoints, scores in self._coco_detections
+            for kp, n, score in zip(keypoints, num_keypoints, scores)
+        ]
 
-            # Scale poses to image
-            scaled_poses = detections.copy()
-            scaled_poses.compensate_for_roi(s.roi)
-            if scaled_poses.n_detections != 0 or scaled_poses.keypoints.size != 0:
-                scaled_poses.keypoints[:, :, 0] = scaled_poses.keypoints[:, :, 0] * image.shape[1]
-                scaled_poses.keypoints[:, :, 1] = scaled_poses.keypoints[:, :, 1] * image.shape[0]
-
-            # TO coco
-            img_ids.append(image_id)
-            img_info = self.coco_gt.loadImgs([image_id])[0]
-            coco_height, coco_width = img_info["height"], img_info["width"]
-            actual_height, actual_width = image.shape[0], image.shape[1]
-            scale_x = coco_width / actual_width
-            scale_y = coco_height / actual_height
-
-            for kp, confidence, keypoint_score, _, _ in scaled_poses:
-                keypoints_coco = np.empty((len(kp), 3))  # fmt: skip
-                keypoints_coco[:, 0] = np.clip(kp[:, 0] * scale_x, 0, coco_width - 1)
-                keypoints_coco[:, 1] = np.clip(kp[:, 1] * scale_y, 0, coco_height - 1)
-                keypoints_coco[:, 2] = np.where(
-                    keypoint_score > 0.5, 2, 0
-                )  # 2: labeled visible, 1: labeled not visible, 0: not visible
-                num_visible = np.sum(keypoints_coco[:, 2] == 2)  # count visible keypoints
-
-                # Skip when no visible keypoints to avoid COCOEval to count them as a detection
-                if num_visible == 0:
-                    continue
-
-                coco_detections.append(
-                    {
-                        "image_id": int(image_id),
-                        "category_id": 1,  # Person category in COCO
-                        "keypoints": keypoints_coco.ravel(),
-                        "num_keypoints": num_visible,
-                        "score": confidence,
-                    }
-                )
-
-        # Evaluation
         coco_dt = self.coco_gt.loadRes(coco_detections)
         coco_eval = COCOeval(self.coco_gt, coco_dt, "keypoints")
-        if len(img_ids) > 0:
-            coco_eval.params.imgIds = img_ids
+        if len(self._img_ids) > 0:
+            coco_eval.params.imgIds = self._img_ids
 
         coco_eval.evaluate()
         coco_eval.accumulate()
@@ -17,6 +17,7 @@
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from pathlib import Path
+from typing import Any, Iterable
 
 from modlib.models.results import ROI, Detections, Segments, Classifications, Poses
 from modlib.devices.sources import DatasetSample
@@ -34,18 +35,82 @@ class EvaluationSample:
 
 
 class Evaluator(ABC):
+    """
+    Base class for evaluators.
+
+    Samples are accumulated incrementally with `add()` and the metrics are computed with `finalize()`.
+    Each sample is reduced to the metadata needed for the metrics when it is added, the evaluator
+    holds no reference to the sample image. This allows to stream large datasets through an evaluator:
+    ```
+    evaluator.reset()
+    for sample in dataset:
+        ...
+        evaluator.add(EvaluationSample(roi=roi, detections=detections, dataset_sample=sample))
+    metrics = evaluator.finalize()
+    ```
+    """
+
     @abstractmethod
-    def evaluate(
-        self,
-        samples: list[EvaluationSample],
-        *args,
-    ) -> None:
+    def reset(self) -> None:
+        """
+        Abstract method to clear all accumulated samples.
+        Should be implemented by subclasses.
+        """
+        ...
+
+    @abstractmethod
+    def add(self, sample: EvaluationSample) -> None:
+        """
+        Abstract method to accumulate a single evaluation sample.
+        Should be implemented by subclasses.
         """
-        Abstract method to evaluate model predictions.
+        ...
+
+    @abstractmethod
+    def finalize(self) -> Any:
+        """
+        Abstract method to compute the metrics over all accumulated samples.
         Should be implemented by subclasses.
         """
         ...
 
+    def get_state(self) -> dict:
+        """
+        Get the accumulated (reduced) samples as a small picklable state.
+        Used to combine partial results of evaluators running in different processes, subclasses supporting
+        `evaluate_parallel` implement both `get_state()` and `merge_state()`.
+
+        Returns:
+            The accumulated state of the evaluator.
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not support merging partial results.")
+
+    def merge_state(self, state: dict) -> None:
+        """
+        Merge the state of another evaluator of the same type into this evaluator.
+        Merging partial states in dataset order gives the same metrics as a sequential evaluation.
+
+        Args:
+            state: State as returned by `get_state()`.
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not support merging partial results.")
+
+    def evaluate(self, samples: Iterable[EvaluationSample]) -> Any:
+        """
+        Evaluate model predictions over a collection of samples.
+        Clears previously accumulated samples, adds all given samples and computes the metrics.
+
+        Args:
+            samples: Evaluation samples, any iterable (e.g. a generator) is accepted.
+
+        Returns:
+            The metrics as returned by `finalize()`.
+        """
+        self.reset()
+        for sample in samples:
+            self.add(sample)
+        return self.finalize()
+
     @abstractmethod
     def visualize(
         self,
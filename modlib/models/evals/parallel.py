@@ -0,0 +1,140 @@
+#
+# Copyright 2026 Sony Semiconductor Solutions Corp. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import logging
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Any, Callable, Optional
+
+from tqdm import tqdm
+
+from modlib.devices.sources import Dataset, DatasetSample
+from modlib.models.evals import Evaluator, EvaluationSample
+
+ProcessFn = Callable[[DatasetSample], Optional[EvaluationSample]]
+
+logger = logging.getLogger(__name__)
+
+# Per worker process state, set by the pool initializer
+_worker = {}
+
+
+def evaluate_parallel(
+    dataset: Dataset,
+    evaluator: Evaluator,
+    process_fn: ProcessFn,
+    workers: Optional[int] = None,
+    chunk_size: int = 32,
+    mp_context: Optional[Any] = None,
+) -> Any:
+    """
+    Evaluate a dataset by sharding it across a pool of worker processes.
+
+    Every worker loads its images, runs `process_fn` (pre-processing, inference and post-processing)
+    and reduces the result with its own copy of the evaluator. The partial evaluator states are merged
+    in dataset order, so the metrics are identical to a sequential `evaluator.evaluate()`.
+
+    Example:
+    ```
+    def process(sample):
+        it_image, it, roi = model.pre_process(sample.image, sample.image_color_format)
+        return EvaluationSample(roi=roi, detections=device.infer(it), dataset_sample=sample)
+
+    metrics = evaluate_parallel(dataset, evaluator, process, workers=8)
+    ```
+
+    NOTE: On platforms that spawn worker processes (Windows, macOS) the dataset, evaluator and `process_fn`
+    are pickled to every worker, which excludes e.g. lambda functions and hardware devices.
+    Use an interpreter device or a local interpreter, the `AiCamera` can not be shared between processes.
+
+    Args:
+        dataset: Dataset to evaluate.
+        evaluator: Evaluator accumulating the results. Previously accumulated samples are cleared.
+        process_fn: Function converting a dataset sample into an evaluation sample (or None to skip it).
+        workers: Number of worker processes. Defaults to `os.cpu_count()`. Runs in-process when set to 1.
+        chunk_size: Number of images per task, smaller chunks give a finer progress report.
+        mp_context: Optional multiprocessing context for the process pool.
+
+    Returns:
+        The metrics as returned by `evaluator.finalize()`.
+
+    Raises:
+        TypeError: When the evaluator does not implement `get_state()` and `merge_state()`.
+        ValueError: When the chunk size is not positive.
+    """
+    if type(evaluator).get_state is Evaluator.get_state or type(evaluator).merge_state is Evaluator.merge_state:
+        raise TypeError(
+            f"{type(evaluator).__name__} does not support parallel evaluation, "
+            "it must implement `get_state()` and `merge_state()`."
+        )
+    workers = workers or os.cpu_count() or 1
+    if chunk_size < 1:
+        raise ValueError(f"Chunk size must be a positive integer, got {chunk_size}.")
+
+    chunks = [range(i, min(i + chunk_size, len(dataset))) for i in range(0, len(dataset), chunk_size)]
+    states = [None] * len(chunks)
+
+    start_time = time.perf_counter()
+    with tqdm(total=len(dataset), unit="images", desc="Evaluating") as pbar:
+        if workers == 1:
+            _init_worker(dataset, evaluator, process_fn)
+            for i, chunk in enumerate(chunks):
+                states[i] = _evaluate_chunk(chunk)
+                pbar.update(len(chunk))
+            _worker.clear()
+        else:
+            with ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=mp_context,
+                initializer=_init_worker,
+                initargs=(dataset, evaluator, process_fn),
+            ) as pool:
+                futures = {pool.submit(_evaluate_chunk, chunk): i for i, chunk in enumerate(chunks)}
+                for future in as_completed(futures):
+                    states[futures[future]] = future.result()
+                    pbar.update(len(chunks[futures[future]]))
+
+    elapsed = time.perf_counter() - start_time
+    logger.info(f"Processed {len(dataset)} images in {elapsed:.1f}s ({len(dataset) / elapsed:.1f} images/s)")
+
+    # Merge in dataset order for deterministic results
+    evaluator.reset()
+    for state in states:
+        evaluator.merge_state(state)
+    return evaluator.finalize()
+
+
+def _init_worker(dataset: Dataset, evaluator: Evaluator, process_fn: ProcessFn):
+    _worker["dataset"] = dataset
+    _worker["evaluator"] = evaluator
+    _worker["process_fn"] = process_fn
+
+
+def _evaluate_chunk(indices: range) -> dict:
+    dataset, evaluator, process_fn = _worker["dataset"], _worker["evaluator"], _worker["process_fn"]
+
+    evaluator.reset()
+    for i in indices:
+        sample = dataset.load_sample(i)
+        if sample is None:
+            continue  # skip corrupted/not found images
+
+        evaluation_sample = process_fn(sample)
+        if evaluation_sample is not None:
+            evaluator.add(evaluation_sample)
+
+    return evaluator.get_state()
@@ -72,6 +72,8 @@ class VocSegEvaluator(Evaluator):
         else:
             self.label_mapping_func = label_mapping_func
 
+        self.reset()
+
     def _load_gt(self, image_id: Union[int, str]) -> np.ndarray:
         """Load a ground-truth mask for an image."""
         gt_path = self.ground_truth / f"{image_id}.png"
@@ -112,30 +114,49 @@ class VocSegEvaluator(Evaluator):
 
         return mask.astype(np.int64)
 
-    def evaluate(self, samples: list[EvaluationSample]) -> Dict:
+    def reset(self) -> None:
+        """
+        Clear the accumulated confusion matrix.
         """
-        Compute segmentation metrics over a list of evaluation samples.
+        self._confusion_matrix = np.zeros((self.num_classes, self.num_classes), dtype=np.int64)
+
+    def add(self, sample: EvaluationSample) -> None:
+        """
+        Accumulate the confusion matrix of a single evaluation sample.
 
         Args:
-            samples: Collection of evaluation samples with detections and ground-truth references.
+            sample: Evaluation sample with detections and ground-truth reference.
+        """
+        gt_mask = self._load_gt(sample.dataset_sample.image_id)
+        pred_mask = self._to_class_mask(sample.detections.mask, gt_mask.shape)
 
-        Returns:
-            Dictionary containing confusion-matrix derived metrics.
+        self._confusion_matrix += _fast_confusion_matrix(
+            pred_mask,
+            gt_mask,
+            num_classes=self.num_classes,
+            ignore_index=self.ignore_index,
+        )
+
+    def get_state(self) -> dict:
+        """
+        Get the accumulated confusion matrix.
         """
-        cm = np.zeros((self.num_classes, self.num_classes), dtype=np.int64)
+        return {"confusion_matrix": self._confusion_matrix.copy()}
 
-        for s in samples:
-            gt_mask = self._load_gt(s.dataset_sample.image_id)
-            pred_mask = self._to_class_mask(s.detections.mask, gt_mask.shape)
-
-            cm += _fast_confusion_matrix(
-                pred_mask,
-                gt_mask,
-                num_classes=self.num_classes,
-                ignore_index=self.ignore_index,
-            )
+    def merge_state(self, state: dict) -> None:
+        """
+        Add the confusion matrix of another evaluator state.
+        """
+        self._confusion_matrix += state["confusion_matrix"]
 
-        metrics = _metrics_from_cm(cm)
+    def finalize(self) -> Dict:
+        """
+        Compute segmentation metrics over all accumulated samples.
+
+        Returns:
+            Dictionary containing confusion-matrix derived metrics.
+        """
+        metrics = _metrics_from_cm(self._confusion_matrix)
 
         # Print summary
         print("\n" + "=" * 100)
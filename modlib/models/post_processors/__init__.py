@@ -31,3 +31,4 @@ from .post_processors import (
     pp_yolo_pose_ultralytics,
     pp_yolo_segment_ultralytics,
 )
+from .yolo import YOLOv8PostProcessor
@@ -16,12 +16,16 @@
 
 #include <Python.h>
 // #include <numpy/arrayobject.h>
+#include <algorithm>
+#include <cstring>
 #include <iostream>
 #include <vector>
 
 #include "posenet_decoder.h"
 #include "posenet_wrapper.h"
 #include "personlab_decoder.h"
+#include "nms.h"
+#include "higherhrnet_decoder.h"
 
 
 // 1: Posenet
@@ -148,10 +152,211 @@ PyObject* decode_personlab_cpp(PyObject* self, PyObject* args) {
     return Py_BuildValue("O", skeletons_list);
 }
 
+// 3: Non-maximum suppression
+PyObject* nms_cpp(PyObject* self, PyObject* args) {
+    PyObject *boxes_obj, *scores_obj, *classes_obj;
+    Py_buffer boxes_buf, scores_buf, classes_buf;
+    float iou_thres, sigma, score_thres;
+    int max_out_dets, method;
+
+    // Expects contiguous float32 boxes (N, 4) and scores (N,), int32 classes (N,) or None
+    if (!PyArg_ParseTuple(args, "OOOfiiff", &boxes_obj, &scores_obj, &classes_obj,
+                          &iou_thres, &max_out_dets, &method, &sigma, &score_thres)) {
+        return NULL;
+    }
+
+    if (PyObject_GetBuffer(boxes_obj, &boxes_buf, PyBUF_C_CONTIGUOUS | PyBUF_FORMAT) < 0) return NULL;
+    if (PyObject_GetBuffer(scores_obj, &scores_buf, PyBUF_C_CONTIGUOUS | PyBUF_FORMAT) < 0) {
+        PyBuffer_Release(&boxes_buf);
+        return NULL;
+    }
+    const bool class_aware = classes_obj != Py_None;
+    if (class_aware && PyObject_GetBuffer(classes_obj, &classes_buf, PyBUF_C_CONTIGUOUS | PyBUF_FORMAT) < 0) {
+        PyBuffer_Release(&boxes_buf);
+        PyBuffer_Release(&scores_buf);
+        return NULL;
+    }
+
+    const Py_ssize_t n = scores_buf.len / static_cast<Py_ssize_t>(sizeof(float));
+    if (boxes_buf.len != n * 4 * static_cast<Py_ssize_t>(sizeof(float))
+        || (class_aware && classes_buf.len != n * static_cast<Py_ssize_t>(sizeof(int)))) {
+        PyBuffer_Release(&boxes_buf);
+        PyBuffer_Release(&scores_buf);
+        if (class_aware) PyBuffer_Release(&classes_buf);
+        PyErr_SetString(PyExc_ValueError, "Expected boxes of shape (N, 4), scores and classes of shape (N,).");
+        return NULL;
+    }
+
+    std::vector<int> keep;
+    std::vector<float> keep_scores;
+    Py_BEGIN_ALLOW_THREADS
+    non_max_suppression(
+        static_cast<const float*>(boxes_buf.buf),
+        static_cast<const float*>(scores_buf.buf),
+        class_aware ? static_cast<const int*>(classes_buf.buf) : nullptr,
+        static_cast<int>(n),
+        iou_thres,
+        max_out_dets,
+        method,
+        sigma,
+        score_thres,
+        &keep,
+        &keep_scores
+    );
+    Py_END_ALLOW_THREADS
+
+    PyBuffer_Release(&boxes_buf);
+    PyBuffer_Release(&scores_buf);
+    if (class_aware) PyBuffer_Release(&classes_buf);
+
+    // Convert result to Python objects
+    PyObject* keep_list = PyList_New(keep.size());
+    PyObject* keep_scores_list = PyList_New(keep.size());
+    for (size_t i = 0; i < keep.size(); ++i) {
+        PyList_SetItem(keep_list, i, PyLong_FromLong(keep[i]));
+        PyList_SetItem(keep_scores_list, i, PyFloat_FromDouble(keep_scores[i]));
+    }
+
+    return Py_BuildValue("NN", keep_list, keep_scores_list);
+}
+
+// 4: HigherHRNet top-k and tag grouping
+PyObject* top_k_cpp(PyObject* self, PyObject* args) {
+    PyObject* x_obj;
+    Py_buffer x_buf;
+    int k;
+
+    // Expects contiguous float32 x (N, channels)
+    if (!PyArg_ParseTuple(args, "Oi", &x_obj, &k)) {
+        return NULL;
+    }
+    if (PyObject_GetBuffer(x_obj, &x_buf, PyBUF_C_CONTIGUOUS | PyBUF_FORMAT) < 0) return NULL;
+    if (x_buf.ndim != 2 || strcmp(x_buf.format, "f") != 0 || k < 1 || k > x_buf.shape[0]) {
+        PyBuffer_Release(&x_buf);
+        PyErr_SetString(PyExc_ValueError, "Expected float32 x of shape (N, channels) and 1 <= k <= N.");
+        return NULL;
+    }
+
+    const int n = static_cast<int>(x_buf.shape[0]);
+    const int channels = static_cast<int>(x_buf.shape[1]);
+    PyObject* vals_obj = PyByteArray_FromStringAndSize(NULL, static_cast<Py_ssize_t>(k) * channels * sizeof(float));
+    PyObject* inds_obj = PyByteArray_FromStringAndSize(NULL, static_cast<Py_ssize_t>(k) * channels * sizeof(int64_t));
+    if (!vals_obj || !inds_obj) {
+        Py_XDECREF(vals_obj);
+        Py_XDECREF(inds_obj);
+        PyBuffer_Release(&x_buf);
+        return NULL;
+    }
+    float* vals = reinterpret_cast<float*>(PyByteArray_AS_STRING(vals_obj));
+    int64_t* inds = reinterpret_cast<int64_t*>(PyByteArray_AS_STRING(inds_obj));
+
+    Py_BEGIN_ALLOW_THREADS
+    top_k(static_cast<const float*>(x_buf.buf), n, channels, k, vals, inds);
+    Py_END_ALLOW_THREADS
+
+    PyBuffer_Release(&x_buf);
+
+    // Values (k, channels) float32 and indices (k, channels) int64 as bytes, writeable numpy arrays by np.frombuffer
+    return Py_BuildValue("NN", vals_obj, inds_obj);
+}
+
+PyObject* match_by_tag_cpp(PyObject* self, PyObject* args) {
+    PyObject *tag_k_obj, *loc_k_obj, *val_k_obj, *joint_order_obj;
+    Py_buffer tag_k_buf, loc_k_buf, val_k_buf;
+    int num_joints, max_num_people, ignore_too_much, use_detection_val;
+    int single_precision_joints, single_precision_tags;
+    double detection_threshold, tag_threshold;
+
+    // Expects contiguous float64 tag_k (K, num_joints), loc_k (K, num_joints, 2) and val_k (K, num_joints)
+    // and whether numpy would match the joints and tags of these arrays in float32
+    if (!PyArg_ParseTuple(args, "OOOOidippdpp", &tag_k_obj, &loc_k_obj, &val_k_obj, &joint_order_obj, &num_joints,
+                          &detection_threshold, &max_num_people, &ignore_too_much, &use_detection_val,
+                          &tag_threshold, &single_precision_joints, &single_precision_tags)) {
+        return NULL;
+    }
+
+    std::vector<int> joint_order;
+    PyObject* joint_order_seq = PySequence_Fast(joint_order_obj, "joint_order must be a sequence.");
+    if (!joint_order_seq) return NULL;
+    for (Py_ssize_t i = 0; i < PySequence_Fast_GET_SIZE(joint_order_seq); ++i) {
+        joint_order.push_back(PyLong_AsLong(PySequence_Fast_GET_ITEM(joint_order_seq, i)));
+    }
+    Py_DECREF(joint_order_seq);
+    if (PyErr_Occurred()) return NULL;
+    if (static_cast<int>(joint_order.size()) < num_joints
+        || std::any_of(joint_order.begin(), joint_order.begin() + std::max(num_joints, 0),
+                       [num_joints](int idx) { return idx < 0 || idx >= num_joints; })) {
+        PyErr_SetString(PyExc_ValueError, "joint_order must contain num_joints joint indices.");
+        return NULL;
+    }
+
+    if (PyObject_GetBuffer(tag_k_obj, &tag_k_buf, PyBUF_C_CONTIGUOUS | PyBUF_FORMAT) < 0) return NULL;
+    if (PyObject_GetBuffer(loc_k_obj, &loc_k_buf, PyBUF_C_CONTIGUOUS | PyBUF_FORMAT) < 0) {
+        PyBuffer_Release(&tag_k_buf);
+        return NULL;
+    }
+    if (PyObject_GetBuffer(val_k_obj, &val_k_buf, PyBUF_C_CONTIGUOUS | PyBUF_FORMAT) < 0) {
+        PyBuffer_Release(&tag_k_buf);
+        PyBuffer_Release(&loc_k_buf);
+        return NULL;
+    }
+
+    const Py_ssize_t k = val_k_buf.ndim == 2 ? val_k_buf.shape[0] : -1;
+    const Py_ssize_t size = k * num_joints * static_cast<Py_ssize_t>(sizeof(double));
+    if (k < 0 || val_k_buf.shape[1] != num_joints || strcmp(val_k_buf.format, "d") != 0
+        || tag_k_buf.len != size || strcmp(tag_k_buf.format, "d") != 0
+        || loc_k_buf.len != 2 * size || strcmp(loc_k_buf.format, "d") != 0) {
+        PyBuffer_Release(&tag_k_buf);
+        PyBuffer_Release(&loc_k_buf);
+        PyBuffer_Release(&val_k_buf);
+        PyErr_SetString(PyExc_ValueError,
+                        "Expected float64 tag_k and val_k of shape (K, num_joints), loc_k of shape (K, num_joints, 2).");
+        return NULL;
+    }
+
+    std::vector<float> groups;
+    bool solved;
+    Py_BEGIN_ALLOW_THREADS
+    solved = match_by_tag(
+        static_cast<const double*>(tag_k_buf.buf),
+        static_cast<const double*>(loc_k_buf.buf),
+        static_cast<const double*>(val_k_buf.buf),
+        static_cast<int>(k),
+        num_joints,
+        joint_order,
+        detection_threshold,
+        max_num_people,
+        ignore_too_much,
+        use_detection_val,
+        tag_threshold,
+        single_precision_joints,
+        single_precision_tags,
+        &groups
+    );
+    Py_END_ALLOW_THREADS
+
+    PyBuffer_Release(&tag_k_buf);
+    PyBuffer_Release(&loc_k_buf);
+    PyBuffer_Release(&val_k_buf);
+
+    if (!solved) {
+        PyErr_SetString(PyExc_ValueError, "Matrix cannot be solved!");
+        return NULL;
+    }
+
+    // Groups (num_groups, num_joints, 4) as float32 bytes, a writeable numpy array by np.frombuffer
+    return PyByteArray_FromStringAndSize(
+        reinterpret_cast<const char*>(groups.data()), groups.size() * sizeof(float)
+    );
+}
+
 // Exposed methods definitions
 static PyMethodDef methods[] = {
     {"decode_poses_cpp", (PyCFunction)decode_poses_cpp, METH_VARARGS, NULL},
     {"decode_personlab_cpp", (PyCFunction)decode_personlab_cpp, METH_VARARGS, NULL},
+    {"nms_cpp", (PyCFunction)nms_cpp, METH_VARARGS, NULL},
+    {"top_k_cpp", (PyCFunction)top_k_cpp, METH_VARARGS, NULL},
+    {"match_by_tag_cpp", (PyCFunction)match_by_tag_cpp, METH_VARARGS, NULL},
     {NULL, NULL, 0, NULL},
 };
 
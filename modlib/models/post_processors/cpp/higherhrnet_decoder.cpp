@@ -0,0 +1,448 @@
+/*
+ * Copyright 2026 Sony Semiconductor Solutions Corp. All rights reserved.
+ * 
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ * 
+ *    http://www.apache.org/licenses/LICENSE-2.0
+ * 
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ */
+
+#include <algorithm>
+#include <cmath>
+#include <vector>
+
+#include "higherhrnet_decoder.h"
+
+
+// Higher value first, the lower index on ties
+static inline bool before(const std::pair<float, int>& a, const std::pair<float, int>& b) {
+    return a.first > b.first || (a.first == b.first && a.second < b.second);
+}
+
+
+void top_k(const float* x, const int n, const int channels, const int k, float* vals, int64_t* inds) {
+    // One min-heap of the k best candidates per channel, the worst candidate on top
+    std::vector<std::vector<std::pair<float, int>>> heaps(channels);
+    for (auto& heap : heaps) heap.reserve(k);
+
+    for (int i = 0; i < n; ++i) {
+        const float* row = x + static_cast<int64_t>(i) * channels;
+        for (int c = 0; c < channels; ++c) {
+            std::vector<std::pair<float, int>>& heap = heaps[c];
+            const std::pair<float, int> candidate(row[c], i);
+            if (static_cast<int>(heap.size()) < k) {
+                heap.push_back(candidate);
+                std::push_heap(heap.begin(), heap.end(), before);
+            } else if (before(candidate, heap.front())) {
+                std::pop_heap(heap.begin(), heap.end(), before);
+                heap.back() = candidate;
+                std::push_heap(heap.begin(), heap.end(), before);
+            }
+        }
+    }
+
+    for (int c = 0; c < channels; ++c) {
+        std::vector<std::pair<float, int>>& heap = heaps[c];
+        std::sort_heap(heap.begin(), heap.end(), before);
+        for (int j = 0; j < k; ++j) {
+            vals[j * channels + c] = heap[j].first;
+            inds[j * channels + c] = heap[j].second;
+        }
+    }
+}
+
+
+// Port of `munkres.Munkres.compute`, same order of operations for identical assignments on ties.
+// V is the precision of the cost matrix, the Python version computes in the dtype of the numpy cost matrix.
+template <typename V>
+class Munkres {
+public:
+    Munkres(const std::vector<V>& cost, const int rows, const int cols)
+        : rows_(rows), cols_(cols), n_(std::max(rows, cols)),
+          C_(n_ * n_, V(0)), marked_(n_ * n_, 0), row_covered_(n_, false), col_covered_(n_, false) {
+        for (int i = 0; i < rows; ++i) {
+            for (int j = 0; j < cols; ++j) {
+                C_[i * n_ + j] = cost[i * cols + j];
+            }
+        }
+    }
+
+    bool compute(std::vector<std::pair<int, int>>* pairs) {
+        int step = 1;
+        while (step != 7) {
+            switch (step) {
+                case 1: step = step1(); break;
+                case 2: step = step2(); break;
+                case 3: step = step3(); break;
+                case 4: step = step4(); break;
+                case 5: step = step5(); break;
+                case 6: step = step6(); break;
+                default: return false;  // unsolvable
+            }
+        }
+        for (int i = 0; i < rows_; ++i) {
+            for (int j = 0; j < cols_; ++j) {
+                if (marked_[i * n_ + j] == 1) pairs->emplace_back(i, j);
+            }
+        }
+        return true;
+    }
+
+private:
+    V& C(const int i, const int j) { return C_[i * n_ + j]; }
+    int& marked(const int i, const int j) { return marked_[i * n_ + j]; }
+
+    int step1() {
+        // Subtract the row minimum from every row
+        for (int i = 0; i < n_; ++i) {
+            V minval = C(i, 0);
+            for (int j = 1; j < n_; ++j) minval = std::min(minval, C(i, j));
+            for (int j = 0; j < n_; ++j) C(i, j) -= minval;
+        }
+        return 2;
+    }
+
+    int step2() {
+        // Star the first uncovered zero of every row
+        for (int i = 0; i < n_; ++i) {
+            for (int j = 0; j < n_; ++j) {
+                if (C(i, j) == 0 && !col_covered_[j] && !row_covered_[i]) {
+                    marked(i, j) = 1;
+                    col_covered_[j] = true;
+                    row_covered_[i] = true;
+                    break;
+                }
+            }
+        }
+        clear_covers();
+        return 3;
+    }
+
+    int step3() {
+        // Cover every column containing a starred zero, done when all columns are covered
+        int count = 0;
+        for (int i = 0; i < n_; ++i) {
+            for (int j = 0; j < n_; ++j) {
+                if (marked(i, j) == 1 && !col_covered_[j]) {
+                    col_covered_[j] = true;
+                    ++count;
+                }
+            }
+        }
+        return count >= n_ ? 7 : 4;
+    }
+
+    int step4() {
+        // Prime uncovered zeros until one has no starred zero in its row
+        int row = 0, col = 0;
+        while (true) {
+            find_a_zero(row, col, &row, &col);
+            if (row < 0) return 6;
+            marked(row, col) = 2;
+            const int star_col = find_in_row(row, 1);
+            if (star_col < 0) {
+                z0_r_ = row;
+                z0_c_ = col;
+                return 5;
+            }
+            col = star_col;
+            row_covered_[row] = true;
+            col_covered_[col] = false;
+        }
+    }
+
+    int step5() {
+        // Alternate primed and starred zeros starting at Z0 and flip the stars along the path
+        std::vector<std::pair<int, int>> path = {{z0_r_, z0_c_}};
+        while (true) {
+            const int row = find_star_in_col(path.back().second);
+            if (row < 0) break;
+            path.emplace_back(row, path.back().second);
+            path.emplace_back(row, find_in_row(row, 2));
+        }
+        for (const auto& p : path) {
+            marked(p.first, p.second) = marked(p.first, p.second) == 1 ? 0 : 1;
+        }
+        clear_covers();
+        for (int& m : marked_) {
+            if (m == 2) m = 0;
+        }
+        return 3;
+    }
+
+    int step6() {
+        // Add the smallest uncovered value to the covered rows and subtract it from the uncovered columns
+        V minval = V(9223372036854775807.0);  // sys.maxsize
+        for (int i = 0; i < n_; ++i) {
+            for (int j = 0; j < n_; ++j) {
+                if (!row_covered_[i] && !col_covered_[j] && minval > C(i, j)) minval = C(i, j);
+            }
+        }
+        int events = 0;
+        for (int i = 0; i < n_; ++i) {
+            for (int j = 0; j < n_; ++j) {
+                if (row_covered_[i]) {
+                    C(i, j) += minval;
+                    ++events;
+                }
+                if (!col_covered_[j]) {
+                    C(i, j) -= minval;
+                    ++events;
+                }
+                if (row_covered_[i] && !col_covered_[j]) events -= 2;
+            }
+        }
+        return events == 0 ? 0 : 4;
+    }
+
+    void find_a_zero(const int i0, const int j0, int* row, int* col) {
+        // Uncovered zero scanning cyclically from (i0, j0), as the Python version the last one of the first row
+        int i = i0;
+        *row = -1;
+        *col = -1;
+        do {
+            int j = j0;
+            do {
+                if (C(i, j) == 0 && !row_covered_[i] && !col_covered_[j]) {
+                    *row = i;
+                    *col = j;
+                }
+                j = (j + 1) % n_;
+            } while (j != j0);
+            if (*row >= 0) return;
+            i = (i + 1) % n_;
+        } while (i != i0);
+    }
+
+    int find_in_row(const int row, const int mark) {
+        for (int j = 0; j < n_; ++j) {
+            if (marked(row, j) == mark) return j;
+        }
+        return -1;
+    }
+
+    int find_star_in_col(const int col) {
+        for (int i = 0; i < n_; ++i) {
+            if (marked(i, col) == 1) return i;
+        }
+        return -1;
+    }
+
+    void clear_covers() {
+        std::fill(row_covered_.begin(), row_covered_.end(), false);
+        std::fill(col_covered_.begin(), col_covered_.end(), false);
+    }
+
+    const int rows_, cols_, n_;
+    std::vector<V> C_;
+    std::vector<int> marked_;
+    std::vector<bool> row_covered_, col_covered_;
+    int z0_r_ = 0, z0_c_ = 0;
+};
+
+
+bool munkres(const std::vector<double>& cost, const int rows, const int cols, std::vector<std::pair<int, int>>* pairs) {
+    return Munkres<double>(cost, rows, cols).compute(pairs);
+}
+
+
+// Pairwise summation as numpy, mean tags are bitwise identical to `np.mean`
+template <typename T>
+static T pairwise_sum(const T* a, const int n) {
+    if (n < 8) {
+        T res = 0;
+        for (int i = 0; i < n; ++i) res += a[i];
+        return res;
+    }
+    if (n <= 128) {
+        T r[8];
+        for (int j = 0; j < 8; ++j) r[j] = a[j];
+        int i = 8;
+        for (; i < n - (n % 8); i += 8) {
+            for (int j = 0; j < 8; ++j) r[j] += a[i + j];
+        }
+        T res = ((r[0] + r[1]) + (r[2] + r[3])) + ((r[4] + r[5]) + (r[6] + r[7]));
+        for (; i < n; ++i) res += a[i];
+        return res;
+    }
+    int n2 = n / 2;
+    n2 -= n2 % 8;
+    return pairwise_sum(a, n2) + pairwise_sum(a + n2, n - n2);
+}
+
+
+template <typename T>
+struct Group {
+    T key;                       // tag of the joint that started the group
+    std::vector<double> joints;  // num_joints x (x, y, score, tag)
+    std::vector<T> tags;         // tags of the grouped joints
+};
+
+
+// `joint_dict.setdefault(key, default_)` followed by resetting the tags of the group
+template <typename T>
+static Group<T>& add_group(std::vector<Group<T>>* groups, const T key, const int num_joints) {
+    for (Group<T>& group : *groups) {
+        if (group.key == key) {
+            group.tags.clear();
+            return group;
+        }
+    }
+    groups->push_back({key, std::vector<double>(num_joints * 4, 0.0), {}});
+    return groups->back();
+}
+
+
+template <typename V>
+static bool solve(const std::vector<V>& cost, const int rows, const int cols, std::vector<std::pair<int, int>>* pairs) {
+    return Munkres<V>(cost, rows, cols).compute(pairs);
+}
+
+
+// J is the precision of the joints (x, y, score, tag), i.e. the result dtype of loc_k, val_k and tag_k,
+// and T the precision of the tags, as numpy computes the distances, costs and mean tags of `match_by_tag`
+template <typename J, typename T>
+static bool match_by_tag_impl(
+    const double* tag_k,
+    const double* loc_k,
+    const double* val_k,
+    const int k,
+    const int num_joints,
+    const std::vector<int>& joint_order,
+    const double detection_threshold,
+    const int max_num_people,
+    const bool ignore_too_much,
+    const bool use_detection_val,
+    const double tag_threshold,
+    std::vector<float>* result
+) {
+    const J detection_thres = static_cast<J>(detection_threshold);
+    const J tag_thres = static_cast<J>(tag_threshold);
+    std::vector<Group<T>> groups;
+    std::vector<J> joints;  // added joints x (x, y, score, tag)
+    std::vector<T> tags;    // tags of the added joints
+    std::vector<J> cost, diff_saved;
+    std::vector<double> padded_cost;
+    std::vector<T> mean_tags;
+    std::vector<std::pair<int, int>> pairs;
+
+    for (int i = 0; i < num_joints; ++i) {
+        const int idx = joint_order[i];
+
+        joints.clear();
+        tags.clear();
+        for (int r = 0; r < k; ++r) {
+            const J val = static_cast<J>(val_k[r * num_joints + idx]);
+            if (val > detection_thres) {
+                const double* loc = loc_k + (r * num_joints + idx) * 2;
+                const T tag = static_cast<T>(tag_k[r * num_joints + idx]);
+                joints.insert(joints.end(), {static_cast<J>(loc[0]), static_cast<J>(loc[1]), val, static_cast<J>(tag)});
+                tags.push_back(tag);
+            }
+        }
+        const int num_added = static_cast<int>(tags.size());
+        if (num_added == 0) continue;
+
+        if (i == 0 || groups.empty()) {
+            for (int r = 0; r < num_added; ++r) {
+                Group<T>& group = add_group(&groups, tags[r], num_joints);
+                std::copy(joints.begin() + r * 4, joints.begin() + r * 4 + 4, group.joints.begin() + idx * 4);
+                group.tags.push_back(tags[r]);
+            }
+            continue;
+        }
+
+        const int num_grouped = std::min(static_cast<int>(groups.size()), max_num_people);
+        if (ignore_too_much && num_grouped == max_num_people) continue;
+
+        mean_tags.resize(num_grouped);
+        for (int c = 0; c < num_grouped; ++c) {
+            const std::vector<T>& group_tags = groups[c].tags;
+            const int n = static_cast<int>(group_tags.size());
+            mean_tags[c] = pairwise_sum(group_tags.data(), n) / static_cast<T>(n);
+        }
+
+        // Cost of adding joint r to group c
+        cost.resize(num_added * num_grouped);
+        diff_saved.resize(num_added * num_grouped);
+        for (int r = 0; r < num_added; ++r) {
+            for (int c = 0; c < num_grouped; ++c) {
+                const J diff = joints[r * 4 + 3] - static_cast<J>(mean_tags[c]);
+                const J diff_normed = std::sqrt(diff * diff);
+                diff_saved[r * num_grouped + c] = diff_normed;
+                cost[r * num_grouped + c] =
+                    use_detection_val ? std::nearbyint(diff_normed) * J(100) - joints[r * 4 + 2] : diff_normed;
+            }
+        }
+
+        pairs.clear();
+        if (num_added > num_grouped) {
+            // Padded with unmatchable groups, the concatenation with the float64 padding is solved in double precision
+            padded_cost.assign(num_added * num_added, 1e10);
+            for (int r = 0; r < num_added; ++r) {
+                for (int c = 0; c < num_grouped; ++c) padded_cost[r * num_added + c] = cost[r * num_grouped + c];
+            }
+            if (!solve(padded_cost, num_added, num_added, &pairs)) return false;
+        } else if (!solve(cost, num_added, num_grouped, &pairs)) {
+            return false;
+        }
+
+        for (const auto& pair : pairs) {
+            const int row = pair.first, col = pair.second;
+            Group<T>* group;
+            if (col < num_grouped && diff_saved[row * num_grouped + col] < tag_thres) {
+                group = &groups[col];
+            } else {
+                group = &add_group(&groups, tags[row], num_joints);
+            }
+            std::copy(joints.begin() + row * 4, joints.begin() + row * 4 + 4, group->joints.begin() + idx * 4);
+            group->tags.push_back(tags[row]);
+        }
+    }
+
+    result->clear();
+    result->reserve(groups.size() * num_joints * 4);
+    for (const Group<T>& group : groups) {
+        for (const double v : group.joints) result->push_back(static_cast<float>(v));
+    }
+    return true;
+}
+
+
+bool match_by_tag(
+    const double* tag_k,
+    const double* loc_k,
+    const double* val_k,
+    const int k,
+    const int num_joints,
+    const std::vector<int>& joint_order,
+    const double detection_threshold,
+    const int max_num_people,
+    const bool ignore_too_much,
+    const bool use_detection_val,
+    const double tag_threshold,
+    const bool single_precision_joints,
+    const bool single_precision_tags,
+    std::vector<float>* result
+) {
+    if (single_precision_joints) {
+        return match_by_tag_impl<float, float>(tag_k, loc_k, val_k, k, num_joints, joint_order, detection_threshold,
+                                               max_num_people, ignore_too_much, use_detection_val, tag_threshold,
+                                               result);
+    }
+    if (single_precision_tags) {
+        return match_by_tag_impl<double, float>(tag_k, loc_k, val_k, k, num_joints, joint_order, detection_threshold,
+                                                max_num_people, ignore_too_much, use_detection_val, tag_threshold,
+                                                result);
+    }
+    return match_by_tag_impl<double, double>(tag_k, loc_k, val_k, k, num_joints, joint_order, detection_threshold,
+                                             max_num_people, ignore_too_much, use_detection_val, tag_threshold,
+                                             result);
+}
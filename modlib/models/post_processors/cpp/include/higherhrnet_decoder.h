@@ -0,0 +1,62 @@
+/*
+ * Copyright 2026 Sony Semiconductor Solutions Corp. All rights reserved.
+ * 
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ * 
+ *    http://www.apache.org/licenses/LICENSE-2.0
+ * 
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ */
+
+#include <cstdint>
+#include <utility>
+#include <vector>
+
+
+extern "C" {
+    /*
+     * Top-k of every channel of an (n x channels) row-major array, e.g. flattened (h*w x num_joints) heatmaps.
+     * Values are sorted in descending order, equal values by ascending index.
+     * The values and indices are written to `vals` and `inds` of shape (k x channels), k <= n.
+     */
+    void top_k(const float* x, const int n, const int channels, const int k, float* vals, int64_t* inds);
+
+    /*
+     * Munkres (Hungarian) assignment of a rows x cols cost matrix (row-major), padded with zeros to a square matrix.
+     * The assigned (row, col) pairs within the original matrix are written to `pairs` in row-major order.
+     * Returns false when the matrix can not be solved.
+     */
+    bool munkres(const std::vector<double>& cost, const int rows, const int cols, std::vector<std::pair<int, int>>* pairs);
+
+    /*
+     * HigherHRNet associative embedding grouping of the top-k joint candidates of one image.
+     * tag_k and val_k are (k x num_joints), loc_k is (k x num_joints x 2). Joints are grouped in `joint_order`
+     * by matching their tag to the mean tag of every group. The groups are written to `result`
+     * as (num_groups x num_joints x 4) with (x, y, score, tag) per joint.
+     * The joints (result dtype of tag_k, loc_k and val_k) and tags are matched in single or double precision,
+     * as numpy computes with the input dtypes. float32 inputs are exactly representable by the double arrays.
+     * Returns false when a matching can not be solved.
+     */
+    bool match_by_tag(
+        const double* tag_k,
+        const double* loc_k,
+        const double* val_k,
+        const int k,
+        const int num_joints,
+        const std::vector<int>& joint_order,
+        const double detection_threshold,
+        const int max_num_people,
+        const bool ignore_too_much,
+        const bool use_detection_val,
+        const double tag_threshold,
+        const bool single_precision_joints,
+        const bool single_precision_tags,
+        std::vector<float>* result
+    );
+}
@@ -0,0 +1,44 @@
+/*
+ * Copyright 2024 Sony Semiconductor Solutions Corp. All rights reserved.
+ * 
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ * 
+ *    http://www.apache.org/licenses/LICENSE-2.0
+ * 
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ */
+
+#include <vector>
+
+#define NMS_METHOD_HARD 0
+#define NMS_METHOD_LINEAR 1
+#define NMS_METHOD_GAUSSIAN 2
+
+
+extern "C" {
+    /*
+     * Greedy (soft) non-maximum suppression of N boxes in corner format (N x 4).
+     * When `classes` is not NULL only boxes of the same class suppress each other.
+     * The indices of the kept boxes are written to `keep` in descending score order,
+     * their (decayed for soft-NMS) scores to `keep_scores`.
+     */
+    void non_max_suppression(
+        const float* boxes,
+        const float* scores,
+        const int* classes,
+        const int n,
+        const float iou_thres,
+        const int max_out_dets,
+        const int method,
+        const float sigma,
+        const float score_thres,
+        std::vector<int>* keep,
+        std::vector<float>* keep_scores
+    );
+}
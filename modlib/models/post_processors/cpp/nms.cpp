@@ -0,0 +1,130 @@
+/*
+ * Copyright 2024 Sony Semiconductor Solutions Corp. All rights reserved.
+ * 
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ * 
+ *    http://www.apache.org/licenses/LICENSE-2.0
+ * 
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ */
+
+#include <algorithm>
+#include <cmath>
+#include <numeric>
+#include <vector>
+
+#include "nms.h"
+
+
+static inline float iou(const float* a, const float* b, const float area_a, const float area_b) {
+    const float inter_0 = std::max(0.0f, std::min(a[2], b[2]) - std::max(a[0], b[0]));
+    const float inter_1 = std::max(0.0f, std::min(a[3], b[3]) - std::max(a[1], b[1]));
+    const float inter = inter_0 * inter_1;
+    const float union_area = area_a + area_b - inter;
+    return union_area > 0.0f ? inter / union_area : 0.0f;
+}
+
+
+static void hard_nms(
+    const float* boxes, const float* scores, const int* classes, const int n,
+    const float iou_thres, const int max_out_dets, const std::vector<float>& areas,
+    std::vector<int>* keep, std::vector<float>* keep_scores
+) {
+    std::vector<int> order(n);
+    std::iota(order.begin(), order.end(), 0);
+    std::stable_sort(order.begin(), order.end(), [scores](int a, int b) { return scores[a] > scores[b]; });
+
+    // Only compare against the kept boxes: stops as soon as max_out_dets boxes are kept
+    for (int k = 0; k < n && static_cast<int>(keep->size()) < max_out_dets; ++k) {
+        const int i = order[k];
+        bool suppressed = false;
+        for (const int j : *keep) {
+            if (classes && classes[i] != classes[j]) continue;
+            if (iou(boxes + 4 * i, boxes + 4 * j, areas[i], areas[j]) > iou_thres) {
+                suppressed = true;
+                break;
+            }
+        }
+        if (!suppressed) {
+            keep->push_back(i);
+            keep_scores->push_back(scores[i]);
+        }
+    }
+}
+
+
+static void soft_nms(
+    const float* boxes, const float* scores, const int* classes, const int n,
+    const float iou_thres, const int max_out_dets, const int method, const float sigma,
+    const float score_thres, const std::vector<float>& areas,
+    std::vector<int>* keep, std::vector<float>* keep_scores
+) {
+    std::vector<float> decayed(scores, scores + n);
+    std::vector<int> alive;
+    alive.reserve(n);
+    for (int i = 0; i < n; ++i) {
+        if (decayed[i] >= score_thres) alive.push_back(i);
+    }
+
+    while (!alive.empty() && static_cast<int>(keep->size()) < max_out_dets) {
+        // Select the highest (decayed) score, first index on ties
+        size_t best = 0;
+        for (size_t k = 1; k < alive.size(); ++k) {
+            if (decayed[alive[k]] > decayed[alive[best]]) best = k;
+        }
+        const int i = alive[best];
+        alive.erase(alive.begin() + best);
+        keep->push_back(i);
+        keep_scores->push_back(decayed[i]);
+
+        // Decay the overlapping boxes and drop the ones below the score threshold
+        size_t m = 0;
+        for (const int j : alive) {
+            if (!classes || classes[i] == classes[j]) {
+                const float overlap = iou(boxes + 4 * i, boxes + 4 * j, areas[i], areas[j]);
+                if (method == NMS_METHOD_LINEAR) {
+                    if (overlap > iou_thres) decayed[j] *= 1.0f - overlap;
+                } else {
+                    decayed[j] *= std::exp(-(overlap * overlap) / sigma);
+                }
+            }
+            if (decayed[j] >= score_thres) alive[m++] = j;
+        }
+        alive.resize(m);
+    }
+}
+
+
+void non_max_suppression(
+    const float* boxes,
+    const float* scores,
+    const int* classes,
+    const int n,
+    const float iou_thres,
+    const int max_out_dets,
+    const int method,
+    const float sigma,
+    const float score_thres,
+    std::vector<int>* keep,
+    std::vector<float>* keep_scores
+) {
+    std::vector<float> areas(n);
+    for (int i = 0; i < n; ++i) {
+        const float* b = boxes + 4 * i;
+        areas[i] = (b[2] - b[0]) * (b[3] - b[1]);
+    }
+
+    keep->reserve(std::min(n, max_out_dets));
+    keep_scores->reserve(std::min(n, max_out_dets));
+    if (method == NMS_METHOD_HARD) {
+        hard_nms(boxes, scores, classes, n, iou_thres, max_out_dets, areas, keep, keep_scores);
+    } else {
+        soft_nms(boxes, scores, classes, n, iou_thres, max_out_dets, method, sigma, score_thres, areas, keep, keep_scores);
+    }
+}
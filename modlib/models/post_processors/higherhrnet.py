@@ -42,6 +42,16 @@ import numpy as np
 
 from .munkres import Munkres
 
+try:
+    from . import cpp_post_processors
+except ImportError:  # extension module not built
+    cpp_post_processors = None
+
+_top_k_cpp = getattr(cpp_post_processors, "top_k_cpp", None)
+_match_by_tag_cpp = getattr(cpp_post_processors, "match_by_tag_cpp", None)
+_FLOAT_DTYPES = (np.float32, np.float64)
+_CV_CN_MAX = 512  # maximum number of channels of an OpenCV matrix
+
 default_joint_order = [0, 1, 2, 3, 4, 5, 6, 11, 12, 7, 8, 9, 10, 13, 14, 15, 16]
 
 
@@ -188,6 +198,7 @@ def parse(
     ignore_too_much=False,
     use_detection_val=True,
     tag_threshold=1.0,
+    use_cpp=True,
 ):
     if network_postprocess:
         tag_k, ind_k, val_k = network_outputs
@@ -213,6 +224,7 @@ def parse(
             max_num_people=max_num_people,
             nms_kernel=nms_kernel,
             nms_padding=nms_padding,
+            use_cpp=use_cpp,
         )
     # ans [num_joints_detected, num_joints, 4]
     ans = match(
@@ -226,6 +238,7 @@ def parse(
         ignore_too_much=ignore_too_much,
         use_detection_val=use_detection_val,
         tag_threshold=tag_threshold,
+        use_cpp=use_cpp,
     )
     if adjust:
         # ans [[num_joints_detected, num_joints, 4]]
@@ -246,7 +259,7 @@ def parse(
     return ans, scores
 
 
-def top_k(det, tag, tag_per_joint=17, max_num_people=30, nms_kernel=5, nms_padding=2):
+def top_k(det, tag, tag_per_joint=17, max_num_people=30, nms_kernel=5, nms_padding=2, use_cpp=True):
     # det [144, 192, 17]
     # tag [144, 192, 17]
 
@@ -261,7 +274,7 @@ def top_k(det, tag, tag_per_joint=17, max_num_people=30, nms_kernel=5, nms_paddi
     # det [num_images, h*w, num_joints]
     det = det.reshape((num_images, -1, num_joints))
     # val_k [num_images, max_num_people, num_joints]
-    val_k, ind = np_topk(det, max_num_people)
+    val_k, ind = np_topk(det, max_num_people, use_cpp=use_cpp)
 
     # tag [num_images, h*w, num_joints]
     tag = tag.reshape((num_images, -1, num_joints))
@@ -272,10 +285,7 @@ def top_k(det, tag, tag_per_joint=17, max_num_people=30, nms_kernel=5, nms_paddi
         tag = tag.expand(-1, num_joints, -1, -1)
 
     # tag_k [num_images, max_num_people, num_joints]
-    tag_k = np.zeros((num_images, max_num_people, num_joints))
-    for img in range(num_images):
-        for kp in range(num_joints):
-            tag_k[img, :, kp] = tag[img, ind[img, :, kp], kp]
+    tag_k = np.take_along_axis(tag, ind, axis=1).astype(np.float64)
 
     x = ind % w
     y = (ind / w).astype(ind.dtype)
@@ -297,9 +307,7 @@ def nms(det, nms_kernel=5, nms_padding=2):
     # det [144, 192, 17]
     # maxm [144, 192, 17]
     maxm = np_max_pool(det, k=nms_kernel, p=nms_padding)
-    maxm = np.equal(maxm, det).astype(np.float32)
-    det = det * maxm
-    return det
+    return det * np.equal(maxm, det)
 
 
 def np_max_pool(x, k=5, p=2, p_value=0):
@@ -313,51 +321,46 @@ def np_max_pool(x, k=5, p=2, p_value=0):
     elif isinstance(p, (list, tuple)) and len(p) == 2:
         p = ((p[0], p[0]), (p[1], p[1]), (0, 0))
 
-    # y [148, 196, 17
+    same_size = p == ((k[0] // 2,) * 2, (k[1] // 2,) * 2, (0, 0)) and k[0] % 2 and k[1] % 2
+    if x.dtype == np.float32 and same_size and 1 < x.shape[2] <= _CV_CN_MAX:
+        # same size pooling, zero padding is a constant border of the dilation
+        # (OpenCV drops a single channel axis and supports at most CV_CN_MAX channels)
+        return cv2.dilate(x, np.ones(k, dtype=np.uint8), borderType=cv2.BORDER_CONSTANT, borderValue=0)
+
+    # y [148, 196, 17]
     y = np.pad(x, p)
-    out = np.concatenate(
-        [
-            np.max(
-                np.concatenate(
-                    [
-                        y[ky : ky + y.shape[0] - k[0] + 1, kx : kx + y.shape[1] - k[1] + 1, c : c + 1]
-                        for ky in range(k[0])
-                        for kx in range(k[1])
-                    ],
-                    2,
-                ),
-                axis=2,
-                keepdims=True,
-            )
-            for c in range(y.shape[2])
-        ],
-        2,
-    )
+    # separable max filter, first over the rows then over the columns of the kernel window
+    h, w = y.shape[0] - k[0] + 1, y.shape[1] - k[1] + 1
+    rows = y[:h].copy()
+    for ky in range(1, k[0]):
+        np.maximum(rows, y[ky : ky + h], out=rows)
+    out = rows[:, :w].copy()
+    for kx in range(1, k[1]):
+        np.maximum(out, rows[:, kx : kx + w], out=out)
     # out [144, 192, 17]
     return out
 
 
-def np_topk(x, k):
+def np_topk(x, k, use_cpp=True):
     # x [1, 27648, 17]
-    # n_images 1
-    # n_keypoints 17
-    n_images, _, n_keypoints = x.shape
-    # vals [1, k, 17]
+    # Sorted in descending order, equal values (e.g. the suppressed zeros) by ascending index
+    if use_cpp and _top_k_cpp is not None and x.dtype == np.float32:
+        n_images, _, n_keypoints = x.shape
+        # vals [1, k, 17]
+        # inds [1, k, 17]
+        vals = np.empty((n_images, k, n_keypoints), dtype=np.float32)
+        inds = np.empty((n_images, k, n_keypoints), dtype=np.int64)
+        for img in range(n_images):
+            _vals, _inds = _top_k_cpp(np.ascontiguousarray(x[img]), k)
+            vals[img] = np.frombuffer(_vals, dtype=np.float32).reshape((k, n_keypoints))
+            inds[img] = np.frombuffer(_inds, dtype=np.int64).reshape((k, n_keypoints))
+        return vals, inds
+
     # inds [1, k, 17]
-    vals = np.zeros((n_images, k, n_keypoints), dtype=x.dtype)
-    inds = np.zeros((n_images, k, n_keypoints), dtype=np.int64)
-    for img in range(n_images):
-        for kp in range(n_keypoints):
-            # _inds [k]
-            _inds = np.argpartition(x[img, :, kp], -k)[-k:]
-            _inds = _inds[
-                np.argsort(
-                    x[img, _inds, kp],
-                )
-            ][::-1]
-            inds[img, :, kp] = _inds
-            vals[img, :, kp] = x[img, _inds, kp]
-    return vals, inds
+    inds = np.argsort(-x, axis=1, kind="stable")[:, :k]
+    # vals [1, k, 17]
+    vals = np.take_along_axis(x, inds, axis=1)
+    return vals, inds.astype(np.int64, copy=False)
 
 
 def match(
@@ -371,8 +374,31 @@ def match(
     ignore_too_much=False,
     use_detection_val=True,
     tag_threshold=1.0,
+    use_cpp=True,
 ):
     def m(x):
+        # The extension matches in the precision numpy computes with, float32 tags (e.g. of the zoo model) or float64
+        joints_dtype, tags_dtype = np.result_type(*x), x[0].dtype
+        if use_cpp and _match_by_tag_cpp is not None and joints_dtype in _FLOAT_DTYPES and tags_dtype in _FLOAT_DTYPES:
+            tag, loc, val = (np.ascontiguousarray(a, dtype=np.float64) for a in x)
+            groups = _match_by_tag_cpp(
+                tag,
+                loc,
+                val,
+                list(joint_order),
+                num_joints,
+                detection_threshold,
+                max_num_people,
+                ignore_too_much,
+                use_detection_val,
+                tag_threshold,
+                joints_dtype == np.float32,
+                tags_dtype == np.float32,
+            )
+            ans = np.frombuffer(groups, dtype=np.float32)
+            # ans [len(groups), num_joints, 4]
+            return ans.reshape((-1, num_joints, 4)) if len(ans) else ans
+
         return match_by_tag(
             inp=x,
             num_joints=num_joints,
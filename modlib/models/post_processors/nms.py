@@ -0,0 +1,280 @@
+#
+# Copyright 2026 Sony Semiconductor Solutions Corp. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""
+Non-maximum suppression (NMS) of bounding boxes.
+
+Uses the C++ kernel of the `cpp_post_processors` extension module when available,
+otherwise falls back to a vectorised numpy implementation with identical results.
+"""
+
+from dataclasses import dataclass
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+try:
+    from . import cpp_post_processors
+except ImportError:  # extension module not built
+    cpp_post_processors = None
+
+_nms_cpp = getattr(cpp_post_processors, "nms_cpp", None)
+
+#: Number of candidates the numpy fallback suppresses at once, bounds the size of the pairwise IoU matrix.
+_BLOCK_SIZE = 256
+
+
+@dataclass
+class NMS_METHOD:
+    """
+    Non-maximum suppression method. Can be used as e.g. `NMS_METHOD.GAUSSIAN`
+    """
+
+    HARD = "hard"  #: Greedy NMS, removes every box overlapping a higher scoring box by more than the IoU threshold.
+    LINEAR = "linear"  #: Soft-NMS, scales the score of boxes overlapping more than the IoU threshold by `1 - IoU`.
+    GAUSSIAN = "gaussian"  #: Soft-NMS, scales the score of all overlapping boxes by `exp(-IoU^2 / sigma)`.
+
+
+_METHOD_IDS = {NMS_METHOD.HARD: 0, NMS_METHOD.LINEAR: 1, NMS_METHOD.GAUSSIAN: 2}
+
+
+def non_max_suppression(
+    boxes: np.ndarray,
+    scores: np.ndarray,
+    iou_thres: float = 0.5,
+    max_out_dets: int = 300,
+    classes: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    """
+    Greedy non-maximum suppression.
+
+    Boxes are kept in descending score order, a box is removed when its IoU with an already kept box
+    exceeds `iou_thres`. Stops as soon as `max_out_dets` boxes are kept.
+
+    Args:
+        boxes: Array of shape (N, 4) with the boxes in corner format, e.g. [y1, x1, y2, x2] or [x1, y1, x2, y2].
+        scores: Array of shape (N,) with the confidence score of every box.
+        iou_thres: IoU threshold above which a box is suppressed. Default is 0.5.
+        max_out_dets: Maximum number of boxes to keep. Default is 300.
+        classes: Optional array of shape (N,) with the class of every box. When provided the suppression is
+            class-aware, only boxes of the same class suppress each other. Default is None (class-agnostic).
+
+    Returns:
+        Indices of the kept boxes, sorted by descending score.
+    """
+    keep, _ = _suppress(boxes, scores, classes, iou_thres, max_out_dets, NMS_METHOD.HARD)
+    return keep
+
+
+def soft_nms(
+    boxes: np.ndarray,
+    scores: np.ndarray,
+    iou_thres: float = 0.5,
+    max_out_dets: int = 300,
+    classes: Optional[np.ndarray] = None,
+    method: str = NMS_METHOD.GAUSSIAN,
+    sigma: float = 0.5,
+    score_thres: float = 0.001,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Soft non-maximum suppression (Bodla et al., 2017).
+
+    Instead of removing overlapping boxes, their scores are decayed depending on the IoU with the selected box.
+    Boxes are removed once their decayed score drops below `score_thres`.
+
+    Args:
+        boxes: Array of shape (N, 4) with the boxes in corner format, e.g. [y1, x1, y2, x2] or [x1, y1, x2, y2].
+        scores: Array of shape (N,) with the confidence score of every box.
+        iou_thres: IoU threshold of the linear decay, unused by the gaussian decay. Default is 0.5.
+        max_out_dets: Maximum number of boxes to keep. Default is 300.
+        classes: Optional array of shape (N,) with the class of every box, for class-aware suppression.
+        method: Score decay `NMS_METHOD.LINEAR` or `NMS_METHOD.GAUSSIAN`. Default is `NMS_METHOD.GAUSSIAN`.
+        sigma: Width of the gaussian decay. Default is 0.5.
+        score_thres: Minimum decayed score of a kept box. Default is 0.001.
+
+    Returns:
+        Tuple of the indices of the kept boxes and their decayed scores, sorted by descending decayed score.
+
+    Raises:
+        ValueError: If the method is not a soft-NMS method.
+    """
+    if method not in (NMS_METHOD.LINEAR, NMS_METHOD.GAUSSIAN):
+        raise ValueError(
+            f"Invalid soft-NMS method '{method}'. Must be one of: {NMS_METHOD.LINEAR}, {NMS_METHOD.GAUSSIAN}."
+        )
+    return _suppress(boxes, scores, classes, iou_thres, max_out_dets, method, sigma, score_thres)
+
+
+def batched_nms(
+    batch_boxes: np.ndarray,
+    batch_scores: np.ndarray,
+    batch_classes: Optional[np.ndarray] = None,
+    iou_thres: float = 0.5,
+    max_out_dets: int = 300,
+    method: str = NMS_METHOD.HARD,
+    sigma: float = 0.5,
+    score_thres: float = 0.001,
+) -> List[Tuple[np.ndarray, np.ndarray]]:
+    """
+    Non-maximum suppression of every image in a batch.
+
+    Args:
+        batch_boxes: Array of shape (B, N, 4), or a sequence of (N, 4) arrays, with the boxes in corner format.
+        batch_scores: Array of shape (B, N), or a sequence of (N,) arrays, with the confidence scores.
+        batch_classes: Optional array of shape (B, N), or a sequence of (N,) arrays, for class-aware suppression.
+        iou_thres: IoU threshold, see `non_max_suppression` and `soft_nms`. Default is 0.5.
+        max_out_dets: Maximum number of boxes to keep per image. Default is 300.
+        method: NMS method, see `NMS_METHOD`. Default is `NMS_METHOD.HARD`.
+        sigma: Width of the gaussian soft-NMS decay. Default is 0.5.
+        score_thres: Minimum decayed score of a box kept by soft-NMS. Default is 0.001.
+
+    Returns:
+        List with, for every image, a tuple of the indices of the kept boxes and their (decayed) scores.
+
+    Raises:
+        ValueError: If the method is not a valid `NMS_METHOD`.
+    """
+    if method not in _METHOD_IDS:
+        raise ValueError(
+            f"Invalid NMS method '{method}'. Must be one of: "
+            f"{NMS_METHOD.HARD}, {NMS_METHOD.LINEAR}, {NMS_METHOD.GAUSSIAN}."
+        )
+    if batch_classes is None:
+        batch_classes = [None] * len(batch_boxes)
+    return [
+        _suppress(boxes, scores, classes, iou_thres, max_out_dets, method, sigma, score_thres)
+        for boxes, scores, classes in zip(batch_boxes, batch_scores, batch_classes)
+    ]
+
+
+def _suppress(
+    boxes: np.ndarray,
+    scores: np.ndarray,
+    classes: Optional[np.ndarray],
+    iou_thres: float,
+    max_out_dets: int,
+    method: str,
+    sigma: float = 0.5,
+    score_thres: float = 0.001,
+    use_cpp: bool = True,
+) -> Tuple[np.ndarray, np.ndarray]:
+    boxes = np.ascontiguousarray(boxes, dtype=np.float32).reshape(-1, 4)
+    scores = np.ascontiguousarray(scores, dtype=np.float32).reshape(-1)
+    if classes is not None:
+        classes = np.ascontiguousarray(classes, dtype=np.int32).reshape(-1)
+    if len(boxes) != len(scores) or (classes is not None and len(classes) != len(scores)):
+        raise ValueError(
+            f"Expected boxes of shape (N, 4), scores and classes of shape (N,), got {len(boxes)} boxes, "
+            f"{len(scores)} scores and {'no' if classes is None else len(classes)} classes."
+        )
+    if len(scores) == 0 or max_out_dets <= 0:
+        return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float32)
+
+    if use_cpp and _nms_cpp is not None:
+        keep, keep_scores = _nms_cpp(
+            boxes, scores, classes, iou_thres, max_out_dets, _METHOD_IDS[method], sigma, score_thres
+        )
+        return np.array(keep, dtype=np.int64), np.array(keep_scores, dtype=np.float32)
+    if method == NMS_METHOD.HARD:
+        return _nms_numpy(boxes, scores, classes, iou_thres, max_out_dets)
+    return _soft_nms_numpy(boxes, scores, classes, iou_thres, max_out_dets, method, sigma, score_thres)
+
+
+def _pairwise_iou(a: np.ndarray, b: np.ndarray, area_a: np.ndarray, area_b: np.ndarray) -> np.ndarray:
+    # IoU matrix of shape (len(a), len(b)) of boxes in corner format
+    inter_0 = np.minimum(a[:, None, 2], b[None, :, 2]) - np.maximum(a[:, None, 0], b[None, :, 0])
+    inter_1 = np.minimum(a[:, None, 3], b[None, :, 3]) - np.maximum(a[:, None, 1], b[None, :, 1])
+    inter = np.maximum(inter_0, 0) * np.maximum(inter_1, 0)
+    union = area_a[:, None] + area_b[None, :] - inter
+    return np.divide(inter, union, out=np.zeros_like(inter), where=union > 0)
+
+
+def _nms_numpy(
+    boxes: np.ndarray, scores: np.ndarray, classes: Optional[np.ndarray], iou_thres: float, max_out_dets: int
+) -> Tuple[np.ndarray, np.ndarray]:
+    order = np.argsort(-scores, kind="stable")
+    boxes = boxes[order]
+    areas = (boxes[:, 2] - boxes[:, 0]) * (boxes[:, 3] - boxes[:, 1])
+    if classes is not None:
+        classes = classes[order]
+
+    keep = np.empty(0, dtype=np.int64)
+    for start in range(0, len(order), _BLOCK_SIZE):
+        block = np.arange(start, min(start + _BLOCK_SIZE, len(order)))
+
+        # Candidates suppressed by a box kept in a previous block
+        alive = np.ones(len(block), dtype=bool)
+        if len(keep):
+            overlap = _pairwise_iou(boxes[keep], boxes[block], areas[keep], areas[block]) > iou_thres
+            if classes is not None:
+                overlap &= classes[keep, None] == classes[None, block]
+            alive = ~overlap.any(0)
+
+        # Greedy suppression within the block as a fixed point of matrix operations (Cluster-NMS),
+        # equivalent to sequential greedy NMS and typically converging in a few iterations
+        overlap = _pairwise_iou(boxes[block], boxes[block], areas[block], areas[block]) > iou_thres
+        if classes is not None:
+            overlap &= classes[block, None] == classes[None, block]
+        overlap = np.triu(overlap, k=1)
+        block_keep = alive
+        while True:
+            suppressed = (overlap & block_keep[:, None]).any(0)
+            next_keep = alive & ~suppressed
+            if np.array_equal(next_keep, block_keep):
+                break
+            block_keep = next_keep
+
+        keep = np.concatenate([keep, block[block_keep]])
+        if len(keep) >= max_out_dets:
+            break
+
+    keep = order[keep[:max_out_dets]]
+    return keep, scores[keep]
+
+
+def _soft_nms_numpy(
+    boxes: np.ndarray,
+    scores: np.ndarray,
+    classes: Optional[np.ndarray],
+    iou_thres: float,
+    max_out_dets: int,
+    method: str,
+    sigma: float,
+    score_thres: float,
+) -> Tuple[np.ndarray, np.ndarray]:
+    areas = (boxes[:, 2] - boxes[:, 0]) * (boxes[:, 3] - boxes[:, 1])
+    decayed = scores.copy()
+    alive = np.flatnonzero(decayed >= score_thres)
+
+    keep, keep_scores = [], []
+    while len(alive) and len(keep) < max_out_dets:
+        best = np.argmax(decayed[alive])
+        i = alive[best]
+        keep.append(i)
+        keep_scores.append(decayed[i])
+        alive = np.delete(alive, best)
+
+        overlap = _pairwise_iou(boxes[i : i + 1], boxes[alive], areas[i : i + 1], areas[alive])[0]
+        if classes is not None:
+            overlap[classes[alive] != classes[i]] = 0
+        if method == NMS_METHOD.LINEAR:
+            weight = np.where(overlap > iou_thres, 1 - overlap, 1)
+        else:
+            weight = np.exp(-(overlap * overlap) / sigma)
+        decayed[alive] *= weight.astype(np.float32)
+        alive = alive[decayed[alive] >= score_thres]
+
+    return np.array(keep, dtype=np.int64), np.array(keep_scores, dtype=np.float32)
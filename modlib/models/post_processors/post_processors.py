@@ -14,14 +14,14 @@
 # limitations under the License.
 #
 
-from typing import List, Tuple
+from typing import List, Tuple, Union
 
 import numpy as np
 from modlib.models.post_processors import cpp_post_processors
 
 from ..results import Anomaly, Classifications, Detections, Poses, Segments, InstanceSegments
 from .higherhrnet import postprocess_higherhrnet
-from .yolo import postprocess_yolov8_detection, postprocess_yolov8_keypoints
+from .yolo import postprocess_yolov8_detection, postprocess_yolov8_keypoints, process_mask_crops
 
 
 def pp_cls(output_tensors: List[np.ndarray]) -> Classifications:
@@ -136,7 +136,7 @@ def pp_od_yolo_ultralytics(output_tensors: List[np.ndarray], input_tensor_sz: in
     return detections
 
 
-def pp_od_yolov8n(output_tensors: List[np.ndarray]) -> Detections:
+def pp_od_yolov8n(output_tensors: List[np.ndarray], input_tensor_sz: Union[int, Tuple[int, int]] = 640) -> Detections:
     """
     Postprocess the outputs of a YOLOv8 model for object detection, without any internal post-processing in the model.
     Default post processing settings:
@@ -146,6 +146,7 @@ def pp_od_yolov8n(output_tensors: List[np.ndarray]) -> Detections:
 
     Args:
         output_tensors: Resulting output tensors to be processed.
+        input_tensor_sz: Input tensor size, either an int or (width, height), default 640.
 
     Returns:
         The post-processed object detection detections.
@@ -156,10 +157,12 @@ def pp_od_yolov8n(output_tensors: List[np.ndarray]) -> Detections:
         conf=0.01,
         iou_thres=0.7,
         max_out_dets=50,
+        input_tensor_size=input_tensor_sz,
     )[0]
 
+    w, h = (input_tensor_sz, input_tensor_sz) if np.isscalar(input_tensor_sz) else input_tensor_sz
     return Detections(
-        bbox=np.array(boxes / 640)[:, [1, 0, 3, 2]],
+        bbox=np.array(boxes / [h, w, h, w])[:, [1, 0, 3, 2]],
         class_id=classes,
         confidence=scores,
     )
@@ -547,12 +550,13 @@ def pp_higherhrnet(output_tensors: List[np.ndarray]) -> Poses:
     )
 
 
-def pp_yolov8n_pose(output_tensors: List[np.ndarray]) -> Poses:
+def pp_yolov8n_pose(output_tensors: List[np.ndarray], input_tensor_sz: Union[int, Tuple[int, int]] = 640) -> Poses:
     """
     Performs post-processing on a raw YOLOv8n-pose result tensor.
 
     Args:
         output_tensors: Resulting output tensors to be processed.
+        input_tensor_sz: Input tensor size, either an int or (width, height), default 640.
 
     Returns:
         The post-processed pose estimation results.
@@ -563,11 +567,13 @@ def pp_yolov8n_pose(output_tensors: List[np.ndarray]) -> Poses:
         conf=0.01,
         iou_thres=0.3,
         max_out_dets=10,
+        input_tensor_size=input_tensor_sz,
     )
 
+    w, h = (input_tensor_sz, input_tensor_sz) if np.isscalar(input_tensor_sz) else input_tensor_sz
     keypoints = np.reshape(kpts, [kpts.shape[0], 17, 3])
-    keypoints[:, :, 0] /= 640
-    keypoints[:, :, 1] /= 640
+    keypoints[:, :, 0] /= w
+    keypoints[:, :, 1] /= h
 
     n_detections = len(scores)
     return Poses(
@@ -575,7 +581,7 @@ def pp_yolov8n_pose(output_tensors: List[np.ndarray]) -> Poses:
         confidence=scores,
         keypoints=keypoints[:, :, :2],
         keypoint_scores=keypoints[:, :, 2],
-        bbox=np.reshape(boxes / 640, [n_detections, 4])[:, [1, 0, 3, 2]],
+        bbox=np.reshape(boxes / [h, w, h, w], [n_detections, 4])[:, [1, 0, 3, 2]],
     )
 
 
@@ -643,10 +649,6 @@ def pp_yolo_segment_ultralytics(
         The post-processed segmentation results.
     """
 
-    def sigmoid(x):
-        x = np.array(x)  # Ensure x is a NumPy array for element-wise operations
-        return np.where(x >= 0, 1 / (1 + np.exp(-x)), np.exp(x) / (1 + np.exp(x)))
-
     scores = np.asarray(output_tensors[1])
     n = min(np.sum(scores > 0.0), max_detections)
     if n == 0:
@@ -658,18 +660,9 @@ def pp_yolo_segment_ultralytics(
     mask_coeffs = output_tensors[3][:n]
     masks_proto = output_tensors[4]
 
-    c, mh, mw = masks_proto.shape
-    masks_proto_flattered = masks_proto.reshape(c, -1)
-    mask = np.dot(mask_coeffs, masks_proto_flattered)
-    mask = sigmoid(mask)
-    mask = mask.reshape(-1, mh, mw)
-    binary_mask = (mask > threshold).astype(np.uint8)
-
-    # crop
-    mask_crops: List[np.ndarray] = []
-    for i in range(n):
-        yi1, yi2, xi1, xi2 = InstanceSegments._bbox_to_slices(boxes[i], mh, mw)
-        mask_crops.append(binary_mask[i, yi1:yi2, xi1:xi2])
+    # Binary masks computed only inside the bounding box of every instance
+    _, mh, mw = masks_proto.shape
+    mask_crops = process_mask_crops(mask_coeffs, masks_proto, boxes, threshold)
 
     return InstanceSegments(
         mask=mask_crops,
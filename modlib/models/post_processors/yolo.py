@@ -31,11 +31,15 @@ This code is based on:
 https://github.com/ultralytics/ultralytics
 """
 
+import threading
 from enum import Enum
-from typing import List, Tuple
+from typing import List, Optional, Tuple, Union
 
 import numpy as np
 
+from ..results import InstanceSegments
+from .nms import non_max_suppression
+
 
 def nms(dets: np.ndarray, scores: np.ndarray, iou_thres: float = 0.55, max_out_dets: int = 50) -> List[int]:
     """
@@ -44,59 +48,37 @@ def nms(dets: np.ndarray, scores: np.ndarray, iou_thres: float = 0.55, max_out_d
     Args:
         dets: Array of bounding box coordinates of shape (N, 4) representing [y1, x1, y2, x2].
         scores: Array of confidence scores associated with each bounding box.
-        iou_thres: IoU threshold for NMS. Default is 0.5.
-        max_out_dets: Maximum number of output detections to keep. Default is 300.
+        iou_thres: IoU threshold for NMS. Default is 0.55.
+        max_out_dets: Maximum number of output detections to keep. Default is 50.
 
     Returns:
         List of indices representing the indices of the bounding boxes to keep after NMS.
     """
-    y1, x1 = dets[:, 0], dets[:, 1]
-    y2, x2 = dets[:, 2], dets[:, 3]
-    areas = (x2 - x1 + 1) * (y2 - y1 + 1)
-    order = scores.argsort()[::-1]
-
-    keep = []
-    while order.size > 0:
-        i = order[0]
-        keep.append(i)
-        xx1 = np.maximum(x1[i], x1[order[1:]])
-        yy1 = np.maximum(y1[i], y1[order[1:]])
-        xx2 = np.minimum(x2[i], x2[order[1:]])
-        yy2 = np.minimum(y2[i], y2[order[1:]])
-
-        w = np.maximum(0.0, xx2 - xx1 + 1)
-        h = np.maximum(0.0, yy2 - yy1 + 1)
-        inter = w * h
-        ovr = inter / (areas[i] + areas[order[1:]] - inter)
-
-        inds = np.where(ovr <= iou_thres)[0]
-        order = order[inds + 1]
-
-    return keep[:max_out_dets]
+    return non_max_suppression(dets, scores, iou_thres=iou_thres, max_out_dets=max_out_dets).tolist()
 
 
-def combined_nms(batch_boxes, batch_scores, iou_thres: float = 0.65, conf: float = 0.55, max_out_dets: int = 50):
+def combined_nms(
+    batch_boxes,
+    batch_scores,
+    iou_thres: float = 0.65,
+    conf: float = 0.55,
+    max_out_dets: int = 50,
+    max_candidates: int = 1000,
+):
     nms_results = []
     for boxes, scores in zip(batch_boxes, batch_scores):
-        xc = np.argmax(scores, 1)
+        # Threshold the maximum class score first, only the top candidates are gathered
         xs = np.amax(scores, 1)
-        x = np.concatenate([boxes, np.expand_dims(xs, 1), np.expand_dims(xc, 1)], 1)
-
-        xi = xs > conf
-        x = x[xi]
+        xi = _top_k_candidates(xs, conf, max_candidates)
+        xc = np.argmax(scores[xi], 1)
+        boxes = convert_to_ymin_xmin_ymax_xmax_format(boxes[xi], BoxFormat.XC_YC_W_H)
+        xs = xs[xi]
 
-        x = x[np.argsort(-x[:, 4])[:8400]]
-        scores = x[:, 4]
-        x[..., :4] = convert_to_ymin_xmin_ymax_xmax_format(x[..., :4], BoxFormat.XC_YC_W_H)
-        offset = x[:, 5] * 640
-        boxes = x[..., :4] + np.expand_dims(offset, 1)
-
-        # Original post-processing part
-        valid_indexs = nms(boxes, scores, iou_thres=iou_thres, max_out_dets=max_out_dets)
-        x = x[valid_indexs]
-        nms_classes = x[:, 5]
-        nms_bbox = x[:, :4]
-        nms_scores = x[:, 4]
+        # Class-aware NMS, boxes only suppress boxes of the same class
+        valid_indexs = non_max_suppression(boxes, xs, iou_thres=iou_thres, max_out_dets=max_out_dets, classes=xc)
+        nms_bbox = boxes[valid_indexs]
+        nms_scores = xs[valid_indexs]
+        nms_classes = xc[valid_indexs].astype(boxes.dtype)
 
         nms_results.append((nms_bbox, nms_scores, nms_classes))
 
@@ -104,60 +86,95 @@ def combined_nms(batch_boxes, batch_scores, iou_thres: float = 0.65, conf: float
 
 
 def combined_nms_seg(
-    batch_boxes, batch_scores, batch_masks, iou_thres: float = 0.5, conf: float = 0.001, max_out_dets: int = 300
+    batch_boxes,
+    batch_scores,
+    batch_masks,
+    iou_thres: float = 0.5,
+    conf: float = 0.001,
+    max_out_dets: int = 300,
+    max_candidates: int = 1000,
 ):
     nms_results = []
     for boxes, scores, masks in zip(batch_boxes, batch_scores, batch_masks):
-        # Compute maximum scores and corresponding class indices
-        class_indices = np.argmax(scores, axis=1)
+        # Filter out detections below the confidence threshold, keeping the top candidates
         max_scores = np.amax(scores, axis=1)
-        detections = np.concatenate(
-            [boxes, np.expand_dims(max_scores, axis=1), np.expand_dims(class_indices, axis=1)], axis=1
-        )
+        valid_detections = _top_k_candidates(max_scores, conf, max_candidates)
 
-        # Swap the position of the two dimensions (32, 8400) to (8400, 32)
-        masks = np.transpose(masks, (1, 0))
-        # Filter out detections below the confidence threshold
-        valid_detections = max_scores > conf
-
-        if np.all(valid_detections is False):
+        if len(valid_detections) == 0:
             nms_results.append((np.ndarray(0), np.ndarray(0), np.ndarray(0), np.ndarray(0)))
         else:
-            detections = detections[valid_detections]
-            masks = masks[valid_detections]
-
-            # Sort detections by score in descending order
-            sorted_indices = np.argsort(-detections[:, 4])
-            detections = detections[sorted_indices]
-            masks = masks[sorted_indices]
+            boxes = convert_to_ymin_xmin_ymax_xmax_format(boxes[valid_detections], BoxFormat.XC_YC_W_H)
+            class_indices = np.argmax(scores[valid_detections], axis=1)
+            max_scores = max_scores[valid_detections]
 
-            detections[..., :4] = convert_to_ymin_xmin_ymax_xmax_format(detections[..., :4], BoxFormat.XC_YC_W_H)
+            # Perform class-aware NMS, sorted by descending score
+            final_indices = non_max_suppression(
+                boxes, max_scores, iou_thres=iou_thres, max_out_dets=max_out_dets, classes=class_indices
+            )
 
-            # Perform class-wise NMS
-            unique_classes = np.unique(detections[:, 5])
-            final_indices = []
-
-            for cls in unique_classes:
-                cls_indices = np.where(detections[:, 5] == cls)[0]
-                cls_boxes = detections[cls_indices, :4]
-                cls_scores = detections[cls_indices, 4]
-                cls_valid_indices = nms(cls_boxes, cls_scores, iou_thres=iou_thres, max_out_dets=max_out_dets)
-                final_indices.extend(cls_indices[cls_valid_indices])
-
-            final_indices = np.array(final_indices)
-            final_detections = detections[final_indices]
-            final_masks = masks[final_indices]
+            # Gather the (32, 8400) mask coefficients of the kept detections as (N, 32)
+            final_masks = masks[:, valid_detections[final_indices]].transpose()
 
             # Extract class indices, bounding boxes, and scores
-            nms_classes = final_detections[:, 5]
-            nms_bbox = final_detections[:, :4]
-            nms_scores = final_detections[:, 4]
+            nms_classes = class_indices[final_indices].astype(boxes.dtype)
+            nms_bbox = boxes[final_indices]
+            nms_scores = max_scores[final_indices]
 
             # Append results including masks
             nms_results.append((nms_bbox, nms_scores, nms_classes, final_masks))
     return nms_results
 
 
+def _top_k_candidates(scores: np.ndarray, conf: float, max_candidates: int) -> np.ndarray:
+    # Indices of the scores above the threshold, limited to the `max_candidates` highest and sorted by descending
+    # score. The partial partition avoids sorting all candidates of a low confidence threshold.
+    candidates = np.flatnonzero(scores > conf)
+    if len(candidates) > max_candidates:
+        top = np.argpartition(scores[candidates], len(candidates) - max_candidates)[len(candidates) - max_candidates :]
+        candidates = candidates[top]
+    return candidates[np.argsort(-scores[candidates], kind="stable")]
+
+
+def process_mask_crops(
+    mask_coeffs: np.ndarray, masks_proto: np.ndarray, bbox: np.ndarray, threshold: float = 0.5
+) -> List[np.ndarray]:
+    """
+    Assemble the binary instance masks from the mask prototypes, cropped to the bounding box of every instance.
+
+    The mask logits are only computed inside each box, and thresholded in logit space since
+    `sigmoid(x) > threshold` is equivalent to `x > logit(threshold)`. The crops are views into a single packed buffer.
+
+    Args:
+        mask_coeffs: Mask coefficients of shape (N, C).
+        masks_proto: Mask prototypes of shape (C, H, W).
+        bbox: Bounding boxes of shape (N, 4) with normalized `x1, y1, x2, y2`.
+        threshold: Threshold of the mask probability. Default is 0.5.
+
+    Returns:
+        List of N cropped 2D uint8 masks, matching the cropped storage of `InstanceSegments`.
+    """
+    c, height, width = masks_proto.shape
+    slices = InstanceSegments._bboxes_to_slices(bbox, height, width)
+    sizes = (slices[:, 1] - slices[:, 0]) * (slices[:, 3] - slices[:, 2])
+    offsets = np.concatenate([[0], np.cumsum(sizes)])
+
+    if threshold <= 0:
+        logit_threshold = -np.inf
+    elif threshold >= 1:
+        logit_threshold = np.inf
+    else:
+        logit_threshold = np.log(threshold / (1 - threshold))
+
+    buffer = np.empty(offsets[-1], dtype=np.uint8)
+    crops: List[np.ndarray] = []
+    for i, (y1, y2, x1, x2) in enumerate(slices):
+        crop = buffer[offsets[i] : offsets[i + 1]].reshape(y2 - y1, x2 - x1)
+        logits = mask_coeffs[i] @ masks_proto[:, y1:y2, x1:x2].reshape(c, -1)
+        np.greater(logits.reshape(crop.shape), logit_threshold, out=crop)
+        crops.append(crop)
+    return crops
+
+
 class BoxFormat(Enum):
     """
     Enumeration of different bounding box formats used in object detection.
@@ -198,32 +215,305 @@ def convert_to_ymin_xmin_ymax_xmax_format(boxes, orig_format: BoxFormat):
         raise Exception("Unsupported boxes format")
 
 
+InputTensorSize = Union[int, Tuple[int, int]]
+
+
+class YOLOv8PostProcessor:
+    """
+    Post-processor for the raw outputs of a YOLOv8 model, without any internal post-processing in the model.
+    Build it once per model: the anchor points and strides are derived from the input tensor size and cached,
+    and the box decoding reuses preallocated buffers between frames.
+
+    Example:
+    ```
+    class CustomYOLOv8(Model):
+        def __init__(self):
+            super().__init__(...)
+            self.yolo_post_processor = YOLOv8PostProcessor(input_tensor_size=(320, 320))
+
+        def post_process(self, output_tensors: List[np.ndarray]) -> Detections:
+            outputs = [np.expand_dims(t, axis=0) for t in output_tensors]  # batch=1
+            boxes, scores, classes = self.yolo_post_processor.detection(outputs)[0]
+            ...
+    ```
+
+    NOTE: The decode buffers are shared between calls, use one post-processor per model and thread.
+    """
+
+    input_tensor_size: Tuple[int, int]  #: Input tensor size (width, height) of the model.
+    strides: Tuple[int, ...]  #: Strides of the detection heads.
+    feat_sizes: List[Tuple[int, int]]  #: Feature map size (height, width) of every detection head.
+    num_anchors: int  #: Total number of anchors of all detection heads, e.g. 8400 for a 640x640 input tensor.
+
+    def __init__(
+        self,
+        input_tensor_size: InputTensorSize = 640,
+        strides: Tuple[int, ...] = (8, 16, 32),
+        grid_cell_offset: float = 0.5,
+    ):
+        """
+        Args:
+            input_tensor_size: Input tensor size of the model, either an int for square inputs or (width, height).
+                Default is 640.
+            strides: Strides of the detection heads. Default is (8, 16, 32).
+            grid_cell_offset: Offset of the anchor points within their grid cell. Default is 0.5.
+
+        Raises:
+            ValueError: If the input tensor size is not divisible by the largest stride.
+        """
+        width, height = (input_tensor_size, input_tensor_size) if np.isscalar(input_tensor_size) else input_tensor_size
+        if width % max(strides) or height % max(strides):
+            raise ValueError(f"Input tensor size {width}x{height} must be divisible by the stride {max(strides)}.")
+
+        self.input_tensor_size = (int(width), int(height))
+        self.strides = tuple(strides)
+        self.feat_sizes = [(height // s, width // s) for s in self.strides]
+
+        anchors, stride_tensor = make_anchors_yolo_v8(self.feat_sizes, self.strides, grid_cell_offset)
+        self._anchors = np.ascontiguousarray(anchors.transpose(), dtype=np.float32)  # (2, num_anchors)
+        self._stride_tensor = np.ascontiguousarray(stride_tensor.transpose(), dtype=np.float32)  # (1, num_anchors)
+        self.num_anchors = self._anchors.shape[1]
+
+        self._dbox = np.empty((0, 4, self.num_anchors), dtype=np.float32)
+        self._kpts = np.empty((0, 0, self.num_anchors), dtype=np.float32)
+
+    def decode_boxes(self, y_bb: np.ndarray) -> np.ndarray:
+        """
+        Decode the box distances (left, top, right, bottom) to the anchor points into boxes.
+
+        Args:
+            y_bb: Box distances output of shape (batch, 4, num_anchors) in units of the stride.
+
+        Returns:
+            Boxes (xc, yc, w, h) of shape (batch, 4, num_anchors) in input tensor pixels.
+            A view of the internal buffer, overwritten by the next call.
+        """
+        self._check_anchors(y_bb)
+        if self._dbox.shape[0] != len(y_bb):
+            self._dbox = np.empty((len(y_bb), 4, self.num_anchors), dtype=np.float32)
+
+        lt, rb = y_bb[:, :2], y_bb[:, 2:4]
+        c_xy, wh = self._dbox[:, :2], self._dbox[:, 2:]
+        # c_xy = (anchor - lt + anchor + rb) / 2, wh = (anchor + rb) - (anchor - lt)
+        np.subtract(rb, lt, out=c_xy)
+        c_xy *= 0.5
+        c_xy += self._anchors
+        c_xy *= self._stride_tensor
+        np.add(lt, rb, out=wh)
+        wh *= self._stride_tensor
+        return self._dbox
+
+    def decode_keypoints(self, kpts: np.ndarray, ndim: int = 3) -> np.ndarray:
+        """
+        Decode the keypoint offsets to the anchor points into keypoints.
+
+        Args:
+            kpts: Keypoint output of shape (batch, num_keypoints * ndim, num_anchors), with (x, y[, visibility logit]).
+            ndim: Number of values per keypoint, 2 or 3. Default is 3.
+
+        Returns:
+            Keypoints (x, y[, visibility]) of shape (batch, num_keypoints * ndim, num_anchors) in input tensor pixels.
+            A view of the internal buffer, overwritten by the next call.
+        """
+        self._check_anchors(kpts)
+        if self._kpts.shape[:2] != kpts.shape[:2]:
+            self._kpts = np.empty((*kpts.shape[:2], self.num_anchors), dtype=np.float32)
+
+        np.copyto(self._kpts, kpts)
+        return _decode_keypoints(self._kpts, self._anchors, self._stride_tensor, ndim)
+
+    def detection(
+        self,
+        outputs: Tuple[np.ndarray, np.ndarray],
+        conf: float = 0.3,
+        iou_thres: float = 0.7,
+        max_out_dets: int = 50,
+        max_candidates: int = 1000,
+    ) -> List[Tuple[np.ndarray, np.ndarray, np.ndarray]]:
+        """
+        Postprocess the outputs of a YOLOv8 model for object detection.
+
+        Args:
+            outputs: Tuple containing the model outputs for bounding boxes and class predictions.
+            conf: Confidence threshold for bounding box predictions. Default is 0.3
+            iou_thres: IoU (Intersection over Union) threshold for Non-Maximum Suppression (NMS). Default is 0.7.
+            max_out_dets: Maximum number of output detections to keep after NMS. Default is 50.
+            max_candidates: Maximum number of candidates above the confidence threshold, with the highest scores,
+                passed to NMS. Default is 1000.
+
+        Returns:
+            For every image in the batch, a tuple containing the post-processed bounding boxes
+            [y1, x1, y2, x2] in input tensor pixels, their corresponding scores, and categories.
+        """
+        y_bb, y_cls = outputs
+        dbox = self.decode_boxes(y_bb)
+        return combined_nms(
+            dbox.transpose([0, 2, 1]), y_cls.transpose([0, 2, 1]), iou_thres, conf, max_out_dets, max_candidates
+        )
+
+    def keypoints(
+        self,
+        outputs: Tuple[np.ndarray, np.ndarray, np.ndarray],
+        conf: float = 0.3,
+        iou_thres: float = 0.7,
+        max_out_dets: int = 300,
+        max_candidates: int = 1000,
+        kpt_shape: Tuple[int, int] = (17, 3),
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Postprocess the outputs of a YOLOv8 model for object detection and pose estimation.
+
+        Args:
+            outputs: Tuple containing the model outputs for bounding boxes, class predictions, and keypoint predictions.
+            conf: Confidence threshold for bounding box predictions. Default is 0.3
+            iou_thres: IoU (Intersection over Union) threshold for Non-Maximum Suppression (NMS). Default is 0.7.
+            max_out_dets: Maximum number of output detections to keep after NMS. Default is 300.
+            max_candidates: Maximum number of candidates above the confidence threshold, with the highest scores,
+                passed to NMS. Default is 1000.
+            kpt_shape: Number of keypoints and values per keypoint. Default is (17, 3).
+
+        Returns:
+            Tuple containing the post-processed bounding boxes, their corresponding scores, and keypoints
+            of the first image in the batch.
+        """
+        y_bb, y_cls, kpts = outputs
+        self._check_anchors(kpts)
+
+        # Threshold the maximum class score first, only the top candidates are gathered and decoded
+        scores = np.amax(y_cls[0], axis=0)
+        candidates = _top_k_candidates(scores, conf, max_candidates)
+        scores = scores[candidates]
+        boxes = self.decode_boxes(y_bb)[0][:, candidates].transpose()
+        boxes = convert_to_ymin_xmin_ymax_xmax_format(boxes, BoxFormat.XC_YC_W_H)
+        pred_kpt = _decode_keypoints(
+            np.take(kpts[0], candidates, axis=1).astype(np.float32, copy=False),  # C-contiguous for the decode
+            np.take(self._anchors, candidates, axis=1),
+            np.take(self._stride_tensor, candidates, axis=1),
+            kpt_shape[1],
+        )
+
+        # Original post-processing part
+        valid_indexs = non_max_suppression(boxes, scores, iou_thres=iou_thres, max_out_dets=max_out_dets)
+        nms_bbox = boxes[valid_indexs]
+        nms_scores = scores[valid_indexs]
+        nms_kpts = pred_kpt[:, valid_indexs].transpose()
+
+        return nms_bbox, nms_scores, nms_kpts
+
+    def inst_seg(
+        self,
+        outputs: Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray],
+        conf: float = 0.001,
+        iou_thres: float = 0.7,
+        max_out_dets: int = 300,
+        max_candidates: int = 1000,
+        mask_threshold: Optional[float] = None,
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, Union[np.ndarray, List[np.ndarray]]]:
+        """
+        Postprocess the outputs of a YOLOv8 model for instance segmentation.
+
+        Args:
+            outputs: Tuple containing the model outputs for bounding boxes, class predictions,
+                mask coefficients and mask prototypes.
+            conf: Confidence threshold for bounding box predictions. Default is 0.001
+            iou_thres: IoU (Intersection over Union) threshold for Non-Maximum Suppression (NMS). Default is 0.7.
+            max_out_dets: Maximum number of output detections to keep after NMS. Default is 300.
+            max_candidates: Maximum number of candidates above the confidence threshold, with the highest scores,
+                passed to NMS. Default is 1000.
+            mask_threshold: Optional threshold of the mask probability. When set, the masks are returned as binary
+                uint8 crops of every bounding box at mask resolution, see `process_mask_crops`. Default is None,
+                returning the dense mask logits of shape (N, H, W).
+
+        Returns:
+            Tuple containing the post-processed bounding boxes, their corresponding scores, categories
+            and masks of the first image in the batch.
+        """
+        y_bb, y_cls, ymask_weights, y_masks = outputs
+        dbox = self.decode_boxes(y_bb)
+
+        nms_bbox, nms_scores, nms_classes, ymask_weights = combined_nms_seg(
+            dbox.transpose([0, 2, 1]),
+            y_cls.transpose([0, 2, 1]),
+            ymask_weights,
+            iou_thres,
+            conf,
+            max_out_dets,
+            max_candidates,
+        )[0]
+        if mask_threshold is not None:
+            width, height = self.input_tensor_size
+            bbox = nms_bbox[:, [1, 0, 3, 2]] / [width, height, width, height] if len(nms_scores) else nms_bbox
+            final_masks = process_mask_crops(ymask_weights, y_masks[0], bbox, mask_threshold)
+        elif len(nms_scores) == 0:
+            final_masks = y_masks
+        else:
+            y_masks = y_masks.squeeze(0)
+            ymask_weights = ymask_weights.transpose(1, 0)
+            final_masks = np.tensordot(ymask_weights, y_masks, axes=([0], [0]))
+
+        return nms_bbox, nms_scores, nms_classes, final_masks
+
+    def _check_anchors(self, output: np.ndarray):
+        if output.shape[-1] != self.num_anchors:
+            width, height = self.input_tensor_size
+            raise ValueError(
+                f"Expected {self.num_anchors} anchors for an input tensor size of {width}x{height}, "
+                f"got an output of shape {output.shape}."
+            )
+
+
+def _decode_keypoints(pred_kpt: np.ndarray, anchors: np.ndarray, stride_tensor: np.ndarray, ndim: int) -> np.ndarray:
+    # Decodes keypoints of shape (..., num_keypoints * ndim, N) in place, given the N anchors (2, N) and strides (1, N)
+    if ndim == 3:
+        visibility = pred_kpt[..., 2::3, :]
+        np.negative(visibility, out=visibility)
+        np.exp(visibility, out=visibility)
+        visibility += 1
+        np.reciprocal(visibility, out=visibility)  # sigmoid
+    for i in range(2):
+        coord = pred_kpt[..., i::ndim, :]
+        coord *= 2.0
+        coord += anchors[i] - 0.5
+        coord *= stride_tensor
+    return pred_kpt
+
+
+_post_processors = threading.local()
+
+
+def _cached_post_processor(input_tensor_size: InputTensorSize) -> YOLOv8PostProcessor:
+    # One post-processor per input tensor size and thread, since the decode buffers are shared between calls
+    cache = _post_processors.__dict__.setdefault("cache", {})
+    key = (input_tensor_size, input_tensor_size) if np.isscalar(input_tensor_size) else tuple(input_tensor_size)
+    if key not in cache:
+        cache[key] = YOLOv8PostProcessor(key)
+    return cache[key]
+
+
 def postprocess_yolov8_detection(
-    outputs: Tuple[np.ndarray, np.ndarray], conf: float = 0.3, iou_thres: float = 0.7, max_out_dets: int = 50
+    outputs: Tuple[np.ndarray, np.ndarray],
+    conf: float = 0.3,
+    iou_thres: float = 0.7,
+    max_out_dets: int = 50,
+    max_candidates: int = 1000,
+    input_tensor_size: InputTensorSize = 640,
 ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
     """
-    Postprocess the outputs of a YOLOv8 model for object detection
+    Postprocess the outputs of a YOLOv8 model for object detection, see `YOLOv8PostProcessor.detection`.
 
     Args:
         outputs: Tuple containing the model outputs for bounding boxes and class predictions.
         conf: Confidence threshold for bounding box predictions. Default is 0.3
         iou_thres: IoU (Intersection over Union) threshold for Non-Maximum Suppression (NMS). Default is 0.7.
         max_out_dets: Maximum number of output detections to keep after NMS. Default is 50.
+        max_candidates: Maximum number of candidates above the confidence threshold, with the highest scores,
+            passed to NMS. Default is 1000.
+        input_tensor_size: Input tensor size of the model, either an int or (width, height). Default is 640.
 
     Returns:
         Tuple containing the post-processed bounding boxes, their corresponding scores, and categories.
     """
-    feat_sizes = np.array([80, 40, 20])
-    stride_sizes = np.array([8, 16, 32])
-    a, s = (x.transpose() for x in make_anchors_yolo_v8(feat_sizes, stride_sizes, 0.5))
-
-    y_bb, y_cls = outputs
-    dbox = dist2bbox_yolo_v8(y_bb, a, xywh=True, dim=1) * s
-    detect_out = np.concatenate((dbox, y_cls), 1)
-
-    xd = detect_out.transpose([0, 2, 1])
-
-    return combined_nms(xd[..., :4], xd[..., 4:84], iou_thres, conf, max_out_dets)
+    return _cached_post_processor(input_tensor_size).detection(outputs, conf, iou_thres, max_out_dets, max_candidates)
 
 
 def postprocess_yolov8_keypoints(
@@ -231,86 +521,65 @@ def postprocess_yolov8_keypoints(
     conf: float = 0.3,
     iou_thres: float = 0.7,
     max_out_dets: int = 300,
+    max_candidates: int = 1000,
+    input_tensor_size: InputTensorSize = 640,
 ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
     """
-    Postprocess the outputs of a YOLOv8 model for object detection and pose estimation.
+    Postprocess the outputs of a YOLOv8 model for object detection and pose estimation,
+    see `YOLOv8PostProcessor.keypoints`.
 
     Args:
         outputs: Tuple containing the model outputs for bounding boxes, class predictions, and keypoint predictions.
         conf: Confidence threshold for bounding box predictions. Default is 0.3
         iou_thres: IoU (Intersection over Union) threshold for Non-Maximum Suppression (NMS). Default is 0.7.
         max_out_dets: Maximum number of output detections to keep after NMS. Default is 300.
+        max_candidates: Maximum number of candidates above the confidence threshold, with the highest scores,
+            passed to NMS. Default is 1000.
+        input_tensor_size: Input tensor size of the model, either an int or (width, height). Default is 640.
 
     Returns:
         Tuple containing the post-processed bounding boxes, their corresponding scores, and keypoints.
     """
-    kpt_shape = (17, 3)
-    feat_sizes = np.array([80, 40, 20])
-    stride_sizes = np.array([8, 16, 32])
-    a, s = (x.transpose() for x in make_anchors_yolo_v8(feat_sizes, stride_sizes, 0.5))
-
-    y_bb, y_cls, kpts = outputs
-    dbox = dist2bbox_yolo_v8(y_bb, a, xywh=True, dim=1) * s
-    detect_out = np.concatenate((dbox, y_cls), 1)
-    # additional part for pose estimation
-    ndim = kpt_shape[1]
-    pred_kpt = kpts.copy()
-    if ndim == 3:
-        pred_kpt[:, 2::3] = 1 / (1 + np.exp(-pred_kpt[:, 2::3]))  # sigmoid (WARNING: inplace .sigmoid_() Apple MPS bug)
-    pred_kpt[:, 0::ndim] = (pred_kpt[:, 0::ndim] * 2.0 + (a[0] - 0.5)) * s
-    pred_kpt[:, 1::ndim] = (pred_kpt[:, 1::ndim] * 2.0 + (a[1] - 0.5)) * s
-
-    x = np.concatenate([detect_out.transpose([2, 1, 0]).squeeze(), pred_kpt.transpose([2, 1, 0]).squeeze()], 1)
-    x = x[(x[:, 4] > conf)]
-    x = x[np.argsort(-x[:, 4])[:8400]]
-    x[..., :4] = convert_to_ymin_xmin_ymax_xmax_format(x[..., :4], BoxFormat.XC_YC_W_H)
-    boxes = x[..., :4]
-    scores = x[..., 4]
-
-    # Original post-processing part
-    valid_indexs = nms(boxes, scores, iou_thres=iou_thres, max_out_dets=max_out_dets)
-    x = x[valid_indexs]
-    nms_bbox = x[:, :4]
-    nms_scores = x[:, 4]
-    nms_kpts = x[:, 5:]
-
-    return nms_bbox, nms_scores, nms_kpts
+    return _cached_post_processor(input_tensor_size).keypoints(outputs, conf, iou_thres, max_out_dets, max_candidates)
 
 
 def postprocess_yolov8_inst_seg(
-    outputs: Tuple[np.ndarray, np.ndarray, np.ndarray],
+    outputs: Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray],
     conf: float = 0.001,
     iou_thres: float = 0.7,
     max_out_dets: int = 300,
-) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
-    feat_sizes = np.array([80, 40, 20])
-    stride_sizes = np.array([8, 16, 32])
-    a, s = (x.transpose() for x in make_anchors_yolo_v8(feat_sizes, stride_sizes, 0.5))
-
-    y_bb, y_cls, ymask_weights, y_masks = outputs
-    dbox = dist2bbox_yolo_v8(y_bb, a, xywh=True, dim=1) * s
-    detect_out = np.concatenate((dbox, y_cls), 1)
-
-    xd = detect_out.transpose([0, 2, 1])
-    nms_bbox, nms_scores, nms_classes, ymask_weights = combined_nms_seg(
-        xd[..., :4], xd[..., 4:84], ymask_weights, iou_thres, conf, max_out_dets
-    )[0]
-    if len(nms_scores) == 0:
-        final_masks = y_masks
-    else:
-        y_masks = y_masks.squeeze(0)
-        ymask_weights = ymask_weights.transpose(1, 0)
-        final_masks = np.tensordot(ymask_weights, y_masks, axes=([0], [0]))
+    max_candidates: int = 1000,
+    input_tensor_size: InputTensorSize = 640,
+    mask_threshold: Optional[float] = None,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, Union[np.ndarray, List[np.ndarray]]]:
+    """
+    Postprocess the outputs of a YOLOv8 model for instance segmentation, see `YOLOv8PostProcessor.inst_seg`.
+
+    Args:
+        outputs: Tuple containing the model outputs for bounding boxes, class predictions,
+            mask coefficients and mask prototypes.
+        conf: Confidence threshold for bounding box predictions. Default is 0.001
+        iou_thres: IoU (Intersection over Union) threshold for Non-Maximum Suppression (NMS). Default is 0.7.
+        max_out_dets: Maximum number of output detections to keep after NMS. Default is 300.
+        max_candidates: Maximum number of candidates above the confidence threshold, with the highest scores,
+            passed to NMS. Default is 1000.
+        input_tensor_size: Input tensor size of the model, either an int or (width, height). Default is 640.
+        mask_threshold: Optional threshold of the mask probability, returning binary mask crops. Default is None.
 
-    return nms_bbox, nms_scores, nms_classes, final_masks
+    Returns:
+        Tuple containing the post-processed bounding boxes, their corresponding scores, categories and masks.
+    """
+    return _cached_post_processor(input_tensor_size).inst_seg(
+        outputs, conf, iou_thres, max_out_dets, max_candidates, mask_threshold
+    )
 
 
 def make_anchors_yolo_v8(feats, strides, grid_cell_offset=0.5):
-    """Generate anchors from features."""
+    """Generate anchors from features, given as a size per feature map for square or (height, width)."""
     anchor_points, stride_tensor = [], []
     assert feats is not None
     for i, stride in enumerate(strides):
-        h, w = feats[i], feats[i]
+        h, w = (feats[i], feats[i]) if np.isscalar(feats[i]) else feats[i]
         sx = np.arange(stop=w) + grid_cell_offset  # shift x
         sy = np.arange(stop=h) + grid_cell_offset  # shift y
         sy, sx = np.meshgrid(sy, sx, indexing="ij")
@@ -967,6 +967,18 @@ class InstanceSegments(Result):
             yi2 = min(height, yi1 + 1)
         return yi1, yi2, xi1, xi2
 
+    @staticmethod
+    def _bboxes_to_slices(bbox: np.ndarray, height: int, width: int) -> np.ndarray:
+        """Vectorized `_bbox_to_slices` of `(N, 4)` boxes, returns `(N, 4)` integer slice bounds `y1,y2,x1,x2`."""
+        b = np.asarray(bbox, dtype=np.float64).reshape(-1, 4)
+        xi1 = np.clip(np.floor(b[:, 0] * width), 0, width)
+        yi1 = np.clip(np.floor(b[:, 1] * height), 0, height)
+        xi2 = np.clip(np.ceil(b[:, 2] * width), 0, width)
+        yi2 = np.clip(np.ceil(b[:, 3] * height), 0, height)
+        xi2 = np.where(xi2 <= xi1, np.minimum(width, xi1 + 1), xi2)
+        yi2 = np.where(yi2 <= yi1, np.minimum(height, yi1 + 1), yi2)
+        return np.stack([yi1, yi2, xi1, xi2], axis=1).astype(np.int64)
+
     def compress_mask(mask: np.ndarray, bbox: np.ndarray) -> List[np.ndarray]:
         """
         Crop each instance mask to the corresponding normalized bounding box region.
@@ -14,29 +14,68 @@
 # limitations under the License.
 #
 
-from .models import (
-    DeepLabV3Plus,
-    EfficientDetLite0,
-    EfficientNetB0,
-    EfficientNetLite0,
-    EfficientNetV2B0,
-    EfficientNetV2B1,
-    EfficientNetV2B2,
-    HigherHRNet,
-    InputTensorOnly,
-    MNASNet1_0,
-    MobileNetV2,
-    MobileViTXS,
-    MobileViTXXS,
-    NanoDetPlus416x416,
-    Posenet,
-    RegNetX002,
-    RegNetY002,
-    RegNetY004,
-    ResNet18,
-    ShuffleNetV2X1_5,
-    SqueezeNet1_0,
-    SSDMobileNetV2FPNLite320x320,
-    YOLO11n,
-    YOLOv8n,
+from typing import TYPE_CHECKING
+
+from ..._lazy import attach
+
+# The zoo models are imported on first access
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    dict.fromkeys(
+        [
+            "DeepLabV3Plus",
+            "EfficientDetLite0",
+            "EfficientNetB0",
+            "EfficientNetLite0",
+            "EfficientNetV2B0",
+            "EfficientNetV2B1",
+            "EfficientNetV2B2",
+            "HigherHRNet",
+            "InputTensorOnly",
+            "MNASNet1_0",
+            "MobileNetV2",
+            "MobileViTXS",
+            "MobileViTXXS",
+            "NanoDetPlus416x416",
+            "Posenet",
+            "RegNetX002",
+            "RegNetY002",
+            "RegNetY004",
+            "ResNet18",
+            "ShuffleNetV2X1_5",
+            "SqueezeNet1_0",
+            "SSDMobileNetV2FPNLite320x320",
+            "YOLO11n",
+            "YOLOv8n",
+        ],
+        ".models",
+    ),
 )
+
+if TYPE_CHECKING:
+    from .models import (
+        DeepLabV3Plus,
+        EfficientDetLite0,
+        EfficientNetB0,
+        EfficientNetLite0,
+        EfficientNetV2B0,
+        EfficientNetV2B1,
+        EfficientNetV2B2,
+        HigherHRNet,
+        InputTensorOnly,
+        MNASNet1_0,
+        MobileNetV2,
+        MobileViTXS,
+        MobileViTXXS,
+        NanoDetPlus416x416,
+        Posenet,
+        RegNetX002,
+        RegNetY002,
+        RegNetY004,
+        ResNet18,
+        ShuffleNetV2X1_5,
+        SqueezeNet1_0,
+        SSDMobileNetV2FPNLite320x320,
+        YOLO11n,
+        YOLOv8n,
+    )
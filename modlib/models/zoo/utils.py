@@ -16,10 +16,6 @@
 
 import os
 
-import requests
-from requests.adapters import HTTPAdapter
-from requests.packages.urllib3.util.retry import Retry
-
 
 def download_imx500_rpk_model(model_file: str, save_dir: str) -> str | None:
     """
@@ -44,6 +40,11 @@ def download_imx500_rpk_model(model_file: str, save_dir: str) -> str | None:
 
     print(f"Downloading {model_file} from RPI IMX500 models repository...")
 
+    # Imported on demand, only needed when downloading (keeps `import modlib.models.zoo` fast)
+    import requests
+    from requests.adapters import HTTPAdapter
+    from requests.packages.urllib3.util.retry import Retry
+
     # Create a session
     session = requests.Session()
 
@@ -0,0 +1,66 @@
+#
+# Copyright 2026 Sony Semiconductor Solutions Corp. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import time
+
+import numpy as np
+import pytest
+
+from modlib.devices import AiCamera
+
+from tests.devices.test_aicamera import make_output_tensor_info
+
+
+def parse_fromiter(output_tensor, output_tensor_info):
+    # Previous element wise conversion, as reference
+    np_output = np.fromiter(output_tensor, dtype=np.float32)
+    offset = 0
+    outputs = []
+    for tensor_shape in AiCamera._get_output_tensor_shape(output_tensor_info):
+        size = np.prod(tensor_shape)
+        outputs.append(np_output[offset : offset + size].reshape(tensor_shape, order="F"))
+        offset += size
+    return outputs
+
+
+@pytest.mark.slow
+@pytest.mark.parametrize(
+    "name, shapes",
+    [
+        ("detection (NMS in network)", [[4, 300], [300], [300], [1]]),
+        ("segmentation 320x320", [[320, 320]]),
+        ("raw detection heads", [[8400, 84]]),
+    ],
+)
+def test_benchmark_parse_output_tensor(name, shapes):
+    info = make_output_tensor_info(shapes)
+    flat = np.random.default_rng(0).random(sum(int(np.prod(s)) for s in shapes)).astype(np.float32)
+    as_sequence = tuple(flat.tolist())  # as returned by the libcamera Python bindings
+    as_buffer = bytearray(flat.tobytes())
+
+    def latency(fn, output_tensor, repeat=20):
+        fn(output_tensor, info)
+        t0 = time.perf_counter()
+        for _ in range(repeat):
+            fn(output_tensor, info)
+        return (time.perf_counter() - t0) / repeat * 1000
+
+    print(
+        f"\n{name} ({flat.size} floats) parse latency per request:"
+        f" fromiter {latency(parse_fromiter, as_sequence):.3f} ms,"
+        f" packed {latency(AiCamera._get_output_tensors, as_sequence):.3f} ms,"
+        f" buffer protocol {latency(AiCamera._get_output_tensors, as_buffer):.3f} ms"
+    )
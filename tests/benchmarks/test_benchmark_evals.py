@@ -0,0 +1,63 @@
+#
+# Copyright 2026 Sony Semiconductor Solutions Corp. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import time
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from modlib.devices.sources import DatasetSample
+from modlib.models import COLOR_FORMAT, ROI, Detections
+from modlib.models.evals import COCOEvaluator, EvaluationSample
+
+from tests.utils import make_synthetic_coco
+
+
+@pytest.mark.slow
+def test_benchmark_coco_add(tmp_path):
+    num_images, num_detections = 5000, 50
+    annotations, _, image_ids = make_synthetic_coco(tmp_path, num_images=num_images)
+    evaluator = COCOEvaluator(annotations)
+
+    rng = np.random.default_rng(0)
+    image = np.zeros((480, 640, 3), dtype=np.uint8)
+    samples = []
+    for image_id in image_ids:
+        x1y1 = rng.uniform(0, 0.5, (num_detections, 2))
+        x2y2 = x1y1 + rng.uniform(0.05, 0.5, (num_detections, 2))
+        samples.append(
+            EvaluationSample(
+                roi=ROI(0.1, 0.1, 0.8, 0.8),
+                detections=Detections(
+                    bbox=np.concatenate([x1y1, x2y2], axis=1),
+                    confidence=rng.uniform(0, 1, num_detections),
+                    class_id=rng.integers(0, 80, num_detections),
+                ),
+                dataset_sample=DatasetSample(Path(f"{image_id}.jpg"), f"{image_id}.jpg", image_id, image, COLOR_FORMAT.RGB),
+            )
+        )
+
+    evaluator.reset()
+    t0 = time.perf_counter()
+    for sample in samples:
+        evaluator.add(sample)
+    elapsed = time.perf_counter() - t0
+
+    print(
+        f"\nCOCO result conversion: {num_images} images x {num_detections} detections"
+        f" in {elapsed * 1000:.1f} ms ({num_images / elapsed:.0f} images/s)"
+    )
@@ -0,0 +1,88 @@
+#
+# Copyright 2026 Sony Semiconductor Solutions Corp. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import multiprocessing as mp
+import time
+
+import numpy as np
+import pytest
+
+from modlib.devices import FrameRing, FrameRingReader
+from tests.devices.test_playback import make_frames
+
+N = 200
+
+
+def _consume_ring(name, ready, done):
+    with FrameRingReader(name) as reader:
+        ready.set()
+        count = 0
+        while reader.get(timeout=10) is not None:
+            count += 1
+        done.put((count, reader.dropped))
+
+
+def _consume_queue(queue, done):
+    count = 0
+    while queue.get() is not None:
+        count += 1
+    done.put((count, 0))
+
+
+def vga_frames():
+    frames = make_frames(N)
+    image = np.random.default_rng(0).integers(0, 255, (480, 640, 3), dtype=np.uint8)
+    for frame in frames:
+        frame.image = image
+    return frames
+
+
+@pytest.mark.slow
+def test_benchmark_frame_ring_vs_queue():
+    # Delivery of VGA frames with detections to a consumer process
+    ctx = mp.get_context("spawn")
+    frames = vga_frames()
+
+    ring = FrameRing(num_slots=64, max_meta_bytes=64 * 1024)
+    ready, done = ctx.Event(), ctx.Queue()
+    process = ctx.Process(target=_consume_ring, args=(ring.name, ready, done))
+    process.start()
+    ready.wait(timeout=30)
+    t0 = time.perf_counter()
+    for frame in frames:
+        ring.publish(frame)
+    ring.close()
+    count, dropped = done.get(timeout=60)
+    t_ring = time.perf_counter() - t0
+    process.join()
+    assert count + dropped == N
+
+    queue, done = ctx.Queue(maxsize=8), ctx.Queue()
+    process = ctx.Process(target=_consume_queue, args=(queue, done))
+    process.start()
+    t0 = time.perf_counter()
+    for frame in frames:
+        queue.put(frame)
+    queue.put(None)
+    count, _ = done.get(timeout=60)
+    t_queue = time.perf_counter() - t0
+    process.join()
+    assert count == N
+
+    print(
+        f"\nFrameRing: {N / t_ring:.0f} frames/s ({dropped} dropped), multiprocessing.Queue: {N / t_queue:.0f} frames/s"
+    )
+    assert t_ring < t_queue
@@ -0,0 +1,62 @@
+#
+# Copyright 2026 Sony Semiconductor Solutions Corp. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+
+import time
+
+import numpy as np
+import pytest
+
+from modlib.models.post_processors import higherhrnet
+from modlib.models.post_processors.higherhrnet import match, parse
+from tests.models.test_higherhrnet import random_heatmaps, reference_max_pool, reference_topk
+
+
+def measure(fn, n=5):
+    fn()
+    t0 = time.perf_counter()
+    for _ in range(n):
+        fn()
+    return (time.perf_counter() - t0) / n * 1000
+
+
+def legacy_top_k(det, max_num_people=30):
+    # Previous `top_k`, max pooling, top-k and tag gathering per keypoint
+    det = det * (reference_max_pool(det) == det)
+    return reference_topk(det.reshape((1, -1, det.shape[2])), max_num_people)
+
+
+@pytest.mark.slow
+@pytest.mark.parametrize("num_people", [1, 5, 15])
+def test_benchmark_higherhrnet(num_people):
+    # Output shape of the zoo HigherHRNet model (144x192 heatmaps and tags of 17 joints)
+    det, tag = random_heatmaps(num_people)
+    topk = higherhrnet.top_k(det, tag, max_num_people=30)
+    results = {
+        "legacy top_k": measure(lambda: legacy_top_k(det)),
+        "numpy top_k": measure(lambda: higherhrnet.top_k(det, tag, max_num_people=30, use_cpp=False)),
+        "python match": measure(lambda: match(**topk, detection_threshold=0.1, use_cpp=False)),
+        "python parse": measure(lambda: parse([det, tag], output_shape=(144, 192), use_cpp=False)),
+    }
+    if higherhrnet._match_by_tag_cpp is not None:
+        results["cpp top_k"] = measure(lambda: higherhrnet.top_k(det, tag, max_num_people=30))
+        results["cpp match"] = measure(lambda: match(**topk, detection_threshold=0.1))
+        results["cpp parse"] = measure(lambda: parse([det, tag], output_shape=(144, 192)))
+
+    print(f"\n{num_people} people:")
+    for name, ms in results.items():
+        print(f"  {name}: {ms:.3f} ms")
+    assert results["numpy top_k"] < results["legacy top_k"]
@@ -0,0 +1,35 @@
+#
+# Copyright 2026 Sony Semiconductor Solutions Corp. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import pytest
+
+from tests.test_imports import import_times
+
+EAGER = (
+    "from modlib.devices import AiCamera, Triton, InterpreterClient, SimulatedCamera, Images; "
+    "from modlib.apps import Annotator, BYTETracker; from modlib.models.zoo import YOLOv8n"
+)
+
+
+@pytest.mark.slow
+@pytest.mark.parametrize("package", ["modlib.devices", "modlib.apps", "modlib.models.zoo"])
+def test_benchmark_import_time(package):
+    # Cold import time of the package versus loading all of its main attributes
+    lazy = min(import_times(f"import {package}")[package] for _ in range(3))
+    eager = min(sum(t for m, t in import_times(EAGER).items() if "." not in m) for _ in range(3))
+
+    print(f"\nimport {package}: {lazy / 1000:.1f} ms, all devices, apps and zoo: {eager / 1000:.1f} ms")
+    assert lazy < 0.25 * eager
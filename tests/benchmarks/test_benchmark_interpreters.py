@@ -0,0 +1,89 @@
+#
+# Copyright 2026 Sony Semiconductor Solutions Corp. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import io
+import time
+
+import numpy as np
+import pytest
+import requests
+
+from modlib.devices import InterpreterClient
+
+from tests.devices.test_interpreter_client import MockModel
+from tests.utils import LocalInterpreterServer
+
+
+@pytest.mark.slow
+def test_benchmark_infer_batch():
+    num_tensors = 64
+    tensors = [np.random.default_rng(i).uniform(0, 255, (320, 320, 3)).astype(np.float32) for i in range(num_tensors)]
+
+    # Fixed per request overhead (e.g. network, framework dispatch) and a smaller per sample compute cost
+    with LocalInterpreterServer(input_tensor_size=(320, 320), latency=0.010, sample_latency=0.002) as server:
+        device = InterpreterClient(endpoint=server.endpoint)
+        device.deploy(MockModel(), data={"model_uri": "local"})
+
+        print()
+        for batch_size in [1, 2, 4, 8, 16]:
+            t0 = time.perf_counter()
+            for i in range(0, num_tensors, batch_size):
+                if batch_size == 1:
+                    device.infer(tensors[i])
+                else:
+                    device.infer_batch(tensors[i : i + batch_size])
+            elapsed = time.perf_counter() - t0
+            print(f"Batch size {batch_size:2d}: {num_tensors / elapsed:7.1f} frames/s")
+
+        device.stop()
+
+
+@pytest.mark.slow
+def test_benchmark_transport_and_pipeline(tmp_path):
+    import cv2
+
+    from modlib.devices import Images
+
+    num_frames = 64
+    for i in range(num_frames):
+        cv2.imwrite(str(tmp_path / f"{i:03d}.png"), np.full((240, 320, 3), i, dtype=np.uint8))
+
+    with LocalInterpreterServer(input_tensor_size=(320, 320), latency=0.005) as server:
+        # Previous client behaviour: a new connection and .npy/.npz containers for every request
+        tensor = np.zeros((1, 320, 320, 3), dtype=np.float32)
+        t0 = time.perf_counter()
+        for _ in range(num_frames):
+            buf = io.BytesIO()
+            np.save(buf, tensor)
+            r = requests.post(
+                f"{server.endpoint}/infer/local",
+                files={"input_npy": ("input.npy", buf.getvalue(), "application/octet-stream")},
+            )
+            npz = np.load(io.BytesIO(r.content))
+            [npz[k] for k in sorted(npz.files)]
+        print(f"\nNo keep-alive, npy            : {num_frames / (time.perf_counter() - t0):7.1f} frames/s")
+
+        for transport, pipeline in [("npy", 0), ("raw", 0), ("raw", 2), ("raw", 4)]:
+            device = InterpreterClient(
+                Images(tmp_path), endpoint=server.endpoint, headless=True, transport=transport, pipeline=pipeline
+            )
+            device.deploy(MockModel(), data={"model_uri": "local"})
+
+            t0 = time.perf_counter()
+            with device as stream:
+                frames = sum(1 for _ in stream)
+            elapsed = time.perf_counter() - t0
+            print(f"Keep-alive, {transport}, pipeline {pipeline}: {frames / elapsed:7.1f} frames/s")
@@ -0,0 +1,81 @@
+#
+# Copyright 2026 Sony Semiconductor Solutions Corp. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import time
+
+import numpy as np
+import pytest
+
+import modlib.devices.imx500.isp as isp
+
+from tests.devices.test_isp import MockModel
+
+
+def normalize_int32(t, model):
+    # Previous per channel int32 arithmetic, as reference
+    info = model.info["input_tensor"]
+    t = t.astype(np.int32)
+    for i in [0, 1, 2]:
+        t[i] = (((t[i] * info["div_val"][i]) >> info["div_shift"]) + info["norm_val"][i]) >> info["norm_shift"][i]
+    return t.astype(info["dtype"])
+
+
+def denormalize_int32(t, model):
+    info = model.info["input_tensor"]
+    w, h = model.input_tensor_size
+    r1 = np.array(t, dtype=np.uint8).astype(np.int32).reshape((3, h, w))
+    for i in [0, 1, 2]:
+        r1[i] = ((((r1[i] << info["norm_shift"][i]) - info["norm_val"][i]) << info["div_shift"]) // info["div_val"][i]) & 0xFF
+    return np.transpose(r1, (1, 2, 0)).astype(np.uint8).copy()
+
+
+def latency(fn, *args, repeat=20, **kwargs):
+    fn(*args, **kwargs)
+    t0 = time.perf_counter()
+    for _ in range(repeat):
+        fn(*args, **kwargs)
+    return (time.perf_counter() - t0) / repeat * 1000
+
+
+@pytest.mark.slow
+@pytest.mark.parametrize("size", [(224, 224), (640, 640)])
+def test_benchmark_isp_lut(size):
+    w, h = size
+    m = MockModel(
+        width=w, height=h,
+        norm_val=[-2048, -2048, -2048], norm_shift=[4, 4, 4], div_val=[1024, 1024, 1024], div_shift=6,
+        dtype=np.int8,
+    )
+    image = np.random.default_rng(0).integers(0, 256, size=(h, w, 3), dtype=np.uint8)
+    image_chw = np.transpose(image, (2, 0, 1))  # as in prepare_tensor_like_isp
+    input_tensor = isp.isp_normalize_and_quantscale(image_chw, m).ravel()
+    out = np.empty((h, w, 3), dtype=np.uint8)
+
+    results = {
+        "normalize int32": latency(normalize_int32, image_chw, m),
+        "normalize lut": latency(isp.isp_normalize_and_quantscale, image_chw, m),
+        "denormalize int32": latency(denormalize_int32, input_tensor, m),
+        "denormalize lut": latency(isp.isp_denormalize_input_tensor, input_tensor, m),
+        "denormalize lut (out)": latency(isp.isp_denormalize_input_tensor, input_tensor, m, out=out),
+    }
+
+    print(f"\nInput tensor {w}x{h}")
+    for name, ms in results.items():
+        print(f"  {name:>22}: {ms:7.2f} ms")
+
+    np.testing.assert_array_equal(isp.isp_denormalize_input_tensor(input_tensor, m), denormalize_int32(input_tensor, m))
+    assert results["denormalize lut"] < results["denormalize int32"]
+    assert results["normalize lut"] < 1.5 * results["normalize int32"]
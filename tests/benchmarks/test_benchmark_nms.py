@@ -0,0 +1,74 @@
+#
+# Copyright 2026 Sony Semiconductor Solutions Corp. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import time
+
+import numpy as np
+import pytest
+
+from modlib.models.post_processors import nms
+from modlib.models.post_processors.nms import NMS_METHOD
+from tests.models.test_nms import random_boxes
+
+
+def legacy_nms(dets, scores, iou_thres, max_out_dets):
+    # Previous `yolo.nms`, recomputing the IoU against all remaining boxes for every kept box
+    y1, x1, y2, x2 = dets[:, 0], dets[:, 1], dets[:, 2], dets[:, 3]
+    areas = (x2 - x1 + 1) * (y2 - y1 + 1)
+    order = scores.argsort()[::-1]
+    keep = []
+    while order.size > 0:
+        i = order[0]
+        keep.append(i)
+        xx1 = np.maximum(x1[i], x1[order[1:]])
+        yy1 = np.maximum(y1[i], y1[order[1:]])
+        xx2 = np.minimum(x2[i], x2[order[1:]])
+        yy2 = np.minimum(y2[i], y2[order[1:]])
+        inter = np.maximum(0.0, xx2 - xx1 + 1) * np.maximum(0.0, yy2 - yy1 + 1)
+        ovr = inter / (areas[i] + areas[order[1:]] - inter)
+        order = order[np.where(ovr <= iou_thres)[0] + 1]
+    return keep[:max_out_dets]
+
+
+def measure(fn, n=5):
+    fn()
+    t0 = time.perf_counter()
+    for _ in range(n):
+        fn()
+    return (time.perf_counter() - t0) / n * 1000
+
+
+@pytest.mark.slow
+@pytest.mark.parametrize("candidates", [100, 1000, 4000, 8400])
+def test_benchmark_nms(candidates):
+    # Candidates of a low confidence threshold (e.g. 0.01 of `pp_od_yolov8n`), 80 classes, 50 output detections
+    boxes, scores, classes = random_boxes(candidates, num_classes=80)
+    results = {"legacy": measure(lambda: legacy_nms(boxes, scores, 0.7, 50))}
+    for use_cpp in [False, True] if nms._nms_cpp is not None else [False]:
+        backend = "cpp" if use_cpp else "numpy"
+        for name, method, cls in [
+            ("agnostic", NMS_METHOD.HARD, None),
+            ("class-aware", NMS_METHOD.HARD, classes),
+            ("soft gaussian", NMS_METHOD.GAUSSIAN, classes),
+        ]:
+            results[f"{backend} {name}"] = measure(
+                lambda: nms._suppress(boxes, scores, cls, 0.7, 50, method, use_cpp=use_cpp)
+            )
+
+    print(f"\n{candidates} candidates:")
+    for name, ms in results.items():
+        print(f"  {name}: {ms:.3f} ms")
+    assert results["numpy agnostic"] < results["legacy"]
@@ -0,0 +1,94 @@
+#
+# Copyright 2026 Sony Semiconductor Solutions Corp. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import time
+
+import numpy as np
+import pytest
+
+from modlib.devices.playback import BinaryCodec, JsonCodec, Playback, Recorder
+
+from tests.devices.test_playback import load_frames, make_frames, record
+
+
+@pytest.mark.slow
+def test_benchmark_playback_open_and_seek(tmp_path):
+    n = 20000  # ~11 minutes at 30 FPS
+    frames = make_frames(n, interval=1 / 30)
+    paths = {
+        "json": record(tmp_path / "json", frames, JsonCodec()),
+        "binary": record(tmp_path / "binary", frames, BinaryCodec()),
+    }
+
+    # Time to the last frame: sequential decoding vs. indexed open and seek
+    t0 = time.perf_counter()
+    with Playback(str(paths["json"]), codec=JsonCodec(), headless=True) as device:
+        for frame in device:
+            pass
+    json_ms = (time.perf_counter() - t0) * 1000
+
+    t0 = time.perf_counter()
+    device = Playback(str(paths["binary"]), codec=BinaryCodec(), headless=True)
+    open_ms = (time.perf_counter() - t0) * 1000
+    with device:
+        device.seek(frame=-1)
+        frame = next(device)
+    binary_ms = (time.perf_counter() - t0) * 1000
+
+    print(f"\nLast frame of {n} frames: json {json_ms:.1f} ms, binary {binary_ms:.2f} ms (open {open_ms:.2f} ms)")
+    assert frame.frame_count == n - 1
+    assert binary_ms < json_ms
+
+
+@pytest.mark.slow
+@pytest.mark.parametrize("codec", [JsonCodec(), BinaryCodec()], ids=["json", "binary"])
+def test_benchmark_recorder_add(tmp_path, codec):
+    # Time spent in `add` on the capture thread for VGA frames
+    frame = load_frames()[0]
+    frame.image = np.ascontiguousarray(np.resize(frame.image, (480, 640, 3)))
+    n = 100
+
+    results = {}
+    for background in [False, True]:
+        rec = Recorder(directory=str(tmp_path / str(background)), codec=codec, background=background)
+        t0 = time.perf_counter()
+        for _ in range(n):
+            rec.add(frame)
+        results[background] = (time.perf_counter() - t0) / n * 1000
+        rec.close()
+        assert rec.written + rec.dropped == n
+
+    print(f"\n{type(codec).__name__} add: inline {results[False]:.2f} ms, background {results[True]:.2f} ms")
+    assert results[True] < results[False]
+
+
+@pytest.mark.slow
+def test_benchmark_playback_prefetch(tmp_path):
+    # Frames/s of a playback loop with 10 ms of (I/O bound) app work per frame
+    path = record(tmp_path, load_frames() * 20, JsonCodec())
+
+    results = {}
+    for prefetch in [0, 8]:
+        with Playback(str(path), codec=JsonCodec(), headless=True, prefetch=prefetch) as device:
+            t0 = time.perf_counter()
+            n = 0
+            for frame in device:
+                time.sleep(0.01)
+                n += 1
+            results[prefetch] = n / (time.perf_counter() - t0)
+
+    print(f"\nPlayback: {results[0]:.1f} frames/s, prefetch {results[8]:.1f} frames/s")
+    assert results[8] > results[0]
@@ -0,0 +1,52 @@
+#
+# Copyright 2026 Sony Semiconductor Solutions Corp. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import time
+
+import cv2
+import numpy as np
+import pytest
+
+from modlib.devices import Images, SimulatedCamera
+
+from tests.devices.test_simulated_camera import MockModel
+
+
+@pytest.mark.slow
+@pytest.mark.parametrize("app_latency", [0.0, 0.02, 0.05])
+def test_benchmark_simulated_pipeline(tmp_path, app_latency):
+    # Application throughput and frame drops at 30 FPS / 15 DPS for a given per frame application latency
+    for i in range(60):
+        cv2.imwrite(str(tmp_path / f"{i:03d}.jpg"), np.full((480, 640, 3), i * 4, dtype=np.uint8))
+
+    device = SimulatedCamera(
+        Images(tmp_path), frame_rate=30, detection_rate=15, output_tensors=[np.array([1.0, 0.5], dtype=np.float32)]
+    )
+    device.deploy(MockModel())
+
+    with device as stream:
+        t0 = time.perf_counter()
+        consumed = 0
+        for frame in stream:
+            time.sleep(app_latency)
+            consumed += 1
+        elapsed = time.perf_counter() - t0
+
+    print(
+        f"\nApp latency {app_latency * 1000:.0f} ms: {consumed / elapsed:.1f} FPS consumed, "
+        f"{frame.dps:.1f} DPS, {device.dropped_frames} frames dropped"
+    )
+    assert consumed + device.dropped_frames <= 60
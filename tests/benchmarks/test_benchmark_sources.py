@@ -0,0 +1,87 @@
+#
+# Copyright 2024 Sony Semiconductor Solutions Corp. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import time
+import cv2
+import numpy as np
+import pytest
+
+from modlib.devices import Dataset, Video
+
+from tests.utils import make_synthetic_video
+
+
+def consume(source, work_s=0.0):
+    t0 = time.perf_counter()
+    count = 0
+    while source.get_frame() is not None:
+        count += 1
+        if work_s:
+            time.sleep(work_s)  # Simulated pre-processing & inference
+    return count / (time.perf_counter() - t0)
+
+
+@pytest.mark.slow
+@pytest.mark.parametrize("work_s", [0.0, 0.005])
+def test_benchmark_video_decode(tmp_path, work_s):
+    video_path = make_synthetic_video(tmp_path / "benchmark.mp4", num_frames=300, width=640, height=480)
+
+    modes = {
+        "seek": dict(sequential=False),
+        "sequential": dict(sequential=True),
+        "sequential+prefetch": dict(sequential=True, prefetch=8),
+    }
+
+    print(f"\nVideo decode throughput (simulated work per frame: {work_s * 1000:.1f} ms)")
+    results = {}
+    for name, kwargs in modes.items():
+        source = Video(video_path, **kwargs)
+        results[name] = consume(source, work_s)
+        source.close()
+        print(f"  {name:<22} {results[name]:8.1f} frames/s")
+
+    assert results["sequential"] > results["seek"]
+
+
+@pytest.mark.slow
+def test_benchmark_dataset_prefetch(tmp_path):
+    rng = np.random.default_rng(0)
+    for i in range(200):
+        image = rng.integers(0, 255, (480, 640, 3), dtype=np.uint8)
+        cv2.imwrite(str(tmp_path / f"{i:04d}.jpg"), image)
+
+    work_s = 0.005  # Simulated pre-processing & inference
+    print(f"\nDataset throughput (simulated work per image: {work_s * 1000:.1f} ms)")
+
+    results = {}
+    for prefetch, workers in [(0, None), (4, 1), (8, 2), (16, 4)]:
+        dataset = Dataset(tmp_path, prefetch=prefetch, workers=workers)
+        t0 = time.perf_counter()
+        count = 0
+        for _ in dataset:
+            count += 1
+            time.sleep(work_s)
+        results[(prefetch, workers)] = count / (time.perf_counter() - t0)
+
+        stats = dataset.prefetch_stats
+        print(
+            f"  prefetch={prefetch:<3} workers={str(dataset.workers if prefetch else '-'):<3}"
+            f" {results[(prefetch, workers)]:8.1f} images/s"
+            f"  decode={stats.decode_latency * 1000:6.2f} ms  wait={stats.wait_latency * 1000:6.2f} ms"
+            f"  max_queue_depth={stats.max_queue_depth}"
+        )
+
+    assert results[(8, 2)] > results[(0, None)]
@@ -0,0 +1,118 @@
+#
+# Copyright 2026 Sony Semiconductor Solutions Corp. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import multiprocessing
+import platform
+import time
+
+import cv2
+import numpy as np
+import pytest
+
+from modlib.devices.triton.allocator import Allocator
+from modlib.devices.triton.triton import RequestHandler, _ImageBufferPool
+
+N = 300
+INTERVAL = 0.002
+
+
+class ManagerListHandler:
+    # Previous request hand-off: a Manager().list() and a notification byte over a Pipe
+    def __init__(self):
+        self._requests = multiprocessing.Manager().list()
+        self._requestslock = multiprocessing.Lock()
+        self.notifyme_r, self.notifyme_w = multiprocessing.Pipe(duplex=False)
+
+    def py_callback(self, req_idx):
+        with self._requestslock:
+            self._requests += [(req_idx, time.perf_counter())]
+        self.notifyme_w.send(b"\x00")
+
+    def get(self, timeout):
+        if not self.notifyme_r.poll(timeout):
+            return None
+        self.notifyme_r.recv()
+        with self._requestslock:
+            requests = list(self._requests)
+            self._requests[:] = []
+        return requests[-1] if requests else None
+
+
+def _produce(handler):
+    for i in range(N):
+        handler.py_callback(i % 10)
+        time.sleep(INTERVAL)
+
+
+def measure(handler):
+    process = multiprocessing.Process(target=_produce, args=(handler,))
+    process.start()
+    latencies = []
+    while process.is_alive() or latencies == []:
+        entry = handler.get(timeout=0.2)
+        if entry is not None:
+            latencies.append(time.perf_counter() - entry[1])
+    process.join()
+    return np.array(latencies) * 1000
+
+
+@pytest.mark.slow
+@pytest.mark.skipif(platform.system() != "Linux", reason="POSIX shared memory")
+def test_benchmark_request_handoff():
+    allocator = Allocator()
+    allocator.allocate(image_shape=(8, 8, 3), input_tensor_shape=(0, 0, 0), output_tensor_shape_list=[(4,)])
+    ring = RequestHandler(multiprocessing.Value("d", 0.0))
+    ring.attach(allocator)
+    try:
+        ring_ms = measure(ring)
+    finally:
+        ring.detach()
+        allocator.cleanup()
+    manager_ms = measure(ManagerListHandler())
+
+    for name, ms in [("ring", ring_ms), ("manager list", manager_ms)]:
+        print(f"\n{name}: median {np.median(ms):.3f} ms, p99 {np.percentile(ms, 99):.3f} ms ({len(ms)} requests)")
+    assert np.median(ring_ms) < np.median(manager_ms)
+
+
+@pytest.mark.slow
+def test_benchmark_image_copy():
+    # Copy of a binning factor 4 image (1012x756) out of the request pool to a 640x480 frame.image
+    shared = np.random.default_rng(0).integers(0, 255, (756, 1012, 3), dtype=np.uint8)
+    pool = _ImageBufferPool()
+    n = 200
+
+    def run(fn):
+        fn()
+        t0 = time.perf_counter()
+        for _ in range(n):
+            fn()
+        return (time.perf_counter() - t0) / n * 1000
+
+    def fused(interpolation):
+        return lambda: cv2.resize(shared, (640, 480), dst=pool.acquire((480, 640, 3)), interpolation=interpolation)
+
+    results = {
+        "resize (previous)": run(lambda: cv2.resize(shared, (640, 480))),
+        "fused linear": run(fused(cv2.INTER_LINEAR)),
+        "fused area": run(fused(cv2.INTER_AREA)),
+        "fused nearest": run(fused(cv2.INTER_NEAREST)),
+        "native size": run(lambda: np.copyto(pool.acquire(shared.shape), shared)),
+    }
+    print()
+    for name, ms in results.items():
+        print(f"{name}: {ms:.3f} ms")
+    assert results["fused nearest"] < results["resize (previous)"]
@@ -0,0 +1,54 @@
+#
+# Copyright 2026 Sony Semiconductor Solutions Corp. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import time
+
+import numpy as np
+import pytest
+
+from modlib.models.post_processors import YOLOv8PostProcessor
+from tests.models.test_yolo import raw_outputs
+
+
+def measure(fn, n=30):
+    fn()
+    t0 = time.perf_counter()
+    for _ in range(n):
+        fn()
+    return (time.perf_counter() - t0) / n * 1000
+
+
+@pytest.mark.slow
+def test_benchmark_yolov8_candidates():
+    # Low confidence threshold of `pp_od_yolov8n` and `pp_yolov8n_pose`: thousands of candidates reach NMS
+    post_processor = YOLOv8PostProcessor()
+    y_bb, y_cls = raw_outputs(8400)
+    _, y_pose = raw_outputs(8400, num_classes=1, seed=1)
+    kpts = np.random.default_rng(2).normal(size=(1, 51, 8400)).astype(np.float32)
+
+    results = {}
+    for max_candidates in [8400, 1000, 300]:
+        results[f"detection, {max_candidates} candidates"] = measure(
+            lambda: post_processor.detection((y_bb, y_cls), 0.01, 0.7, 50, max_candidates)
+        )
+        results[f"keypoints, {max_candidates} candidates"] = measure(
+            lambda: post_processor.keypoints((y_bb, y_pose**0.1, kpts), 0.01, 0.3, 10, max_candidates)
+        )
+
+    print()
+    for name, ms in results.items():
+        print(f"{name}: {ms:.3f} ms")
+    assert results["detection, 1000 candidates"] < results["detection, 8400 candidates"]
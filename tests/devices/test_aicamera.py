@@ -14,6 +14,7 @@
 # limitations under the License.
 #
 
+import numpy as np
 import pytest
 
 from modlib.devices import AiCamera
@@ -33,3 +34,43 @@ def test_capture(test_device):
     with test_device as stream:
         for frame in stream:
             print("Frame: ", frame.fps)
+
+
+def make_output_tensor_info(shapes):
+    from modlib.devices.ai_camera.ai_camera import _CnnOutputTensorInfoExported
+
+    info = _CnnOutputTensorInfoExported()
+    info.num_tensors = len(shapes)
+    for i, shape in enumerate(shapes):
+        info.info[i].num_dimensions = len(shape)
+        info.info[i].tensor_data_num = int(np.prod(shape))
+        for j, size in enumerate(shape):
+            info.info[i].size[j] = size
+    return info
+
+
+@pytest.mark.parametrize("container", ["tuple", "list", "bytes", "bytearray"])
+def test_get_output_tensors(container):
+    shapes = [[4, 300], [300], [300], [1]]
+    flat = np.random.default_rng(0).random(sum(int(np.prod(s)) for s in shapes)).astype(np.float32)
+    output_tensor = {
+        "tuple": tuple(flat.tolist()),
+        "list": flat.tolist(),
+        "bytes": flat.tobytes(),
+        "bytearray": bytearray(flat.tobytes()),
+    }[container]
+
+    outputs = AiCamera._get_output_tensors(output_tensor, make_output_tensor_info(shapes))
+
+    # Reference: element wise conversion
+    np_output = np.fromiter(flat.tolist(), dtype=np.float32)
+    offset = 0
+    for output, shape in zip(outputs, shapes):
+        size = int(np.prod(shape))
+        np.testing.assert_array_equal(output, np_output[offset : offset + size].reshape(shape, order="F"))
+        assert output.flags.writeable
+        offset += size
+
+    if container == "bytearray":
+        # Zero-copy view on writable buffers
+        assert np.shares_memory(outputs[0], np.frombuffer(output_tensor, dtype=np.uint8))
@@ -0,0 +1,160 @@
+#
+# Copyright 2026 Sony Semiconductor Solutions Corp. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import threading
+import time
+
+import pytest
+
+from modlib.devices import BUFFER_POLICY
+from modlib.devices.broadcast import FrameBroadcaster, FrameQueue
+from modlib.devices.frame import Frame
+
+
+def make_frame(i):
+    return Frame(str(i), None, None, 0, 0, 0, None, False, 0, 0, frame_count=i)
+
+
+def test_drop_oldest():
+    broadcaster = FrameBroadcaster()
+    subscription = broadcaster.subscribe(maxsize=3, policy=BUFFER_POLICY.DROP_OLDEST)
+
+    for i in range(5):
+        broadcaster.publish(make_frame(i))
+
+    assert subscription.received == 5
+    assert subscription.dropped == 2
+    assert [subscription.get(timeout=0).frame_count for _ in range(3)] == [2, 3, 4]
+    assert subscription.get(timeout=0) is None
+
+
+def test_latest():
+    broadcaster = FrameBroadcaster()
+    subscription = broadcaster.subscribe(maxsize=10, policy=BUFFER_POLICY.LATEST)
+
+    for i in range(5):
+        broadcaster.publish(make_frame(i))
+
+    assert subscription.maxsize == 1
+    assert subscription.dropped == 4
+    assert subscription.get(timeout=0).frame_count == 4
+
+
+def test_independent_subscriptions():
+    broadcaster = FrameBroadcaster()
+    all_frames = broadcaster.subscribe(maxsize=10)
+    latest = broadcaster.subscribe(policy=BUFFER_POLICY.LATEST)
+
+    for i in range(4):
+        broadcaster.publish(make_frame(i))
+    broadcaster.close()
+
+    # Buffered frames are drained after the stream ended
+    assert [frame.frame_count for frame in all_frames] == [0, 1, 2, 3]
+    assert [frame.frame_count for frame in latest] == [3]
+    assert all_frames.closed and latest.closed
+    assert len(broadcaster) == 0
+
+
+def test_close_discards_pending_frames():
+    broadcaster = FrameBroadcaster()
+    subscription = broadcaster.subscribe(maxsize=10)
+    broadcaster.publish(make_frame(0))
+
+    subscription.close()
+    broadcaster.publish(make_frame(1))
+
+    assert subscription.get(timeout=0) is None
+    assert subscription.received == 1
+    assert len(broadcaster) == 0
+
+
+def test_block_backpressure():
+    broadcaster = FrameBroadcaster()
+    subscription = broadcaster.subscribe(maxsize=2, policy=BUFFER_POLICY.BLOCK)
+
+    def produce():
+        for i in range(10):
+            broadcaster.publish(make_frame(i))
+        broadcaster.close()
+
+    received = []
+    producer = threading.Thread(target=produce)
+    producer.start()
+    for frame in subscription:
+        time.sleep(0.005)  # slow consumer
+        received.append(frame.frame_count)
+    producer.join(timeout=5)
+
+    assert received == list(range(10))
+    assert subscription.dropped == 0
+    assert subscription.blocked_time > 0
+
+
+def test_close_releases_blocked_producer():
+    broadcaster = FrameBroadcaster()
+    subscription = broadcaster.subscribe(maxsize=1, policy=BUFFER_POLICY.BLOCK)
+    broadcaster.publish(make_frame(0))
+
+    producer = threading.Thread(target=broadcaster.publish, args=(make_frame(1),))
+    producer.start()
+    time.sleep(0.05)
+    assert producer.is_alive()  # blocked on the full subscription
+
+    subscription.close()
+    producer.join(timeout=5)
+    assert not producer.is_alive()
+
+
+def test_consumer_thread_receives_every_frame():
+    broadcaster = FrameBroadcaster()
+    subscription = broadcaster.subscribe(maxsize=100)
+
+    received = []
+    consumer = threading.Thread(target=lambda: received.extend(f.frame_count for f in subscription))
+    consumer.start()
+
+    for i in range(50):
+        broadcaster.publish(make_frame(i))
+    while len(subscription):
+        time.sleep(0.001)
+    subscription.close()
+    consumer.join(timeout=5)
+
+    assert received == list(range(50))
+    assert subscription.dropped == 0
+
+
+@pytest.mark.parametrize("kwargs", [{"maxsize": 0}, {"policy": "newest"}])
+def test_invalid_args(kwargs):
+    with pytest.raises(ValueError):
+        FrameBroadcaster().subscribe(**kwargs)
+
+
+def test_frame_queue_end():
+    queue = FrameQueue(maxsize=2, policy=BUFFER_POLICY.BLOCK)
+    consumed = []
+    consumer = threading.Thread(target=lambda: consumed.extend(f.frame_count for f in queue))
+    consumer.start()
+    for i in range(10):
+        queue.put(make_frame(i))
+    queue.end()
+    consumer.join(timeout=5)
+
+    assert consumed == list(range(10))
+    assert queue.received == 10 and queue.dropped == 0
+    queue.put(make_frame(10))  # ignored after the end
+    assert queue.received == 10 and len(queue) == 0
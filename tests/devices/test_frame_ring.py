@@ -0,0 +1,159 @@
+#
+# Copyright 2026 Sony Semiconductor Solutions Corp. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import multiprocessing as mp
+
+import numpy as np
+import pytest
+
+from modlib.devices import FrameRing, FrameRingReader, frame_ring
+from tests.devices.test_playback import assert_detections_equal, make_frames
+
+
+def make_image_frames(n):
+    frames = make_frames(n)
+    for frame in frames:
+        frame.image = np.full((12, 16, 3), frame.frame_count, dtype=np.uint8)
+    return frames
+
+
+@pytest.fixture
+def ring():
+    ring = FrameRing(num_slots=4, max_image_bytes=12 * 16 * 3)
+    yield ring
+    ring.close()
+
+
+def test_frame_ring_round_trip(ring):
+    frames = make_image_frames(3)
+    with FrameRingReader(ring.name) as reader:
+        for original in frames:
+            ring.publish(original)
+            frame = reader.get(timeout=1)
+            assert frame.timestamp == original.timestamp
+            assert frame.frame_count == original.frame_count
+            np.testing.assert_array_equal(frame.image, original.image)
+            assert not frame.image.flags.writeable
+            assert_detections_equal(frame.detections, original.detections)
+            np.testing.assert_array_equal(frame.detections.mask, original.detections.mask)
+            assert reader.is_valid(frame)
+        assert reader.received == 3 and reader.dropped == 0
+
+
+def test_frame_ring_headless(ring):
+    frames = make_frames(1)
+    with FrameRingReader(ring.name) as reader:
+        ring.publish(frames[0])
+        frame = reader.get(timeout=1)
+        with pytest.raises(ValueError):
+            _ = frame.image
+        assert_detections_equal(frame.detections, frames[0].detections)
+
+
+def test_frame_ring_overrun(ring):
+    with FrameRingReader(ring.name) as reader:
+        for frame in make_image_frames(10):
+            ring.publish(frame)
+
+        # Only the last num_slots frames are available
+        frame = reader.get(timeout=1)
+        assert frame.frame_count == 6
+        assert reader.dropped == 6
+
+        ring.publish(make_image_frames(11)[-1])
+        frame = reader.get(timeout=1, latest=True)
+        assert frame.frame_count == 10
+        assert reader.dropped == 9
+
+
+def test_frame_ring_zero_copy_lifetime(ring):
+    frames = make_image_frames(5)
+    with FrameRingReader(ring.name) as reader:
+        ring.publish(frames[0])
+        view = reader.get(timeout=1)
+        ring.publish(frames[1])
+        copied = reader.get(timeout=1, copy=True)
+        assert copied.image.flags.writeable
+
+        for frame in frames[2:]:
+            ring.publish(frame)
+        assert not reader.is_valid(view)  # slot was overwritten by frame 4
+        assert reader.is_valid(copied)
+        np.testing.assert_array_equal(view.image, frames[4].image)
+        np.testing.assert_array_equal(copied.image, frames[1].image)
+
+
+def test_frame_ring_timeout_and_close():
+    ring = FrameRing(num_slots=2, max_image_bytes=0)
+    reader = FrameRingReader(ring.name)
+    assert reader.get(timeout=0.01) is None
+
+    for frame in make_frames(2):
+        ring.publish(frame)
+    ring.close()
+    assert [f.frame_count for f in reader] == [0, 1]
+    reader.close()
+
+
+def test_frame_ring_capacity(ring):
+    frame = make_image_frames(1)[0]
+    frame.image = np.zeros((480, 640, 3), dtype=np.uint8)
+    with pytest.raises(ValueError):
+        ring.publish(frame)
+    with pytest.raises(ValueError):
+        FrameRing(num_slots=1)
+
+
+def test_frame_ring_attach_errors():
+    with pytest.raises(FileNotFoundError):
+        FrameRingReader("modlib_frame_ring_does_not_exist")
+
+
+def test_frame_ring_memory_ordering_warning(monkeypatch, caplog):
+    # Weakly ordered CPUs require the memory fence extension
+    monkeypatch.setattr(frame_ring, "_memory_fence", None)
+    monkeypatch.setattr(frame_ring.platform, "machine", lambda: "aarch64")
+    with FrameRing(num_slots=2, max_image_bytes=0):
+        pass
+    assert "torn frames" in caplog.text
+
+    caplog.clear()
+    monkeypatch.setattr(frame_ring.platform, "machine", lambda: "x86_64")
+    with FrameRing(num_slots=2, max_image_bytes=0):
+        pass
+    assert "torn frames" not in caplog.text
+
+
+def _consume(name, ready, results):
+    with FrameRingReader(name) as reader:
+        ready.set()
+        results.put([(f.frame_count, int(f.image[0, 0, 0]), f.detections.class_id.tolist()) for f in reader])
+
+
+def test_frame_ring_between_processes(ring):
+    ctx = mp.get_context("spawn")
+    ready, results = ctx.Event(), ctx.Queue()
+    process = ctx.Process(target=_consume, args=(ring.name, ready, results))
+    process.start()
+    assert ready.wait(timeout=30)
+
+    for frame in make_image_frames(3):
+        ring.publish(frame)
+    ring.close()
+
+    assert results.get(timeout=30) == [(0, 0, [0, 1]), (1, 1, [1, 2]), (2, 2, [2, 3])]
+    process.join(timeout=30)
+    assert process.exitcode == 0
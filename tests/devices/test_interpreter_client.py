@@ -0,0 +1,159 @@
+#
+# Copyright 2026 Sony Semiconductor Solutions Corp. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import asyncio
+
+import cv2
+import numpy as np
+import pytest
+
+from modlib.devices import Images, InterpreterClient
+from modlib.devices.interpreters.client import decode_tensors, encode_tensors
+from modlib.models import COLOR_FORMAT, ROI, Classifications, Model
+
+from tests.utils import LocalInterpreterServer
+
+
+class MockModel(Model):
+    def __init__(self):
+        super().__init__(color_format=COLOR_FORMAT.RGB, preserve_aspect_ratio=False)
+
+    def pre_process(self, image, src_color_format=COLOR_FORMAT.BGR, resize_fn=None):
+        it_image = cv2.resize(image, self.input_tensor_size)
+        return it_image, it_image.astype(np.float32), ROI(0, 0, 1, 1)
+
+    def post_process(self, output_tensors):
+        return Classifications(confidence=output_tensors[1], class_id=np.arange(len(output_tensors[1])))
+
+
+@pytest.fixture
+def images_dir(tmp_path):
+    for i in range(7):
+        cv2.imwrite(str(tmp_path / f"{i:03d}.png"), np.full((48, 64, 3), i * 30, dtype=np.uint8))
+    return tmp_path
+
+
+@pytest.fixture
+def server():
+    with LocalInterpreterServer(input_tensor_size=(32, 32)) as server:
+        yield server
+
+
+def run_device(images_dir, server, batch_size, **kwargs):
+    device = InterpreterClient(
+        Images(images_dir), endpoint=server.endpoint, headless=True, batch_size=batch_size, **kwargs
+    )
+    device.deploy(MockModel(), data={"model_uri": "local"})
+    with device as stream:
+        frames = list(stream)
+    return frames
+
+
+@pytest.mark.parametrize("batch_size", [2, 3, 8])
+def test_batched_iterator_matches_single(images_dir, server, batch_size):
+    single = run_device(images_dir, server, batch_size=1)
+    requests_single = server.requests
+
+    batched = run_device(images_dir, server, batch_size=batch_size)
+    requests_batched = server.requests - requests_single
+
+    assert len(single) == len(batched) == 7
+    assert requests_batched == -(-7 // batch_size)
+    for a, b in zip(single, batched):
+        np.testing.assert_allclose(a.detections.confidence, b.detections.confidence, rtol=1e-6)
+        np.testing.assert_array_equal(a.detections.class_id, b.detections.class_id)
+
+
+@pytest.mark.parametrize("batch_size", [1, 3])
+@pytest.mark.parametrize("pipeline", [0, 1, 4])
+@pytest.mark.parametrize("transport", ["npy", "raw"])
+def test_transport_and_pipeline(images_dir, server, transport, pipeline, batch_size):
+    single = run_device(images_dir, server, batch_size=1)
+    frames = run_device(images_dir, server, batch_size=batch_size, transport=transport, pipeline=pipeline)
+
+    # Frames keep the source order
+    assert len(frames) == len(single) == 7
+    for a, b in zip(single, frames):
+        np.testing.assert_allclose(a.detections.confidence, b.detections.confidence, rtol=1e-6)
+
+
+def test_keep_alive(server):
+    device = InterpreterClient(endpoint=server.endpoint, transport="raw")
+    device.deploy(MockModel(), data={"model_uri": "local"})
+
+    for _ in range(5):
+        result = device.infer(np.ones((32, 32, 3), dtype=np.float32))
+        assert result.confidence.flags.writeable
+    device.stop()
+
+    assert server.requests == 5
+    assert server.connections == 1
+
+
+def test_tensor_codec():
+    tensors = {
+        "input": np.arange(24, dtype=np.uint8).reshape(1, 2, 4, 3),
+        "scores": np.asfortranarray(np.random.default_rng(0).random((3, 5))),
+        "empty": np.empty((0, 4), dtype=np.float32),
+    }
+    decoded = decode_tensors(encode_tensors(tensors))
+
+    assert list(decoded) == list(tensors)
+    for name, tensor in tensors.items():
+        assert decoded[name].dtype == tensor.dtype
+        np.testing.assert_array_equal(decoded[name], tensor)
+
+
+def test_infer_batch(server):
+    device = InterpreterClient(endpoint=server.endpoint)
+    device.deploy(MockModel(), data={"model_uri": "local"})
+
+    rng = np.random.default_rng(0)
+    tensors = [rng.uniform(0, 255, (32, 32, 3)).astype(np.float32) for _ in range(4)]
+
+    results = device.infer_batch(tensors)
+    assert len(results) == len(tensors)
+    for tensor, result in zip(tensors, results):
+        np.testing.assert_allclose(result.confidence, device.infer(tensor).confidence, rtol=1e-6)
+    device.stop()
+
+
+@pytest.mark.parametrize("pipeline", [0, 3])
+def test_async_iterator(images_dir, server, pipeline):
+    single = run_device(images_dir, server, batch_size=1)
+
+    async def capture():
+        device = InterpreterClient(Images(images_dir), endpoint=server.endpoint, headless=True, pipeline=pipeline)
+        device.deploy(MockModel(), data={"model_uri": "local"})
+
+        tensor = np.ones((32, 32, 3), dtype=np.float32)
+        expected = device.infer(tensor)
+        result = await device.infer_async(tensor)
+        np.testing.assert_allclose(result.confidence, expected.confidence)
+
+        async with device as stream:
+            return [frame async for frame in stream]
+
+    frames = asyncio.run(capture())
+    assert len(frames) == len(single)
+    for a, b in zip(single, frames):
+        np.testing.assert_allclose(a.detections.confidence, b.detections.confidence, rtol=1e-6)
+
+
+@pytest.mark.parametrize("kwargs", [{"batch_size": 0}, {"transport": "json"}, {"pipeline": -1}])
+def test_invalid_args(kwargs):
+    with pytest.raises(ValueError):
+        InterpreterClient(endpoint="http://localhost:8000", **kwargs)
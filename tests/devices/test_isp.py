@@ -154,6 +154,77 @@ def test_round_trip_uint8(mock_model_uint8):
 # Tests for set_model_color_order
 # ============================================================================
 
+def reference_normalize(t, model):
+    # Element wise integer arithmetic on each channel, as reference for the lookup tables
+    info = model.info["input_tensor"]
+    t = t.astype(np.int32)
+    for i in [0, 1, 2]:
+        t[i] = (((t[i] * info["div_val"][i]) >> info["div_shift"]) + info["norm_val"][i]) >> info["norm_shift"][i]
+    return t.astype(info["dtype"])
+
+
+def reference_denormalize(t, model):
+    info = model.info["input_tensor"]
+    w, h = model.input_tensor_size
+    r1 = np.asarray(t).astype(np.uint8).astype(np.int32).reshape((3, h, w))
+    for i in [0, 1, 2]:
+        r1[i] = ((((r1[i] << info["norm_shift"][i]) - info["norm_val"][i]) << info["div_shift"]) // info["div_val"][i]) & 0xFF
+    return np.transpose(r1, (1, 2, 0)).astype(np.uint8)
+
+
+@pytest.mark.parametrize("dtype", [np.int8, np.uint8])
+def test_lut_matches_reference_for_all_values(dtype):
+    # Per channel parameters, covering every possible input value of each channel
+    m = MockModel(
+        width=16, height=16,
+        norm_val=[-1839, -1792, -1597], norm_shift=[4, 4, 4], div_val=[1142, 1167, 1162], div_shift=6,
+        dtype=dtype,
+    )
+    t = np.broadcast_to(np.arange(256, dtype=np.uint8).reshape(16, 16), (3, 16, 16))
+
+    normalized = isp.isp_normalize_and_quantscale(t, m)
+    assert normalized.dtype == dtype
+    np.testing.assert_array_equal(normalized, reference_normalize(t, m))
+
+    q = np.broadcast_to(np.arange(256, dtype=np.uint8).view(dtype).reshape(16, 16), (3, 16, 16))
+    np.testing.assert_array_equal(isp.isp_denormalize_input_tensor(q.ravel(), m), reference_denormalize(q, m))
+    np.testing.assert_array_equal(isp.isp_denormalize_input_tensor(q.tolist(), m), reference_denormalize(q, m))
+
+
+def test_isp_denormalize_input_tensor_out(mock_model_int8):
+    m = mock_model_int8
+    np.random.seed(7)
+    sample_image_chw = np.random.randint(0, 256, size=(3, m.height, m.width), dtype=np.uint8)
+
+    normalized = np.empty(sample_image_chw.shape, dtype=np.int8)
+    assert isp.isp_normalize_and_quantscale(sample_image_chw, m, out=normalized) is normalized
+
+    out = np.empty((m.height, m.width, 3), dtype=np.uint8)
+    result = isp.isp_denormalize_input_tensor(normalized.ravel(), m, out=out)
+    assert result is out
+    np.testing.assert_array_equal(out, np.transpose(sample_image_chw, (1, 2, 0)))
+
+
+def test_isp_denormalize_input_tensor_padded():
+    # DSP padded input tensor, height padded to even and width to a multiple of 32
+    m = MockModel(
+        width=100, height=75,
+        norm_val=[0, 0, 0], norm_shift=[4, 4, 4], div_val=[1024, 1024, 1024], div_shift=6,
+        dtype=np.uint8,
+    )
+    np.random.seed(8)
+    sample_image = np.random.randint(0, 256, size=(m.height, m.width, 3), dtype=np.uint8)
+
+    padded = isp.isp_padding(sample_image, m)
+    normalized = isp.isp_normalize_and_quantscale(np.transpose(padded, (2, 0, 1)), m)
+    assert normalized.shape == (3, 76, 128)
+
+    np.testing.assert_array_equal(isp.isp_denormalize_input_tensor(normalized.ravel(), m), sample_image)
+
+    with pytest.raises(ValueError):
+        isp.isp_denormalize_input_tensor(normalized.ravel()[:-1], m)
+
+
 def test_set_model_color_order_bgr_to_rgb():
     # Create a BGR image: blue pixel at (0,0), green at (0,1), red at (0,2)
     bgr_image = np.zeros((10, 10, 3), dtype=np.uint8)
@@ -0,0 +1,313 @@
+#
+# Copyright 2026 Sony Semiconductor Solutions Corp. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import os
+import shutil
+import time
+from collections import namedtuple
+from datetime import datetime, timedelta
+
+import numpy as np
+import pytest
+
+from modlib.devices import BUFFER_POLICY
+from modlib.devices.frame import Frame
+from modlib.devices.playback import BinaryCodec, JsonCodec, PickleCodec, Playback, Recorder
+from modlib.models.results import InstanceSegments
+
+RECORDING = f"{os.path.dirname(os.path.abspath(__file__))}/../assets/recordings/od_samples.json"
+
+
+def load_frames():
+    with Playback(RECORDING, codec=JsonCodec(), headless=True) as device:
+        return list(device)
+
+
+def record(directory, frames, codec):
+    rec = Recorder(directory=str(directory), codec=codec)
+    for frame in frames:
+        rec.add(frame)
+    rec.close()
+    return rec.path
+
+
+def make_frames(n, interval=0.1):
+    # Headless frames with instance segmentation results, one frame every `interval` seconds
+    start = datetime(2025, 1, 1, 12, 0, 0)
+    dense = np.zeros((2, 12, 16), dtype=np.uint8)
+    dense[0, 2:8, 3:10] = 1
+    dense[1, 6:11, 8:14] = 1
+    frames = []
+    for i in range(n):
+        detections = InstanceSegments(
+            mask=dense,
+            bbox=InstanceSegments._bbox_from_dense_masks(dense),
+            class_id=np.array([i, i + 1], dtype=np.int32),
+            confidence=np.array([0.7, 0.9], dtype=np.float32),
+        )
+        timestamp = (start + timedelta(seconds=i * interval)).isoformat()
+        frames.append(Frame(timestamp, None, "VGA", 16, 12, 3, detections, True, 30.0, 10.0, frame_count=i))
+    return frames
+
+
+def assert_detections_equal(a, b):
+    assert type(a) is type(b)
+    np.testing.assert_array_equal(a.bbox, b.bbox)
+    np.testing.assert_array_equal(a.class_id, b.class_id)
+    np.testing.assert_allclose(a.confidence, b.confidence)
+
+
+@pytest.mark.parametrize("image_format", ["raw", "jpeg"])
+def test_binary_codec_round_trip(tmp_path, image_format):
+    frames = load_frames()
+    path = record(tmp_path, frames, BinaryCodec(image_format=image_format))
+    assert path.suffix == ".bin"
+
+    with Playback(str(path), codec=BinaryCodec(), headless=True) as device:
+        assert len(device) == len(frames)
+        played = list(device)
+
+    assert len(played) == len(frames)
+    for original, frame in zip(frames, played):
+        assert frame.timestamp == original.timestamp
+        assert frame.image.shape == original.image.shape
+        if image_format == "raw":
+            np.testing.assert_array_equal(frame.image, original.image)
+        assert frame.image.flags.writeable
+        assert_detections_equal(frame.detections, original.detections)
+        assert frame.detections.bbox.flags.writeable
+
+
+def test_binary_codec_results_attributes(tmp_path):
+    frames = make_frames(3)
+    path = record(tmp_path, frames, BinaryCodec())
+
+    with Playback(str(path), codec=BinaryCodec(), headless=True) as device:
+        played = list(device)
+
+    for original, frame in zip(frames, played):
+        assert frame.frame_count == original.frame_count
+        assert frame.detections.mask_shape == (12, 16)
+        assert_detections_equal(frame.detections, original.detections)
+        np.testing.assert_array_equal(frame.detections.mask, original.detections.mask)
+
+
+def test_playback_seek(tmp_path):
+    path = record(tmp_path, make_frames(10, interval=0.5), BinaryCodec())
+
+    device = Playback(str(path), codec=BinaryCodec(), headless=True)
+    with device:
+        assert len(device) == 10
+        assert device.seek(frame=7) == 7
+        assert [f.frame_count for f in device] == [7, 8, 9]
+
+        assert device.seek(frame=-2) == 8
+        assert next(device).frame_count == 8
+
+        assert device.seek(time=2.0) == 4
+        assert next(device).frame_count == 4
+        assert device.seek(time=2.2) == 5
+        assert device.tell() == 5
+        assert device.seek(time=100) == 10
+        with pytest.raises(StopIteration):
+            next(device)
+
+        with pytest.raises(IndexError):
+            device.seek(frame=11)
+        with pytest.raises(ValueError):
+            device.seek(frame=1, time=1.0)
+
+
+def test_playback_unfinalized_recording(tmp_path):
+    frames = make_frames(5)
+    codec = BinaryCodec()
+    rec = Recorder(directory=str(tmp_path), codec=codec)
+    for frame in frames:
+        rec.add(frame)
+    rec.flush()
+
+    # Recording without index (e.g. crashed recorder) and a truncated last frame
+    data = rec.path.read_bytes()
+    truncated = tmp_path / "truncated.bin"
+    truncated.write_bytes(data[:-10])
+
+    with Playback(str(rec.path), codec=BinaryCodec(), headless=True) as device:
+        assert [f.frame_count for f in device] == [0, 1, 2, 3, 4]
+    with Playback(str(truncated), codec=BinaryCodec(), headless=True) as device:
+        assert len(device) == 4
+    rec.close()
+
+
+def test_playback_sequential_decode(tmp_path):
+    # Sequential decoding from the file object, e.g. used by subclasses of Playback
+    frames = make_frames(3)
+    path = record(tmp_path, frames, BinaryCodec())
+    codec = BinaryCodec()
+    with open(path, "rb") as f:
+        decoded = [codec.decode(f) for _ in range(4)]
+    assert [f.frame_count for f in decoded[:3]] == [0, 1, 2]
+    assert decoded[3] is None
+
+
+def test_playback_not_seekable(tmp_path):
+    path = record(tmp_path, make_frames(3), PickleCodec())
+    with Playback(str(path), codec=PickleCodec(), headless=True) as device:
+        with pytest.raises(TypeError):
+            len(device)
+        with pytest.raises(TypeError):
+            device.seek(frame=1)
+        assert [f.frame_count for f in device] == [0, 1, 2]
+
+
+class SlowCodec(BinaryCodec):
+    def __init__(self, delay):
+        super().__init__()
+        self.delay = delay
+
+    def encode(self, frame, file):
+        time.sleep(self.delay)
+        super().encode(frame, file)
+
+
+@pytest.mark.parametrize("background", [True, False])
+def test_recorder_snapshot(tmp_path, background):
+    frames = load_frames()
+    originals = [f.image.copy() for f in frames]
+
+    rec = Recorder(directory=str(tmp_path), codec=BinaryCodec(image_format="raw"), background=background)
+    for frame in frames:
+        rec.add(frame)
+        frame.image[:] = 0  # annotate in place right after adding
+    rec.close()
+    assert rec.written == len(frames) and rec.dropped == 0
+
+    with Playback(str(rec.path), codec=BinaryCodec(), headless=True) as device:
+        for original, frame in zip(originals, device):
+            np.testing.assert_array_equal(frame.image, original)
+
+
+def test_recorder_block_policy(tmp_path):
+    n = 10
+    rec = Recorder(directory=str(tmp_path), codec=SlowCodec(0.01), maxsize=2, policy=BUFFER_POLICY.BLOCK)
+    for frame in make_frames(n):
+        rec.add(frame)
+    rec.close()
+
+    assert rec.written == n and rec.dropped == 0
+    assert rec.blocked_time > 0
+    with Playback(str(rec.path), codec=BinaryCodec(), headless=True) as device:
+        assert len(device) == n
+
+
+def test_recorder_drop_policy(tmp_path):
+    n = 20
+    rec = Recorder(directory=str(tmp_path), codec=SlowCodec(0.02), maxsize=2, policy=BUFFER_POLICY.DROP_OLDEST)
+    for frame in make_frames(n):
+        rec.add(frame)
+    rec.close()
+
+    assert rec.dropped > 0
+    assert rec.written + rec.dropped == n
+    assert rec.blocked_time == 0
+    with Playback(str(rec.path), codec=BinaryCodec(), headless=True) as device:
+        played = [f.frame_count for f in device]
+    assert len(played) == rec.written
+    assert played[-1] == n - 1  # the newest frames are kept
+
+
+def test_recorder_invalid_policy(tmp_path):
+    with pytest.raises(ValueError):
+        Recorder(directory=str(tmp_path), policy=BUFFER_POLICY.LATEST)
+
+
+def test_recorder_disk_check_rate_limited(tmp_path, monkeypatch):
+    calls = []
+    usage = shutil.disk_usage
+
+    def disk_usage(path):
+        calls.append(path)
+        return usage(path)
+
+    monkeypatch.setattr(shutil, "disk_usage", disk_usage)
+    rec = Recorder(directory=str(tmp_path), codec=BinaryCodec())
+    for frame in make_frames(50):
+        rec.add(frame)
+    rec.close()
+    assert rec.written == 50
+    assert len(calls) == 1
+
+
+def test_recorder_low_disk_space(tmp_path, monkeypatch):
+    DiskUsage = namedtuple("DiskUsage", ["total", "used", "free"])
+    monkeypatch.setattr(shutil, "disk_usage", lambda path: DiskUsage(0, 0, 0))
+
+    rec = Recorder(directory=str(tmp_path), codec=BinaryCodec())
+    with pytest.warns(UserWarning, match="Low disk space"):
+        with pytest.raises(SystemExit):
+            for frame in make_frames(100, interval=0.01):
+                rec.add(frame)
+                time.sleep(0.01)
+    assert rec.written == 0
+    assert rec.file.closed
+
+
+@pytest.mark.parametrize("speed", [1.0, 4.0])
+def test_playback_realtime(tmp_path, speed):
+    path = record(tmp_path, make_frames(6, interval=0.1), BinaryCodec())
+
+    with Playback(str(path), codec=BinaryCodec(), headless=True, realtime=True, speed=speed) as device:
+        t0 = time.perf_counter()
+        assert len(list(device)) == 6
+        elapsed = time.perf_counter() - t0
+
+    expected = 0.5 / speed
+    assert expected * 0.9 <= elapsed < expected + 0.1
+
+
+@pytest.mark.parametrize("codec", [BinaryCodec(), PickleCodec()], ids=["binary", "pickle"])
+def test_playback_prefetch(tmp_path, codec):
+    path = record(tmp_path, make_frames(10), codec)
+
+    with Playback(str(path), codec=codec, headless=True, prefetch=4) as device:
+        assert [f.frame_count for f in device] == list(range(10))
+        with pytest.raises(StopIteration):
+            next(device)
+
+        if codec.seekable:
+            assert device.seek(frame=3) == 3
+            assert next(device).frame_count == 3
+            assert device.tell() == 4
+            assert device.seek(frame=8) == 8
+            assert [f.frame_count for f in device] == [8, 9]
+
+
+@pytest.mark.parametrize("prefetch", [0, 3])
+@pytest.mark.parametrize("codec", [BinaryCodec(), JsonCodec()], ids=["binary", "json"])
+def test_playback_loop(tmp_path, codec, prefetch):
+    path = record(tmp_path, make_frames(4), codec)
+
+    with Playback(str(path), codec=codec, headless=True, loop=True, prefetch=prefetch) as device:
+        frame_counts = [next(device).frame_count for _ in range(10)]
+        assert frame_counts == [0, 1, 2, 3, 0, 1, 2, 3, 0, 1]
+        assert device.loops == 2
+
+
+def test_playback_invalid_args(tmp_path):
+    path = record(tmp_path, make_frames(1), BinaryCodec())
+    with pytest.raises(ValueError):
+        Playback(str(path), codec=BinaryCodec(), speed=0)
+    with pytest.raises(ValueError):
+        Playback(str(path), codec=BinaryCodec(), prefetch=-1)
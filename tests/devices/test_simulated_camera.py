@@ -0,0 +1,174 @@
+#
+# Copyright 2025 Sony Semiconductor Solutions Corp. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+
+import asyncio
+import time
+
+import cv2
+import numpy as np
+import pytest
+
+from modlib.devices import BUFFER_POLICY, Images, SimulatedCamera
+from modlib.models import COLOR_FORMAT, ROI, Classifications, Model
+
+
+class MockModel(Model):
+    def __init__(self):
+        super().__init__(color_format=COLOR_FORMAT.RGB, preserve_aspect_ratio=False)
+
+    @property
+    def input_tensor_size(self):
+        return (32, 24)
+
+    def pre_process(self, image, src_color_format=COLOR_FORMAT.BGR, resize_fn=None):
+        it_image = cv2.resize(image, self.input_tensor_size)
+        return it_image, it_image.astype(np.float32), ROI(0, 0, 1, 1)
+
+    def post_process(self, output_tensors):
+        return Classifications(confidence=output_tensors[0], class_id=np.arange(len(output_tensors[0])))
+
+
+@pytest.fixture
+def images_dir(tmp_path):
+    for i in range(20):
+        cv2.imwrite(str(tmp_path / f"{i:03d}.png"), np.full((48, 64, 3), i * 10, dtype=np.uint8))
+    return tmp_path
+
+
+@pytest.fixture
+def tensors_dir(tmp_path):
+    d = tmp_path / "tensors"
+    d.mkdir()
+    for i in range(3):
+        np.save(d / f"{i:03d}.npy", np.array([i, 0.5], dtype=np.float32))
+    return d
+
+
+def run(device):
+    # Receive every frame of the stream through a blocking subscription, subscribed before the first frame
+    device.deploy(MockModel())
+    subscription = device.subscribe(maxsize=64, policy=BUFFER_POLICY.BLOCK)
+    with device:
+        for _ in device:
+            pass
+    return list(subscription)
+
+
+def test_simulated_camera_output_tensors(images_dir, tensors_dir):
+    device = SimulatedCamera(Images(images_dir), frame_rate=200, output_tensors=tensors_dir, headless=True)
+    frames = run(device)
+
+    assert len(frames) == 20
+    assert all(f.new_detection for f in frames)
+    assert [f.detections.confidence[0] for f in frames[:6]] == [0, 1, 2, 0, 1, 2]
+    assert [f.frame_count for f in frames[:3]] == [1, 2, 3]
+
+
+def test_simulated_camera_detection_rate(images_dir):
+    device = SimulatedCamera(
+        Images(images_dir), frame_rate=40, detection_rate=10, output_tensors=[np.array([1.0, 0.5])]
+    )
+    t0 = time.perf_counter()
+    frames = run(device)
+    elapsed = time.perf_counter() - t0
+
+    # 20 frames at 40 FPS, of which ~5 with a new detection at 10 DPS
+    assert len(frames) == 20
+    assert 0.45 < elapsed < 1.0
+    assert 4 <= sum(f.new_detection for f in frames) <= 6
+    assert frames[0].image.shape == (48, 64, 3)
+    assert frames[0].image_type == "source"
+    assert frames[-1].dps == pytest.approx(10, rel=0.3)
+
+
+def test_simulated_camera_interpreter(images_dir):
+    inputs = []
+
+    def interpreter(input_tensor):
+        inputs.append(input_tensor.shape)
+        return [input_tensor.mean(axis=(0, 1))]
+
+    device = SimulatedCamera(Images(images_dir), frame_rate=200, interpreter=interpreter, enable_input_tensor=True)
+    frames = run(device)
+
+    assert len(frames) == 20
+    assert inputs[0] == (24, 32, 3)
+    assert frames[3].image.shape == (24, 32, 3)
+    np.testing.assert_allclose(frames[3].detections.confidence, [30, 30, 30])
+
+
+def test_simulated_camera_drops_frames(images_dir):
+    device = SimulatedCamera(Images(images_dir), frame_rate=100, headless=True)
+    with device as stream:
+        consumed = 0
+        for frame in stream:
+            consumed += 1
+            time.sleep(0.05)  # slow application
+
+    assert frame.detections is None
+    assert 0 < device.dropped_frames
+    assert consumed + device.dropped_frames <= 20
+
+
+def test_simulated_camera_async(images_dir, tensors_dir):
+    async def main():
+        device = SimulatedCamera(Images(images_dir), frame_rate=200, output_tensors=tensors_dir, headless=True)
+        device.deploy(MockModel())
+        async with device as stream:
+            return [frame async for frame in stream]
+
+    frames = asyncio.run(main())
+    assert 0 < len(frames) <= 20
+    assert all(isinstance(f.detections, Classifications) for f in frames)
+
+
+def test_simulated_camera_processing_error(images_dir):
+    def interpreter(input_tensor):
+        raise RuntimeError("broken interpreter")
+
+    device = SimulatedCamera(Images(images_dir), frame_rate=200, interpreter=interpreter)
+    device.deploy(MockModel())
+    with device as stream:
+        with pytest.raises(RuntimeError, match="broken interpreter"):
+            for _ in stream:
+                pass
+
+
+def test_simulated_camera_processing_error_async(images_dir, tensors_dir):
+    async def main():
+        device = SimulatedCamera(Images(images_dir), frame_rate=200, output_tensors=tensors_dir, headless=True)
+        device.deploy(MockModel())
+        device.model.post_process = lambda output_tensors: output_tensors[1]  # IndexError
+        async with device as stream:
+            return [frame async for frame in stream]
+
+    with pytest.raises(IndexError):
+        asyncio.run(main())
+
+
+def test_simulated_camera_invalid_args(images_dir, tensors_dir):
+    with pytest.raises(ValueError):
+        SimulatedCamera(Images(images_dir), frame_rate=0)
+    with pytest.raises(ValueError):
+        SimulatedCamera(Images(images_dir), output_tensors=tensors_dir, interpreter=lambda x: [x])
+    with pytest.raises(FileNotFoundError):
+        SimulatedCamera(Images(images_dir), output_tensors=tensors_dir / "missing.npy")
+
+    device = SimulatedCamera(Images(images_dir))
+    device.deploy(MockModel())
+    with pytest.raises(ValueError):
+        device.start()
@@ -0,0 +1,127 @@
+#
+# Copyright 2026 Sony Semiconductor Solutions Corp. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import ctypes
+import os
+import platform
+import subprocess
+import sys
+
+import pytest
+
+from modlib.devices.triton.allocator import SHM_DIR, SHM_PREFIX, Allocator, ConfigAllocator, cleanup_stale_segments
+from modlib.devices.triton.request_interface import MAX_REQUEST_POOL_SIZE, RequestPool
+
+pytestmark = pytest.mark.skipif(platform.system() != "Linux", reason="POSIX shared memory")
+
+SHAPES = dict(image_shape=(64, 48, 3), input_tensor_shape=(0, 0, 0), output_tensor_shape_list=[(10, 4), (10,)])
+
+
+def test_unique_segment_names():
+    a, b = Allocator(), Allocator()
+    a.allocate(**SHAPES)
+    b.allocate(**SHAPES)
+    try:
+        assert a.name != b.name
+        assert os.path.exists(os.path.join(SHM_DIR, a.name))
+
+        a.get_request(0).idx = 3
+        assert b.get_request(0).idx == 0
+
+        # Cleaning up one instance leaves the other one intact
+        a.cleanup()
+        assert not os.path.exists(os.path.join(SHM_DIR, a.name))
+        assert os.path.exists(os.path.join(SHM_DIR, b.name))
+    finally:
+        a.cleanup()
+        b.cleanup()
+
+
+def test_config_allocator():
+    config = ConfigAllocator()
+    config.allocate()
+    try:
+        assert config.name.startswith(SHM_PREFIX) and config.name.endswith("_config")
+        config.set_keep_running(True)
+        assert config.get_config().keep_running
+    finally:
+        config.cleanup()
+    assert not os.path.exists(os.path.join(SHM_DIR, config.name))
+
+
+@pytest.mark.parametrize("request_pool_size", [1, 4, MAX_REQUEST_POOL_SIZE])
+def test_request_pool_size(request_pool_size):
+    allocator = Allocator(request_pool_size=request_pool_size)
+    allocator.allocate(**SHAPES)
+    try:
+        output_tensor_size = (10 * 4 + 10) * 4
+        assert (
+            allocator.total_size == ctypes.sizeof(RequestPool) + (64 * 48 * 3 + output_tensor_size) * request_pool_size
+        )
+        pool = RequestPool.from_buffer(allocator.mmap())
+        assert pool.num_requests == request_pool_size
+        del pool
+
+        allocator.get_request(request_pool_size - 1)
+        with pytest.raises(IndexError):
+            allocator.get_request(request_pool_size)
+        with pytest.raises(IndexError):
+            allocator.release_request(request_pool_size)
+    finally:
+        allocator.cleanup()
+
+
+def test_invalid_request_pool_size():
+    with pytest.raises(ValueError):
+        Allocator(request_pool_size=0)
+    with pytest.raises(ValueError):
+        Allocator(request_pool_size=MAX_REQUEST_POOL_SIZE + 1)
+
+
+def test_cleanup_stale_segments():
+    # Segments of a process that no longer exists are removed, those of running processes are kept
+    process = subprocess.run([sys.executable, "-c", "import os; print(os.getpid())"], capture_output=True, text=True)
+    dead_pid = int(process.stdout)
+
+    stale = os.path.join(SHM_DIR, f"{SHM_PREFIX}_{dead_pid}_0123abcd_pool")
+    with open(stale, "wb") as f:
+        f.write(b"\x00" * 16)
+
+    allocator = Allocator()
+    allocator.allocate(**SHAPES)
+    try:
+        removed = cleanup_stale_segments()
+        assert os.path.basename(stale) in removed
+        assert not os.path.exists(stale)
+        assert os.path.exists(os.path.join(SHM_DIR, allocator.name))
+    finally:
+        allocator.cleanup()
+        if os.path.exists(stale):
+            os.unlink(stale)
+
+
+@pytest.mark.skipif(os.geteuid() != 0, reason="requires changing the segment owner")
+def test_cleanup_keeps_segments_of_other_users():
+    process = subprocess.run([sys.executable, "-c", "import os; print(os.getpid())"], capture_output=True, text=True)
+    stale = os.path.join(SHM_DIR, f"{SHM_PREFIX}_{int(process.stdout)}_4567cdef_pool")
+    with open(stale, "wb") as f:
+        f.write(b"\x00" * 16)
+    os.chown(stale, os.getuid() + 1, -1)
+    try:
+        assert os.path.basename(stale) not in cleanup_stale_segments()
+        assert os.path.exists(stale)
+    finally:
+        os.unlink(stale)
@@ -0,0 +1,116 @@
+#
+# Copyright 2026 Sony Semiconductor Solutions Corp. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import platform
+
+import cv2
+import numpy as np
+import pytest
+
+from modlib.devices.frame import Frame
+from modlib.devices.triton.allocator import Allocator
+from modlib.devices.triton.triton import Triton, _ImageBufferPool
+
+pytestmark = pytest.mark.skipif(platform.system() != "Linux", reason="POSIX shared memory")
+
+W, H = 200, 150
+
+
+@pytest.fixture
+def device():
+    # Image path of a Triton device without camera: a request pool holding a single BGR image
+    allocator = Allocator(request_pool_size=1)
+    allocator.allocate(image_shape=(W, H, 3), input_tensor_shape=(0, 0, 0), output_tensor_shape_list=[])
+    req = allocator.get_request(0)
+    req.image.width, req.image.height, req.image.num_channels = W, H, 3
+    req.image.data_offset = allocator._request_pool.image_buffer_offset
+    req.image.data_size = W * H * 3
+
+    image = np.random.default_rng(0).integers(0, 255, (H, W, 3), dtype=np.uint8)
+    np.frombuffer(allocator.mmap(), dtype=np.uint8, count=W * H * 3, offset=req.image.data_offset)[:] = image.ravel()
+
+    device = Triton.__new__(Triton)
+    device._allocator = allocator
+    device._image_buffers = _ImageBufferPool()
+    device.image_size = (100, 80)
+    device.resize = True
+    device.interpolation = cv2.INTER_LINEAR
+    del req
+    yield device, image
+
+    allocator.cleanup()
+
+
+@pytest.mark.parametrize("interpolation", [cv2.INTER_LINEAR, cv2.INTER_AREA, cv2.INTER_NEAREST])
+def test_copy_image_resize(device, interpolation):
+    device, image = device
+    req = device._allocator.get_request(0)
+    device.interpolation = interpolation
+
+    copied = device._copy_image(req)
+    np.testing.assert_array_equal(copied, cv2.resize(image, (100, 80), interpolation=interpolation))
+
+
+def test_copy_image_native(device):
+    device, image = device
+    req = device._allocator.get_request(0)
+    device.resize = False
+
+    copied = device._copy_image(req)
+    np.testing.assert_array_equal(copied, image)
+    assert copied.ctypes.data != np.frombuffer(device._allocator.mmap(), dtype=np.uint8).ctypes.data
+
+
+def test_copy_image_reuses_released_buffers(device):
+    device, _ = device
+    req = device._allocator.get_request(0)
+
+    first = device._copy_image(req)
+    second = device._copy_image(req)
+    assert first is not second  # the first frame is still referenced
+
+    address = first.ctypes.data
+    del first
+    assert device._copy_image(req).ctypes.data == address
+
+
+def test_image_buffer_pool():
+    pool = _ImageBufferPool(size=2)
+    buffers = [pool.acquire((4, 4, 3)) for _ in range(3)]
+    assert len({id(b) for b in buffers}) == 3
+
+    view = buffers[0][1:]  # views keep their buffer alive
+    del buffers
+    reused = pool.acquire((4, 4, 3))
+    assert not np.shares_memory(reused, view)
+
+    assert pool.acquire((8, 8, 3)).shape == (8, 8, 3)
+
+
+def test_image_buffer_pool_ownership():
+    # Buffers are reused only when no image or view references them, independent of reference counts
+    pool = _ImageBufferPool(size=1)
+    frames = [Frame(None, pool.acquire((4, 4, 3)), None, 4, 4, 3, None, False, 0, 0)]
+    for frame in frames:
+        assert not np.shares_memory(pool.acquire((4, 4, 3)), frame.image)
+    del frame
+    transposed = frames.pop().image.transpose(2, 0, 1)
+    assert not np.shares_memory(pool.acquire((4, 4, 3)), transposed)
+
+    address = transposed.ctypes.data
+    del transposed
+    image = pool.acquire((4, 4, 3))
+    assert image.ctypes.data == address and image.flags.writeable
@@ -0,0 +1,94 @@
+#
+# Copyright 2026 Sony Semiconductor Solutions Corp. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import multiprocessing
+import platform
+import time
+
+import pytest
+
+from modlib.devices.device import Latency
+from modlib.devices.triton.allocator import Allocator
+from modlib.devices.triton.request_interface import MAX_REQUEST_POOL_SIZE
+from modlib.devices.triton.triton import RequestHandler
+
+pytestmark = pytest.mark.skipif(platform.system() != "Linux", reason="POSIX shared memory")
+
+SHAPES = dict(image_shape=(8, 8, 3), input_tensor_shape=(0, 0, 0), output_tensor_shape_list=[(4,)])
+
+
+@pytest.fixture
+def handler():
+    allocator = Allocator()
+    allocator.allocate(**SHAPES)
+    handler = RequestHandler(multiprocessing.Value("d", 0.0))
+    handler.attach(allocator)
+    yield handler
+    handler.detach()
+    allocator.cleanup()
+
+
+def _produce(handler, indices, state):
+    if state is not None:
+        handler.__dict__.update(state)  # emulate a spawned camera process mapping the pool by name
+    for idx in indices:
+        handler.py_callback(idx)
+
+
+def test_request_ring_order(handler):
+    assert handler.get(timeout=0) is None
+
+    t0 = time.perf_counter()
+    _produce(handler, [3, 1, 2], None)
+    entries = [handler.get(timeout=0) for _ in range(3)]
+    assert [idx for idx, _ in entries] == [3, 1, 2]
+    assert all(t0 <= t <= time.perf_counter() for _, t in entries)
+    assert handler.get(timeout=0) is None
+
+
+def test_request_ring_wraps_around(handler):
+    for i in range(3 * MAX_REQUEST_POOL_SIZE):
+        handler.py_callback(i % 10)
+        assert handler.get(timeout=0)[0] == i % 10
+
+
+@pytest.mark.parametrize("by_name", [False, True])
+def test_request_ring_between_processes(handler, by_name):
+    # The camera process is the producer, the processing thread of the parent process the consumer
+    indices = [i % 10 for i in range(50)]
+    process = multiprocessing.Process(
+        target=_produce, args=(handler, indices, handler.__getstate__() if by_name else None)
+    )
+    process.start()
+
+    received = []
+    while len(received) < len(indices):
+        entry = handler.get(timeout=10)
+        assert entry is not None
+        received.append(entry[0])
+    process.join()
+
+    assert received == indices
+    assert handler.rps.value > 0
+
+
+def test_latency():
+    latency = Latency(window=2)
+    for value in [0.1, 0.3, 0.2]:
+        latency.update(value)
+    assert latency.value == pytest.approx(0.25)
+    assert latency.last == 0.2
+    assert latency.max == 0.3
@@ -19,7 +19,9 @@ import pytest
 import numpy as np
 from pathlib import Path
 
+from modlib.models import COLOR_FORMAT
 from modlib.models.results import ROI, Classifications
+from modlib.devices.sources import DatasetSample
 from modlib.devices import Dataset
 from modlib.models.evals import ClassificationEvaluator, EvaluationSample
 from tests.utils import get_imagenet_dataset
@@ -58,3 +60,32 @@ def test_with_ground_truth(imagenet_dataset):
     # Perfect match
     assert np.all(r["per_class_accuracy"][sample_ids] == 1) # 100%
     assert np.all(r["confusion_matrix"][sample_ids, sample_ids] == 1) # 1 sample per class
+
+
+def test_streaming(tmp_path):
+    evaluator = ClassificationEvaluator(tmp_path, labels=[f"class_{i}" for i in range(10)])
+
+    evaluator.reset()
+    for i in range(20):
+        gt_class, predicted = i % 10, [i % 10, (i + 1) % 10] if i % 4 else [(i + 1) % 10, i % 10]
+        evaluator.add(EvaluationSample(
+            roi=ROI(0, 0, 1, 1),
+            detections=Classifications(class_id=np.array(predicted), confidence=np.array([0.9, 0.1])),
+            dataset_sample=DatasetSample(
+                image_path=Path(f"{gt_class}/{i}.jpg"),
+                image_name=f"{i}.jpg",
+                image_id=gt_class,
+                image=np.zeros((8, 8, 3), dtype=np.uint8),
+                image_color_format=COLOR_FORMAT.RGB,
+            ),
+        ))
+    r = evaluator.finalize()
+
+    assert r["total_samples"] == 20
+    assert r["correct_top1"] == 15
+    assert r["correct_top5"] == 20
+    assert r["confusion_matrix"].sum() == 20
+
+    # The returned confusion matrix is a copy, modifying it does not affect later results
+    r["confusion_matrix"][:] = 0
+    assert evaluator.finalize()["confusion_matrix"].sum() == 20
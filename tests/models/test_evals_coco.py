@@ -15,14 +15,18 @@
 #
 
 import os
+import gc
+import weakref
 import pytest
 import numpy as np
 from pathlib import Path
 
 from modlib.models.results import ROI
 from modlib.devices import Dataset
+from modlib.devices.sources import DatasetSample
+from modlib.models import COLOR_FORMAT
 from modlib.models.evals import COCOEvaluator, COCOPoseEvaluator, EvaluationSample
-from tests.utils import get_coco_annotations, get_coco_samples, get_coco_keypoints_samples
+from tests.utils import get_coco_annotations, get_coco_samples, get_coco_keypoints_samples, make_synthetic_coco
 
 
 @pytest.fixture()
@@ -46,6 +50,27 @@ def coco_keypoints_samples():
     return Path(current_dir)
 
 
+@pytest.fixture()
+def synthetic_coco(tmp_path):
+    return make_synthetic_coco(tmp_path)
+
+
+def synthetic_samples(evaluator, image_ids, image_shape=(120, 160, 3)):
+    # Ground truth as predictions on images downscaled from the annotated size
+    for image_id in image_ids:
+        yield EvaluationSample(
+            roi=ROI(0, 0, 1, 1),
+            detections=evaluator._get_detection_from_coco(image_id),
+            dataset_sample=DatasetSample(
+                image_path=Path(f"{image_id}.jpg"),
+                image_name=f"{image_id}.jpg",
+                image_id=image_id,
+                image=np.zeros(image_shape, dtype=np.uint8),
+                image_color_format=COLOR_FORMAT.RGB,
+            ),
+        )
+
+
 #################################
 ### COCO Detection Evaluation ###
 #################################
@@ -74,6 +99,34 @@ def test_with_ground_truth(coco_annotations, coco_samples):
     assert np.all(r == 1.0)
 
 
+def test_streaming(synthetic_coco):
+    annotations, _, image_ids = synthetic_coco
+    evaluator = COCOEvaluator(annotations, label_mapping_func=lambda x: x)
+
+    r_list = evaluator.evaluate(list(synthetic_samples(evaluator, image_ids)))
+
+    evaluator.reset()
+    for sample in synthetic_samples(evaluator, image_ids):
+        evaluator.add(sample)
+    r_stream = evaluator.finalize()
+
+    assert np.array_equal(r_list, r_stream)
+    assert np.allclose(np.delete(r_stream, 6), 1.0)
+
+
+def test_streaming_drops_images(synthetic_coco):
+    annotations, _, image_ids = synthetic_coco
+    evaluator = COCOEvaluator(annotations, label_mapping_func=lambda x: x)
+
+    sample = next(synthetic_samples(evaluator, image_ids))
+    image_ref = weakref.ref(sample.dataset_sample.image)
+    evaluator.add(sample)
+    del sample
+    gc.collect()
+
+    assert image_ref() is None
+
+
 #################################
 ### COCO Keypoints Evaluation ###
 #################################
@@ -96,3 +149,14 @@ def test_with_ground_truth_keypoints(coco_annotations, coco_keypoints_samples):
 
     r = evaluator.evaluate(samples)
     assert np.all(r == 1.0)
+
+
+def test_streaming_keypoints(synthetic_coco):
+    _, annotations, image_ids = synthetic_coco
+    evaluator = COCOPoseEvaluator(annotations)
+
+    r_list = evaluator.evaluate(list(synthetic_samples(evaluator, image_ids)))
+    r_stream = evaluator.evaluate(synthetic_samples(evaluator, image_ids))  # generator
+
+    assert np.array_equal(r_list, r_stream)
+    assert np.allclose(r_stream[r_stream != -1], 1.0)
@@ -0,0 +1,141 @@
+#
+# Copyright 2026 Sony Semiconductor Solutions Corp. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import multiprocessing
+import pickle
+
+import cv2
+import pytest
+import numpy as np
+
+from modlib.models.results import ROI, Classifications
+from modlib.devices import Dataset
+from modlib.models.evals import COCOEvaluator, ClassificationEvaluator, EvaluationSample, Evaluator, evaluate_parallel
+from tests.utils import make_synthetic_coco
+
+
+@pytest.fixture()
+def coco_dataset(tmp_path):
+    annotations, _, image_ids = make_synthetic_coco(tmp_path / "annotations", num_images=10)
+    images_dir = tmp_path / "images"
+    images_dir.mkdir()
+    for image_id in image_ids:
+        cv2.imwrite(str(images_dir / f"{image_id}.jpg"), np.zeros((120, 160, 3), dtype=np.uint8))
+    return annotations, Dataset(images_dir)
+
+
+def noisy_ground_truth(evaluator):
+    def process(sample):
+        detections = evaluator._get_detection_from_coco(sample.image_id)
+        rng = np.random.default_rng(sample.image_id)
+        detections.bbox = np.clip(detections.bbox + rng.normal(0, 0.02, detections.bbox.shape), 0, 1)
+        detections.confidence = rng.uniform(0.1, 1, len(detections))
+        return EvaluationSample(roi=ROI(0, 0, 1, 1), detections=detections, dataset_sample=sample)
+
+    return process
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_parallel_coco_matches_sequential(coco_dataset, workers):
+    annotations, dataset = coco_dataset
+    evaluator = COCOEvaluator(annotations, label_mapping_func=lambda x: x)
+    process = noisy_ground_truth(evaluator)
+
+    expected = evaluator.evaluate(process(sample) for sample in dataset)
+    r = evaluate_parallel(dataset, evaluator, process, workers=workers, chunk_size=3)
+
+    assert np.array_equal(r, expected)
+
+
+def test_parallel_classification(tmp_path):
+    for class_id in range(4):
+        (tmp_path / str(class_id)).mkdir()
+        for i in range(3):
+            cv2.imwrite(str(tmp_path / str(class_id) / f"{i}.jpg"), np.zeros((8, 8, 3), dtype=np.uint8))
+
+    dataset = Dataset(tmp_path, dataset_id_function=lambda path: int(path.parent.name))
+    evaluator = ClassificationEvaluator(tmp_path, labels=[str(i) for i in range(4)])
+
+    def process(sample):
+        predicted = sample.image_id if sample.image_name != "0.jpg" else (sample.image_id + 1) % 4
+        detections = Classifications(class_id=np.array([predicted]), confidence=np.array([1.0]))
+        return EvaluationSample(roi=ROI(0, 0, 1, 1), detections=detections, dataset_sample=sample)
+
+    r = evaluate_parallel(dataset, evaluator, process, workers=2, chunk_size=5)
+
+    assert r["total_samples"] == 12
+    assert r["correct_top1"] == 8
+    assert r["confusion_matrix"].sum() == 12
+
+
+class CountingEvaluator(Evaluator):
+    # Sequential only, no `get_state()` and `merge_state()`
+    def reset(self):
+        self.count = 0
+
+    def add(self, sample):
+        self.count += 1
+
+    def finalize(self):
+        return self.count
+
+    def visualize(self, samples, output_dir):
+        pass
+
+
+def test_parallel_unsupported_evaluator(coco_dataset):
+    _, dataset = coco_dataset
+    with pytest.raises(TypeError, match="CountingEvaluator"):
+        evaluate_parallel(dataset, CountingEvaluator(), identity, workers=1)
+
+
+def identity(x):
+    return x
+
+
+class NoisyGroundTruth:
+    # Picklable by reference for spawned workers, unlike the closure of `noisy_ground_truth`
+    def __init__(self, evaluator):
+        self.process = noisy_ground_truth(evaluator)
+        self.evaluator = evaluator
+
+    def __getstate__(self):
+        return {"evaluator": self.evaluator}
+
+    def __setstate__(self, state):
+        self.__init__(state["evaluator"])
+
+    def __call__(self, sample):
+        return self.process(sample)
+
+
+def test_parallel_spawn(coco_dataset):
+    annotations, dataset = coco_dataset
+    dataset = Dataset(dataset.images_dir, prefetch=4)
+    assert dataset.get_frame().shape == (120, 160, 3)  # started prefetcher threads are not sent to the workers
+    assert dataset._prefetcher._executor is not None
+    restored = pickle.loads(pickle.dumps(dataset))
+    assert restored.get_frame().shape == (120, 160, 3)
+    assert restored.load_sample(2).image.shape == (120, 160, 3)
+
+    evaluator = COCOEvaluator(annotations, label_mapping_func=identity)
+    process = NoisyGroundTruth(evaluator)
+    expected = evaluator.evaluate(process(sample) for sample in dataset)
+    r = evaluate_parallel(
+        dataset, evaluator, process, workers=2, chunk_size=4, mp_context=multiprocessing.get_context("spawn")
+    )
+
+    assert np.array_equal(r, expected)
@@ -16,9 +16,13 @@
 
 import os
 import pytest
+import numpy as np
 from pathlib import Path
+from PIL import Image
 
+from modlib.models import COLOR_FORMAT
 from modlib.models.results import ROI, Segments
+from modlib.devices.sources import DatasetSample
 from modlib.devices import Dataset
 from modlib.models.evals import VocSegEvaluator, EvaluationSample
 from tests.utils import get_voc_samples
@@ -54,3 +58,38 @@ def test_with_ground_truth(voc_samples):
     assert r['mean_accuracy'] == 1
     assert r['pixel_accuracy'] == 1
     assert r['fw_iou'] == 1
+
+
+def test_streaming(tmp_path):
+    rng = np.random.default_rng(0)
+    for image_id in range(3):
+        Image.fromarray(rng.integers(0, 21, (40, 60), dtype=np.uint8)).save(tmp_path / f"{image_id}.png")
+
+    evaluator = VocSegEvaluator(tmp_path)
+
+    def samples():
+        for image_id in range(3):
+            mask = evaluator._load_gt(image_id)
+            mask[:10] = rng.integers(0, 21, (10, 60))  # Partially wrong prediction
+            yield EvaluationSample(
+                roi=ROI(0, 0, 1, 1),
+                detections=Segments(mask=mask),
+                dataset_sample=DatasetSample(
+                    image_path=Path(f"{image_id}.jpg"),
+                    image_name=f"{image_id}.jpg",
+                    image_id=image_id,
+                    image=np.zeros((40, 60, 3), dtype=np.uint8),
+                    image_color_format=COLOR_FORMAT.RGB,
+                ),
+            )
+
+    all_samples = list(samples())
+    r_list = evaluator.evaluate(all_samples)
+
+    evaluator.reset()
+    for sample in all_samples:
+        evaluator.add(sample)
+    r_stream = evaluator.finalize()
+
+    assert r_list["mean_iou"] == r_stream["mean_iou"] < 1
+    assert np.array_equal(r_list["per_class_iou"], r_stream["per_class_iou"])
@@ -0,0 +1,200 @@
+#
+# Copyright 2026 Sony Semiconductor Solutions Corp. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+
+import numpy as np
+import pytest
+
+from modlib.models.post_processors import higherhrnet
+from modlib.models.post_processors.higherhrnet import (
+    match,
+    match_by_tag,
+    np_max_pool,
+    np_topk,
+    parse,
+    postprocess_higherhrnet,
+)
+
+requires_cpp = pytest.mark.skipif(higherhrnet._match_by_tag_cpp is None, reason="cpp_post_processors not built")
+use_cpp_params = pytest.mark.parametrize(
+    "use_cpp", [False, pytest.param(True, marks=requires_cpp)], ids=["numpy", "cpp"]
+)
+
+
+def reference_max_pool(x, k=5, p=2):
+    # Previous `np_max_pool`, concatenating all kernel offsets per channel
+    y = np.pad(x, ((p, p), (p, p), (0, 0)))
+    return np.concatenate(
+        [
+            np.max(
+                np.concatenate(
+                    [
+                        y[ky : ky + y.shape[0] - k + 1, kx : kx + y.shape[1] - k + 1, c : c + 1]
+                        for ky in range(k)
+                        for kx in range(k)
+                    ],
+                    2,
+                ),
+                axis=2,
+                keepdims=True,
+            )
+            for c in range(y.shape[2])
+        ],
+        2,
+    )
+
+
+def reference_topk(x, k):
+    # Previous `np_topk`, one partition and sort per keypoint
+    vals = np.zeros((x.shape[0], k, x.shape[2]), dtype=x.dtype)
+    inds = np.zeros((x.shape[0], k, x.shape[2]), dtype=np.int64)
+    for kp in range(x.shape[2]):
+        _inds = np.argpartition(x[0, :, kp], -k)[-k:]
+        _inds = _inds[np.argsort(x[0, _inds, kp])][::-1]
+        inds[0, :, kp] = _inds
+        vals[0, :, kp] = x[0, _inds, kp]
+    return vals, inds
+
+
+def random_heatmaps(num_people, h=144, w=192, num_joints=17, seed=0):
+    # Gaussian peaks per person and joint, tags of a person scattered around a person embedding
+    rng = np.random.default_rng(seed)
+    yy, xx = np.mgrid[:h, :w]
+    det = rng.uniform(0, 0.05, (h, w, num_joints)).astype(np.float32)
+    tag = rng.normal(0, 0.2, (h, w, num_joints)).astype(np.float32)
+    for person in range(num_people):
+        embedding = rng.uniform(-num_people, num_people)
+        for j in range(num_joints):
+            if rng.random() < 0.2:
+                continue  # occluded joint
+            cy, cx = rng.integers(4, h - 4), rng.integers(4, w - 4)
+            peak = np.exp(-((yy - cy) ** 2 + (xx - cx) ** 2) / 8) * rng.uniform(0.2, 1.0)
+            det[..., j] = np.maximum(det[..., j], peak)
+            tag[cy - 2 : cy + 3, cx - 2 : cx + 3, j] = embedding + rng.normal(0, 0.3)
+    return det, tag
+
+
+@pytest.mark.parametrize("channels", [1, 17, 600])
+@pytest.mark.parametrize("dtype", [np.float32, np.float64])
+@pytest.mark.parametrize("k, p", [(5, 2), (3, 1), (3, 0)])
+def test_np_max_pool(k, p, dtype, channels):
+    x = np.random.default_rng(0).normal(size=(36, 48, channels)).astype(dtype)
+    result = np_max_pool(x, k=k, p=p)
+    assert result.dtype == dtype
+    np.testing.assert_array_equal(result, reference_max_pool(x, k=k, p=p))
+
+
+def test_nms_single_channel():
+    x = np.random.default_rng(0).random((8, 9, 1)).astype(np.float32)
+    result = higherhrnet.nms(x)
+    assert result.shape == x.shape
+    np.testing.assert_array_equal(result, np.where(reference_max_pool(x) == x, x, 0))
+
+
+@use_cpp_params
+def test_np_topk(use_cpp):
+    det = higherhrnet.nms(random_heatmaps(5)[0]).reshape((1, -1, 17))
+    vals, inds = np_topk(det, 30, use_cpp=use_cpp)
+    ref_vals, ref_inds = reference_topk(det, 30)
+    assert vals.dtype == np.float32 and inds.dtype == np.int64
+    np.testing.assert_array_equal(vals, ref_vals)
+    np.testing.assert_array_equal(inds[vals > 0], ref_inds[ref_vals > 0])
+
+
+@requires_cpp
+def test_np_topk_ties():
+    # Quantized heatmaps, equal values are ordered by index in both implementations
+    x = np.round(np.random.default_rng(0).uniform(-1, 1, (1, 500, 17)), 1).astype(np.float32)
+    vals, inds = np_topk(x, 100, use_cpp=True)
+    ref_vals, ref_inds = np_topk(x, 100, use_cpp=False)
+    np.testing.assert_array_equal(vals, ref_vals)
+    np.testing.assert_array_equal(inds, ref_inds)
+    np.testing.assert_array_equal(np.take_along_axis(x, inds, axis=1), vals)
+
+    with pytest.raises(ValueError):
+        higherhrnet._top_k_cpp(x[0], 501)
+
+
+@requires_cpp
+@pytest.mark.parametrize("num_people", [0, 1, 4, 12, 40])
+@pytest.mark.parametrize("use_detection_val", [True, False])
+def test_match_parity(num_people, use_detection_val):
+    det, tag = random_heatmaps(num_people, seed=num_people)
+    topk = higherhrnet.top_k(det, tag, max_num_people=30)
+    kwargs = dict(detection_threshold=0.1, use_detection_val=use_detection_val)
+
+    expected = match(**topk, **kwargs, use_cpp=False)
+    result = match(**topk, **kwargs, use_cpp=True)
+    assert result[0].dtype == np.float32
+    np.testing.assert_array_equal(result[0], expected[0])
+
+
+@requires_cpp
+@pytest.mark.parametrize("seed", range(20))
+def test_match_parity_ties(seed):
+    # Rounded tags give many equal matching costs, the Hungarian solvers must break the ties identically
+    rng = np.random.default_rng(seed)
+    tag_k = np.round(rng.uniform(-3, 3, (1, 30, 17)), 1)
+    loc_k = rng.integers(0, 192, (1, 30, 17, 2))
+    val_k = rng.choice([0.0, 0.5, 0.5, 0.9], (1, 30, 17)).astype(np.float32)
+    for kwargs in [{}, dict(ignore_too_much=True, max_num_people=8), dict(tag_threshold=0.3, max_num_people=12)]:
+        expected = match(tag_k, loc_k, val_k, detection_threshold=0.1, **kwargs, use_cpp=False)
+        result = match(tag_k, loc_k, val_k, detection_threshold=0.1, **kwargs, use_cpp=True)
+        np.testing.assert_array_equal(result[0], expected[0])
+
+
+def network_outputs(seed, loc_dtype=np.float32):
+    # tag_k, loc_k and val_k as returned by the zoo model with network post-processing (float32)
+    rng = np.random.default_rng(seed)
+    tag_k = (rng.normal(size=(1, 30, 17)) * 2).astype(np.float32)
+    if seed % 2:
+        tag_k = np.round(tag_k, 1)  # many equal matching costs
+    ind_k = rng.integers(0, 144 * 192, (1, 30, 17)).astype(loc_dtype)
+    loc_k = np.stack([ind_k % 192, (ind_k / 192).astype(loc_dtype)], axis=3)
+    val_k = rng.random((1, 30, 17)).astype(np.float32)
+    return tag_k, loc_k, val_k
+
+
+@use_cpp_params
+@pytest.mark.parametrize("loc_dtype", [np.float32, np.int64])
+@pytest.mark.parametrize("seed", range(10))
+def test_match_float32_parity(seed, loc_dtype, use_cpp):
+    # Matching float32 tags is identical to the original `match_by_tag`, which computes in float32
+    tag_k, loc_k, val_k = network_outputs(seed, loc_dtype)
+    for kwargs in [{}, dict(use_detection_val=False), dict(tag_threshold=0.3, max_num_people=10)]:
+        expected = match_by_tag((tag_k[0], loc_k[0], val_k[0]), detection_threshold=0.3, **kwargs)
+        result = match(tag_k, loc_k, val_k, detection_threshold=0.3, **kwargs, use_cpp=use_cpp)
+        np.testing.assert_array_equal(result[0], expected)
+
+
+@requires_cpp
+def test_match_invalid_shapes():
+    with pytest.raises(ValueError):
+        match(np.zeros((1, 30, 17)), np.zeros((1, 30, 17, 2)), np.zeros((1, 30, 17)), num_joints=16)
+
+
+def test_postprocess_higherhrnet():
+    det, tag = random_heatmaps(4)
+    outputs = [np.concatenate((det, tag), axis=2)[None], det[None]]
+    kwargs = dict(img_size=(480, 640), img_w_pad=(0, 0), img_h_pad=(0, 0), network_postprocess=False)
+
+    kpts, scores = postprocess_higherhrnet(outputs, **kwargs)
+    assert kpts.shape == (len(scores), 17 * 3) and len(scores) >= 4
+
+    grouped, ref_scores = parse([det, tag], output_shape=(144, 192), detection_threshold=0.3, use_cpp=False)
+    np.testing.assert_array_equal(parse([det, tag], output_shape=(144, 192), detection_threshold=0.3)[0][0], grouped[0])
+    assert len(grouped[0]) == len(scores)
+    np.testing.assert_allclose(scores, ref_scores)
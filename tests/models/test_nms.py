@@ -0,0 +1,144 @@
+#
+# Copyright 2026 Sony Semiconductor Solutions Corp. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import numpy as np
+import pytest
+
+from modlib.models.post_processors import nms
+from modlib.models.post_processors.nms import NMS_METHOD, batched_nms, non_max_suppression, soft_nms
+from modlib.models.post_processors.yolo import combined_nms
+
+BACKENDS = [
+    pytest.param(True, id="cpp", marks=pytest.mark.skipif(nms._nms_cpp is None, reason="extension not built")),
+    pytest.param(False, id="numpy"),
+]
+
+
+def random_boxes(n, num_classes=5, seed=0):
+    rng = np.random.default_rng(seed)
+    xy = rng.uniform(0, 600, (n, 2))
+    wh = rng.uniform(5, 120, (n, 2))
+    boxes = np.concatenate([xy, xy + wh], 1).astype(np.float32)
+    return boxes, rng.random(n).astype(np.float32), rng.integers(0, num_classes, n)
+
+
+def iou(a, b):
+    inter = max(0, min(a[2], b[2]) - max(a[0], b[0])) * max(0, min(a[3], b[3]) - max(a[1], b[1]))
+    return inter / ((a[2] - a[0]) * (a[3] - a[1]) + (b[2] - b[0]) * (b[3] - b[1]) - inter)
+
+
+def reference_nms(boxes, scores, iou_thres, max_out_dets, classes=None):
+    keep = []
+    for i in np.argsort(-scores, kind="stable"):
+        if all((classes is not None and classes[i] != classes[j]) or iou(boxes[i], boxes[j]) <= iou_thres for j in keep):
+            keep.append(i)
+    return keep[:max_out_dets]
+
+
+@pytest.mark.parametrize("use_cpp", BACKENDS)
+@pytest.mark.parametrize("n", [1, 30, 700])
+@pytest.mark.parametrize("class_aware", [False, True])
+def test_nms_matches_reference(use_cpp, n, class_aware):
+    boxes, scores, classes = random_boxes(n)
+    classes = classes if class_aware else None
+    keep, keep_scores = nms._suppress(boxes, scores, classes, 0.5, 300, NMS_METHOD.HARD, use_cpp=use_cpp)
+
+    assert keep.tolist() == reference_nms(boxes, scores, 0.5, 300, classes)
+    np.testing.assert_array_equal(keep_scores, scores[keep])
+
+
+@pytest.mark.parametrize("use_cpp", BACKENDS)
+def test_nms_class_aware(use_cpp):
+    boxes = np.array([[0, 0, 10, 10], [0, 0, 10, 10], [1, 1, 10, 10], [50, 50, 60, 60]], dtype=np.float32)
+    scores = np.array([0.9, 0.8, 0.7, 0.6], dtype=np.float32)
+    classes = np.array([0, 1, 0, 0])
+
+    keep, _ = nms._suppress(boxes, scores, None, 0.5, 10, NMS_METHOD.HARD, use_cpp=use_cpp)
+    assert keep.tolist() == [0, 3]
+    keep, _ = nms._suppress(boxes, scores, classes, 0.5, 10, NMS_METHOD.HARD, use_cpp=use_cpp)
+    assert keep.tolist() == [0, 1, 3]
+    keep, _ = nms._suppress(boxes, scores, classes, 0.5, 2, NMS_METHOD.HARD, use_cpp=use_cpp)
+    assert keep.tolist() == [0, 1]
+
+
+@pytest.mark.parametrize("method", [NMS_METHOD.LINEAR, NMS_METHOD.GAUSSIAN])
+def test_soft_nms(method):
+    boxes = np.array([[0, 0, 10, 10], [0, 0, 10, 8], [50, 50, 60, 60]], dtype=np.float32)
+    scores = np.array([0.9, 0.8, 0.5], dtype=np.float32)
+
+    keep, keep_scores = soft_nms(boxes, scores, iou_thres=0.5, method=method)
+    # The overlapping box is decayed below the isolated box instead of being removed
+    assert keep.tolist() == [0, 2, 1]
+    assert keep_scores[1] == pytest.approx(0.5)
+    expected = 0.8 * (1 - 0.8) if method == NMS_METHOD.LINEAR else 0.8 * np.exp(-(0.8**2) / 0.5)
+    assert keep_scores[2] == pytest.approx(expected, rel=1e-5)
+
+    keep, _ = soft_nms(boxes, scores, method=method, score_thres=0.3)
+    assert keep.tolist() == [0, 2]
+
+
+@pytest.mark.parametrize("method", [NMS_METHOD.HARD, NMS_METHOD.LINEAR, NMS_METHOD.GAUSSIAN])
+@pytest.mark.parametrize("class_aware", [False, True])
+def test_nms_backends_match(method, class_aware):
+    if nms._nms_cpp is None:
+        pytest.skip("extension not built")
+    boxes, scores, classes = random_boxes(3000, seed=1)
+    classes = classes if class_aware else None
+    keep_cpp, scores_cpp = nms._suppress(boxes, scores, classes, 0.6, 300, method, use_cpp=True)
+    keep_np, scores_np = nms._suppress(boxes, scores, classes, 0.6, 300, method, use_cpp=False)
+
+    np.testing.assert_array_equal(keep_cpp, keep_np)
+    np.testing.assert_allclose(scores_cpp, scores_np, rtol=1e-5)
+
+
+def test_batched_nms():
+    batch = [random_boxes(200, seed=i) for i in range(3)]
+    results = batched_nms(
+        np.stack([b for b, _, _ in batch]),
+        np.stack([s for _, s, _ in batch]),
+        np.stack([c for _, _, c in batch]),
+        iou_thres=0.5,
+        max_out_dets=20,
+    )
+
+    assert len(results) == 3
+    for (boxes, scores, classes), (keep, keep_scores) in zip(batch, results):
+        np.testing.assert_array_equal(keep, non_max_suppression(boxes, scores, 0.5, 20, classes))
+        np.testing.assert_array_equal(keep_scores, scores[keep])
+
+    with pytest.raises(ValueError):
+        batched_nms(batch[0][0][None], batch[0][1][None], method="median")
+
+
+def test_nms_invalid_input():
+    keep = non_max_suppression(np.zeros((0, 4)), np.zeros(0))
+    assert keep.shape == (0,)
+    with pytest.raises(ValueError):
+        non_max_suppression(np.zeros((3, 4)), np.zeros(2))
+    with pytest.raises(ValueError):
+        soft_nms(np.zeros((3, 4)), np.zeros(3), method=NMS_METHOD.HARD)
+
+
+def test_combined_nms_class_aware():
+    # Identical boxes (xc, yc, w, h) of different classes are both kept, independent of the box coordinates
+    boxes = np.array([[[2000, 2000, 100, 100], [2000, 2000, 100, 100], [2010, 2000, 100, 100]]], dtype=np.float32)
+    scores = np.zeros((1, 3, 80), dtype=np.float32)
+    scores[0, [0, 1, 2], [3, 7, 3]] = [0.9, 0.8, 0.7]
+
+    nms_bbox, nms_scores, nms_classes = combined_nms(boxes, scores, iou_thres=0.5, conf=0.5)[0]
+    np.testing.assert_array_equal(nms_classes, [3, 7])
+    np.testing.assert_allclose(nms_scores, [0.9, 0.8])
+    np.testing.assert_array_equal(nms_bbox[0], [1950, 1950, 2050, 2050])
@@ -16,7 +16,7 @@
 
 import numpy as np
 
-from modlib.models import Classifications, Detections, Poses, Segments
+from modlib.models import Classifications, Detections, InstanceSegments, Poses, Segments
 from modlib.models.post_processors import pp_cls, pp_cls_softmax, pp_higherhrnet, pp_od_bcsn, pp_od_bscn, pp_od_efficientdet_lite0, pp_posenet, pp_personlab, pp_segment, pp_yolov8n_pose, pp_yolo_pose_ultralytics, pp_yolo_segment_ultralytics
 
 
@@ -110,3 +110,29 @@ def test_pp_segment():
     assert len(result.indices) == len(set(result.indices))  # Ensure uniqueness
     assert len(result.indices) > 0 and len(result.indices) <= 21 - 0
     assert 0 not in result.indices
+
+
+def test_pp_yolo_segment_ultralytics():
+    rng = np.random.default_rng(0)
+    xy = rng.uniform(0, 500, (5, 2))
+    boxes = np.concatenate([xy, xy + rng.uniform(10, 140, (5, 2))], 1).astype(np.float32)
+    output_tensors = [
+        np.concatenate([boxes, np.zeros((3, 4), dtype=np.float32)]),  # Boxes in input tensor pixels
+        np.array([0.9, 0.8, 0.7, 0.6, 0.5, 0.0, 0.0, 0.0], dtype=np.float32),  # Scores, padded
+        np.arange(8, dtype=np.float32),  # Class IDs
+        rng.normal(size=(8, 32)).astype(np.float32),  # Mask coefficients
+        rng.normal(size=(32, 160, 160)).astype(np.float32),  # Mask prototypes
+    ]
+
+    result = pp_yolo_segment_ultralytics(output_tensors, threshold=0.6)
+
+    assert isinstance(result, InstanceSegments)
+    assert len(result) == 5 and result.mask_shape == (160, 160)
+    np.testing.assert_array_equal(result.class_id, [0, 1, 2, 3, 4])
+
+    # Reference: sigmoid of the full frame mask logits, thresholded and cropped to the boxes
+    logits = np.tensordot(output_tensors[3][:5], output_tensors[4], axes=1)
+    dense = (1 / (1 + np.exp(-logits)) > 0.6).astype(np.uint8)
+    for i, crop in enumerate(result.mask_crops):
+        y1, y2, x1, x2 = InstanceSegments._bbox_to_slices(boxes[i] / 640, 160, 160)
+        np.testing.assert_array_equal(crop, dense[i, y1:y2, x1:x2])
@@ -0,0 +1,172 @@
+#
+# Copyright 2026 Sony Semiconductor Solutions Corp. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import numpy as np
+import pytest
+
+from modlib.models import Detections, InstanceSegments
+from modlib.models.post_processors import YOLOv8PostProcessor, pp_od_yolov8n
+from modlib.models.post_processors.yolo import (
+    _top_k_candidates,
+    dist2bbox_yolo_v8,
+    make_anchors_yolo_v8,
+    postprocess_yolov8_inst_seg,
+    postprocess_yolov8_keypoints,
+    process_mask_crops,
+)
+
+
+def raw_outputs(num_anchors, num_classes=80, seed=0):
+    rng = np.random.default_rng(seed)
+    y_bb = rng.uniform(0, 8, (1, 4, num_anchors)).astype(np.float32)
+    y_cls = (rng.random((1, num_classes, num_anchors)) ** 20).astype(np.float32)
+    return y_bb, y_cls
+
+
+@pytest.mark.parametrize(
+    "input_tensor_size, num_anchors", [(640, 8400), (320, 2100), (416, 3549), ((640, 480), 6300), ((320, 640), 4200)]
+)
+def test_yolov8_anchors(input_tensor_size, num_anchors):
+    post_processor = YOLOv8PostProcessor(input_tensor_size)
+    assert post_processor.num_anchors == num_anchors
+
+    # Anchor centers of the coarsest head cover the full input tensor
+    width, height = post_processor.input_tensor_size
+    h, w = post_processor.feat_sizes[-1]
+    assert (h * 32, w * 32) == (height, width)
+    centers = post_processor._anchors[:, -h * w :] * 32
+    assert centers[0].max() == width - 16 and centers[1].max() == height - 16
+
+
+def test_yolov8_decode_boxes():
+    post_processor = YOLOv8PostProcessor(320)
+    y_bb, _ = raw_outputs(post_processor.num_anchors)
+
+    anchors, strides = (x.transpose() for x in make_anchors_yolo_v8([40, 20, 10], [8, 16, 32]))
+    expected = dist2bbox_yolo_v8(y_bb, anchors, xywh=True, dim=1) * strides
+    dbox = post_processor.decode_boxes(y_bb)
+    np.testing.assert_allclose(dbox, expected, rtol=1e-5, atol=1e-4)
+
+    # Decode buffer is reused between frames
+    assert post_processor.decode_boxes(y_bb * 2) is dbox
+
+
+def test_yolov8_invalid_input_size():
+    with pytest.raises(ValueError):
+        YOLOv8PostProcessor(630)
+
+    post_processor = YOLOv8PostProcessor(320)
+    with pytest.raises(ValueError, match="2100 anchors"):
+        post_processor.detection(raw_outputs(8400))
+
+
+@pytest.mark.parametrize("input_tensor_sz", [320, (640, 480)])
+def test_pp_od_yolov8n_input_size(input_tensor_sz):
+    w, h = (input_tensor_sz, input_tensor_sz) if np.isscalar(input_tensor_sz) else input_tensor_sz
+    y_bb, y_cls = raw_outputs(YOLOv8PostProcessor(input_tensor_sz).num_anchors)
+
+    result = pp_od_yolov8n([y_bb[0], y_cls[0]], input_tensor_sz=input_tensor_sz)
+    boxes, scores, classes = YOLOv8PostProcessor(input_tensor_sz).detection((y_bb, y_cls), 0.01, 0.7, 50)[0]
+
+    assert isinstance(result, Detections)
+    assert len(result) == len(scores) > 0
+    np.testing.assert_allclose(result.bbox, boxes[:, [1, 0, 3, 2]] / [w, h, w, h])
+    np.testing.assert_array_equal(result.class_id, classes)
+
+
+def test_postprocess_yolov8_keypoints():
+    post_processor = YOLOv8PostProcessor()
+    y_bb, y_cls = raw_outputs(8400, num_classes=1)
+    kpts = np.random.default_rng(1).normal(size=(1, 51, 8400)).astype(np.float32)
+
+    boxes, scores, keypoints = postprocess_yolov8_keypoints((y_bb, y_cls, kpts), conf=0.01, iou_thres=0.3)
+    assert keypoints.shape == (len(scores), 51)
+    assert np.all((keypoints[:, 2::3] > 0) & (keypoints[:, 2::3] < 1))
+
+    expected = post_processor.keypoints((y_bb, y_cls, kpts), conf=0.01, iou_thres=0.3)
+    for a, b in zip(expected, (boxes, scores, keypoints)):
+        np.testing.assert_array_equal(a, b)
+
+
+def test_top_k_candidates():
+    scores = np.array([0.2, 0.9, 0.05, 0.5, 0.9, 0.7], dtype=np.float32)
+    np.testing.assert_array_equal(_top_k_candidates(scores, 0.1, 10), [1, 4, 5, 3, 0])
+    np.testing.assert_array_equal(_top_k_candidates(scores, 0.1, 3), [1, 4, 5])
+    np.testing.assert_array_equal(_top_k_candidates(scores, 0.95, 3), [])
+
+
+def test_yolov8_max_candidates():
+    post_processor = YOLOv8PostProcessor()
+    y_bb, y_cls = raw_outputs(8400)
+
+    boxes, scores, classes = post_processor.detection((y_bb, y_cls), conf=0.01, max_out_dets=50)[0]
+    all_boxes, all_scores, all_classes = post_processor.detection(
+        (y_bb, y_cls), conf=0.01, max_out_dets=50, max_candidates=8400
+    )[0]
+    # The highest scoring detections do not depend on the low scoring candidates
+    np.testing.assert_array_equal(scores, all_scores)
+    np.testing.assert_array_equal(classes, all_classes)
+    np.testing.assert_array_equal(boxes, all_boxes)
+
+    _, scores, _ = post_processor.detection((y_bb, y_cls), conf=0.01, max_out_dets=50, max_candidates=20)[0]
+    assert len(scores) <= 20
+    np.testing.assert_array_equal(scores, all_scores[: len(scores)])
+
+
+@pytest.mark.parametrize("threshold", [0.0, 0.3, 0.5, 0.9, 1.0])
+def test_process_mask_crops(threshold):
+    rng = np.random.default_rng(0)
+    masks_proto = rng.normal(size=(32, 40, 60)).astype(np.float32)
+    mask_coeffs = rng.normal(size=(4, 32)).astype(np.float32)
+    bbox = np.array([[0.1, 0.2, 0.5, 0.6], [0.0, 0.0, 1.0, 1.0], [0.7, 0.7, 0.7, 0.7], [0.3, 0.1, 0.35, 0.9]])
+
+    crops = process_mask_crops(mask_coeffs, masks_proto, bbox, threshold)
+
+    logits = np.tensordot(mask_coeffs, masks_proto, axes=1)
+    dense = (1 / (1 + np.exp(-logits.astype(np.float64))) > threshold).astype(np.uint8)
+    assert len(crops) == 4
+    for i, crop in enumerate(crops):
+        y1, y2, x1, x2 = InstanceSegments._bbox_to_slices(bbox[i], 40, 60)
+        assert crop.dtype == np.uint8 and crop.flags.c_contiguous
+        np.testing.assert_array_equal(crop, dense[i, y1:y2, x1:x2])
+
+    # All crops are views into one packed buffer
+    assert all(crop.base is crops[0].base for crop in crops)
+    assert crops[0].base.size == sum(crop.size for crop in crops)
+    assert process_mask_crops(mask_coeffs[:0], masks_proto, bbox[:0]) == []
+
+
+def test_postprocess_yolov8_inst_seg_mask_crops():
+    y_bb, y_cls = raw_outputs(8400)
+    rng = np.random.default_rng(1)
+    mask_weights = rng.normal(size=(1, 32, 8400)).astype(np.float32)
+    masks_proto = rng.normal(size=(1, 32, 160, 160)).astype(np.float32)
+    outputs = (y_bb, y_cls, mask_weights, masks_proto)
+
+    boxes, scores, classes, logits = postprocess_yolov8_inst_seg(outputs, conf=0.3, max_out_dets=20)
+    _, _, _, crops = postprocess_yolov8_inst_seg(outputs, conf=0.3, max_out_dets=20, mask_threshold=0.5)
+
+    assert logits.shape == (len(scores), 160, 160) and len(crops) == len(scores) > 0
+    bbox = boxes[:, [1, 0, 3, 2]] / 640
+    np.testing.assert_array_equal(
+        InstanceSegments(mask=crops, bbox=bbox, mask_shape=(160, 160), class_id=classes, confidence=scores).mask,
+        InstanceSegments.decompress_mask(
+            InstanceSegments.compress_mask((logits > 0).astype(np.uint8), bbox), bbox, (160, 160)
+        ),
+    )
+
+    _, scores, _, crops = postprocess_yolov8_inst_seg(outputs, conf=1.0, mask_threshold=0.5)
+    assert len(scores) == 0 and crops == []
@@ -17,8 +17,11 @@
 import os
 import json
 import time
+import asyncio
+import threading
 import pytest
 
+from modlib.devices.device import Device
 from modlib.devices.frame import Frame
 from modlib.devices.playback import JsonCodec, PickleCodec, Playback
 
@@ -65,6 +68,52 @@ class RepeatingMockPlayback(Playback):
 
 
 
+class ThreadedMockDevice(Device):
+    """Mock device producing frames from a background thread, like the AiCamera and Triton devices."""
+
+    def __init__(self, num_frames, interval=0.01):
+        super().__init__(headless=True)
+        self.num_frames = num_frames
+        self.interval = interval
+        self._frames = []
+        self._frameslock = threading.Lock()
+        self._frame_ready = threading.Condition(self._frameslock)
+        self._thread = None
+        self.poll_count = 0
+
+    def deploy(self, model):
+        pass
+
+    def _produce(self):
+        for i in range(self.num_frames):
+            time.sleep(self.interval)
+            with self._frameslock:
+                self._frames.append(Frame(str(i), None, None, 0, 0, 0, None, False, 0, 0, frame_count=i))
+                self._frame_ready.notify_all()
+                self._notify_async_waiters()
+
+    def _take_frame(self):
+        self.poll_count += 1
+        return self._frames.pop(0) if self._frames else None
+
+    def __enter__(self):
+        self._thread = threading.Thread(target=self._produce, daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self._thread.join()
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        raise NotImplementedError
+
+    async def _anext_frame(self):
+        return await self._wait_for_frame(self._take_frame)
+
+
 @pytest.fixture
 def test_classifier_device():
     recording = f"{os.path.dirname(os.path.abspath(__file__))}/assets/recordings/cls_samples.json"
@@ -150,3 +199,40 @@ def test_detector(test_detector_device):
             expected = expected_class_counts[i]
             actual = {cid: class_ids.count(cid) for cid in set(class_ids)}
             assert actual == expected, f"Frame {i}: Expected {expected}, got {actual}"
+
+
+def test_async_capture(test_detector_device):
+
+    async def capture():
+        frames = []
+        async with test_detector_device as stream:
+            async for frame in stream:
+                frames.append(frame)
+        return frames
+
+    frames = asyncio.run(capture())
+    assert len(frames) == 3 # Expected number of frames in the recording
+    assert frames[0].detections.class_id.tolist() == [11]
+
+
+def test_async_multiple_devices():
+
+    async def capture(device):
+        frame_counts = []
+        async with device as stream:
+            async for frame in stream:
+                frame_counts.append(frame.frame_count)
+                if len(frame_counts) == device.num_frames:
+                    break
+        return frame_counts
+
+    async def main(devices):
+        return await asyncio.gather(*(capture(device) for device in devices))
+
+    devices = [ThreadedMockDevice(num_frames=10), ThreadedMockDevice(num_frames=5, interval=0.02)]
+    results = asyncio.run(main(devices))
+
+    assert results == [list(range(10)), list(range(5))]
+    for device in devices:
+        # Woken up by the producer, no busy polling: at most one empty poll per frame
+        assert device.poll_count <= 2 * device.num_frames + 1
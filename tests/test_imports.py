@@ -0,0 +1,83 @@
+#
+# Copyright 2026 Sony Semiconductor Solutions Corp. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Modules that must only be imported when the corresponding attribute is used
+HEAVY_MODULES = [
+    "modlib.devices.ai_camera",
+    "modlib.devices.triton",
+    "modlib.devices.interpreters",
+    "modlib.models.zoo.models",
+    "requests",
+]
+
+
+def import_times(statement: str) -> dict:
+    """
+    Run a statement in a fresh interpreter with `python -X importtime`.
+
+    Returns:
+        Mapping of every imported module to its cumulative import time in microseconds.
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement], cwd=ROOT, capture_output=True, text=True, check=True
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, module = line.split("|")
+        if cumulative.strip().isdigit():
+            times[module.strip()] = int(cumulative)
+    return times
+
+
+@pytest.mark.parametrize(
+    "statement",
+    [
+        "import modlib.devices",
+        "import modlib.apps",
+        "import modlib.models.zoo",
+        "from modlib.devices import Images, Frame, BUFFER_POLICY",
+        "from modlib.devices.playback import Playback",
+    ],
+)
+def test_lazy_imports(statement):
+    times = import_times(statement)
+    imported = [m for m in HEAVY_MODULES if m in times]
+    assert not imported, f"'{statement}' imports {imported}"
+
+
+def test_lazy_attributes():
+    times = import_times("from modlib.devices import SimulatedCamera; from modlib.apps import Annotator, blur")
+    assert "modlib.devices.simulated" in times and "modlib.apps.annotate" in times and "modlib.apps.blur" in times
+    assert "modlib.devices.triton" not in times and "modlib.apps.tracker" not in times
+
+    import modlib.apps
+    import modlib.devices
+    import modlib.models.zoo
+
+    assert "AiCamera" in dir(modlib.devices) and "YOLOv8n" in modlib.models.zoo.__all__
+    assert modlib.apps.blur.__name__ == "modlib.apps.blur"
+    with pytest.raises(AttributeError):
+        modlib.devices.NotADevice
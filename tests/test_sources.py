@@ -16,11 +16,13 @@
 
 import os
 import pytest
+import cv2
+import numpy as np
 from pathlib import Path
 
 from modlib.devices import Images, Video, Dataset
 
-from tests.utils import get_imagenet_samples, get_coco_samples, get_tracking_video
+from tests.utils import get_imagenet_samples, get_coco_samples, get_tracking_video, make_synthetic_video
 
 
 @pytest.fixture
@@ -104,6 +106,51 @@ def test_tracking_video(tracking_video):
     assert tracking_video.get_frame() is None
 
 
+@pytest.fixture
+def synthetic_video(tmp_path):
+    return make_synthetic_video(tmp_path / "synthetic.mp4", num_frames=40)
+
+
+def test_video_sequential_matches_seeking(synthetic_video):
+    seeking = Video(synthetic_video, sequential=False)
+    sequential = Video(synthetic_video)
+    prefetching = Video(synthetic_video, prefetch=4)
+
+    for i in range(len(seeking)):
+        expected = seeking.get_frame()
+        assert np.array_equal(sequential.get_frame(), expected)
+        assert np.array_equal(prefetching.get_frame(), expected)
+        assert sequential.frame_number == prefetching.frame_number == i + 1
+
+    assert sequential.get_frame() is None
+    assert prefetching.get_frame() is None
+    prefetching.close()
+
+
+@pytest.mark.parametrize("prefetch", [0, 3])
+def test_video_random_access(synthetic_video, prefetch):
+    reference = [frame for frame in Video(synthetic_video, sequential=False)]
+    video = Video(synthetic_video, prefetch=prefetch)
+
+    _ = video.get_frame()
+    assert np.array_equal(video[25], reference[25])
+    assert video.frame_number == 26
+    assert np.array_equal(video.get_frame(), reference[26])
+
+    video.frame_number = 10
+    assert np.array_equal(video.get_frame(), reference[10])
+
+    assert np.array_equal(video[-1], reference[-1])
+    assert video.get_frame() is None
+
+    video.seek(0)
+    assert np.array_equal(video.get_frame(), reference[0])
+
+    with pytest.raises(IndexError):
+        video[len(video)]
+    video.close()
+
+
 def test_imagenet_dataset(imagenet_dataset):
     assert imagenet_dataset.timestamp is not None
     assert len(imagenet_dataset) == 3
@@ -127,6 +174,52 @@ def test_imagenet_dataset_iterator(imagenet_dataset):
             raise ValueError(f"Unexpected number of images: {i}")
 
 
+@pytest.fixture
+def synthetic_images(tmp_path):
+    for i in range(12):
+        image = np.full((48, 64, 3), (i * 20, 255 - i * 20, i), dtype=np.uint8)
+        cv2.imwrite(str(tmp_path / f"{i:03d}.png"), image)
+    return tmp_path
+
+
+@pytest.mark.parametrize("source_cls", [Images, Dataset])
+def test_prefetch_get_frame_in_order(synthetic_images, source_cls):
+    reference_source = source_cls(synthetic_images)
+    reference = [reference_source.get_frame() for _ in range(len(reference_source))]
+    source = source_cls(synthetic_images, prefetch=4, workers=3)
+
+    for expected in reference:
+        assert np.array_equal(source.get_frame(), expected)
+    assert source.get_frame() is None
+
+    # Out-of-order access restarts the prefetch window
+    source.image_number = 5
+    assert np.array_equal(source.get_frame(), reference[5])
+
+    stats = source.prefetch_stats
+    assert stats.requests == len(reference) + 1
+    assert stats.images >= stats.requests
+    assert stats.decode_latency > 0
+    assert 0 <= stats.max_queue_depth <= 4
+    source.close()
+
+
+def test_prefetch_dataset_iterator(synthetic_images):
+    reference = list(Dataset(synthetic_images))
+    samples = list(Dataset(synthetic_images, prefetch=3, workers=2))
+
+    assert [s.image_id for s in samples] == [s.image_id for s in reference]
+    for sample, expected in zip(samples, reference):
+        assert np.array_equal(sample.image, expected.image)
+
+
+def test_prefetch_invalid_args(synthetic_images):
+    with pytest.raises(ValueError):
+        Images(synthetic_images, prefetch=-1)
+    with pytest.raises(ValueError):
+        Dataset(synthetic_images, prefetch=2, workers=0)
+
+
 def test_non_exist():
     with pytest.raises(FileNotFoundError):
         Images(Path("path/to/non_exist"))
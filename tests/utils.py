@@ -278,3 +278,204 @@ def get_voc_samples(output_dir):
                 f.write(response.content)
 
     return data
+
+
+def make_synthetic_video(path, num_frames=60, width=320, height=240, fps=30):
+    """
+    Write a small video where every frame has a unique, decodable pattern.
+    Useful to test video sources without downloading assets.
+    """
+    import cv2
+    import numpy as np
+
+    writer = cv2.VideoWriter(str(path), cv2.VideoWriter_fourcc(*"mp4v"), fps, (width, height))
+    for i in range(num_frames):
+        frame = np.full((height, width, 3), (i * 4) % 256, dtype=np.uint8)
+        cv2.putText(frame, str(i), (10, height // 2), cv2.FONT_HERSHEY_SIMPLEX, 2, (255, 255, 255), 3)
+        writer.write(frame)
+    writer.release()
+
+    return path
+
+
+def make_synthetic_coco(output_dir, num_images=4, width=320, height=240, seed=0):
+    """
+    Write small COCO style annotation files with boxes (instances) and person keypoints.
+    Useful to test the COCO evaluators without downloading the COCO annotations.
+
+    Returns:
+        Paths to the instances and keypoints annotation files and the list of image ids.
+    """
+    import json
+    import numpy as np
+
+    rng = np.random.default_rng(seed)
+    os.makedirs(output_dir, exist_ok=True)
+
+    images, annotations = [], []
+    for image_id in range(1, num_images + 1):
+        images.append({"id": image_id, "width": width, "height": height, "file_name": f"{image_id}.jpg"})
+        for _ in range(3):
+            x, y = rng.uniform(0, width / 2), rng.uniform(0, height / 2)
+            w, h = rng.uniform(20, width / 2), rng.uniform(20, height / 2)
+            keypoints = np.stack(
+                [rng.uniform(x, x + w, 17), rng.uniform(y, y + h, 17), np.full(17, 2)], axis=1
+            )
+            annotations.append({
+                "id": len(annotations) + 1,
+                "image_id": image_id,
+                "category_id": [1, 3, 13][len(annotations) % 3],
+                "bbox": [x, y, w, h],
+                "area": w * h,
+                "iscrowd": 0,
+                "keypoints": keypoints.ravel().tolist(),
+                "num_keypoints": 17,
+            })
+
+    categories = [
+        {"id": 1, "name": "person", "keypoints": [f"kp{i}" for i in range(17)], "skeleton": []},
+        {"id": 3, "name": "car"},
+        {"id": 13, "name": "stop sign"},
+    ]
+
+    instances_path = os.path.join(output_dir, "synthetic_instances.json")
+    with open(instances_path, "w") as f:
+        json.dump({"images": images, "annotations": annotations, "categories": categories}, f)
+
+    keypoints_path = os.path.join(output_dir, "synthetic_person_keypoints.json")
+    with open(keypoints_path, "w") as f:
+        json.dump({
+            "images": images,
+            "annotations": [ann for ann in annotations if ann["category_id"] == 1],
+            "categories": categories[:1],
+        }, f)
+
+    return instances_path, keypoints_path, [image["id"] for image in images]
+
+
+class LocalInterpreterServer:
+    """
+    Minimal stand-in for the example interpreter server (`examples/interpreters/docker/server.py`).
+    Runs an HTTP server in a background thread, implementing the `/init`, `/input_tensor_size`, `/infer`,
+    `/infer_batch` and `/session` endpoints for a fake model with a configurable latency.
+    Supports both the `.npy`/`.npz` and the raw tensor transport and counts the opened connections.
+
+    The fake model outputs the per channel mean of the input tensor (`output0`) and
+    a fixed vector of scores derived from it (`output1`).
+
+    ```
+    with LocalInterpreterServer(latency=0.005) as server:
+        device = InterpreterClient(source, endpoint=server.endpoint)
+    ```
+    """
+
+    def __init__(self, input_tensor_size=(64, 64), latency=0.0, sample_latency=0.0):
+        self.input_tensor_size = input_tensor_size
+        self.latency = latency
+        self.sample_latency = sample_latency
+        self.requests = 0
+        self.connections = 0
+        self._lock = None
+        self._server = None
+        self._thread = None
+
+    @property
+    def endpoint(self):
+        return f"http://127.0.0.1:{self._server.server_address[1]}"
+
+    @staticmethod
+    def model(x):
+        import numpy as np
+
+        means = x.reshape(len(x), -1, x.shape[-1]).mean(axis=1, dtype=np.float32)
+        scores = np.outer(means.sum(axis=1), np.linspace(0, 1, 10, dtype=np.float32))
+        return {"output0": means, "output1": scores}
+
+    def __enter__(self):
+        import threading
+        from http.server import ThreadingHTTPServer
+
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._make_handler())
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self._server.shutdown()
+        self._server.server_close()
+        self._thread.join()
+
+    def _make_handler(self):
+        import io
+        import json
+        import time
+        from http.server import BaseHTTPRequestHandler
+
+        import numpy as np
+
+        from modlib.devices.interpreters.client import RAW_TENSORS_CONTENT_TYPE, decode_tensors, encode_tensors
+
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            disable_nagle_algorithm = True  # headers and body are written separately on kept-alive connections
+
+            def setup(self):
+                super().setup()
+                with server._lock:
+                    server.connections += 1
+
+            def log_message(self, *args):
+                pass
+
+            def _send(self, body, content_type="application/json", status=200):
+                self.send_response(status)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def _read_input(self):
+                body = self.rfile.read(int(self.headers["Content-Length"]))
+                if self.headers["Content-Type"] == RAW_TENSORS_CONTENT_TYPE:
+                    return decode_tensors(body)["input"]
+
+                boundary = self.headers["Content-Type"].split("boundary=")[1].encode()
+                part = body.split(b"--" + boundary)[1]
+                payload = part[part.index(b"\r\n\r\n") + 4 : -2]  # strip part headers and trailing CRLF
+                return np.load(io.BytesIO(payload), allow_pickle=False)
+
+            def do_POST(self):
+                if self.path == "/init":
+                    self.rfile.read(int(self.headers.get("Content-Length", 0)))
+                    return self._send(json.dumps({"session_id": "local", "status": "success"}).encode())
+
+                x = self._read_input()
+                with server._lock:
+                    server.requests += 1
+                time.sleep(server.latency + server.sample_latency * len(x))
+                outputs = server.model(x)
+
+                if self.path.startswith("/infer/"):
+                    outputs = {k: np.squeeze(v) for k, v in outputs.items()}
+                elif not self.path.startswith("/infer_batch/"):
+                    return self._send(b"{}", status=404)
+
+                if self.headers["Content-Type"] == RAW_TENSORS_CONTENT_TYPE:
+                    return self._send(bytes(encode_tensors(outputs)), content_type=RAW_TENSORS_CONTENT_TYPE)
+
+                buf = io.BytesIO()
+                np.savez(buf, **outputs)
+                self._send(buf.getvalue(), content_type="application/x.numpy-npz")
+
+            def do_GET(self):
+                payload = {"input_tensor_size": list(server.input_tensor_size)}
+                self._send(json.dumps(payload).encode())
+
+            def do_DELETE(self):
+                self._send(json.dumps({"status": "closed"}).encode())
+
+        return Handler